@@ -0,0 +1,65 @@
+"""Benchmark NumberArray arithmetic against the equivalent FOR loop.
+
+Computes ``x * 2 + 1`` and ``x < n / 2`` for every element of a 10^6
+element list, once as a ``FOR`` loop over the list and once on an
+``ARRAY`` of the same numbers, on every engine registered in
+``simplescript.runtime.ENGINES``, and reports the time of each and the
+array's speedup.
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_array.py [--size N] [--repeat N]
+"""
+
+import argparse
+import time
+from typing import List, Tuple
+from simplescript.runtime import ENGINES, run
+
+# (label, FOR loop program, NumberArray program)
+WORKLOADS: List[Tuple[str, str, str]] = [
+    ("x * 2 + 1", "FOR i = 0 TO n THEN (xs / i) * 2 + 1", "a * 2 + 1"),
+    ("x < n / 2", "FOR i = 0 TO n THEN (xs / i) < n / 2", "a < n / 2"),
+    ("x * x", "FOR i = 0 TO n THEN (xs / i) * (xs / i)", "a * a"),
+]
+
+
+def best_time(engine: str, program: str, repeat: int) -> float:
+    """Return the fastest of ``repeat`` runs of a program, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, error = run("<bench>", program, engine=engine)
+        best = min(best, time.perf_counter() - start)
+        if error:
+            raise RuntimeError(error.as_string())
+    return best
+
+
+def main() -> None:
+    """Time every workload on every engine and print a table."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=1_000_000)
+    arg_parser.add_argument("--repeat", type=int, default=1)
+    args = arg_parser.parse_args()
+
+    _, error = run(
+        "<bench>",
+        f"VAR n = {args.size}\nVAR xs = FOR i = 0 TO n THEN i\nVAR a = ARRAY(xs)",
+    )
+    if error:
+        raise RuntimeError(error.as_string())
+
+    print(f"{args.size:,} elements")
+    print(f"{'workload':<12}{'engine':<14}{'FOR loop':>12}{'ARRAY':>12}{'speedup':>10}")
+    for label, loop_program, array_program in WORKLOADS:
+        for name in ENGINES:
+            loop_time = best_time(name, loop_program, args.repeat)
+            array_time = best_time(name, array_program, args.repeat)
+            print(
+                f"{label:<12}{name:<14}{loop_time * 1000:>10.1f}ms"
+                f"{array_time * 1000:>10.1f}ms{loop_time / array_time:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
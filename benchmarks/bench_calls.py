@@ -0,0 +1,82 @@
+"""Benchmark SimpleScript function calls, in calls per second.
+
+Runs programs dominated by calls to small user-defined functions on every
+engine registered in ``simplescript.runtime.ENGINES``, and reports how
+many SimpleScript calls each engine makes per second (counting the whole
+program's time, so the loop driving the calls is included).
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_calls.py [--repeat N]
+"""
+
+import argparse
+import time
+from typing import List, Tuple
+from simplescript.runtime import ENGINES, run
+
+# (label, setup, program, number of calls the program makes)
+WORKLOADS: List[Tuple[str, str, str, int]] = [
+    ("no args", "FUNC one() -> 1", "FOR i = 0 TO 50000 THEN one()", 50000),
+    ("two args", "FUNC add(a, b) -> a + b", "FOR i = 0 TO 50000 THEN add(i, 1)", 50000),
+    (
+        "locals",
+        "FUNC f(a) -> VAR b = a + 1",
+        "FOR i = 0 TO 50000 THEN f(i)",
+        50000,
+    ),
+    (
+        "fib(20)",
+        "FUNC fib(n) -> IF n <= 1 THEN n ELSE fib(n - 1) + fib(n - 2)",
+        "fib(20)",
+        # Memoized, so each fib(n) body runs once and makes two calls.
+        39,
+    ),
+]
+
+
+def calls_per_second(
+    engine: str, setup: str, program: str, calls: int, repeat: int
+) -> float:
+    """Return the best call rate of a program on an engine.
+
+    Args:
+        engine: Name of the execution engine.
+        setup: Source executed before each timed run (the function
+            definitions), so that memoized functions start with an empty cache.
+        program: Source whose execution is timed.
+        calls: Number of SimpleScript calls ``program`` makes.
+        repeat: Number of timed runs; the fastest is reported.
+
+    Returns:
+        Calls per second of the fastest run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        _, error = run("<bench>", setup, engine=engine)
+        if error:
+            raise RuntimeError(error.as_string())
+        start = time.perf_counter()
+        _, error = run("<bench>", program, engine=engine)
+        best = min(best, time.perf_counter() - start)
+        if error:
+            raise RuntimeError(error.as_string())
+    return calls / best
+
+
+def main() -> None:
+    """Run every workload on every engine and print a calls/s table."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print(f"{'workload':<12}" + "".join(f"{name:>16}" for name in ENGINES) + "   (calls/s)")
+    for label, setup, program, calls in WORKLOADS:
+        rates = [
+            calls_per_second(name, setup, program, calls, args.repeat)
+            for name in ENGINES
+        ]
+        print(f"{label:<12}" + "".join(f"{rate:>16,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark the SimpleScript execution engines against each other.
+
+Runs the same workloads on every engine registered in
+``simplescript.runtime.ENGINES`` and reports the best wall-clock time and
+the speedup relative to the tree-walking interpreter.
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_engines.py [--repeat N]
+"""
+
+import argparse
+import time
+from typing import Dict, List, Tuple
+from simplescript.runtime import ENGINES, run
+
+WORKLOADS: List[Tuple[str, str, str]] = [
+    (
+        "fib(20)",
+        "NOMEMO FUNC fib(n) -> IF n <= 1 THEN n ELSE fib(n - 1) + fib(n - 2)",
+        "fib(20)",
+    ),
+    (
+        "memo fib(90)",
+        "",
+        "FUNC fib(n) -> IF n <= 1 THEN n ELSE fib(n - 1) + fib(n - 2)\nfib(90)",
+    ),
+    (
+        "numeric loop",
+        "VAR acc = 0",
+        "FOR i = 0 TO 100000 THEN VAR acc = acc + i * i - i / 2",
+    ),
+    (
+        "local loop",
+        "FUNC work(n, acc) -> FOR i = 0 TO n THEN VAR acc = acc + i * i - i / 2",
+        "work(100000, 0)",
+    ),
+    (
+        "call loop",
+        "FUNC sq(x) -> x * x + 1",
+        "FOR i = 0 TO 50000 THEN sq(i)",
+    ),
+    (
+        "map",
+        "FUNC sq(x) -> x * x + 1\nVAR xs = FOR i = 0 TO 50000 THEN i",
+        "MAP(sq, xs)",
+    ),
+    (
+        "list read",
+        "VAR big = FOR i = 0 TO 100000 THEN i",
+        "FOR i = 0 TO 20000 THEN big / 500",
+    ),
+    (
+        "string build",
+        'VAR s = ""',
+        'FOR i = 0 TO 10000 THEN VAR s = s + "line of output\\n"',
+    ),
+]
+
+
+def time_workload(engine: str, setup: str, program: str, repeat: int) -> float:
+    """Return the best time, in seconds, of running a program on an engine.
+
+    Args:
+        engine: Name of the execution engine.
+        setup: Source executed before each timed run (e.g., definitions),
+            so that memoized functions start with an empty cache.
+        program: Source whose execution is timed.
+        repeat: Number of timed runs; the fastest is reported.
+
+    Returns:
+        The fastest run time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        _, error = run("<bench>", setup, engine=engine)
+        if error:
+            raise RuntimeError(error.as_string())
+        start = time.perf_counter()
+        _, error = run("<bench>", program, engine=engine)
+        best = min(best, time.perf_counter() - start)
+        if error:
+            raise RuntimeError(error.as_string())
+    return best
+
+
+def main() -> None:
+    """Run every workload on every engine and print a comparison table."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'workload':<16}" + "".join(f"{name:>22}" for name in ENGINES))
+    for label, setup, program in WORKLOADS:
+        timings: Dict[str, float] = {
+            name: time_workload(name, setup, program, args.repeat) for name in ENGINES
+        }
+        baseline = timings["interpreter"]
+        cells = [
+            f"{seconds * 1000:>10.1f} ms ({baseline / seconds:>4.1f}x)"
+            for seconds in timings.values()
+        ]
+        print(f"{label:<16}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark the Evaluator against the Interpreter, per AST node evaluated.
+
+Runs each workload with the RTResult-returning Interpreter and with the
+exception-based Evaluator, and reports the time per node visit of the
+fastest run of each, and the time the Evaluator saves per node. The
+number of node visits a workload makes is counted once, by a counting
+Interpreter. The functions are defined with ``NOMEMO FUNC``, so that every
+call evaluates its body instead of returning a memoized result.
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_evaluator.py [--repeat N]
+
+or, from the repository root without installing it:
+    PYTHONPATH=. python benchmarks/bench_evaluator.py [--repeat N]
+"""
+
+import argparse
+import gc
+import time
+from typing import List, Tuple
+from simplescript.runtime import execute, global_symbol_table, parse
+from simplescript.core.context import Context
+from simplescript.core.interpreter import Interpreter
+
+WORKLOADS: List[Tuple[str, str, str]] = [
+    (
+        "fib(18)",
+        "NOMEMO FUNC fib(n) -> IF n <= 1 THEN n ELSE fib(n - 1) + fib(n - 2)",
+        "fib(18)",
+    ),
+    (
+        "call loop",
+        "NOMEMO FUNC sq(x) -> x * x + 1",
+        "FOR i = 0 TO 50000 THEN sq(i)",
+    ),
+    (
+        "while loop",
+        "",
+        "VAR n = 0; WHILE n < 30000 THEN VAR n = n + 1",
+    ),
+    (
+        "lists",
+        "NOMEMO FUNC pair(a) -> [a, [a, a + 1]]",
+        "FOR i = 0 TO 20000 THEN pair(i)",
+    ),
+]
+
+
+class CountingInterpreter(Interpreter):
+    """An Interpreter counting the nodes it visits."""
+
+    def __init__(self) -> None:
+        self.visits = 0
+
+    def visit(self, node, context):
+        self.visits += 1
+        return super().visit(node, context)
+
+
+def count_visits(setup: str, program: str) -> int:
+    """Return how many nodes the Interpreter visits running a program.
+
+    Args:
+        setup: Source executed first (the definitions).
+        program: Source whose node visits are counted.
+
+    Returns:
+        The number of node visits.
+    """
+    global_symbol_table.symbols.clear()
+    context = Context("<bench>")
+    context.symbol_table = global_symbol_table
+    counter = CountingInterpreter()
+    for text in (setup, program):
+        node, error = parse("<bench>", text)
+        counter.visits = 0
+        if not error:
+            error = counter.visit(node, context).error
+        if error:
+            raise RuntimeError(error.as_string())
+    return counter.visits
+
+
+def time_workloads(setup: str, program: str, repeat: int) -> Tuple[float, float]:
+    """Return the best times, in seconds, of a program on both engines.
+
+    The engines run alternately, so that both see the same machine load,
+    and with the garbage collector off, as ``timeit`` runs, since its full
+    collections take longer than the difference being measured.
+
+    Args:
+        setup: Source executed before each timed run (the definitions).
+        program: Source whose execution is timed.
+        repeat: Number of timed runs on each engine; the fastest is reported.
+
+    Returns:
+        The fastest run times of the Interpreter and of the Evaluator.
+    """
+    global_symbol_table.symbols.clear()
+    setup_node, error = parse("<bench>", setup)
+    if error:
+        raise RuntimeError(error.as_string())
+
+    node, error = parse("<bench>", program)
+    best = {"interpreter": float("inf"), "evaluator": float("inf")}
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for engine in best:
+                _, error = execute(setup_node)
+                if error:
+                    raise RuntimeError(error.as_string())
+                start = time.perf_counter()
+                _, error = execute(node, engine)
+                best[engine] = min(best[engine], time.perf_counter() - start)
+                if error:
+                    raise RuntimeError(error.as_string())
+                gc.collect()
+    finally:
+        gc.enable()
+    return best["interpreter"], best["evaluator"]
+
+
+def main() -> None:
+    """Run every workload on both engines and print a per-node table."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    print(f"{'workload':<12}{'nodes':>10}{'interpreter':>14}{'evaluator':>14}{'saved':>14}")
+    for label, setup, program in WORKLOADS:
+        visits = count_visits(setup, program)
+        interpreter, evaluator = (
+            seconds / visits * 1e9
+            for seconds in time_workloads(setup, program, args.repeat)
+        )
+        print(
+            f"{label:<12}{visits:>10,}{interpreter:>11.0f} ns{evaluator:>11.0f} ns"
+            f"{interpreter - evaluator:>11.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark the SimpleScript lexer throughput.
+
+Generates SimpleScript source of increasing sizes, made of a mix of
+assignments, function definitions, strings, lists, maps and loops, and
+reports how many megabytes of source ``Lexer.make_tokens`` scans per
+second.
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_lexer.py [--sizes 1 10 100] [--repeat N]
+"""
+
+import argparse
+import time
+from typing import List
+from simplescript.core.lexer import Lexer
+
+SNIPPETS: List[str] = [
+    "VAR total_{n} = {n} * 2 + 3.75 / (1 - 4) ^ 2",
+    "FUNC add_{n}(a, b) -> IF a >= b THEN a - b ELSE b + a",
+    'VAR greeting_{n} = "Hello, \\"world\\" number {n}\\n"',
+    "VAR items_{n} = [1, 2.5, 'three', [4, 5]] + {n}",
+    'VAR table_{n} = {{"key": {n}, "other": "value"}}',
+    "FOR i = 0 TO {n} STEP 2 THEN VAR acc = acc + i * i",
+    "WHILE NOT counter == {n} AND flag != 0 THEN VAR counter = counter + 1",
+]
+
+
+def generate_source(size_bytes: int) -> str:
+    """Generate SimpleScript source of at least ``size_bytes`` characters.
+
+    Args:
+        size_bytes: The minimum length of the generated source.
+
+    Returns:
+        Newline-separated SimpleScript statements.
+    """
+    lines = []
+    length = 0
+    n = 0
+    while length < size_bytes:
+        line = SNIPPETS[n % len(SNIPPETS)].format(n=n)
+        lines.append(line)
+        length += len(line) + 1
+        n += 1
+    return "\n".join(lines)
+
+
+def time_lexer(text: str, repeat: int) -> float:
+    """Return the best time, in seconds, of tokenizing ``text``.
+
+    Args:
+        text: The source to tokenize.
+        repeat: Number of timed runs; the fastest is reported.
+
+    Returns:
+        The fastest run time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens, error = Lexer("<bench>", text).make_tokens()
+        best = min(best, time.perf_counter() - start)
+        if error:
+            raise RuntimeError(error.as_string())
+        del tokens
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a throughput table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=float,
+        nargs="+",
+        default=[1, 10, 100],
+        help="source sizes to generate, in MB (default: 1 10 100)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="timed runs per size (default: 3)"
+    )
+    args = parser.parse_args()
+
+    print(f"{'size (MB)':>10}  {'tokens':>12}  {'time (s)':>10}  {'MB/s':>8}")
+    for size in args.sizes:
+        text = generate_source(int(size * 1024 * 1024))
+        tokens, _ = Lexer("<bench>", text).make_tokens()
+        token_count = len(tokens)
+        del tokens
+        seconds = time_lexer(text, args.repeat)
+        megabytes = len(text) / (1024 * 1024)
+        print(
+            f"{megabytes:>10.1f}  {token_count:>12,}  {seconds:>10.3f}  "
+            f"{megabytes / seconds:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark SimpleScript List operations as the list grows.
+
+For each size, builds a List by appending one element at a time (as
+``VAR l = l + i`` does), then times indexing (``l / i``), removing the
+last element (``l - -1``) and concatenating a short list (``l * [...]``).
+Times are reported per operation, so costs that do not grow with the size
+of the list show up as flat columns.
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_list.py [--sizes 1000 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List as PyList
+from simplescript.types.list import List
+from simplescript.types.number import Number
+
+SHORT_LIST_LENGTH: int = 32
+"""Length of the list concatenated onto the benchmarked list."""
+
+
+def per_op(run: Callable[[], None], count: int) -> float:
+    """Return the time of ``run``, in microseconds per operation.
+
+    Args:
+        run: Performs ``count`` operations.
+        count: Number of operations ``run`` performs.
+
+    Returns:
+        Microseconds per operation.
+    """
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a microseconds-per-operation table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000, 1000000],
+        help="list sizes (default: 1000 10000 100000 1000000)",
+    )
+    parser.add_argument(
+        "--ops", type=int, default=10000, help="operations timed per size (default: 10000)"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>10}  {'append':>9}  {'index':>9}  {'pop last':>9}  {'concat':>9}"
+        "   (us/op)"
+    )
+    for size in args.sizes:
+        numbers: PyList[Number] = [Number(i) for i in range(size)]
+        built: PyList[List] = [List([])]
+
+        def append() -> None:
+            current = built[0]
+            for number in numbers:
+                current, _ = current.added_to(number)
+            built[0] = current
+
+        append_us = per_op(append, size)
+        full = built[0]
+        ops = min(args.ops, size)
+        indices = [Number(random.randrange(size)) for _ in range(ops)]
+        last = Number(-1)
+        short = List(numbers[:SHORT_LIST_LENGTH])
+
+        def index() -> None:
+            for number in indices:
+                full.dived_by(number)
+
+        def pop_last() -> None:
+            current = full
+            for _ in range(ops):
+                current, _ = current.subbed_by(last)
+
+        def concat() -> None:
+            for _ in range(ops):
+                full.multed_by(short)
+
+        print(
+            f"{size:>10,}  {append_us:>9.2f}  {per_op(index, ops):>9.2f}  "
+            f"{per_op(pop_last, ops):>9.2f}  {per_op(concat, ops):>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark SimpleScript FOR loops, in iterations per second.
+
+Runs FOR loops with small bodies on every engine registered in
+``simplescript.runtime.ENGINES``, and reports how many loop iterations
+each engine runs per second (counting the whole program's time).
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_loops.py [--repeat N]
+"""
+
+import argparse
+import time
+from typing import List, Tuple
+from simplescript.runtime import ENGINES, run
+
+# (label, setup, program, number of iterations the program runs)
+WORKLOADS: List[Tuple[str, str, str, int]] = [
+    ("global", "VAR acc = 0", "FOR i = 0 TO 200000 THEN VAR acc = acc + i", 200000),
+    (
+        "local",
+        "FUNC work(n, acc) -> FOR i = 0 TO n THEN VAR acc = acc + i",
+        "work(200000, 0)",
+        200000,
+    ),
+    ("step -2", "VAR acc = 0", "FOR i = 400000 TO 0 STEP -2 THEN VAR acc = acc + i", 200000),
+    ("float step", "VAR acc = 0", "FOR i = 0 TO 20000 STEP 0.1 THEN VAR acc = acc + i", 200000),
+    ("collect", "", "FOR i = 0 TO 200000 THEN i", 200000),
+]
+
+
+def iterations_per_second(
+    engine: str, setup: str, program: str, iterations: int, repeat: int
+) -> float:
+    """Return the best iteration rate of a program on an engine.
+
+    Args:
+        engine: Name of the execution engine.
+        setup: Source executed before each timed run (e.g., definitions),
+            so that memoized functions start with an empty cache.
+        program: Source whose execution is timed.
+        iterations: Number of loop iterations ``program`` runs.
+        repeat: Number of timed runs; the fastest is reported.
+
+    Returns:
+        Iterations per second of the fastest run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        _, error = run("<bench>", setup, engine=engine)
+        if error:
+            raise RuntimeError(error.as_string())
+        start = time.perf_counter()
+        _, error = run("<bench>", program, engine=engine)
+        best = min(best, time.perf_counter() - start)
+        if error:
+            raise RuntimeError(error.as_string())
+    return iterations / best
+
+
+def main() -> None:
+    """Run every workload on every engine and print an iterations/s table."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print(
+        f"{'workload':<12}" + "".join(f"{name:>16}" for name in ENGINES) + "   (iterations/s)"
+    )
+    for label, setup, program, iterations in WORKLOADS:
+        rates = [
+            iterations_per_second(name, setup, program, iterations, args.repeat)
+            for name in ENGINES
+        ]
+        print(f"{label:<12}" + "".join(f"{rate:>16,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark SimpleScript Map operations as the map grows.
+
+For each size, builds a Map by adding one key at a time (as
+``VAR m = m + {key: value}`` does), then times looking up a key
+(``m / key``), removing a key (``m - key``) and merging a short map
+(``m * {...}``). Times are reported per operation, so costs that do not
+grow with the size of the map show up as flat columns.
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_map.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List as PyList
+from simplescript.types.map import Map
+from simplescript.types.number import Number
+from simplescript.types.string import String
+
+SHORT_MAP_LENGTH: int = 8
+"""Number of keys in the map merged into the benchmarked map."""
+
+
+def per_op(run: Callable[[], None], count: int) -> float:
+    """Return the time of ``run``, in microseconds per operation.
+
+    Args:
+        run: Performs ``count`` operations.
+        count: Number of operations ``run`` performs.
+
+    Returns:
+        Microseconds per operation.
+    """
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a microseconds-per-operation table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="map sizes (default: 1000 10000 100000)",
+    )
+    parser.add_argument(
+        "--ops", type=int, default=1000, help="operations timed per size (default: 1000)"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>10}  {'add':>9}  {'lookup':>9}  {'remove':>9}  {'merge':>9}"
+        "   (us/op)"
+    )
+    for size in args.sizes:
+        singles: PyList[Map] = [Map({f"k{i}": Number(i)}) for i in range(size)]
+        built: PyList[Map] = [Map({})]
+
+        def add() -> None:
+            current = built[0]
+            for single in singles:
+                current, _ = current.added_to(single)
+            built[0] = current
+
+        add_us = per_op(add, size)
+        full = built[0]
+        ops = min(args.ops, size)
+        keys = [String(f"k{random.randrange(size)}") for _ in range(ops)]
+        short = Map({f"new{i}": Number(i) for i in range(SHORT_MAP_LENGTH)})
+
+        def lookup() -> None:
+            for key in keys:
+                full.dived_by(key)
+
+        def remove() -> None:
+            for key in keys:
+                full.subbed_by(key)
+
+        def merge() -> None:
+            for _ in range(ops):
+                full.multed_by(short)
+
+        print(
+            f"{size:>10,}  {add_us:>9.2f}  {per_op(lookup, ops):>9.2f}  "
+            f"{per_op(remove, ops):>9.2f}  {per_op(merge, ops):>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark the memory footprint of SimpleScript's core objects.
+
+Lexes and parses generated SimpleScript source and creates batches of
+runtime values, measuring the memory allocated with ``tracemalloc`` to
+report the average bytes per token, per AST node and per runtime value.
+Each figure includes everything the object keeps alive on its own (for
+example, the positions of an AST node), but not objects shared with
+others (the source text, or a token referenced by a node).
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/bench_memory.py [--size KB] [--count N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+from simplescript.ast import nodes
+from simplescript.core.context import Context
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.types.list import List as ListValue
+from simplescript.types.number import Number
+from simplescript.types.string import String
+
+SNIPPETS: List[str] = [
+    "VAR total_{n} = {n} * 2 + 3.75 / (1 - 4) ^ 2",
+    "FUNC add_{n}(a, b) -> IF a >= b THEN a - b ELSE b + a",
+    'VAR greeting_{n} = "Hello number {n}"',
+    "VAR items_{n} = [1, 2.5, 'three', [4, 5]] + {n}",
+    'VAR table_{n} = {{"key": {n}, "other": "value"}}',
+    "FOR i = 0 TO {n} STEP 2 THEN VAR acc = acc + i * i",
+    "WHILE NOT counter == {n} AND flag != 0 THEN VAR counter = counter + 1",
+]
+
+
+def generate_source(size_bytes: int) -> str:
+    """Generate SimpleScript source of at least ``size_bytes`` characters.
+
+    Args:
+        size_bytes: The minimum length of the generated source.
+
+    Returns:
+        Newline-separated SimpleScript statements.
+    """
+    lines = []
+    length = 0
+    n = 0
+    while length < size_bytes:
+        line = SNIPPETS[n % len(SNIPPETS)].format(n=n)
+        lines.append(line)
+        length += len(line) + 1
+        n += 1
+    return "\n".join(lines)
+
+
+def measure(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Call ``build`` and return its result and the bytes it left allocated.
+
+    Args:
+        build: A function creating the objects to measure.
+
+    Returns:
+        A tuple of (result, bytes still allocated once ``build`` returns).
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def count_nodes() -> int:
+    """Return the number of live AST node objects."""
+    return sum(1 for obj in gc.get_objects() if type(obj).__module__ == nodes.__name__)
+
+
+def main() -> None:
+    """Run the benchmark and print a bytes-per-object table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=256,
+        help="size of the generated source, in KB (default: 256)",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=100_000,
+        help="runtime values created per type (default: 100000)",
+    )
+    args = parser.parse_args()
+    text = generate_source(args.size * 1024)
+
+    rows = []
+    tokens, size = measure(lambda: Lexer("<bench>", text).make_tokens()[0])
+    rows.append(("token", len(tokens), size))
+
+    ast, size = measure(lambda: Parser(tokens).parse())
+    if ast.error:
+        raise RuntimeError(ast.error.as_string())
+    rows.append(("AST node", count_nodes(), size))
+
+    position = tokens[0].pos_start
+    context = Context("<bench>")
+    value_types = [
+        ("Number", lambda i: Number(i * 0.5)),
+        ("String", lambda i: String("value")),
+        ("List", lambda i: ListValue([])),
+    ]
+    for name, make in value_types:
+        values, size = measure(
+            lambda: [
+                make(i).set_pos(position, position).set_context(context)
+                for i in range(args.count)
+            ]
+        )
+        rows.append((f"{name} value", len(values), size))
+        del values
+
+    print(f"{'object':>14}  {'count':>10}  {'bytes':>12}  {'bytes/object':>12}")
+    for name, count, size in rows:
+        print(f"{name:>14}  {count:>10,}  {size:>12,}  {size / count:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,6 @@ Example:
 """
 
 from simplescript.__version__ import __version__, __author__, __license__
-from simplescript.runtime import run
+from simplescript.runtime import run, run_iter
 
-__all__ = ["run", "__version__", "__author__", "__license__"]
+__all__ = ["run", "run_iter", "__version__", "__author__", "__license__"]
@@ -12,6 +12,9 @@ from simplescript.ast.nodes import (
     WhileNode,
     FuncDefNode,
     CallNode,
+    ListNode,
+    MapNode,
+    ProgramNode,
 )
 
 __all__ = [
@@ -26,4 +29,7 @@ __all__ = [
     "WhileNode",
     "FuncDefNode",
     "CallNode",
+    "ListNode",
+    "MapNode",
+    "ProgramNode",
 ]
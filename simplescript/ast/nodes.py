@@ -16,12 +16,26 @@ class NumberNode:
         tok (Token): The number token containing the numeric value.
         pos_start (Position): Start position of the number in source text.
         pos_end (Position): End position of the number in source text.
+        constant: The Constant every engine evaluates this literal to,
+            built on first use (see ``operands.literal``). It is not
+            pickled.
     """
 
+    __slots__ = ("tok", "pos_start", "pos_end", "constant", "__weakref__")
+
     def __init__(self, tok) -> None:
         self.tok = tok
         self.pos_start = self.tok.pos_start
         self.pos_end = self.tok.pos_end
+        self.constant = None
+
+    def __getstate__(self) -> tuple:
+        return None, {"tok": self.tok, "pos_start": self.pos_start, "pos_end": self.pos_end}
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self.constant = None
 
     def __repr__(self) -> str:
         return f"{self.tok}"
@@ -39,6 +53,8 @@ class StringNode:
         pos_end (Position): End position of the string in source text.
     """
 
+    __slots__ = ("tok", "pos_start", "pos_end", "__weakref__")
+
     def __init__(self, tok) -> None:
         self.tok = tok
         self.pos_start = self.tok.pos_start
@@ -62,19 +78,83 @@ class BinOpNode:
         right_node: Right operand AST node.
         pos_start (Position): Start position (from left operand).
         pos_end (Position): End position (from right operand).
+        feedback (Optional[list]): The Interpreter's record of the operand
+            types evaluated: ``[left type, right type, times seen in a row,
+            deoptimizations]``. It is not pickled.
+        quickened (Optional[tuple]): The Interpreter's evaluator
+            specialized for the operand types seen, if any (see
+            ``simplescript.core.quickening``). It is not pickled.
+        unboxed: The NumericTree for this subtree, shared by the engines,
+            False if it cannot be evaluated unboxed, or None before it is
+            first evaluated or compiled (see ``simplescript.core.unboxed``).
+            It is not pickled.
     """
 
+    __slots__ = (
+        "left_node",
+        "op_tok",
+        "right_node",
+        "pos_start",
+        "pos_end",
+        "feedback",
+        "quickened",
+        "unboxed",
+        "__weakref__",
+    )
+
     def __init__(self, left_node, op_tok, right_node) -> None:
         self.left_node = left_node
         self.op_tok = op_tok
         self.right_node = right_node
         self.pos_start = self.left_node.pos_start
         self.pos_end = self.right_node.pos_end
+        self.feedback = None
+        self.quickened = None
+        self.unboxed = None
+
+    def __getstate__(self) -> tuple:
+        return None, {
+            "left_node": self.left_node,
+            "op_tok": self.op_tok,
+            "right_node": self.right_node,
+            "pos_start": self.pos_start,
+            "pos_end": self.pos_end,
+        }
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self.feedback = None
+        self.quickened = None
+        self.unboxed = None
 
     def __repr__(self) -> str:
         return f"({self.left_node}, {self.op_tok}, {self.right_node})"
 
 
+def left_spine(node: BinOpNode) -> list:
+    """Return the chain of BinOpNodes down the left side of a binary operation.
+
+    Left-associative operators parse ``a + b + c + ...`` into a tree that
+    is as deep as the chain is long. Passes over the AST walk this list
+    in a loop instead of recursing into each ``left_node``, so long
+    chains do not hit the Python recursion limit.
+
+    Args:
+        node: A BinOpNode.
+
+    Returns:
+        The BinOpNodes from the innermost one (whose ``left_node`` is the
+        chain's first operand) out to ``node``.
+    """
+    spine = []
+    while type(node) is BinOpNode:
+        spine.append(node)
+        node = node.left_node
+    spine.reverse()
+    return spine
+
+
 class UnaryOpNode:
     """AST node representing a unary operation (e.g., negation).
 
@@ -89,6 +169,8 @@ class UnaryOpNode:
         pos_end (Position): End position (from the operand).
     """
 
+    __slots__ = ("op_tok", "node", "pos_start", "pos_end", "__weakref__")
+
     def __init__(self, op_tok, node) -> None:
         self.op_tok = op_tok
         self.node = node
@@ -107,12 +189,20 @@ class VarAccessNode:
 
     Attributes:
         var_name_tok (Token): The variable name token.
+        depth (int): Number of function scopes between this access and the
+            one defining the variable (set by the resolver).
+        slot (Optional[int]): The variable's slot in that scope's frame, or
+            None for a global variable, looked up by name.
         pos_start (Position): Start position of the identifier.
         pos_end (Position): End position of the identifier.
     """
 
+    __slots__ = ("var_name_tok", "depth", "slot", "pos_start", "pos_end", "__weakref__")
+
     def __init__(self, var_name_tok) -> None:
         self.var_name_tok = var_name_tok
+        self.depth = 0
+        self.slot = None
         self.pos_start = self.var_name_tok.pos_start
         self.pos_end = self.var_name_tok.pos_end
 
@@ -127,13 +217,25 @@ class VarAssignNode:
     Attributes:
         var_name_tok (Token): The variable name token.
         value_node: The value expression AST node.
+        slot (Optional[int]): The variable's slot in the current function's
+            frame, or None for a global variable (set by the resolver).
         pos_start (Position): Start position (from the variable name).
         pos_end (Position): End position (from the value expression).
     """
 
+    __slots__ = (
+        "var_name_tok",
+        "value_node",
+        "slot",
+        "pos_start",
+        "pos_end",
+        "__weakref__",
+    )
+
     def __init__(self, var_name_tok, value_node) -> None:
         self.var_name_tok = var_name_tok
         self.value_node = value_node
+        self.slot = None
         self.pos_start = self.var_name_tok.pos_start
         self.pos_end = self.value_node.pos_end
 
@@ -152,6 +254,8 @@ class IfNode:
         pos_end (Position): End position (from the last branch).
     """
 
+    __slots__ = ("cases", "else_case", "pos_start", "pos_end", "__weakref__")
+
     def __init__(self, cases: list, else_case=None) -> None:
         self.cases = cases
         self.else_case = else_case
@@ -175,10 +279,27 @@ class ForNode:
         end_value_node: End value AST node.
         step_value_node: Step value AST node, or None.
         body_node: Loop body AST node.
+        slot (Optional[int]): The loop variable's frame slot, or None for a
+            global variable (set by the resolver).
+        value_unused (bool): True when the loop's value is discarded, so no
+            list of body results needs to be built (set by the parser).
         pos_start (Position): Start position (from the variable name).
         pos_end (Position): End position (from the body).
     """
 
+    __slots__ = (
+        "var_name_tok",
+        "start_value_node",
+        "end_value_node",
+        "step_value_node",
+        "body_node",
+        "slot",
+        "value_unused",
+        "pos_start",
+        "pos_end",
+        "__weakref__",
+    )
+
     def __init__(
         self, var_name_tok, start_value_node, end_value_node, step_value_node, body_node
     ) -> None:
@@ -187,6 +308,8 @@ class ForNode:
         self.end_value_node = end_value_node
         self.step_value_node = step_value_node
         self.body_node = body_node
+        self.slot = None
+        self.value_unused = False
         self.pos_start = self.var_name_tok.pos_start
         self.pos_end = self.body_node.pos_end
 
@@ -201,13 +324,25 @@ class WhileNode:
     Attributes:
         condition_node: Condition AST node.
         body_node: Loop body AST node.
+        value_unused (bool): True when the loop's value is discarded, so no
+            list of body results needs to be built (set by the parser).
         pos_start (Position): Start position (from the condition).
         pos_end (Position): End position (from the body).
     """
 
+    __slots__ = (
+        "condition_node",
+        "body_node",
+        "value_unused",
+        "pos_start",
+        "pos_end",
+        "__weakref__",
+    )
+
     def __init__(self, condition_node, body_node) -> None:
         self.condition_node = condition_node
         self.body_node = body_node
+        self.value_unused = False
         self.pos_start = self.condition_node.pos_start
         self.pos_end = self.body_node.pos_end
 
@@ -219,19 +354,45 @@ class FuncDefNode:
         var_name_tok: The function name token, or None for anonymous functions.
         arg_name_toks: List of argument identifier tokens.
         body_node: The function body expression node.
+        memoize: True for ``MEMO FUNC``, False for ``NOMEMO FUNC``, or None
+            to memoize the function only if it is pure.
 
     Attributes:
         var_name_tok (Optional[Token]): Function name token, or None.
         arg_name_toks (list[Token]): Argument name tokens.
         body_node: Function body AST node.
+        slot (Optional[int]): Frame slot the function's name is bound to,
+            or None for a global name (set by the resolver).
+        frame_size (int): Number of slots in a call's frame: the arguments,
+            then the other locals of the body (set by the resolver).
+        callees (Optional[tuple[str, ...]]): The global functions a pure
+            body calls, or None if the body is not pure (set by the resolver).
+        memoize (Optional[bool]): The explicit memoization choice, if any.
         pos_start (Position): Start position.
         pos_end (Position): End position (from the body).
     """
 
-    def __init__(self, var_name_tok, arg_name_toks: list, body_node) -> None:
+    __slots__ = (
+        "var_name_tok",
+        "arg_name_toks",
+        "body_node",
+        "slot",
+        "frame_size",
+        "callees",
+        "memoize",
+        "pos_start",
+        "pos_end",
+        "__weakref__",
+    )
+
+    def __init__(self, var_name_tok, arg_name_toks: list, body_node, memoize=None) -> None:
         self.var_name_tok = var_name_tok
         self.arg_name_toks = arg_name_toks
         self.body_node = body_node
+        self.slot = None
+        self.frame_size = len(arg_name_toks)
+        self.callees = None
+        self.memoize = memoize
 
         if self.var_name_tok:
             self.pos_start = self.var_name_tok.pos_start
@@ -255,11 +416,17 @@ class CallNode:
         arg_nodes (list): List of argument AST nodes.
         pos_start (Position): Start position (from the callable).
         pos_end (Position): End position (from the last argument or callable).
+        tail (bool): Whether the call is in tail position in a function
+            body, so its result is the function's result (set by the
+            parser).
     """
 
+    __slots__ = ("node_to_call", "arg_nodes", "pos_start", "pos_end", "tail", "__weakref__")
+
     def __init__(self, node_to_call, arg_nodes: list) -> None:
         self.node_to_call = node_to_call
         self.arg_nodes = arg_nodes
+        self.tail = False
         self.pos_start = self.node_to_call.pos_start
 
         if len(self.arg_nodes) > 0:
@@ -280,6 +447,8 @@ class ListNode:
         pos_end (Position): End position (from the last element).
     """
 
+    __slots__ = ("element_nodes", "pos_start", "pos_end", "__weakref__")
+
     def __init__(self, element_nodes: list) -> None:
         self.element_nodes = element_nodes
         self.pos_start = (
@@ -306,7 +475,31 @@ class MapNode:
         pos_end (Position): End position.
     """
 
+    __slots__ = ("key_value_pairs", "pos_start", "pos_end", "__weakref__")
+
     def __init__(self, key_value_pairs: list, pos_start=None, pos_end=None) -> None:
         self.key_value_pairs = key_value_pairs
         self.pos_start = pos_start
         self.pos_end = pos_end
+
+
+class ProgramNode:
+    """AST node representing a whole program: a sequence of statements.
+
+    Args:
+        statement_nodes: List of top-level statement nodes, in source order.
+        pos_start: Start position of the program.
+        pos_end: End position of the program.
+
+    Attributes:
+        statement_nodes: List of statement AST nodes.
+        pos_start (Position): Start position.
+        pos_end (Position): End position.
+    """
+
+    __slots__ = ("statement_nodes", "pos_start", "pos_end", "__weakref__")
+
+    def __init__(self, statement_nodes: list, pos_start=None, pos_end=None) -> None:
+        self.statement_nodes = statement_nodes
+        self.pos_start = pos_start
+        self.pos_end = pos_end
@@ -0,0 +1,172 @@
+"""On-disk cache of parsed SimpleScript programs.
+
+Works like Python's ``__pycache__``: the parsed (and optimized) program of
+a ``.simc`` file is pickled into a ``__simcache__`` directory next to the
+file, so later runs of an unchanged file skip lexing and parsing.
+
+Each entry records a key made from the source text, the file name used in
+error positions, the SimpleScript version, the cache format and the
+optimizer setting. An entry whose key does not match, or that cannot be
+read, is treated as a miss and rewritten. Like ``__pycache__``, entries
+are trusted: only use the cache on directories you control.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Optional
+from simplescript.__version__ import __version__
+
+CACHE_DIR_NAME: str = "__simcache__"
+"""Name of the cache directory created next to cached source files."""
+
+CACHE_FORMAT: int = 10
+"""Version of the cached data layout; bump when AST classes change."""
+
+DISABLE_ENV_VAR: str = "SIMPLESCRIPT_NO_CACHE"
+"""Environment variable that disables the cache when set to a non-empty value."""
+
+
+class ProgramCache:
+    """Loads and stores parsed programs for source files.
+
+    Args:
+        enabled: Whether the cache is used at all. A disabled cache never
+            reads or writes files and counts no hits or misses.
+        optimize: Whether cached programs were optimized; part of the key.
+
+    Attributes:
+        enabled (bool): Whether the cache is used.
+        optimize (bool): Whether cached programs are optimized.
+        hits (int): Number of programs loaded from the cache.
+        misses (int): Number of programs that had to be parsed.
+
+    Example:
+        >>> cache = ProgramCache()
+        >>> program = cache.load("script.simc", text)
+        >>> if program is None:
+        ...     program = parse_it(text)
+        ...     cache.store("script.simc", text, program)
+    """
+
+    def __init__(self, enabled: bool = True, optimize: bool = True) -> None:
+        self.enabled = enabled
+        self.optimize = optimize
+        self.hits = 0
+        self.misses = 0
+
+    def cache_path(self, source_path: str) -> str:
+        """Return the cache file path for a source file.
+
+        Args:
+            source_path: Path to the source file.
+
+        Returns:
+            The path of the cache entry, e.g.
+            ``dir/__simcache__/script.simc.simplescript-2.1.0.pickle``.
+        """
+        directory, file_name = os.path.split(os.path.abspath(source_path))
+        return os.path.join(
+            directory,
+            CACHE_DIR_NAME,
+            f"{file_name}.simplescript-{__version__}.pickle",
+        )
+
+    def key(self, source_path: str, source: str) -> str:
+        """Compute the validation key for a source file's contents.
+
+        Args:
+            source_path: Path to the source file, as used in error messages.
+            source: The source text.
+
+        Returns:
+            A hex digest identifying this exact source and configuration.
+        """
+        digest = hashlib.sha256()
+        for part in (
+            source_path,
+            __version__,
+            str(CACHE_FORMAT),
+            str(self.optimize),
+            source,
+        ):
+            digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def load(self, source_path: str, source: str) -> Optional[Any]:
+        """Load the cached program for a source file.
+
+        Args:
+            source_path: Path to the source file.
+            source: The current source text.
+
+        Returns:
+            The cached program, or None on a miss (no entry, a stale
+            entry, an unreadable entry, or a disabled cache).
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with open(self.cache_path(source_path), "rb") as f:
+                entry = pickle.load(f)
+        except Exception:
+            entry = None
+
+        if (
+            isinstance(entry, dict)
+            and entry.get("key") == self.key(source_path, source)
+            and "program" in entry
+        ):
+            self.hits += 1
+            return entry["program"]
+
+        self.misses += 1
+        return None
+
+    def store(self, source_path: str, source: str, program: Any) -> bool:
+        """Store the parsed program for a source file.
+
+        The entry is written to a temporary file and moved into place, so
+        concurrent runs never see a partially written entry. Failures (for
+        example, a read-only directory) are ignored.
+
+        Args:
+            source_path: Path to the source file.
+            source: The source text the program was parsed from.
+            program: The parsed program to cache.
+
+        Returns:
+            True if the entry was written.
+        """
+        if not self.enabled:
+            return False
+
+        path = self.cache_path(source_path)
+        entry = {"key": self.key(source_path, source), "program": program}
+        temp_path = None
+        try:
+            data = pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            return True
+        except Exception:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+    def stats_line(self) -> str:
+        """Return a one-line summary of cache hits and misses."""
+        if not self.enabled:
+            return "cache: disabled"
+        return f"cache: {self.hits} hit(s), {self.misses} miss(es)"
+
+
+def cache_disabled_by_env() -> bool:
+    """Check whether the cache is disabled through ``DISABLE_ENV_VAR``."""
+    return bool(os.environ.get(DISABLE_ENV_VAR))
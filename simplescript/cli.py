@@ -5,8 +5,11 @@ capabilities for SimpleScript.
 """
 
 import sys
+from typing import Optional
 import simplescript
 from simplescript.__version__ import __version__
+from simplescript.cache import ProgramCache, DISABLE_ENV_VAR, cache_disabled_by_env
+from simplescript.runtime import parse, execute_iter
 
 
 def repl() -> None:
@@ -35,27 +38,34 @@ def repl() -> None:
             print(result)
 
 
-def run_file(file_path: str) -> None:
+def run_file(file_path: str, cache: Optional[ProgramCache] = None) -> None:
     """Execute a SimpleScript file.
 
-    Reads the file and executes each line sequentially.
+    Parses the whole file once, then executes its statements in order,
+    printing each result as it is produced.
 
     Args:
         file_path: Path to the .simc file to execute.
+        cache: Cache of parsed programs. If given, an unchanged file is
+            loaded from the cache instead of being parsed again.
     """
     try:
         with open(file_path, "r") as f:
-            lines = f.readlines()
+            text = f.read()
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.")
         sys.exit(1)
 
-    for line_num, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line:
-            continue
+    program = cache.load(file_path, text) if cache else None
+    if program is None:
+        program, error = parse(file_path, text)
+        if error:
+            print(error.as_string())
+            sys.exit(1)
+        if cache:
+            cache.store(file_path, text, program)
 
-        result, error = simplescript.run(file_path, line)
+    for result, error in execute_iter(program):
         if error:
             print(error.as_string())
             sys.exit(1)
@@ -71,22 +81,39 @@ def main() -> None:
         simplescript <file.simc>  Execute a SimpleScript file
         simplescript --version    Show version information
         simplescript --help       Show usage information
+
+    File execution also accepts ``--no-cache`` (do not read or write the
+    ``__simcache__`` directory) and ``--cache-stats`` (print cache hits
+    and misses to stderr).
     """
-    if len(sys.argv) == 1:
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args and not cache_disabled_by_env()
+    show_cache_stats = "--cache-stats" in args
+    args = [arg for arg in args if arg not in ("--no-cache", "--cache-stats")]
+
+    if not args:
         repl()
-    elif sys.argv[1] in ("--version", "-v"):
+    elif args[0] in ("--version", "-v"):
         print(f"SimpleScript v{__version__}")
-    elif sys.argv[1] in ("--help", "-h"):
+    elif args[0] in ("--help", "-h"):
         print("Usage: simplescript [options] [file]")
         print()
         print("Options:")
         print("  -h, --help     Show this help message")
         print("  -v, --version  Show version information")
+        print("  --no-cache     Do not use the __simcache__ directory")
+        print("  --cache-stats  Print cache hits and misses to stderr")
         print()
         print("If no file is provided, starts the interactive REPL.")
         print("Supported file extension: .simc")
+        print(f"Set {DISABLE_ENV_VAR}=1 to disable the cache.")
     else:
-        run_file(sys.argv[1])
+        cache = ProgramCache(enabled=use_cache)
+        try:
+            run_file(args[0], cache)
+        finally:
+            if show_cache_stats:
+                print(cache.stats_line(), file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,233 @@
+"""Built-in functions of SimpleScript.
+
+This module implements the functions every program can call without
+defining them, and ``BUILTINS``, the table the runtime makes the parent of
+the global symbol table.
+"""
+
+from typing import Dict, Optional, Tuple
+from simplescript.errors.errors import RTError
+from simplescript.types.base import Value
+from simplescript.types.builtin_function import BuiltInFunction, Caller
+from simplescript.types.function import BaseFunction
+from simplescript.types.list import List
+from simplescript.types.number import Number
+from simplescript.types.number_array import NumberArray, pack
+from simplescript.utils.symbol_table import SymbolTable
+
+
+def builtin_array(
+    args: list, pos_start, pos_end, context, caller: Caller
+) -> Tuple[Optional[Value], Optional[RTError]]:
+    """``ARRAY(list)``: pack a List of Numbers into a NumberArray.
+
+    Args:
+        args: The call's single argument, a List whose elements are all
+            Numbers.
+        pos_start: Start position of the call expression.
+        pos_end: End position of the call expression.
+        context: The context the call is made in.
+        caller: The engine making the call.
+
+    Returns:
+        A tuple of (NumberArray, None), or (None, RTError) if the argument
+        is not a List of Numbers or an integer does not fit in 64 bits.
+    """
+    (value,) = args
+    if not isinstance(value, List) or not all(
+        isinstance(element, Number) for element in value.elements
+    ):
+        return None, RTError(
+            pos_start, pos_end, "ARRAY expects a list of numbers", context
+        )
+    try:
+        values = pack([element.value for element in value.elements])
+    except OverflowError:
+        return None, RTError(pos_start, pos_end, "Array element out of range", context)
+    return NumberArray(values), None
+
+
+def builtin_list(
+    args: list, pos_start, pos_end, context, caller: Caller
+) -> Tuple[Optional[Value], Optional[RTError]]:
+    """``LIST(array)``: unpack a NumberArray into a List of Numbers.
+
+    Args:
+        args: The call's single argument, a NumberArray.
+        pos_start: Start position of the call expression.
+        pos_end: End position of the call expression.
+        context: The context the call is made in.
+        caller: The engine making the call.
+
+    Returns:
+        A tuple of (List, None), or (None, RTError) if the argument is not
+        a NumberArray.
+    """
+    (value,) = args
+    if not isinstance(value, NumberArray):
+        return None, RTError(pos_start, pos_end, "LIST expects an array", context)
+    return List([Number(element) for element in value.values]), None
+
+
+def check_function_and_list(
+    name: str, function: Value, values: Value, pos_start, pos_end, context
+) -> Optional[RTError]:
+    """Check the arguments of a built-in applying a function to a list.
+
+    Args:
+        name: The built-in's name, for the error message.
+        function: The argument that must be a function.
+        values: The argument that must be a List.
+        pos_start: Start position of the call expression.
+        pos_end: End position of the call expression.
+        context: The context the call is made in.
+
+    Returns:
+        None if the arguments are valid, else the RTError to report.
+    """
+    if not isinstance(function, BaseFunction):
+        return RTError(
+            pos_start,
+            pos_end,
+            f"{name} expects a function as its first argument",
+            context,
+        )
+    if not isinstance(values, List):
+        return RTError(
+            pos_start,
+            pos_end,
+            f"{name} expects a list as its second argument",
+            context,
+        )
+    return None
+
+
+def builtin_map(
+    args: list, pos_start, pos_end, context, caller: Caller
+) -> Tuple[Optional[Value], Optional[RTError]]:
+    """``MAP(f, list)``: a List of ``f(x)`` for every element ``x``.
+
+    Args:
+        args: The function and the List.
+        pos_start: Start position of the call expression.
+        pos_end: End position of the call expression.
+        context: The context the call is made in.
+        caller: The engine making the call, which runs ``f``.
+
+    Returns:
+        A tuple of (List, None), or (None, RTError) for invalid arguments
+        or the first call of ``f`` that fails.
+    """
+    function, values = args
+    error = check_function_and_list(
+        "MAP", function, values, pos_start, pos_end, context
+    )
+    if error:
+        return None, error
+    call = caller.calls(function, pos_start, pos_end, context)
+    results = []
+    append = results.append
+    for element in values.elements:
+        res = call([element.copy()])
+        if res.error:
+            return None, res.error
+        append(res.value)
+    return List(results), None
+
+
+def builtin_filter(
+    args: list, pos_start, pos_end, context, caller: Caller
+) -> Tuple[Optional[Value], Optional[RTError]]:
+    """``FILTER(f, list)``: a List of the elements ``x`` where ``f(x)`` is true.
+
+    A call of ``f`` that returns no value counts as false.
+
+    Args:
+        args: The function and the List.
+        pos_start: Start position of the call expression.
+        pos_end: End position of the call expression.
+        context: The context the call is made in.
+        caller: The engine making the call, which runs ``f``.
+
+    Returns:
+        A tuple of (List, None), or (None, RTError) for invalid arguments
+        or the first call of ``f`` that fails.
+    """
+    function, values = args
+    error = check_function_and_list(
+        "FILTER", function, values, pos_start, pos_end, context
+    )
+    if error:
+        return None, error
+    call = caller.calls(function, pos_start, pos_end, context)
+    results = []
+    append = results.append
+    for element in values.elements:
+        res = call([element.copy()])
+        if res.error:
+            return None, res.error
+        if res.value is not None and res.value.is_true():
+            append(element)
+    return List(results), None
+
+
+def builtin_reduce(
+    args: list, pos_start, pos_end, context, caller: Caller
+) -> Tuple[Optional[Value], Optional[RTError]]:
+    """``REDUCE(f, list, init)``: fold ``list`` into ``f(...f(init, x0)..., xn)``.
+
+    Every call of ``f`` must return a value, the next accumulator.
+
+    Args:
+        args: The function, the List and the initial value.
+        pos_start: Start position of the call expression.
+        pos_end: End position of the call expression.
+        context: The context the call is made in.
+        caller: The engine making the call, which runs ``f``.
+
+    Returns:
+        A tuple of (the last result, or ``init`` for an empty list, None),
+        or (None, RTError) for invalid arguments or the first call of
+        ``f`` that fails or returns no value.
+    """
+    function, values, accumulator = args
+    error = check_function_and_list(
+        "REDUCE", function, values, pos_start, pos_end, context
+    )
+    if error:
+        return None, error
+    call = caller.calls(function, pos_start, pos_end, context)
+    for element in values.elements:
+        res = call([accumulator.copy(), element.copy()])
+        if res.error:
+            return None, res.error
+        accumulator = res.value
+        if accumulator is None:
+            return None, RTError(
+                pos_start, pos_end, "REDUCE expects its function to return a value", context
+            )
+    return accumulator, None
+
+
+BUILTINS: Dict[str, BuiltInFunction] = {
+    function.name: function
+    for function in (
+        BuiltInFunction("ARRAY", 1, builtin_array),
+        BuiltInFunction("LIST", 1, builtin_list),
+        BuiltInFunction("MAP", 2, builtin_map),
+        BuiltInFunction("FILTER", 2, builtin_filter),
+        BuiltInFunction("REDUCE", 3, builtin_reduce),
+    )
+}
+"""The built-in functions, keyed by name."""
+
+
+def builtin_symbol_table() -> SymbolTable:
+    """Return a new symbol table holding the built-in functions.
+
+    Returns:
+        A SymbolTable to use as the parent of a global symbol table.
+    """
+    table = SymbolTable()
+    table.symbols.update(BUILTINS)
+    return table
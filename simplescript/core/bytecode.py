@@ -0,0 +1,186 @@
+"""Bytecode definitions for the SimpleScript virtual machine.
+
+This module defines the instruction set executed by the VM and the
+CodeObject container produced by the compiler. Each instruction is a
+``(opcode, argument)`` tuple; the meaning of the argument depends on the
+opcode and is documented next to each opcode constant.
+"""
+
+from typing import Any, List, Tuple
+
+Instruction = Tuple[int, Any]
+"""A single bytecode instruction: ``(opcode, argument)``."""
+
+LOAD_NUMBER: int = 0
+"""Push a numeric literal. Argument: the literal's Constant (see
+``simplescript.core.operands.literal``)."""
+
+LOAD_STRING: int = 1
+"""Push a new String. Argument: ``(value, pos_start, pos_end)``."""
+
+LOAD_VAR: int = 2
+"""Push a copy of a global variable. Argument: ``(name, pos_start, pos_end)``."""
+
+STORE_VAR: int = 3
+"""Bind the top of stack to a global name, leaving it on the stack.
+
+Argument: ``(name, value_node)``. A shared Constant is first replaced, on
+the stack too, by a copy located at ``value_node``.
+"""
+
+BINARY_OP: int = 4
+"""Pop two operands and push the result.
+
+Argument: ``(method_name, fast_op, shared, pos_start, pos_end, node)``
+where ``fast_op`` is a callable applied directly to two raw numeric
+values, ``shared`` is whether its result is boxed with ``Number.of`` (for
+comparisons, AND and OR), and ``node`` is the BinOpNode, whose operands
+locate an error (see ``simplescript.core.operands``).
+"""
+
+UNARY_OP: int = 5
+"""Pop an operand and push the result. Argument: ``(op, node)``."""
+
+JUMP: int = 6
+"""Jump unconditionally. Argument: target instruction index."""
+
+POP_JUMP_IF_FALSE: int = 7
+"""Pop a value and jump if it is not truthy. Argument: target index."""
+
+LOAD_NONE: int = 8
+"""Push None (the value of an IF without a matching branch)."""
+
+FOR_PREP: int = 9
+"""Pop start, end and step values and push a FOR loop state.
+
+The state holds the iterator over the loop's ``loop_values``.
+"""
+
+FOR_ITER: int = 10
+"""Advance the FOR loop state on top of the stack.
+
+Argument: ``(var_name, slot, exit_target, pos_start, pos_end)``. Binds the
+loop variable to the next value (in the frame if ``slot`` is not None,
+else as a global), or jumps to ``exit_target`` once there is none; fails
+at ``pos_start``-``pos_end`` if the step stopped changing the value.
+"""
+
+WHILE_PREP: int = 11
+"""Push a WHILE loop state."""
+
+LOOP_APPEND: int = 12
+"""Pop a body value and append it to the loop state below it."""
+
+LOOP_END: int = 13
+"""Replace the loop state with its List value. Argument: ``(pos_start, pos_end)``."""
+
+MAKE_FUNCTION: int = 14
+"""Push a new Function.
+
+Argument: ``(name, body_node, arg_names, frame_size, pos_start, pos_end,
+bind, slot, callees, memoize)`` where ``bind`` is True for named functions,
+which are stored in frame slot ``slot``, or as a global if it is None, and
+``callees`` and ``memoize`` are those of the FuncDefNode.
+"""
+
+CALL: int = 15
+"""Call a value with arguments. Argument: ``(argc, pos_start, pos_end)``."""
+
+BUILD_LIST: int = 16
+"""Pop ``n`` values into a List. Argument: ``(n, pos_start, pos_end)``."""
+
+BUILD_MAP: int = 17
+"""Pop ``n`` key/value pairs into a Map. Argument: ``(n, pos_start, pos_end)``."""
+
+RETURN: int = 18
+"""Return the top of stack from the current frame."""
+
+LOAD_CALLEE: int = 19
+"""Push a variable that is about to be called, without copying it.
+
+Argument: ``(name, depth, slot, pos_start, pos_end)``; ``slot`` is None
+for a global variable (see LOAD_OUTER).
+"""
+
+POP_TOP: int = 20
+"""Discard the top of stack (the value of a statement that is not last)."""
+
+LOAD_LOCAL: int = 21
+"""Push a copy of a local variable. Argument: ``(name, slot, pos_start, pos_end)``."""
+
+LOAD_OUTER: int = 22
+"""Push a copy of a variable of an enclosing function.
+
+Argument: ``(name, depth, slot, pos_start, pos_end)``, where ``depth`` is
+the number of frame parents to follow from the current frame.
+"""
+
+STORE_LOCAL: int = 23
+"""Store the top of stack in a frame slot, leaving it on the stack.
+
+Argument: ``(slot, value_node)``, with ``value_node`` as for STORE_VAR.
+"""
+
+TAIL_CALL: int = 24
+"""Call a value in tail position. Argument: ``(argc, pos_start, pos_end)``.
+
+Like CALL, but a function's body replaces the current frame's code
+instead of being pushed on top of it, so its RETURN returns straight to
+the current frame's caller.
+"""
+
+EVAL_UNBOXED: int = 25
+"""Evaluate a purely numeric subtree over raw numbers, if possible.
+
+Argument: ``(variables, evaluate, comparison, context_index, pos_start,
+pos_end, end)``, the parts of the subtree's NumericTree (see
+``simplescript.core.unboxed``) with each variable as a ``(name, depth,
+slot)`` tuple. If every variable holds a Number and ``evaluate``
+succeeds, pushes the result and jumps to ``end``, skipping the
+subtree's normal code that follows; otherwise runs that code, which
+reports any error.
+"""
+
+OPCODE_NAMES: dict = {
+    value: name
+    for name, value in list(globals().items())
+    if name.isupper() and isinstance(value, int)
+}
+"""Mapping of opcode values to their names, used for disassembly."""
+
+
+class CodeObject:
+    """A compiled unit of SimpleScript bytecode.
+
+    Code objects are produced by the Compiler for the top-level program
+    and for every function body, and are executed by the VM.
+
+    Args:
+        name: Display name of the compiled unit (e.g., function name).
+        instructions: The list of ``(opcode, argument)`` instructions.
+
+    Attributes:
+        name (str): Display name of the compiled unit.
+        instructions (list[Instruction]): The instruction sequence.
+    """
+
+    def __init__(self, name: str, instructions: List[Instruction]) -> None:
+        self.name = name
+        self.instructions = instructions
+
+    def disassemble(self) -> str:
+        """Render the instructions in a human-readable form.
+
+        Returns:
+            One line per instruction with its index, opcode name and the
+            interesting part of its argument.
+        """
+        lines = []
+        for index, (op, arg) in enumerate(self.instructions):
+            if isinstance(arg, tuple):
+                arg = arg[0]
+            lines.append(f"{index:4} {OPCODE_NAMES[op]:<18} {'' if arg is None else arg}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"<code {self.name}, {len(self.instructions)} instructions>"
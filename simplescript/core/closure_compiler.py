@@ -0,0 +1,650 @@
+"""Closure compiler for the SimpleScript language.
+
+This module provides the ClosureCompiler class, an execution engine that
+turns every AST node into a Python closure once, ahead of evaluation. Each
+closure captures its already-compiled children and its operator, so
+evaluating the tree needs neither the Interpreter's per-node ``getattr``
+dispatch nor its per-node RTResult objects.
+"""
+
+import weakref
+from typing import Any, Callable
+from simplescript.ast.nodes import VarAccessNode, left_spine
+from simplescript.core.compiler import BINARY_OPS, SHARED_RESULT_OPS
+from simplescript.core.constants import TT_KEYWORD, TT_MINUS
+from simplescript.core.context import Context
+from simplescript.core.operands import (
+    binary_result,
+    called_copy,
+    literal,
+    located,
+    operation_error,
+    unary_result,
+)
+from simplescript.core.loops import STALLED_LOOP_DETAILS, loop_values, stalled
+from simplescript.core.unboxed import NumericTree, numeric_tree
+from simplescript.errors.errors import RTError
+from simplescript.types.function import Function, TailCall
+from simplescript.types.builtin_function import BuiltInFunction, Caller
+from simplescript.types.list import List
+from simplescript.types.map import Map
+from simplescript.types.number import Constant, Number
+from simplescript.types.string import String
+from simplescript.utils.rt_result import RTResult
+
+Evaluator = Callable[[Context], Any]
+"""A compiled node: takes the execution context and returns the node's value."""
+
+_function_body_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class ClosureError(Exception):
+    """Carries an RTError out of a tree of compiled closures.
+
+    Args:
+        error: The runtime error being reported.
+
+    Attributes:
+        error (RTError): The runtime error being reported.
+    """
+
+    def __init__(self, error: RTError) -> None:
+        super().__init__(error.details)
+        self.error = error
+
+
+def compile_function_body(body_node) -> Evaluator:
+    """Compile a function body, reusing a previous compilation if possible.
+
+    Compiled bodies are cached per body node, so every Function created
+    from the same FuncDefNode shares one closure tree.
+
+    Args:
+        body_node: The function body AST node.
+
+    Returns:
+        The compiled closure for the function body.
+    """
+    body = _function_body_cache.get(body_node)
+    if body is None:
+        body = ClosureCompiler().compile(body_node)
+        _function_body_cache[body_node] = body
+    return body
+
+
+class ClosureCaller(Caller):
+    """Runs user-defined functions on the closure engine."""
+
+    def run_body(self, func: Function, context: Context) -> RTResult:
+        """Evaluate a function's compiled body in a prepared context."""
+        try:
+            return RTResult().success(compile_function_body(func.body_node)(context))
+        except ClosureError as exc:
+            return RTResult().failure(exc.error)
+
+    def body_runner(self, func: Function) -> Callable[[Context], RTResult]:
+        """Return a callable evaluating a function's body, compiled once."""
+        body = compile_function_body(func.body_node)
+
+        def run_body(context):
+            try:
+                return RTResult().success(body(context))
+            except ClosureError as exc:
+                return RTResult().failure(exc.error)
+
+        return run_body
+
+
+CLOSURE_CALLER = ClosureCaller()
+"""The Caller that compiled call expressions pass to built-ins."""
+
+
+def run_closure(node, context: Context) -> RTResult:
+    """Compile an AST to closures and evaluate it.
+
+    Args:
+        node: The root AST node.
+        context: The execution context.
+
+    Returns:
+        An RTResult containing the computed value or an error.
+    """
+    res = RTResult()
+    evaluate = ClosureCompiler().compile(node)
+    try:
+        return res.success(evaluate(context))
+    except ClosureError as exc:
+        return res.failure(exc.error)
+
+
+class ClosureCompiler:
+    """Compiles an AST into a tree of pre-bound Python closures.
+
+    Uses the same visitor pattern as the Interpreter, but each
+    ``compile_XxxNode`` method runs once per node and returns an evaluator
+    closure; evaluating the program is then a plain call of the root
+    closure. Runtime errors are raised as ClosureError and converted back
+    into an RTResult by ``run_closure``.
+
+    Example:
+        >>> evaluate = ClosureCompiler().compile(ast_root)
+        >>> value = evaluate(context)
+    """
+
+    def compile(self, node) -> Evaluator:
+        """Compile an AST node and its children into an evaluator closure.
+
+        Args:
+            node: The AST node to compile.
+
+        Returns:
+            The evaluator closure for the node.
+
+        Raises:
+            Exception: If no compile method is defined for the node type.
+        """
+        method_name = f"compile_{type(node).__name__}"
+        method = getattr(self, method_name, self.no_compile_method)
+        return method(node)
+
+    def no_compile_method(self, node) -> None:
+        """Handle AST node types with no defined compile method.
+
+        Args:
+            node: The unhandled AST node.
+
+        Raises:
+            Exception: Always, indicating the missing compile method.
+        """
+        raise Exception(f"No compile_{type(node).__name__} method defined")
+
+    def compile_NumberNode(self, node) -> Evaluator:
+        """Compile a numeric literal node to a closure returning its Constant."""
+        constant = literal(node)
+
+        def number(context):
+            return constant
+
+        return number
+
+    def compile_StringNode(self, node) -> Evaluator:
+        """Compile a string literal node."""
+        value, pos_start, pos_end = node.tok.value, node.pos_start, node.pos_end
+
+        def string(context):
+            return String(value).set_context(context).set_pos(pos_start, pos_end)
+
+        return string
+
+    def compile_variable(self, node) -> Evaluator:
+        """Compile a read of a resolved variable, without copying it.
+
+        Args:
+            node: The VarAccessNode naming the variable.
+
+        Returns:
+            An evaluator returning the variable's value, which raises a
+            ClosureError if the variable is not defined.
+        """
+        var_name, depth, slot = node.var_name_tok.value, node.depth, node.slot
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def undefined(context):
+            return ClosureError(
+                RTError(pos_start, pos_end, f"'{var_name}' is not defined", context)
+            )
+
+        if slot is None:
+
+            def variable(context):
+                value = context.symbol_table.symbols.get(var_name)
+                if value is None:
+                    value = context.symbol_table.get(var_name)
+                    if value is None:
+                        raise undefined(context)
+                return value
+
+        elif depth == 0:
+
+            def variable(context):
+                value = context.frame[slot]
+                if value is None:
+                    raise undefined(context)
+                return value
+
+        else:
+
+            def variable(context):
+                frame = context.frame
+                for _ in range(depth):
+                    frame = frame.parent
+                value = frame[slot]
+                if value is None:
+                    raise undefined(context)
+                return value
+
+        return variable
+
+    def compile_VarAccessNode(self, node) -> Evaluator:
+        """Compile a variable access expression."""
+        variable = self.compile_variable(node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def var_access(context):
+            return variable(context).copy().set_pos(pos_start, pos_end)
+
+        return var_access
+
+    def compile_VarAssignNode(self, node) -> Evaluator:
+        """Compile a variable assignment statement."""
+        var_name, slot, value_node = node.var_name_tok.value, node.slot, node.value_node
+        value_fn = self.compile(value_node)
+
+        if slot is None:
+
+            def var_assign(context):
+                value = located(value_fn(context), value_node, context)
+                context.symbol_table.symbols[var_name] = value
+                return value
+
+        else:
+
+            def var_assign(context):
+                value = located(value_fn(context), value_node, context)
+                context.frame[slot] = value
+                return value
+
+        return var_assign
+
+    def compile_BinOpNode(self, node) -> Evaluator:
+        """Compile a binary operation expression.
+
+        The Value method and the raw numeric operator are looked up once
+        here; Number/Number operands take the raw operator directly. A
+        chain of operations such as ``a + b + c`` compiles to one closure
+        that applies them in a loop (see ``compile_chain``). A purely
+        numeric subtree is first tried unboxed (see ``compile_unboxed``).
+        """
+        spine = left_spine(node)
+        general = self.compile_chain(spine) if len(spine) > 1 else self.compile_bin_op(node)
+        tree = node.unboxed
+        if tree is None:
+            tree = node.unboxed = numeric_tree(node) or False
+        if not tree:
+            return general
+        return self.compile_unboxed(node, tree, general)
+
+    def compile_unboxed(self, node, tree: NumericTree, general: Evaluator) -> Evaluator:
+        """Compile a numeric subtree to run over raw numbers.
+
+        The closure reads each variable of the subtree once and, if they
+        are all Numbers, computes the subtree's value without building the
+        intermediate Numbers. Otherwise, or if the computation fails, it
+        runs the subtree's ``general`` closure, which reports any error.
+
+        Args:
+            node: The root of the subtree.
+            tree: The subtree's NumericTree.
+            general: The subtree's closure compiled the normal way.
+        """
+        variables = [self.compile_variable(var_node) for var_node in tree.variables]
+        evaluate, context_index = tree.evaluate, tree.context_index
+        comparison = tree.comparison
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def unboxed(context):
+            values = []
+            try:
+                for variable in variables:
+                    value = variable(context)
+                    if type(value) is not Number and type(value) is not Constant:
+                        return general(context)
+                    values.append(value)
+                raw = evaluate([value.value for value in values])
+            except (ClosureError, ArithmeticError):
+                return general(context)
+            if comparison:
+                return Number.TRUE if raw else Number.FALSE
+            result = Number(raw)
+            result.context = context if context_index is None else values[context_index].context
+            result.pos_start = pos_start
+            result.pos_end = pos_end
+            return result
+
+        return unboxed
+
+    def compile_bin_op(self, node) -> Evaluator:
+        """Compile a single binary operation, whose left operand is not one."""
+        left_fn = self.compile(node.left_node)
+        right_fn = self.compile(node.right_node)
+        op_tok = node.op_tok
+        key = op_tok.value if op_tok.type == TT_KEYWORD else op_tok.type
+        method_name, fast_op = BINARY_OPS[key]
+        shared = key in SHARED_RESULT_OPS
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def bin_op(context):
+            left = left_fn(context)
+            right = right_fn(context)
+            # Follows ``binary_result``, on the raw operator's result.
+            if (type(left) is Number or type(left) is Constant) and (
+                type(right) is Number or type(right) is Constant
+            ):
+                try:
+                    raw = fast_op(left.value, right.value)
+                except ZeroDivisionError:
+                    pass
+                else:
+                    if shared:
+                        result = Number.of(raw)
+                        if type(result) is Constant:
+                            return result
+                    else:
+                        result = Number(raw)
+                        result.context = left.context
+                    if result.context is None:
+                        if type(left) is Constant and type(right) is Constant:
+                            return Constant(raw)
+                        result.context = context
+                    result.pos_start = pos_start
+                    result.pos_end = pos_end
+                    return result
+            result, error = getattr(left, method_name)(right)
+            if error:
+                raise ClosureError(operation_error(node, left, right, error, context))
+            return binary_result(result, node, left, right, context)
+
+        return bin_op
+
+    def compile_chain(self, spine: list) -> Evaluator:
+        """Compile a chain of binary operations into a single closure.
+
+        Nested ``bin_op`` closures would call each other as deep as the
+        chain is long; this one keeps the running result in a loop, so
+        long chains do not hit the Python recursion limit.
+
+        Args:
+            spine: The chain's BinOpNodes, as returned by ``left_spine``.
+        """
+        first_fn = self.compile(spine[0].left_node)
+        steps = []
+        for node in spine:
+            op_tok = node.op_tok
+            key = op_tok.value if op_tok.type == TT_KEYWORD else op_tok.type
+            method_name, fast_op = BINARY_OPS[key]
+            right_fn = self.compile(node.right_node)
+            steps.append(
+                (right_fn, method_name, fast_op, key in SHARED_RESULT_OPS, node)
+            )
+
+        def bin_chain(context):
+            left = first_fn(context)
+            for right_fn, method_name, fast_op, shared, node in steps:
+                right = right_fn(context)
+                # Follows ``binary_result``, on the raw operator's result.
+                if (type(left) is Number or type(left) is Constant) and (
+                    type(right) is Number or type(right) is Constant
+                ):
+                    try:
+                        raw = fast_op(left.value, right.value)
+                    except ZeroDivisionError:
+                        pass
+                    else:
+                        if shared:
+                            result = Number.of(raw)
+                            if type(result) is Constant:
+                                left = result
+                                continue
+                        else:
+                            result = Number(raw)
+                            result.context = left.context
+                        if result.context is None:
+                            if type(left) is Constant and type(right) is Constant:
+                                left = Constant(raw)
+                                continue
+                            result.context = context
+                        result.pos_start = node.pos_start
+                        result.pos_end = node.pos_end
+                        left = result
+                        continue
+                result, error = getattr(left, method_name)(right)
+                if error:
+                    raise ClosureError(
+                        operation_error(node, left, right, error, context)
+                    )
+                left = binary_result(result, node, left, right, context)
+            return left
+
+        return bin_chain
+
+    def compile_UnaryOpNode(self, node) -> Evaluator:
+        """Compile a unary operation expression (negation, NOT)."""
+        operand_fn = self.compile(node.node)
+
+        if node.op_tok.type == TT_MINUS:
+
+            def apply(value):
+                return value.multed_by(Number(-1))
+
+        elif node.op_tok.matches(TT_KEYWORD, "NOT"):
+
+            def apply(value):
+                return value.notted()
+
+        else:
+
+            def apply(value):
+                return value, None
+
+        def unary_op(context):
+            operand = operand_fn(context)
+            value, error = apply(operand)
+            if error:
+                raise ClosureError(error)
+            return unary_result(value, node, operand, context)
+
+        return unary_op
+
+    def compile_IfNode(self, node) -> Evaluator:
+        """Compile an if/elif/else conditional expression."""
+        cases = [
+            (self.compile(condition), self.compile(expr))
+            for condition, expr in node.cases
+        ]
+        else_fn = self.compile(node.else_case) if node.else_case else None
+
+        def if_expr(context):
+            for condition_fn, expr_fn in cases:
+                if condition_fn(context).is_true():
+                    return expr_fn(context)
+            if else_fn is not None:
+                return else_fn(context)
+            return None
+
+        return if_expr
+
+    def compile_ForNode(self, node) -> Evaluator:
+        """Compile a for loop expression.
+
+        A loop whose value is unused compiles to a variant that does not
+        collect the body's results and evaluates to None.
+        """
+        # The loop variable is stored by name in the globals, or by slot
+        # in the frame.
+        slot = node.slot
+        key = node.var_name_tok.value if slot is None else slot
+        start_fn = self.compile(node.start_value_node)
+        end_fn = self.compile(node.end_value_node)
+        step_fn = self.compile(node.step_value_node) if node.step_value_node else None
+        body_fn = self.compile(node.body_node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def for_expr(context):
+            elements = []
+            start_value = start_fn(context)
+            end_value = end_fn(context)
+            step = step_fn(context).value if step_fn is not None else 1
+            symbols = context.symbol_table.symbols if slot is None else context.frame
+
+            values = loop_values(start_value.value, end_value.value, step)
+            for i in values:
+                symbols[key] = Number(i)
+                elements.append(body_fn(context))
+            if stalled(values):
+                raise ClosureError(
+                    RTError(pos_start, pos_end, STALLED_LOOP_DETAILS, context)
+                )
+
+            return List(elements).set_context(context).set_pos(pos_start, pos_end)
+
+        def for_stmt(context):
+            start_value = start_fn(context)
+            end_value = end_fn(context)
+            step = step_fn(context).value if step_fn is not None else 1
+            symbols = context.symbol_table.symbols if slot is None else context.frame
+
+            values = loop_values(start_value.value, end_value.value, step)
+            for i in values:
+                symbols[key] = Number(i)
+                body_fn(context)
+            if stalled(values):
+                raise ClosureError(
+                    RTError(pos_start, pos_end, STALLED_LOOP_DETAILS, context)
+                )
+            return None
+
+        return for_stmt if node.value_unused else for_expr
+
+    def compile_WhileNode(self, node) -> Evaluator:
+        """Compile a while loop expression (see ``compile_ForNode``)."""
+        condition_fn = self.compile(node.condition_node)
+        body_fn = self.compile(node.body_node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def while_expr(context):
+            elements = []
+            while condition_fn(context).is_true():
+                elements.append(body_fn(context))
+            return List(elements).set_context(context).set_pos(pos_start, pos_end)
+
+        def while_stmt(context):
+            while condition_fn(context).is_true():
+                body_fn(context)
+            return None
+
+        return while_stmt if node.value_unused else while_expr
+
+    def compile_FuncDefNode(self, node) -> Evaluator:
+        """Compile a function definition expression.
+
+        The body is compiled eagerly and cached, so calls never need to
+        compile it again.
+        """
+        func_name = node.var_name_tok.value if node.var_name_tok else None
+        body_node = node.body_node
+        arg_names = [arg_name.value for arg_name in node.arg_name_toks]
+        frame_size, slot = node.frame_size, node.slot
+        callees, memoize = node.callees, node.memoize
+        pos_start, pos_end = node.pos_start, node.pos_end
+        compile_function_body(body_node)
+
+        def func_def(context):
+            func_value = (
+                Function(
+                    func_name,
+                    body_node,
+                    arg_names,
+                    frame_size,
+                    context.frame,
+                    callees,
+                    memoize,
+                )
+                .set_context(context)
+                .set_pos(pos_start, pos_end)
+            )
+            if func_name:
+                if slot is None:
+                    context.symbol_table.symbols[func_name] = func_value
+                else:
+                    context.frame[slot] = func_value
+            return func_value
+
+        return func_def
+
+    def compile_CallNode(self, node) -> Evaluator:
+        """Compile a function call expression.
+
+        A callee that is a plain variable is read without the defensive
+        copy made by variable access: the call never exposes it.
+        """
+        callee_node = node.node_to_call
+        arg_fns = [self.compile(arg_node) for arg_node in node.arg_nodes]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        if isinstance(callee_node, VarAccessNode):
+            callee_fn = self.compile_variable(callee_node)
+        else:
+            callee_fn = self.compile(callee_node)
+
+        tail = node.tail
+
+        def call(context):
+            callee = callee_fn(context)
+            args = [arg_fn(context) for arg_fn in arg_fns]
+            if type(callee) is Function:
+                if tail:
+                    return TailCall(callee, args, pos_start, pos_end)
+                result = CLOSURE_CALLER.call(callee, args, pos_start, pos_end, context)
+            elif type(callee) is BuiltInFunction:
+                result = callee.call(args, pos_start, pos_end, context, CLOSURE_CALLER)
+            else:
+                callee = called_copy(callee, pos_start, pos_end, context)
+                result = callee.execute(args)
+            if result.error:
+                raise ClosureError(result.error)
+            return result.value
+
+        return call
+
+    def compile_ListNode(self, node) -> Evaluator:
+        """Compile a list literal node."""
+        element_fns = [self.compile(element) for element in node.element_nodes]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def list_expr(context):
+            elements = [element_fn(context) for element_fn in element_fns]
+            return List(elements).set_pos(pos_start, pos_end)
+
+        return list_expr
+
+    def compile_MapNode(self, node) -> Evaluator:
+        """Compile a map literal node."""
+        pair_fns = [
+            (self.compile(key_node), self.compile(value_node))
+            for key_node, value_node in node.key_value_pairs
+        ]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def map_expr(context):
+            elements = {}
+            for key_fn, value_fn in pair_fns:
+                key = key_fn(context)
+                key_str = key.value if isinstance(key, String) else str(key)
+                elements[key_str] = value_fn(context)
+            return Map(elements).set_pos(pos_start, pos_end)
+
+        return map_expr
+
+    def compile_ProgramNode(self, node) -> Evaluator:
+        """Compile a program into a closure returning its last value."""
+        statement_fns = [
+            self.compile(statement_node) for statement_node in node.statement_nodes
+        ]
+
+        def program(context):
+            value = None
+            for statement_fn in statement_fns:
+                value = statement_fn(context)
+            return value
+
+        return program
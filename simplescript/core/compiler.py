@@ -0,0 +1,418 @@
+"""Bytecode compiler for the SimpleScript language.
+
+This module provides the Compiler class that translates an Abstract
+Syntax Tree (AST) produced by the parser into CodeObjects for the VM.
+"""
+
+import operator
+import weakref
+from typing import List
+from simplescript.core.bytecode import (
+    CodeObject,
+    Instruction,
+    LOAD_NUMBER,
+    LOAD_STRING,
+    LOAD_VAR,
+    STORE_VAR,
+    BINARY_OP,
+    UNARY_OP,
+    JUMP,
+    POP_JUMP_IF_FALSE,
+    LOAD_NONE,
+    FOR_PREP,
+    FOR_ITER,
+    WHILE_PREP,
+    LOOP_APPEND,
+    LOOP_END,
+    MAKE_FUNCTION,
+    CALL,
+    TAIL_CALL,
+    BUILD_LIST,
+    BUILD_MAP,
+    RETURN,
+    LOAD_CALLEE,
+    POP_TOP,
+    LOAD_LOCAL,
+    LOAD_OUTER,
+    STORE_LOCAL,
+    EVAL_UNBOXED,
+)
+from simplescript.ast.nodes import VarAccessNode, left_spine
+from simplescript.types.number import Number
+from simplescript.core.constants import (
+    TT_PLUS,
+    TT_MINUS,
+    TT_MUL,
+    TT_DIV,
+    TT_POW,
+    TT_EE,
+    TT_NE,
+    TT_LT,
+    TT_GT,
+    TT_LTE,
+    TT_GTE,
+    TT_KEYWORD,
+)
+
+BINARY_OPS: dict = {
+    TT_PLUS: ("added_to", operator.add),
+    TT_MINUS: ("subbed_by", operator.sub),
+    TT_MUL: ("multed_by", operator.mul),
+    TT_DIV: ("dived_by", operator.truediv),
+    TT_POW: ("powed_by", operator.pow),
+    TT_EE: ("get_comparison_eq", lambda a, b: int(a == b)),
+    TT_NE: ("get_comparison_ne", lambda a, b: int(a != b)),
+    TT_LT: ("get_comparison_lt", lambda a, b: int(a < b)),
+    TT_GT: ("get_comparison_gt", lambda a, b: int(a > b)),
+    TT_LTE: ("get_comparison_lte", lambda a, b: int(a <= b)),
+    TT_GTE: ("get_comparison_gte", lambda a, b: int(a >= b)),
+    "AND": ("anded_by", lambda a, b: int(a and b)),
+    "OR": ("ored_by", lambda a, b: int(a or b)),
+}
+"""Binary operator table: token type (or keyword) to (Value method, raw op).
+
+The raw op mirrors the corresponding ``Number`` method and is used by the
+VM as a fast path when both operands are Numbers.
+"""
+
+SHARED_RESULT_OPS: frozenset = frozenset(
+    (TT_EE, TT_NE, TT_LT, TT_GT, TT_LTE, TT_GTE, "AND", "OR")
+)
+"""The ``BINARY_OPS`` keys whose ``Number`` method boxes its result with
+``Number.of``, which returns a shared Constant for a small integer."""
+
+_function_code_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def compile_function_body(name: str, body_node) -> CodeObject:
+    """Compile a function body, reusing a previous compilation if possible.
+
+    Compiled bodies are cached per body node, so every Function sharing
+    the same definition shares one CodeObject.
+
+    Args:
+        name: The function name, used as the CodeObject name.
+        body_node: The function body AST node.
+
+    Returns:
+        The CodeObject for the function body.
+    """
+    code = _function_code_cache.get(body_node)
+    if code is None:
+        code = Compiler().compile(body_node, name)
+        _function_code_cache[body_node] = code
+    return code
+
+
+class Compiler:
+    """Compiles an AST into bytecode for the SimpleScript VM.
+
+    Uses the same visitor pattern as the Interpreter: for each AST node
+    type ``XxxNode``, a method ``compile_XxxNode`` emits the instructions
+    that leave the node's value on top of the VM stack.
+
+    Attributes:
+        instructions (list[Instruction]): Instructions emitted so far.
+
+    Example:
+        >>> code = Compiler().compile(ast_root)
+        >>> result = VM().run(code, context)
+    """
+
+    def __init__(self) -> None:
+        self.instructions: List[Instruction] = []
+
+    def compile(self, node, name: str = "<program>") -> CodeObject:
+        """Compile an AST into a CodeObject that returns the node's value.
+
+        Args:
+            node: The root AST node.
+            name: Display name for the resulting CodeObject.
+
+        Returns:
+            The compiled CodeObject.
+        """
+        self.instructions = []
+        self.visit(node)
+        self.emit(RETURN)
+        return CodeObject(name, self.instructions)
+
+    def emit(self, op: int, arg=None) -> int:
+        """Append an instruction.
+
+        Args:
+            op: The opcode.
+            arg: The opcode argument.
+
+        Returns:
+            The index of the emitted instruction.
+        """
+        self.instructions.append((op, arg))
+        return len(self.instructions) - 1
+
+    def patch(self, index: int, arg) -> None:
+        """Replace the argument of a previously emitted instruction.
+
+        Args:
+            index: Index of the instruction to patch.
+            arg: The new argument.
+        """
+        self.instructions[index] = (self.instructions[index][0], arg)
+
+    def visit(self, node) -> None:
+        """Dispatch to the appropriate compile method for the given node.
+
+        Args:
+            node: The AST node to compile.
+
+        Raises:
+            Exception: If no compile method is defined for the node type.
+        """
+        method_name = f"compile_{type(node).__name__}"
+        method = getattr(self, method_name, self.no_compile_method)
+        method(node)
+
+    def no_compile_method(self, node) -> None:
+        """Handle AST node types with no defined compile method.
+
+        Args:
+            node: The unhandled AST node.
+
+        Raises:
+            Exception: Always, indicating the missing compile method.
+        """
+        raise Exception(f"No compile_{type(node).__name__} method defined")
+
+    def compile_NumberNode(self, node) -> None:
+        """Compile a numeric literal node to a load of its Constant."""
+        # Import here to avoid circular import
+        from simplescript.core.operands import literal
+
+        self.emit(LOAD_NUMBER, literal(node))
+
+    def compile_StringNode(self, node) -> None:
+        """Compile a string literal node."""
+        self.emit(LOAD_STRING, (node.tok.value, node.pos_start, node.pos_end))
+
+    def compile_VarAccessNode(self, node) -> None:
+        """Compile a variable access expression."""
+        name = node.var_name_tok.value
+        if node.slot is None:
+            self.emit(LOAD_VAR, (name, node.pos_start, node.pos_end))
+        elif node.depth == 0:
+            self.emit(LOAD_LOCAL, (name, node.slot, node.pos_start, node.pos_end))
+        else:
+            self.emit(
+                LOAD_OUTER, (name, node.depth, node.slot, node.pos_start, node.pos_end)
+            )
+
+    def compile_VarAssignNode(self, node) -> None:
+        """Compile a variable assignment statement."""
+        self.visit(node.value_node)
+        if node.slot is None:
+            self.emit(STORE_VAR, (node.var_name_tok.value, node.value_node))
+        else:
+            self.emit(STORE_LOCAL, (node.slot, node.value_node))
+
+    def compile_BinOpNode(self, node) -> None:
+        """Compile a binary operation expression.
+
+        A chain of operations such as ``a + b + c`` is compiled in a loop
+        along its left spine. A purely numeric subtree is preceded by an
+        EVAL_UNBOXED instruction that skips the code compiled here when it
+        can evaluate the subtree over raw numbers.
+        """
+        # Import here to avoid circular import
+        from simplescript.core.unboxed import numeric_tree
+
+        tree = node.unboxed
+        if tree is None:
+            tree = node.unboxed = numeric_tree(node) or False
+        if tree:
+            unboxed = self.emit(EVAL_UNBOXED)
+        root = node
+
+        spine = left_spine(node)
+        self.visit(spine[0].left_node)
+        for node in spine:
+            self.visit(node.right_node)
+            op_tok = node.op_tok
+            key = op_tok.value if op_tok.type == TT_KEYWORD else op_tok.type
+            method_name, fast_op = BINARY_OPS[key]
+            shared = key in SHARED_RESULT_OPS
+            self.emit(
+                BINARY_OP,
+                (method_name, fast_op, shared, node.pos_start, node.pos_end, node),
+            )
+
+        if tree:
+            variables = tuple(
+                (var_node.var_name_tok.value, var_node.depth, var_node.slot)
+                for var_node in tree.variables
+            )
+            self.patch(
+                unboxed,
+                (
+                    variables,
+                    tree.evaluate,
+                    tree.comparison,
+                    tree.context_index,
+                    root.pos_start,
+                    root.pos_end,
+                    len(self.instructions),
+                ),
+            )
+
+    def compile_UnaryOpNode(self, node) -> None:
+        """Compile a unary operation expression (negation, NOT)."""
+        self.visit(node.node)
+        op_tok = node.op_tok
+        op = op_tok.value if op_tok.type == TT_KEYWORD else op_tok.type
+        self.emit(UNARY_OP, (op, node))
+
+    def compile_IfNode(self, node) -> None:
+        """Compile an if/elif/else conditional expression."""
+        end_jumps = []
+
+        for condition, expr in node.cases:
+            self.visit(condition)
+            skip = self.emit(POP_JUMP_IF_FALSE)
+            self.visit(expr)
+            end_jumps.append(self.emit(JUMP))
+            self.patch(skip, len(self.instructions))
+
+        if node.else_case:
+            self.visit(node.else_case)
+        else:
+            self.emit(LOAD_NONE)
+
+        for index in end_jumps:
+            self.patch(index, len(self.instructions))
+
+    def compile_ForNode(self, node) -> None:
+        """Compile a for loop expression."""
+        self.visit(node.start_value_node)
+        self.visit(node.end_value_node)
+        if node.step_value_node:
+            self.visit(node.step_value_node)
+        else:
+            self.emit(LOAD_NUMBER, Number.of(1))
+
+        self.emit(FOR_PREP)
+        loop_start = self.emit(FOR_ITER)
+        self.visit(node.body_node)
+        self.emit(POP_TOP if node.value_unused else LOOP_APPEND)
+        self.emit(JUMP, loop_start)
+        self.patch(
+            loop_start,
+            (
+                node.var_name_tok.value,
+                node.slot,
+                len(self.instructions),
+                node.pos_start,
+                node.pos_end,
+            ),
+        )
+        self.compile_loop_end(node)
+
+    def compile_WhileNode(self, node) -> None:
+        """Compile a while loop expression."""
+        self.emit(WHILE_PREP)
+        loop_start = len(self.instructions)
+        self.visit(node.condition_node)
+        exit_jump = self.emit(POP_JUMP_IF_FALSE)
+        self.visit(node.body_node)
+        self.emit(POP_TOP if node.value_unused else LOOP_APPEND)
+        self.emit(JUMP, loop_start)
+        self.patch(exit_jump, len(self.instructions))
+        self.compile_loop_end(node)
+
+    def compile_loop_end(self, node) -> None:
+        """Replace the loop state with the loop's value.
+
+        A loop whose value is unused never appended to its list of results,
+        and evaluates to None instead of an empty List.
+        """
+        if node.value_unused:
+            self.emit(POP_TOP)
+            self.emit(LOAD_NONE)
+        else:
+            self.emit(LOOP_END, (node.pos_start, node.pos_end))
+
+    def compile_FuncDefNode(self, node) -> None:
+        """Compile a function definition expression.
+
+        The function body is compiled eagerly into its own CodeObject and
+        cached so that calls never need to compile it again.
+        """
+        func_name = node.var_name_tok.value if node.var_name_tok else None
+        arg_names = [arg_name.value for arg_name in node.arg_name_toks]
+        compile_function_body(func_name or "<anonymous>", node.body_node)
+        self.emit(
+            MAKE_FUNCTION,
+            (
+                func_name,
+                node.body_node,
+                arg_names,
+                node.frame_size,
+                node.pos_start,
+                node.pos_end,
+                node.var_name_tok is not None,
+                node.slot,
+                node.callees,
+                node.memoize,
+            ),
+        )
+
+    def compile_CallNode(self, node) -> None:
+        """Compile a function call expression.
+
+        A callee that is a plain variable is loaded without the defensive
+        copy made by LOAD_VAR: the call never exposes it to other code.
+        """
+        callee = node.node_to_call
+        if isinstance(callee, VarAccessNode):
+            self.emit(
+                LOAD_CALLEE,
+                (
+                    callee.var_name_tok.value,
+                    callee.depth,
+                    callee.slot,
+                    callee.pos_start,
+                    callee.pos_end,
+                ),
+            )
+        else:
+            self.visit(callee)
+        for arg_node in node.arg_nodes:
+            self.visit(arg_node)
+        self.emit(
+            TAIL_CALL if node.tail else CALL,
+            (len(node.arg_nodes), node.pos_start, node.pos_end),
+        )
+
+    def compile_ListNode(self, node) -> None:
+        """Compile a list literal node."""
+        for element_node in node.element_nodes:
+            self.visit(element_node)
+        self.emit(BUILD_LIST, (len(node.element_nodes), node.pos_start, node.pos_end))
+
+    def compile_MapNode(self, node) -> None:
+        """Compile a map literal node."""
+        for key_node, value_node in node.key_value_pairs:
+            self.visit(key_node)
+            self.visit(value_node)
+        self.emit(
+            BUILD_MAP, (len(node.key_value_pairs), node.pos_start, node.pos_end)
+        )
+
+    def compile_ProgramNode(self, node) -> None:
+        """Compile a program, keeping only the last statement's value."""
+        if not node.statement_nodes:
+            self.emit(LOAD_NONE)
+            return
+
+        for index, statement_node in enumerate(node.statement_nodes):
+            if index:
+                self.emit(POP_TOP)
+            self.visit(statement_node)
@@ -95,6 +95,9 @@ TT_RBRACE: str = "RBRACE"
 TT_COLON: str = "COLON"
 """Colon token for map key-value pairs."""
 
+TT_NEWLINE: str = "NEWLINE"
+"""Statement separator token (a newline or ';')."""
+
 KEYWORDS: list[str] = [
     "SHOW",
     "VAR",
@@ -110,5 +113,7 @@ KEYWORDS: list[str] = [
     "STEP",
     "WHILE",
     "FUNC",
+    "MEMO",
+    "NOMEMO",
 ]
 """List of reserved keywords in SimpleScript."""
@@ -13,8 +13,9 @@ class Context:
     """Represents an execution context in the SimpleScript runtime.
 
     Contexts form a chain that tracks the call stack during execution.
-    Each context has its own symbol table for variable scoping and
-    references to its parent context for traceback generation.
+    Each context gives access to the global variables and, inside a
+    function call, to the call's frame of local variables, and references
+    its parent context for traceback generation.
 
     Args:
         display_name: Human-readable name for this context (e.g., function name).
@@ -25,9 +26,14 @@ class Context:
         display_name (str): Name of this context for display in tracebacks.
         parent (Optional[Context]): Parent context in the call chain.
         parent_entry_pos (Optional[Position]): Position where parent entered this context.
-        symbol_table (Optional[SymbolTable]): Variable symbol table for this scope.
+        symbol_table (Optional[SymbolTable]): Symbol table of the global
+            variables, shared by every context of a program.
+        frame (Optional[Frame]): Local variables of the function call this
+            context runs, or None at top level.
     """
 
+    __slots__ = ("display_name", "parent", "parent_entry_pos", "symbol_table", "frame")
+
     def __init__(
         self,
         display_name: str,
@@ -38,3 +44,4 @@ class Context:
         self.parent = parent
         self.parent_entry_pos = parent_entry_pos
         self.symbol_table = None
+        self.frame = None
@@ -0,0 +1,335 @@
+"""Exception-based evaluation mode of the Interpreter.
+
+The Interpreter's visitors each return an RTResult, and every visitor
+checks the RTResult of every child it visits, so a successful evaluation
+of a node costs an RTResult, a ``register`` and an ``if res.error`` per
+child. The Evaluator walks the tree the same way with ``eval_XxxNode``
+methods that return plain values; a runtime error is raised as an
+EvaluationError carrying the RTError, and passes through the visitors
+without any checks until ``visit`` turns it back into an RTResult. Errors
+are rare, so the success path, which is almost every node, does less work.
+"""
+
+from simplescript.types.list import List
+from simplescript.types.map import Map
+from simplescript.utils.rt_result import RTResult
+from simplescript.types.number import Number
+from simplescript.core.interpreter import Interpreter
+from simplescript.core.operands import called_copy, literal, located
+from simplescript.core.loops import STALLED_LOOP_DETAILS, loop_values, stalled
+from simplescript.types.function import Function, TailCall
+from simplescript.types.builtin_function import BuiltInFunction
+from simplescript.types.string import String
+from simplescript.errors.errors import RTError
+from simplescript.core.context import Context
+from simplescript.ast.nodes import BinOpNode, VarAccessNode, left_spine
+
+
+class EvaluationError(Exception):
+    """Carries an RTError out of the Evaluator's visitors.
+
+    Args:
+        error: The runtime error being reported.
+
+    Attributes:
+        error (RTError): The runtime error being reported.
+    """
+
+    def __init__(self, error: RTError) -> None:
+        super().__init__(error.details)
+        self.error = error
+
+
+class Evaluator(Interpreter):
+    """Evaluates an AST like the Interpreter, raising runtime errors.
+
+    For each AST node type ``XxxNode``, a method ``eval_XxxNode`` returns
+    the node's value, or raises EvaluationError. The values, errors,
+    quickening and unboxed evaluation are those of the Interpreter, whose
+    helpers it shares; ``visit`` keeps the Interpreter's interface and
+    returns an RTResult.
+
+    Example:
+        >>> evaluator = Evaluator()
+        >>> context = Context('<program>')
+        >>> result = evaluator.visit(ast_root, context)
+    """
+
+    def visit(self, node, context: Context) -> RTResult:
+        """Evaluate a node and wrap its value or error in an RTResult.
+
+        Args:
+            node: The AST node to evaluate.
+            context: The current execution context.
+
+        Returns:
+            An RTResult containing the computed value or an error.
+        """
+        try:
+            return RTResult().success(self.evaluate(node, context))
+        except EvaluationError as exc:
+            return RTResult().failure(exc.error)
+
+    def evaluate(self, node, context: Context):
+        """Dispatch to the appropriate ``eval_`` method for the given node.
+
+        Args:
+            node: The AST node to evaluate.
+            context: The current execution context.
+
+        Returns:
+            The node's value.
+
+        Raises:
+            EvaluationError: If the evaluation fails.
+            Exception: If no ``eval_`` method is defined for the node type.
+        """
+        method_name = f"eval_{type(node).__name__}"
+        method = getattr(self, method_name, self.no_eval_method)
+        return method(node, context)
+
+    def no_eval_method(self, node, context: Context) -> None:
+        """Handle AST node types with no ``eval_`` method.
+
+        Args:
+            node: The unhandled AST node.
+            context: The current execution context.
+
+        Raises:
+            Exception: Always, indicating the missing method.
+        """
+        raise Exception(f"No eval_{type(node).__name__} method defined")
+
+    def eval_NumberNode(self, node, context: Context):
+        """Evaluate a numeric literal node to its cached Constant."""
+        return literal(node)
+
+    def eval_StringNode(self, node, context: Context):
+        """Evaluate a string literal node."""
+        return (
+            String(node.tok.value)
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
+    def eval_VarAccessNode(self, node, context: Context):
+        """Evaluate a variable access expression.
+
+        Raises:
+            EvaluationError: If the variable is not defined.
+        """
+        value = self.lookup(node, context)
+        if not value:
+            raise EvaluationError(self.undefined_error(node, context))
+        return value.copy().set_pos(node.pos_start, node.pos_end)
+
+    def eval_VarAssignNode(self, node, context: Context):
+        """Evaluate a variable assignment statement to the assigned value."""
+        value = self.evaluate(node.value_node, context)
+        value = located(value, node.value_node, context)
+        if node.slot is None:
+            context.symbol_table.set(node.var_name_tok.value, value)
+        else:
+            context.frame[node.slot] = value
+        return value
+
+    def eval_BinOpNode(self, node, context: Context):
+        """Evaluate a binary operation expression.
+
+        Follows ``Interpreter.visit_BinOpNode``: a numeric subtree is tried
+        unboxed, then a chain of operations is evaluated along its left
+        spine with ``bin_op_value``.
+
+        Raises:
+            EvaluationError: If an operand or the operation fails.
+        """
+        value = self.evaluate_unboxed(node, context)
+        if value is not None:
+            return value
+
+        evaluate = self.evaluate
+        spine = left_spine(node) if type(node.left_node) is BinOpNode else (node,)
+        left = evaluate(spine[0].left_node, context)
+        for node in spine:
+            right = evaluate(node.right_node, context)
+            left, error = self.bin_op_value(node, left, right, context)
+            if error:
+                raise EvaluationError(error)
+        return left
+
+    def eval_UnaryOpNode(self, node, context: Context):
+        """Evaluate a unary operation expression (negation, NOT).
+
+        Raises:
+            EvaluationError: If the operand or the operation fails.
+        """
+        operand = self.evaluate(node.node, context)
+        value, error = self.unary_op_value(node, operand, context)
+        if error:
+            raise EvaluationError(error)
+        return value
+
+    def eval_IfNode(self, node, context: Context):
+        """Evaluate an if/elif/else expression to its matched branch's value.
+
+        Returns None if no branch matches and there is no else clause.
+        """
+        evaluate = self.evaluate
+        for condition, expr in node.cases:
+            if evaluate(condition, context).is_true():
+                return evaluate(expr, context)
+
+        if node.else_case:
+            return evaluate(node.else_case, context)
+        return None
+
+    def eval_ForNode(self, node, context: Context):
+        """Evaluate a for loop expression.
+
+        Returns the List of the body's values, or None if the loop's value
+        is unused.
+
+        Raises:
+            EvaluationError: If a bound or the body fails, or the loop
+                stalls.
+        """
+        elements = None if node.value_unused else []
+
+        start_value = self.evaluate(node.start_value_node, context)
+        end_value = self.evaluate(node.end_value_node, context)
+        if node.step_value_node:
+            step_value = self.evaluate(node.step_value_node, context)
+        else:
+            step_value = Number.of(1)
+
+        values = loop_values(start_value.value, end_value.value, step_value.value)
+        if node.slot is None:
+            variables, key = context.symbol_table.symbols, node.var_name_tok.value
+        else:
+            variables, key = context.frame, node.slot
+        body_node = node.body_node
+        eval_body = getattr(self, f"eval_{type(body_node).__name__}", self.no_eval_method)
+
+        if elements is None:
+            for i in values:
+                variables[key] = Number.of(i)
+                eval_body(body_node, context)
+        else:
+            append = elements.append
+            for i in values:
+                variables[key] = Number.of(i)
+                append(eval_body(body_node, context))
+
+        if stalled(values):
+            raise EvaluationError(
+                RTError(node.pos_start, node.pos_end, STALLED_LOOP_DETAILS, context)
+            )
+        if elements is None:
+            return None
+        return List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+    def eval_WhileNode(self, node, context: Context):
+        """Evaluate a while loop expression.
+
+        Returns the List of the body's values, or None if the loop's value
+        is unused.
+        """
+        evaluate = self.evaluate
+        condition_node, body_node = node.condition_node, node.body_node
+        elements = None if node.value_unused else []
+
+        while evaluate(condition_node, context).is_true():
+            value = evaluate(body_node, context)
+            if elements is not None:
+                elements.append(value)
+
+        if elements is None:
+            return None
+        return List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+    def eval_FuncDefNode(self, node, context: Context):
+        """Evaluate a function definition expression to its Function."""
+        return self.visit_FuncDefNode(node, context).value
+
+    def eval_CallNode(self, node, context: Context):
+        """Evaluate a function call expression.
+
+        Like ``Interpreter.visit_CallNode``, a tail call evaluates to a
+        TailCall, made by the enclosing ``call``.
+
+        Raises:
+            EvaluationError: If the callee or an argument fails, or the call
+                does.
+        """
+        callee_node = node.node_to_call
+        if type(callee_node) is VarAccessNode:
+            value_to_call = self.lookup(callee_node, context)
+            if not value_to_call:
+                raise EvaluationError(self.undefined_error(callee_node, context))
+        else:
+            value_to_call = self.evaluate(callee_node, context)
+
+        args = []
+        for arg_node in node.arg_nodes:
+            args.append(self.evaluate(arg_node, context))
+
+        if type(value_to_call) is Function:
+            if node.tail:
+                return TailCall(value_to_call, args, node.pos_start, node.pos_end)
+            res = self.call(value_to_call, args, node.pos_start, node.pos_end, context)
+        elif type(value_to_call) is BuiltInFunction:
+            res = value_to_call.call(args, node.pos_start, node.pos_end, context, self)
+        else:
+            value_to_call = called_copy(
+                value_to_call, node.pos_start, node.pos_end, context
+            )
+            res = value_to_call.execute(args)
+        if res.error:
+            raise EvaluationError(res.error)
+        return res.value
+
+    def run_body(self, func: Function, context: Context) -> RTResult:
+        """Evaluate a function's body in a context prepared for the call.
+
+        Args:
+            func: The function whose body to evaluate.
+            context: The call's context, whose frame holds the arguments.
+
+        Returns:
+            The RTResult of the body, whose value may be a TailCall.
+        """
+        try:
+            return RTResult().success(self.evaluate(func.body_node, context))
+        except EvaluationError as exc:
+            return RTResult().failure(exc.error)
+
+    def eval_ListNode(self, node, context: Context):
+        """Evaluate a list literal node."""
+        elements = []
+        for element_node in node.element_nodes:
+            elements.append(self.evaluate(element_node, context))
+        return List(elements).set_pos(node.pos_start, node.pos_end)
+
+    def eval_MapNode(self, node, context: Context):
+        """Evaluate a map literal node."""
+        evaluate = self.evaluate
+        elements = {}
+
+        for key_node, value_node in node.key_value_pairs:
+            key = evaluate(key_node, context)
+            # Convert key to string for dictionary storage
+            key_str = key.value if isinstance(key, String) else str(key)
+            elements[key_str] = evaluate(value_node, context)
+
+        return Map(elements).set_pos(node.pos_start, node.pos_end)
+
+    def eval_ProgramNode(self, node, context: Context):
+        """Evaluate a program's statements to the last one's value.
+
+        Returns None for an empty program.
+        """
+        evaluate = self.evaluate
+        value = None
+        for statement_node in node.statement_nodes:
+            value = evaluate(statement_node, context)
+        return value
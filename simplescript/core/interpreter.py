@@ -7,33 +7,36 @@ Syntax Tree (AST) produced by the parser, producing runtime values.
 from simplescript.types.list import List
 from simplescript.types.map import Map
 from simplescript.utils.rt_result import RTResult
-from simplescript.core.constants import (
-    TT_PLUS,
-    TT_MINUS,
-    TT_MUL,
-    TT_DIV,
-    TT_POW,
-    TT_EE,
-    TT_NE,
-    TT_LT,
-    TT_GT,
-    TT_LTE,
-    TT_GTE,
-    TT_KEYWORD,
+from simplescript.core.constants import TT_MINUS, TT_KEYWORD
+from simplescript.types.number import Constant, Number
+from simplescript.core.compiler import BINARY_OPS
+from simplescript.core.operands import (
+    binary_result,
+    called_copy,
+    literal,
+    located,
+    operation_error,
+    unary_result,
 )
-from simplescript.types.number import Number
-from simplescript.types.function import Function
+from simplescript.core.loops import STALLED_LOOP_DETAILS, loop_values, stalled
+from simplescript.core import quickening
+from simplescript.core.quickening import MAX_DEOPTIMIZATIONS, QUICKEN_THRESHOLD
+from simplescript.core.unboxed import numeric_tree
+from simplescript.types.function import Function, TailCall
+from simplescript.types.builtin_function import BuiltInFunction, Caller
 from simplescript.types.string import String
 from simplescript.errors.errors import RTError
 from simplescript.core.context import Context
+from simplescript.ast.nodes import BinOpNode, VarAccessNode, left_spine
 
 
-class Interpreter:
+class Interpreter(Caller):
     """Evaluates an AST by walking the tree and computing runtime values.
 
     Uses the visitor pattern: for each AST node type ``XxxNode``, a method
     ``visit_XxxNode`` is called. Each visitor method returns an RTResult
-    containing the computed value or an error.
+    containing the computed value or an error. As a Caller, it runs the
+    functions that built-ins call.
 
     Example:
         >>> interpreter = Interpreter()
@@ -73,6 +76,11 @@ class Interpreter:
     def visit_NumberNode(self, node, context: Context) -> RTResult:
         """Evaluate a numeric literal node.
 
+        The value is the literal's Constant (see ``operands.literal``),
+        which every engine shares. Like other shared Constants it has no
+        position or context, and is located only where it is stored or
+        reports an error.
+
         Args:
             node: The NumberNode to evaluate.
             context: The current execution context.
@@ -80,11 +88,7 @@ class Interpreter:
         Returns:
             An RTResult containing the Number value.
         """
-        return RTResult().success(
-            Number(node.tok.value)
-            .set_context(context)
-            .set_pos(node.pos_start, node.pos_end)
-        )
+        return RTResult().success(literal(node))
 
     def visit_StringNode(self, node, context: Context) -> RTResult:
         """Evaluate a string literal node.
@@ -114,22 +118,49 @@ class Interpreter:
             if the variable is not defined.
         """
         res = RTResult()
-        var_name = node.var_name_tok.value
-        value = context.symbol_table.get(var_name)
-
+        value = self.lookup(node, context)
         if not value:
-            return res.failure(
-                RTError(
-                    node.pos_start,
-                    node.pos_end,
-                    f"'{var_name}' is not defined",
-                    context,
-                )
-            )
+            return res.failure(self.undefined_error(node, context))
 
         value = value.copy().set_pos(node.pos_start, node.pos_end)
         return res.success(value)
 
+    def lookup(self, node, context: Context):
+        """Read the variable a VarAccessNode names, without copying it.
+
+        Args:
+            node: The VarAccessNode naming the variable.
+            context: The current execution context.
+
+        Returns:
+            The variable's value, or None if it is not defined.
+        """
+        if node.slot is None:
+            return context.symbol_table.get(node.var_name_tok.value)
+        frame = context.frame
+        depth = node.depth
+        while depth:
+            frame = frame.parent
+            depth -= 1
+        return frame[node.slot]
+
+    def undefined_error(self, node, context: Context) -> RTError:
+        """Build the error reported for a variable that is not defined.
+
+        Args:
+            node: The VarAccessNode naming the variable.
+            context: The current execution context.
+
+        Returns:
+            The RTError spanning ``node``.
+        """
+        return RTError(
+            node.pos_start,
+            node.pos_end,
+            f"'{node.var_name_tok.value}' is not defined",
+            context,
+        )
+
     def visit_VarAssignNode(self, node, context: Context) -> RTResult:
         """Evaluate a variable assignment statement.
 
@@ -147,14 +178,23 @@ class Interpreter:
         if res.error:
             return res
 
-        context.symbol_table.set(var_name, value)
+        # A variable outlives the expression, so a shared Constant such as
+        # Number.TRUE is stored located where it was computed.
+        value = located(value, node.value_node, context)
+        if node.slot is None:
+            context.symbol_table.set(var_name, value)
+        else:
+            context.frame[node.slot] = value
         return res.success(value)
 
     def visit_BinOpNode(self, node, context: Context) -> RTResult:
         """Evaluate a binary operation expression.
 
         Handles arithmetic (+, -, ``*``, /, ^), comparison (==, !=, <, >, <=, >=),
-        and logical (AND, OR) operations.
+        and logical (AND, OR) operations. A chain of operations such as
+        ``a + b + c`` is evaluated in a loop along its left spine, each
+        operation by ``bin_op_value``. A purely numeric subtree is first
+        tried unboxed (see ``evaluate_unboxed``).
 
         Args:
             node: The BinOpNode to evaluate.
@@ -163,46 +203,142 @@ class Interpreter:
         Returns:
             An RTResult containing the operation result, or an error.
         """
+        value = self.evaluate_unboxed(node, context)
+        if value is not None:
+            return RTResult().success(value)
+
         res = RTResult()
-        left = res.register(self.visit(node.left_node, context))
-        if res.error:
-            return res
-        right = res.register(self.visit(node.right_node, context))
+        spine = left_spine(node) if type(node.left_node) is BinOpNode else (node,)
+        left = res.register(self.visit(spine[0].left_node, context))
         if res.error:
             return res
 
-        result, error = None, None
-        if node.op_tok.type == TT_PLUS:
-            result, error = left.added_to(right)
-        elif node.op_tok.type == TT_MINUS:
-            result, error = left.subbed_by(right)
-        elif node.op_tok.type == TT_MUL:
-            result, error = left.multed_by(right)
-        elif node.op_tok.type == TT_DIV:
-            result, error = left.dived_by(right)
-        elif node.op_tok.type == TT_POW:
-            result, error = left.powed_by(right)
-        elif node.op_tok.type == TT_EE:
-            result, error = left.get_comparison_eq(right)
-        elif node.op_tok.type == TT_NE:
-            result, error = left.get_comparison_ne(right)
-        elif node.op_tok.type == TT_LT:
-            result, error = left.get_comparison_lt(right)
-        elif node.op_tok.type == TT_GT:
-            result, error = left.get_comparison_gt(right)
-        elif node.op_tok.type == TT_LTE:
-            result, error = left.get_comparison_lte(right)
-        elif node.op_tok.type == TT_GTE:
-            result, error = left.get_comparison_gte(right)
-        elif node.op_tok.matches(TT_KEYWORD, "AND"):
-            result, error = left.anded_by(right)
-        elif node.op_tok.matches(TT_KEYWORD, "OR"):
-            result, error = left.ored_by(right)
+        for node in spine:
+            right = res.register(self.visit(node.right_node, context))
+            if res.error:
+                return res
+            left, error = self.bin_op_value(node, left, right, context)
+            if error:
+                return res.failure(error)
+        return res.success(left)
 
-        if error:
-            return res.failure(error)
+    def evaluate_unboxed(self, node: BinOpNode, context: Context):
+        """Evaluate a numeric subtree over raw numbers.
+
+        The node's NumericTree is built on its first evaluation. Reads each
+        variable of the subtree once and, if they are all Numbers, computes
+        the subtree's value without building the intermediate Numbers; the
+        result is the Number the normal evaluation would give, with the
+        same position and context.
+
+        Args:
+            node: The BinOpNode, which may be the root of a numeric subtree.
+            context: The current execution context.
+
+        Returns:
+            The result, or None if the node is not the root of a numeric
+            subtree, a variable is not a Number or the computation fails,
+            in which case the caller evaluates the subtree normally to
+            report the error.
+        """
+        tree = node.unboxed
+        if tree is None:
+            tree = node.unboxed = numeric_tree(node) or False
+        if not tree:
+            return None
+
+        values = []
+        for var_node in tree.variables:
+            value = self.lookup(var_node, context)
+            if type(value) is not Number and type(value) is not Constant:
+                return None
+            values.append(value)
+        try:
+            raw = tree.evaluate([value.value for value in values])
+        except ArithmeticError:
+            return None
+
+        if tree.comparison:
+            return Number.TRUE if raw else Number.FALSE
+        result = Number(raw)
+        result.pos_start = node.pos_start
+        result.pos_end = node.pos_end
+        if tree.context_index is None:
+            result.context = context
+        else:
+            result.context = values[tree.context_index].context
+        return result
+
+    def bin_op_value(self, node: BinOpNode, left, right, context: Context) -> tuple:
+        """Apply a BinOpNode's operator to its evaluated operands.
+
+        A node quickened for the types of its operands runs its
+        specialized evaluator; any other goes through ``binary_op``. The
+        result and the error are placed as ``binary_result`` and
+        ``operation_error`` place them.
+
+        Args:
+            node: The BinOpNode being evaluated.
+            left: The left operand value.
+            right: The right operand value.
+            context: The current execution context.
+
+        Returns:
+            A tuple of (the result, or None; the error, or None).
+        """
+        quickened = node.quickened
+        if (
+            quickened is not None
+            and type(left) in quickened[0]
+            and type(right) in quickened[1]
+        ):
+            result, error = quickened[2](left, right)
         else:
-            return res.success(result.set_pos(node.pos_start, node.pos_end))
+            result, error = self.binary_op(node, left, right)
+
+        if error:
+            return None, operation_error(node, left, right, error, context)
+        # What ``binary_result`` does for most results, inlined.
+        if type(result) is Constant or result.context is None:
+            return binary_result(result, node, left, right, context), None
+        return result.set_pos(node.pos_start, node.pos_end), None
+
+    def binary_op(self, node: BinOpNode, left, right) -> tuple:
+        """Apply a BinOpNode's operator through its Value method.
+
+        Records the operand types in the node's feedback, deoptimizing the
+        node if it was quickened for other types, and quickens it once it
+        has seen the same types ``QUICKEN_THRESHOLD`` times in a row.
+
+        Args:
+            node: The BinOpNode being evaluated.
+            left: The left operand value.
+            right: The right operand value.
+
+        Returns:
+            The operation's ``(result, error)`` tuple.
+        """
+        op_tok = node.op_tok
+        op_key = op_tok.value if op_tok.type == TT_KEYWORD else op_tok.type
+        feedback = node.feedback
+        if feedback is None:
+            feedback = node.feedback = [None, None, 0, 0]
+        if node.quickened is not None:
+            node.quickened = None
+            feedback[3] += 1
+            quickening.stats.deoptimized += 1
+
+        if feedback[3] < MAX_DEOPTIMIZATIONS:
+            left_type, right_type = type(left), type(right)
+            if feedback[0] is left_type and feedback[1] is right_type:
+                feedback[2] += 1
+                if feedback[2] >= QUICKEN_THRESHOLD:
+                    node.quickened = quickening.specialize(op_key, left_type, right_type)
+                    quickening.stats.quickened += 1
+            else:
+                feedback[0], feedback[1], feedback[2] = left_type, right_type, 1
+
+        return getattr(left, BINARY_OPS[op_key][0])(right)
 
     def visit_UnaryOpNode(self, node, context: Context) -> RTResult:
         """Evaluate a unary operation expression (negation, NOT).
@@ -215,20 +351,36 @@ class Interpreter:
             An RTResult containing the operation result, or an error.
         """
         res = RTResult()
-        number = res.register(self.visit(node.node, context))
+        operand = res.register(self.visit(node.node, context))
         if res.error:
             return res
 
-        error = None
+        value, error = self.unary_op_value(node, operand, context)
+        if error:
+            return res.failure(error)
+        return res.success(value)
+
+    def unary_op_value(self, node, operand, context: Context) -> tuple:
+        """Apply a UnaryOpNode's operator to its evaluated operand.
+
+        Args:
+            node: The UnaryOpNode being evaluated.
+            operand: The operand value.
+            context: The current execution context.
+
+        Returns:
+            A tuple of (the result, placed as ``unary_result`` places it,
+            or None; the error, or None).
+        """
+        value, error = operand, None
         if node.op_tok.type == TT_MINUS:
-            number, error = number.multed_by(Number(-1))
-        elif node.op_tok.type.matches(TT_KEYWORD, "NOT"):
-            number, error = number.notted()
+            value, error = operand.multed_by(Number.of(-1))
+        elif node.op_tok.matches(TT_KEYWORD, "NOT"):
+            value, error = operand.notted()
 
         if error:
-            return res.failure(error)
-        else:
-            return res.success(number.set_pos(node.pos_start, node.pos_end))
+            return None, error
+        return unary_result(value, node, operand, context), None
 
     def visit_IfNode(self, node, context: Context) -> RTResult:
         """Evaluate an if/elif/else conditional expression.
@@ -265,15 +417,20 @@ class Interpreter:
     def visit_ForNode(self, node, context: Context) -> RTResult:
         """Evaluate a for loop expression.
 
+        The loop variable's values come from ``loop_values`` (a ``range``
+        for integer loops) and are stored straight into the variable's
+        frame slot or global entry; the body's visitor is looked up once.
+
         Args:
             node: The ForNode to evaluate.
             context: The current execution context.
 
         Returns:
-            An RTResult containing the List value on completion, or an error.
+            An RTResult containing the List value on completion (None if the
+            loop's value is unused), or an error.
         """
         res = RTResult()
-        elements = []
+        elements = None if node.value_unused else []
 
         start_value = res.register(self.visit(node.start_value_node, context))
         if res.error:
@@ -288,28 +445,30 @@ class Interpreter:
             if res.error:
                 return res
         else:
-            step_value = Number(1)
-
-        i = start_value.value
-
-        if step_value.value >= 0:
-
-            def condition():
-                return i < end_value.value
+            step_value = Number.of(1)
 
+        values = loop_values(start_value.value, end_value.value, step_value.value)
+        if node.slot is None:
+            variables, key = context.symbol_table.symbols, node.var_name_tok.value
         else:
+            variables, key = context.frame, node.slot
+        body_node = node.body_node
+        visit_body = getattr(self, f"visit_{type(body_node).__name__}", self.no_visit_method)
 
-            def condition():
-                return i > end_value.value
-
-        while condition():
-            context.symbol_table.set(node.var_name_tok.value, Number(i))
-            i += step_value.value
-
-            elements.append(res.register(self.visit(node.body_node, context)))
+        for i in values:
+            variables[key] = Number.of(i)
+            value = res.register(visit_body(body_node, context))
             if res.error:
                 return res
+            if elements is not None:
+                elements.append(value)
 
+        if stalled(values):
+            return res.failure(
+                RTError(node.pos_start, node.pos_end, STALLED_LOOP_DETAILS, context)
+            )
+        if elements is None:
+            return res.success(None)
         return res.success(
             List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
         )
@@ -322,10 +481,11 @@ class Interpreter:
             context: The current execution context.
 
         Returns:
-            An RTResult containing the List value on completion, or an error.
+            An RTResult containing the List value on completion (None if the
+            loop's value is unused), or an error.
         """
         res = RTResult()
-        elements = []
+        elements = None if node.value_unused else []
 
         while True:
             condition = res.register(self.visit(node.condition_node, context))
@@ -335,10 +495,14 @@ class Interpreter:
             if not condition.is_true():
                 break
 
-            elements.append(res.register(self.visit(node.body_node, context)))
+            value = res.register(self.visit(node.body_node, context))
             if res.error:
                 return res
+            if elements is not None:
+                elements.append(value)
 
+        if elements is None:
+            return res.success(None)
         return res.success(
             List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
         )
@@ -362,13 +526,24 @@ class Interpreter:
         body_node = node.body_node
         arg_names = [arg_name.value for arg_name in node.arg_name_toks]
         func_value = (
-            Function(func_name, body_node, arg_names)
+            Function(
+                func_name,
+                body_node,
+                arg_names,
+                node.frame_size,
+                context.frame,
+                node.callees,
+                node.memoize,
+            )
             .set_context(context)
             .set_pos(node.pos_start, node.pos_end)
         )
 
         if node.var_name_tok:
-            context.symbol_table.set(func_name, func_value)
+            if node.slot is None:
+                context.symbol_table.set(func_name, func_value)
+            else:
+                context.frame[node.slot] = func_value
 
         return res.success(func_value)
 
@@ -376,7 +551,10 @@ class Interpreter:
         """Evaluate a function call expression.
 
         Resolves the callable, evaluates all arguments, and executes
-        the function.
+        the function. A callee that is a plain variable is read without
+        the copy made by variable access, since the call never exposes it,
+        and user-defined functions are called directly with ``call``
+        rather than through a located copy's ``execute``.
 
         Args:
             node: The CallNode to evaluate.
@@ -388,21 +566,53 @@ class Interpreter:
         res = RTResult()
         args = []
 
-        value_to_call = res.register(self.visit(node.node_to_call, context))
-        if res.error:
-            return res
-        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
+        callee_node = node.node_to_call
+        if type(callee_node) is VarAccessNode:
+            value_to_call = self.lookup(callee_node, context)
+            if not value_to_call:
+                return res.failure(self.undefined_error(callee_node, context))
+        else:
+            value_to_call = res.register(self.visit(callee_node, context))
+            if res.error:
+                return res
 
         for arg_node in node.arg_nodes:
             args.append(res.register(self.visit(arg_node, context)))
             if res.error:
                 return res
 
+        if type(value_to_call) is Function:
+            if node.tail:
+                return res.success(
+                    TailCall(value_to_call, args, node.pos_start, node.pos_end)
+                )
+            return self.call(value_to_call, args, node.pos_start, node.pos_end, context)
+
+        if type(value_to_call) is BuiltInFunction:
+            return value_to_call.call(
+                args, node.pos_start, node.pos_end, context, self
+            )
+
+        value_to_call = called_copy(
+            value_to_call, node.pos_start, node.pos_end, context
+        )
         return_value = res.register(value_to_call.execute(args))
         if res.error:
             return res
         return res.success(return_value)
 
+    def run_body(self, func: Function, context: Context) -> RTResult:
+        """Evaluate a function's body in a context prepared for the call.
+
+        Args:
+            func: The function whose body to evaluate.
+            context: The call's context, whose frame holds the arguments.
+
+        Returns:
+            The RTResult of the body, whose value may be a TailCall.
+        """
+        return self.visit(func.body_node, context)
+
     def visit_ListNode(self, node, context: Context) -> RTResult:
         """Evaluate a list literal node.
 
@@ -454,3 +664,24 @@ class Interpreter:
             elements[key_str] = value
 
         return res.success(Map(elements).set_pos(node.pos_start, node.pos_end))
+
+    def visit_ProgramNode(self, node, context: Context) -> RTResult:
+        """Evaluate a program's statements in order.
+
+        Args:
+            node: The ProgramNode to evaluate.
+            context: The current execution context.
+
+        Returns:
+            An RTResult containing the value of the last statement (None
+            for an empty program), or the first error.
+        """
+        res = RTResult()
+        value = None
+
+        for statement_node in node.statement_nodes:
+            value = res.register(self.visit(statement_node, context))
+            if res.error:
+                return res
+
+        return res.success(value)
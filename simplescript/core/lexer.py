@@ -4,8 +4,10 @@ This module provides the Lexer class that converts raw source code text
 into a sequence of tokens for the parser to consume.
 """
 
+import re
 from typing import List, Tuple, Optional
 from simplescript.tokens.position import Position
+from simplescript.tokens.source import Source
 from simplescript.tokens.token import Token
 from simplescript.core.constants import (
     DIGITS,
@@ -38,16 +40,83 @@ from simplescript.core.constants import (
     TT_LBRACE,
     TT_RBRACE,
     TT_COLON,
+    TT_NEWLINE,
 )
 from simplescript.errors.errors import IllegalCharError, ExpectedCharError, Error
 
+OPERATOR_TOKENS: dict = {
+    "->": TT_ARROW,
+    "==": TT_EE,
+    "!=": TT_NE,
+    "<=": TT_LTE,
+    ">=": TT_GTE,
+    "+": TT_PLUS,
+    "-": TT_MINUS,
+    "*": TT_MUL,
+    "/": TT_DIV,
+    "^": TT_POW,
+    "(": TT_LPAREN,
+    ")": TT_RPAREN,
+    "[": TT_LSQUARE,
+    "]": TT_RSQUARE,
+    "{": TT_LBRACE,
+    "}": TT_RBRACE,
+    ":": TT_COLON,
+    ",": TT_COMMA,
+    "=": TT_EQ,
+    "<": TT_LT,
+    ">": TT_GT,
+}
+"""Operator and punctuation lexemes mapped to their token types."""
+
+OPENING_BRACKETS: str = "([{"
+CLOSING_BRACKETS: str = ")]}"
+
+ESCAPE_CHARACTERS: dict = {"n": "\n", "t": "\t"}
+"""Escape sequences with a special meaning; any other escaped character
+stands for itself."""
+
+_digits = re.escape(DIGITS)
+_letters = re.escape(LETTERS)
+
+TOKEN_REGEX = re.compile(
+    rf"""
+    [ \t\r]*
+    (?:
+        (?P<IDENTIFIER>[{_letters}_][{_letters}{_digits}_]*)
+        | (?P<OPERATOR>{"|".join(re.escape(op) for op in OPERATOR_TOKENS)})
+        | (?P<NUMBER>[{_digits}]+(?:\.[{_digits}]*)?)
+        | (?P<NEWLINE>[\n;])
+        | (?P<STRING>["'])
+    )?
+    """,
+    re.VERBOSE,
+)
+"""Master pattern matching leading blanks and one whole token at a time.
+
+The pattern always matches; when no token group matched, the scanner has
+reached the end of the text or a character that cannot start a token.
+Two-character operators come before their one-character prefixes so the
+longest operator wins.
+"""
+
+STRING_BODY_REGEX: dict = {
+    quote: re.compile(rf"(?:[^{quote}\\]|\\.)*", re.DOTALL) for quote in "\"'"
+}
+"""Patterns matching the body of a string up to its closing quote."""
+
+ESCAPE_REGEX = re.compile(r"\\(.)", re.DOTALL)
+
+KEYWORD_SET: frozenset = frozenset(KEYWORDS)
+
 
 class Lexer:
     """Converts source code text into a sequence of tokens.
 
-    The lexer performs lexical analysis by scanning through the input text
-    character by character, grouping characters into meaningful tokens such
-    as numbers, strings, identifiers, keywords, and operators.
+    The lexer performs lexical analysis by matching whole tokens at a time
+    against a compiled master regular expression (``TOKEN_REGEX``) and
+    dispatching on the matched group, grouping characters into meaningful
+    tokens such as numbers, strings, identifiers, keywords, and operators.
 
     Args:
         f_name: The source file name (used for error reporting).
@@ -56,8 +125,7 @@ class Lexer:
     Attributes:
         f_name (str): Source file name.
         text (str): Source code text.
-        pos (Position): Current position in the source text.
-        current_char (Optional[str]): Character at the current position.
+        source (Source): The shared source every token points into.
 
     Example:
         >>> lexer = Lexer('<stdin>', 'VAR x = 10 + 5')
@@ -67,16 +135,7 @@ class Lexer:
     def __init__(self, f_name: str, text: str) -> None:
         self.f_name = f_name
         self.text = text
-        self.pos = Position(-1, 0, -1, f_name, text)
-        self.current_char: Optional[str] = None
-        self.advance()
-
-    def advance(self) -> None:
-        """Advance the position to the next character in the source text."""
-        self.pos.advance(self.current_char)
-        self.current_char = (
-            self.text[self.pos.index] if self.pos.index < len(self.text) else None
-        )
+        self.source = Source(f_name, text)
 
     def make_tokens(self) -> Tuple[List[Token], Optional[Error]]:
         """Tokenize the entire source text.
@@ -84,254 +143,134 @@ class Lexer:
         Scans through the input text and produces a list of tokens.
         The list always ends with an EOF token on success.
 
+        Newlines and ``;`` produce NEWLINE tokens that separate statements.
+        Newlines inside parentheses, brackets or braces are skipped, so a
+        bracketed expression can span several lines.
+
+        Tokens only record offsets into the lexer's shared ``source``;
+        line and column numbers are worked out from it when needed.
+
         Returns:
             A tuple of (tokens, error). On success, error is None.
             On failure, tokens is an empty list and error describes
             the problem.
         """
-        tokens: List[Token] = []
-        while self.current_char is not None:
-            if self.current_char in " \t":
-                self.advance()
-            elif self.current_char in DIGITS:
-                tokens.append(self.make_number())
-            elif self.current_char in LETTERS + "_":
-                tokens.append(self.make_identifier())
-            elif self.current_char == '"' or self.current_char == "'":
-                tokens.append(self.make_string())
-            elif self.current_char == "+":
-                tokens.append(Token(TT_PLUS, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "-":
-                token, error = self.make_minus_or_arrow()
-                if error:
-                    return [], error
-                tokens.append(token)
-            elif self.current_char == "*":
-                tokens.append(Token(TT_MUL, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "/":
-                tokens.append(Token(TT_DIV, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "^":
-                tokens.append(Token(TT_POW, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "(":
-                tokens.append(Token(TT_LPAREN, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == ")":
-                tokens.append(Token(TT_RPAREN, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "[":
-                tokens.append(Token(TT_LSQUARE, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "]":
-                tokens.append(Token(TT_RSQUARE, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "{":
-                tokens.append(Token(TT_LBRACE, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "}":
-                tokens.append(Token(TT_RBRACE, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == ":":
-                tokens.append(Token(TT_COLON, pos_start=self.pos))
-                self.advance()
-            elif self.current_char == "!":
-                token, error = self.make_not_equals()
-                if error:
-                    return [], error
-                tokens.append(token)
-            elif self.current_char == "=":
-                token, error = self.make_equals()
-                if error:
-                    return [], error
-                tokens.append(token)
-            elif self.current_char == "<":
-                token, error = self.make_less_than()
-                if error:
-                    return [], error
-                tokens.append(token)
-            elif self.current_char == ">":
-                token, error = self.make_greater_than()
-                if error:
-                    return [], error
-                tokens.append(token)
-            elif self.current_char == ",":
-                tokens.append(Token(TT_COMMA, pos_start=self.pos))
-                self.advance()
-            else:
-                pos_start = self.pos.copy()
-                char = self.current_char
-                self.advance()
-                return [], IllegalCharError(pos_start, self.pos, "'" + char + "'")
-
-        tokens.append(Token(TT_EOF, pos_start=self.pos))
-        return tokens, None
-
-    def make_identifier(self) -> Token:
-        """Tokenize an identifier or keyword.
-
-        Reads a sequence of letters, digits, and underscores, then checks
-        if the result matches a reserved keyword.
-
-        Returns:
-            A KEYWORD token if the identifier matches a keyword,
-            otherwise an IDENTIFIER token.
-        """
-        identifier_str = ""
-        pos_start = self.pos.copy()
+        text = self.text
+        source = self.source
+        length = len(text)
+        match = TOKEN_REGEX.match
+        operators = OPERATOR_TOKENS
+        keywords = KEYWORD_SET
+        new_token = Token.from_offsets
 
-        while (
-            self.current_char is not None
-            and self.current_char in LETTERS + DIGITS + "_"
-        ):
-            identifier_str += self.current_char
-            self.advance()
-
-        identifier_str = identifier_str.upper()
-        tok_type = TT_KEYWORD if identifier_str in KEYWORDS else TT_IDENTIFIER
-        return Token(tok_type, identifier_str, pos_start, self.pos)
-
-    def make_string(self) -> Token:
-        """Tokenize a string literal with escape character support.
-
-        Supports both single and double quoted strings. Handles escape
-        sequences: ``\\n`` (newline), ``\\t`` (tab), ``\\\\`` (backslash),
-        ``\\"`` (double quote), ``\\'`` (single quote).
-
-        Returns:
-            A STRING token containing the processed string value.
-        """
-        string = ""
-        pos_start = self.pos.copy()
-        escape_character = False
-        quote_char = self.current_char
-        self.advance()
-
-        escape_characters = {
-            "n": "\n",
-            "t": "\t",
-        }
-
-        while self.current_char is not None and (
-            self.current_char != quote_char or escape_character
-        ):
-            if escape_character:
-                string += escape_characters.get(self.current_char, self.current_char)
-                escape_character = False
-            else:
-                if self.current_char == "\\":
-                    escape_character = True
+        tokens: List[Token] = []
+        append = tokens.append
+        bracket_depth = 0
+        index = 0
+
+        while True:
+            m = match(text, index)
+            kind = m.lastgroup
+            if kind is None:
+                index = m.end()
+                if index < length:
+                    return [], self.char_error(index)
+                break
+
+            index = m.start(kind)
+            end = m.end()
+
+            if kind == "IDENTIFIER":
+                value = m.group(kind).upper()
+                append(
+                    new_token(
+                        TT_KEYWORD if value in keywords else TT_IDENTIFIER,
+                        value,
+                        source,
+                        index,
+                        end,
+                    )
+                )
+
+            elif kind == "OPERATOR":
+                lexeme = m.group(kind)
+                if lexeme in OPENING_BRACKETS:
+                    bracket_depth += 1
+                elif lexeme in CLOSING_BRACKETS:
+                    bracket_depth = max(bracket_depth - 1, 0)
+                append(new_token(operators[lexeme], None, source, index, end))
+
+            elif kind == "NUMBER":
+                num_str = m.group(kind)
+                if "." in num_str:
+                    append(new_token(TT_FLOAT, float(num_str), source, index, end))
                 else:
-                    string += self.current_char
-            self.advance()
-
-        self.advance()
-        return Token(TT_STRING, string, pos_start, self.pos)
+                    append(new_token(TT_INT, int(num_str), source, index, end))
 
-    def make_not_equals(self) -> Tuple[Optional[Token], Optional[Error]]:
-        """Tokenize the not-equals operator (!=).
+            elif kind == "NEWLINE":
+                if bracket_depth == 0 or text[index] == ";":
+                    append(new_token(TT_NEWLINE, None, source, index, end))
 
-        Returns:
-            A tuple of (NE token, None) on success, or (None, error)
-            if '=' does not follow '!'.
-        """
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "=":
-            self.advance()
-            return Token(TT_NE, pos_start=pos_start, pos_end=self.pos), None
-
-        self.advance()
-        return None, ExpectedCharError(pos_start, self.pos, "'=' (after '!')")
-
-    def make_equals(self) -> Tuple[Token, None]:
-        """Tokenize the assignment (=) or equality (==) operator.
-
-        Returns:
-            A tuple of (EQ or EE token, None).
-        """
-        tok_type = TT_EQ
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "=":
-            self.advance()
-            tok_type = TT_EE
-
-        return Token(tok_type, pos_start=pos_start, pos_end=self.pos), None
-
-    def make_less_than(self) -> Tuple[Token, None]:
-        """Tokenize the less-than (<) or less-than-or-equal (<=) operator.
-
-        Returns:
-            A tuple of (LT or LTE token, None).
-        """
-        token_type = TT_LT
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "=":
-            self.advance()
-            token_type = TT_LTE
-
-        return Token(token_type, pos_start=pos_start, pos_end=self.pos), None
+            else:
+                value, end = self.scan_string(index)
+                append(new_token(TT_STRING, value, source, index, end))
+                if end > length:
+                    # Unterminated string: the EOF token goes past the end.
+                    index = end
+                    break
 
-    def make_greater_than(self) -> Tuple[Token, None]:
-        """Tokenize the greater-than (>) or greater-than-or-equal (>=) operator.
+            index = end
 
-        Returns:
-            A tuple of (GT or GTE token, None).
-        """
-        token_type = TT_GT
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "=":
-            self.advance()
-            token_type = TT_GTE
+        append(new_token(TT_EOF, None, source, index, index + 1))
+        return tokens, None
 
-        return Token(token_type, pos_start=pos_start, pos_end=self.pos), None
+    def scan_string(self, index: int) -> Tuple[str, int]:
+        """Scan a string literal with escape character support.
 
-    def make_number(self) -> Token:
-        """Tokenize a numeric literal (integer or float).
+        Supports both single and double quoted strings. Handles escape
+        sequences: ``\\n`` (newline), ``\\t`` (tab), and a backslash
+        before any other character (e.g. ``\\\\``, ``\\"``, ``\\'``)
+        stands for that character. An unterminated string runs to the end
+        of the text.
 
-        Reads digits and at most one decimal point. If no decimal point
-        is found, produces an INT token; otherwise a FLOAT token.
+        Args:
+            index: Offset of the opening quote.
 
         Returns:
-            An INT or FLOAT token with the parsed numeric value.
+            A tuple of (string value, offset just past the literal). For an
+            unterminated string the offset is one past the end of the text.
         """
-        num_str = ""
-        decimal_count = 0
-        pos_start = self.pos.copy()
-
-        while self.current_char is not None and self.current_char in DIGITS + ".":
-            if self.current_char == ".":
-                if decimal_count == 1:
-                    break
-                decimal_count += 1
-            num_str += self.current_char
-            self.advance()
-
-        if decimal_count == 0:
-            return Token(TT_INT, int(num_str), pos_start, self.pos)
-        return Token(TT_FLOAT, float(num_str), pos_start, self.pos)
-
-    def make_minus_or_arrow(self) -> Tuple[Token, None]:
-        """Tokenize a minus (-) or arrow (->) operator.
+        text = self.text
+        body_start = index + 1
+        body_end = STRING_BODY_REGEX[text[index]].match(text, body_start).end()
+        body = text[body_start:body_end]
+        if "\\" in body:
+            body = ESCAPE_REGEX.sub(
+                lambda m: ESCAPE_CHARACTERS.get(m.group(1), m.group(1)), body
+            )
+
+        # The body stops before the closing quote, or before a backslash
+        # that is the very last character (an escape of nothing).
+        if body_end < len(text) and text[body_end] != "\\":
+            return body, body_end + 1
+        return body, len(text) + 1
+
+    def char_error(self, index: int) -> Error:
+        """Build the error for a character that cannot start a token.
+
+        Args:
+            index: Offset of the offending character.
 
         Returns:
-            A tuple of (MINUS or ARROW token, None).
+            An ExpectedCharError for a ``!`` not followed by ``=``,
+            otherwise an IllegalCharError.
         """
-        tok_type = TT_MINUS
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == ">":
-            self.advance()
-            tok_type = TT_ARROW
-
-        return Token(tok_type, pos_start=pos_start, pos_end=self.pos), None
+        char = self.text[index]
+        pos_start = Position(self.source, index)
+        if char == "!":
+            return ExpectedCharError(
+                pos_start, Position(self.source, index + 2), "'=' (after '!')"
+            )
+        return IllegalCharError(
+            pos_start, Position(self.source, index + 1), "'" + char + "'"
+        )
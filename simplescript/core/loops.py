@@ -0,0 +1,84 @@
+"""Iteration of FOR loops, shared by the execution engines.
+
+This module provides ``loop_values``, which turns the start, end and step
+of a ``FOR`` loop into the sequence of values its variable takes, and the
+FloatSteps iterator used when those are not all integers.
+"""
+
+from typing import Any, Iterator, Union
+
+STALLED_LOOP_DETAILS: str = "Loop STEP is too small to change the loop variable"
+"""Error details for a FOR loop whose variable would stop advancing."""
+
+
+class FloatSteps:
+    """The values of a FOR loop whose bounds or step are not all integers.
+
+    Yields ``start``, ``start + step``, ... while they are below ``end``
+    (above it, for a negative step), adding the step each time as the
+    loop always has. A step that no longer changes the value, because it
+    is zero or too small for the value's float precision, would repeat
+    the same value forever: the iterator stops instead and sets
+    ``stalled``, so the engine can report an error.
+
+    Args:
+        start: The first value.
+        end: The bound the values stay below (or above).
+        step: The amount added per iteration.
+
+    Attributes:
+        stalled (bool): Whether the iteration stopped because the step
+            stopped changing the value.
+
+    Example:
+        >>> list(FloatSteps(0, 1, 0.25))
+        [0, 0.25, 0.5, 0.75]
+    """
+
+    __slots__ = ("value", "end", "step", "ascending", "stalled")
+
+    def __init__(self, start: Any, end: Any, step: Any) -> None:
+        self.value = start
+        self.end = end
+        self.step = step
+        self.ascending = step >= 0
+        self.stalled = False
+
+    def __iter__(self) -> "FloatSteps":
+        return self
+
+    def __next__(self) -> Any:
+        value = self.value
+        if not (value < self.end if self.ascending else value > self.end):
+            raise StopIteration
+        next_value = value + self.step
+        if next_value == value:
+            self.stalled = True
+            raise StopIteration
+        self.value = next_value
+        return value
+
+
+def loop_values(start: Any, end: Any, step: Any) -> Union[range, FloatSteps]:
+    """Return the values the variable of a FOR loop takes.
+
+    Loops over integers with a non-zero step become a ``range``, which
+    iterates in C; any other loop gets a FloatSteps iterator.
+
+    Args:
+        start: The loop's start value (a Number's ``value``).
+        end: The loop's end value, which is never reached.
+        step: The loop's step.
+
+    Returns:
+        An iterable of the values; check ``stalled`` afterwards if it is
+        a FloatSteps.
+    """
+    if type(start) is int and type(end) is int and type(step) is int and step:
+        return range(start, end, step)
+    return FloatSteps(start, end, step)
+
+
+def stalled(values: Union[range, FloatSteps, Iterator]) -> bool:
+    """Return whether iterating ``loop_values`` stopped on a stalled step."""
+    return type(values) is FloatSteps and values.stalled
@@ -0,0 +1,155 @@
+"""Literals and shared Constants, handled alike by the execution engines.
+
+Numeric literals, the small-integer cache and ``Number.TRUE`` /
+``Number.FALSE`` are Constants: values shared between evaluations, with
+no position or context of their own (see ``Constant``). Every engine
+evaluates a NumberNode to the same Constant (see ``literal``), and gives a
+Constant a position and a context only where the Interpreter does: where
+it is stored in a variable, called, or reports an error. An operation on
+Constants gives a Constant, as the literal the Optimizer folds it into
+would be. The functions here implement those rules, so that the engines,
+with or without the Optimizer, report the same errors.
+"""
+
+from simplescript.core.compiler import BINARY_OPS
+from simplescript.core.constants import TT_KEYWORD
+from simplescript.core.context import Context
+from simplescript.errors.errors import RTError
+from simplescript.types.number import Constant
+
+
+def literal(node) -> Constant:
+    """Return the value of a numeric literal.
+
+    The value is a Constant built on first use and kept on the node (see
+    ``NumberNode.constant``), which every evaluation of the node shares.
+
+    Args:
+        node: The NumberNode.
+
+    Returns:
+        The node's Constant.
+    """
+    constant = node.constant
+    if constant is None:
+        constant = node.constant = Constant(node.tok.value)
+    return constant
+
+
+def located(value, node, context: Context):
+    """Give a shared Constant the position of the node it came from.
+
+    Args:
+        value: A value evaluated from ``node``.
+        node: The AST node the value was evaluated from.
+        context: The current execution context.
+
+    Returns:
+        ``value`` itself if it has a position, otherwise a copy spanning
+        ``node``, in ``context``.
+    """
+    if type(value) is Constant and value.pos_start is None:
+        return value.located(node.pos_start, node.pos_end, context)
+    return value
+
+
+def binary_result(result, node, left, right, context: Context):
+    """Place the result of a binary operation at its node.
+
+    A shared Constant result, such as ``Number.TRUE``, is returned as it
+    is. So is, as a new Constant, the result of an operation on two
+    Constants: it stands for the literal that the Optimizer folds the
+    operation into. Any other result takes the node's position, and the
+    current context if it has none because its left operand was a literal.
+
+    Args:
+        result: The value the operation returned.
+        node: The BinOpNode.
+        left: The left operand.
+        right: The right operand.
+        context: The current execution context.
+
+    Returns:
+        The result to use.
+    """
+    if type(result) is Constant and result.pos_start is None:
+        return result
+    if type(left) is Constant and type(right) is Constant:
+        return Constant(result.value)
+    return _placed(result, node, context)
+
+
+def unary_result(result, node, operand, context: Context):
+    """Place the result of a unary operation at its node.
+
+    Follows ``binary_result``, for an operation with one operand.
+
+    Args:
+        result: The value the operation returned.
+        node: The UnaryOpNode.
+        operand: The operand.
+        context: The current execution context.
+
+    Returns:
+        The result to use.
+    """
+    if type(result) is Constant and result.pos_start is None:
+        return result
+    if type(operand) is Constant:
+        return Constant(result.value)
+    return _placed(result, node, context)
+
+
+def _placed(result, node, context: Context):
+    """Give an operation's result the node's position, and a context."""
+    result = result.set_pos(node.pos_start, node.pos_end)
+    if result.context is None:
+        result.context = context
+    return result
+
+
+def operation_error(node, left, right, error: RTError, context: Context) -> RTError:
+    """Return the error a binary operation reports.
+
+    An operand that is a shared Constant has no position or context, so
+    the error the operation returned for it cannot be shown; the operation
+    is then redone on copies located where the operands were evaluated.
+
+    Args:
+        node: The BinOpNode.
+        left: The left operand.
+        right: The right operand.
+        error: The error the operation returned.
+        context: The current execution context.
+
+    Returns:
+        The error to report.
+    """
+    if left.pos_start is not None and right.pos_start is not None:
+        return error
+    op_tok = node.op_tok
+    key = op_tok.value if op_tok.type == TT_KEYWORD else op_tok.type
+    method_name, _ = BINARY_OPS[key]
+    left = located(left, node.left_node, context)
+    right = located(right, node.right_node, context)
+    return getattr(left, method_name)(right)[1]
+
+
+def called_copy(value, pos_start, pos_end, context: Context):
+    """Return the copy of a called value that is not a function.
+
+    The copy spans the call, so that ``execute`` reports the value as not
+    callable there; a shared Constant also takes the calling context.
+
+    Args:
+        value: The value called.
+        pos_start: Start position of the call expression.
+        pos_end: End position of the call expression.
+        context: The context the call is made in.
+
+    Returns:
+        The located copy.
+    """
+    if type(value) is Constant and value.pos_start is None:
+        return value.located(pos_start, pos_end, context)
+    return value.copy().set_pos(pos_start, pos_end)
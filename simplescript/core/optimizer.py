@@ -0,0 +1,404 @@
+"""AST optimization pass for SimpleScript.
+
+This module provides the Optimizer class that rewrites the AST produced by
+the parser before it is executed. It folds operations on literals into a
+single literal and removes arithmetic identities such as ``x * 1``.
+
+Every rewrite preserves observable behaviour: a folded or simplified node
+keeps the source span of the node it replaces, so values and error
+messages point at the same text, and operations that would fail (division
+by zero, illegal operations) are left in place to fail at runtime.
+"""
+
+import copy
+from typing import Optional
+from simplescript.ast.nodes import (
+    NumberNode,
+    StringNode,
+    BinOpNode,
+    UnaryOpNode,
+    left_spine,
+)
+from simplescript.core.compiler import BINARY_OPS
+from simplescript.core.constants import (
+    TT_INT,
+    TT_FLOAT,
+    TT_STRING,
+    TT_PLUS,
+    TT_MINUS,
+    TT_MUL,
+    TT_DIV,
+    TT_POW,
+    TT_KEYWORD,
+)
+from simplescript.tokens.token import Token
+from simplescript.types.number import Number
+from simplescript.types.string import String
+
+MAX_FOLDED_STRING_LENGTH: int = 4096
+"""Longest string a fold may produce; longer results are built at runtime."""
+
+MAX_FOLDED_INT_BITS: int = 4096
+"""Largest integer (in bits) a power fold may produce."""
+
+_INT = "int"
+_FLOAT = "float"
+
+
+class Optimizer:
+    """Folds constant expressions and removes arithmetic identities.
+
+    Uses the visitor pattern: for each AST node type ``XxxNode``, a method
+    ``optimize_XxxNode`` optimizes the node's children and returns the
+    (possibly new) node that replaces it. Leaf nodes without a dedicated
+    method are returned unchanged.
+
+    Attributes:
+        folded (int): Number of operations folded into literals.
+        simplified (int): Number of identity operations removed.
+
+    Example:
+        >>> ast = Parser(tokens).parse()
+        >>> node = Optimizer().optimize(ast.node)
+    """
+
+    def __init__(self) -> None:
+        self.folded = 0
+        self.simplified = 0
+
+    def optimize(self, node):
+        """Optimize an AST node and its children.
+
+        Args:
+            node: The AST node to optimize.
+
+        Returns:
+            The node to use in place of ``node``.
+        """
+        if node is None:
+            return None
+        method_name = f"optimize_{type(node).__name__}"
+        method = getattr(self, method_name, None)
+        if method is None:
+            return node
+        return method(node)
+
+    def optimize_BinOpNode(self, node):
+        """Optimize a chain of binary operations along its left spine."""
+        spine = left_spine(node)
+        result = self.optimize(spine[0].left_node)
+        for node in spine:
+            node.left_node = result
+            node.right_node = self.optimize(node.right_node)
+            result = self.simplify_binary(node)
+        return result
+
+    def simplify_binary(self, node):
+        """Fold a binary operation on literals, or drop an identity operand.
+
+        Args:
+            node: A BinOpNode whose operands are already optimized.
+
+        Returns:
+            The node to use in place of ``node``.
+        """
+        left, right = node.left_node, node.right_node
+
+        left_value = literal_value(left)
+        right_value = literal_value(right)
+        if left_value is not None and right_value is not None:
+            folded = self.fold_binary(node, left_value, right_value)
+            if folded is not None:
+                return folded
+
+        kept = self.identity_operand(node)
+        if kept is not None:
+            self.simplified += 1
+            return respan(kept, node.pos_start, node.pos_end)
+        return node
+
+    def optimize_UnaryOpNode(self, node):
+        """Fold a unary operation on a literal."""
+        node.node = self.optimize(node.node)
+        value = literal_value(node.node)
+        if value is None:
+            return node
+
+        op_tok = node.op_tok
+        try:
+            if op_tok.type == TT_MINUS:
+                result, error = value.multed_by(Number(-1))
+            elif op_tok.matches(TT_KEYWORD, "NOT"):
+                result, error = value.notted()
+            else:
+                result, error = value, None
+        except Exception:
+            return node
+        if error or not foldable_result(result):
+            return node
+
+        self.folded += 1
+        return make_literal(result, node.pos_start, node.pos_end)
+
+    def optimize_VarAssignNode(self, node):
+        """Optimize the assigned value."""
+        node.value_node = self.optimize(node.value_node)
+        return node
+
+    def optimize_IfNode(self, node):
+        """Optimize every condition and branch."""
+        node.cases = [
+            (self.optimize(condition), self.optimize(expr))
+            for condition, expr in node.cases
+        ]
+        node.else_case = self.optimize(node.else_case)
+        return node
+
+    def optimize_ForNode(self, node):
+        """Optimize the loop bounds, step and body."""
+        node.start_value_node = self.optimize(node.start_value_node)
+        node.end_value_node = self.optimize(node.end_value_node)
+        node.step_value_node = self.optimize(node.step_value_node)
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_WhileNode(self, node):
+        """Optimize the loop condition and body."""
+        node.condition_node = self.optimize(node.condition_node)
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_FuncDefNode(self, node):
+        """Optimize the function body."""
+        node.body_node = self.optimize(node.body_node)
+        return node
+
+    def optimize_CallNode(self, node):
+        """Optimize the callee and the arguments."""
+        node.node_to_call = self.optimize(node.node_to_call)
+        node.arg_nodes = [self.optimize(arg_node) for arg_node in node.arg_nodes]
+        return node
+
+    def optimize_ListNode(self, node):
+        """Optimize every element."""
+        node.element_nodes = [self.optimize(element) for element in node.element_nodes]
+        return node
+
+    def optimize_MapNode(self, node):
+        """Optimize every key and value."""
+        node.key_value_pairs = [
+            (self.optimize(key_node), self.optimize(value_node))
+            for key_node, value_node in node.key_value_pairs
+        ]
+        return node
+
+    def optimize_ProgramNode(self, node):
+        """Optimize every statement."""
+        node.statement_nodes = [
+            self.optimize(statement_node) for statement_node in node.statement_nodes
+        ]
+        return node
+
+    def fold_binary(self, node, left, right):
+        """Evaluate a binary operation on two literal values.
+
+        Args:
+            node: The BinOpNode being folded.
+            left: The left operand value.
+            right: The right operand value.
+
+        Returns:
+            A literal node spanning ``node``, or None if the operation must
+            be left for runtime (it fails, or its result is too large).
+        """
+        if not safe_to_fold(node.op_tok, left, right):
+            return None
+
+        method_name, _ = BINARY_OPS[operator_key(node.op_tok)]
+        try:
+            result, error = getattr(left, method_name)(right)
+        except Exception:
+            return None
+        if error or not foldable_result(result):
+            return None
+
+        self.folded += 1
+        return make_literal(result, node.pos_start, node.pos_end)
+
+    def identity_operand(self, node):
+        """Find the operand that a no-op arithmetic operation reduces to.
+
+        Handles ``x * 1``, ``1 * x``, ``x ^ 1``, ``x - 0``, ``x + 0`` and
+        ``0 + x``. The operand must be statically known to be a Number (for
+        ``+ 0``, an integer), because the same operators mean something
+        else for other types (``list + 0`` appends) or are errors.
+
+        Args:
+            node: The BinOpNode to inspect.
+
+        Returns:
+            The operand node to keep, or None if the operation is not an
+            identity.
+        """
+        op_type = node.op_tok.type
+        left, right = node.left_node, node.right_node
+
+        if op_type in (TT_MUL, TT_POW) and is_int_literal(right, 1):
+            if numeric_kind(left) is not None:
+                return left
+        if op_type == TT_MINUS and is_int_literal(right, 0):
+            if numeric_kind(left) is not None:
+                return left
+        if op_type == TT_MUL and is_int_literal(left, 1):
+            if numeric_kind(right) is not None:
+                return right
+        if op_type == TT_PLUS:
+            if is_int_literal(right, 0) and numeric_kind(left) == _INT:
+                return left
+            if is_int_literal(left, 0) and numeric_kind(right) == _INT:
+                return right
+        return None
+
+
+def operator_key(op_tok: Token) -> str:
+    """Return the ``BINARY_OPS`` key for an operator token."""
+    return op_tok.value if op_tok.type == TT_KEYWORD else op_tok.type
+
+
+def literal_value(node):
+    """Return the runtime value of a literal node, or None for other nodes."""
+    if isinstance(node, NumberNode):
+        return Number(node.tok.value).set_pos(node.pos_start, node.pos_end)
+    if isinstance(node, StringNode):
+        return String(node.tok.value).set_pos(node.pos_start, node.pos_end)
+    return None
+
+
+def is_int_literal(node, value: int) -> bool:
+    """Check whether a node is the integer literal ``value``."""
+    return (
+        isinstance(node, NumberNode)
+        and type(node.tok.value) is int
+        and node.tok.value == value
+    )
+
+
+def numeric_kind(node) -> Optional[str]:
+    """Statically determine whether a node always evaluates to a Number.
+
+    Args:
+        node: The AST node to inspect.
+
+    Returns:
+        ``"int"`` or ``"float"`` if every successful evaluation of the node
+        produces a Number holding that Python type, otherwise None.
+    """
+    if isinstance(node, NumberNode):
+        value = node.tok.value
+        if type(value) is int:
+            return _INT
+        return _FLOAT if type(value) is float else None
+
+    if isinstance(node, UnaryOpNode):
+        if node.op_tok.matches(TT_KEYWORD, "NOT"):
+            return _INT
+        return numeric_kind(node.node)
+
+    if isinstance(node, BinOpNode):
+        op_type = node.op_tok.type
+        if op_type not in (TT_PLUS, TT_MINUS, TT_MUL, TT_DIV, TT_POW):
+            # Comparisons and AND/OR are only defined on Numbers, and always
+            # produce integer 0 or 1.
+            return _INT
+        left = numeric_kind(node.left_node)
+        right = numeric_kind(node.right_node)
+        if left is None or right is None:
+            return None
+        if op_type == TT_DIV:
+            return _FLOAT
+        if op_type == TT_POW:
+            # Negative exponents give floats and fractional ones can give
+            # complex numbers, so only a non-negative literal is safe.
+            exponent = node.right_node
+            if (
+                left == _INT
+                and isinstance(exponent, NumberNode)
+                and type(exponent.tok.value) is int
+                and exponent.tok.value >= 0
+            ):
+                return _INT
+            return None
+        return _INT if left == right == _INT else _FLOAT
+
+    return None
+
+
+def safe_to_fold(op_tok: Token, left, right) -> bool:
+    """Check that folding an operation cannot build an oversized value.
+
+    Folding happens even for code that never runs, so results that are
+    expensive to build are left to be computed at runtime.
+
+    Args:
+        op_tok: The operator token.
+        left: The left operand value.
+        right: The right operand value.
+
+    Returns:
+        True if the operation may be evaluated at compile time.
+    """
+    if op_tok.type == TT_POW and isinstance(left, Number) and isinstance(right, Number):
+        base, exponent = left.value, right.value
+        if type(base) is int and type(exponent) is int and abs(base) > 1:
+            return exponent * base.bit_length() <= MAX_FOLDED_INT_BITS
+    if op_tok.type == TT_MUL and isinstance(left, String) and isinstance(right, Number):
+        if isinstance(right.value, int):
+            return len(left.value) * right.value <= MAX_FOLDED_STRING_LENGTH
+    return True
+
+
+def foldable_result(value) -> bool:
+    """Check that a computed value can be stored in a literal node."""
+    if isinstance(value, Number):
+        return True
+    return isinstance(value, String) and len(value.value) <= MAX_FOLDED_STRING_LENGTH
+
+
+def make_literal(value, pos_start, pos_end):
+    """Build a literal node holding ``value`` that spans the given positions.
+
+    Args:
+        value: A Number or String value.
+        pos_start: Start position of the replaced expression.
+        pos_end: End position of the replaced expression.
+
+    Returns:
+        A NumberNode or StringNode.
+    """
+    if isinstance(value, String):
+        return StringNode(Token(TT_STRING, value.value, pos_start, pos_end))
+    tok_type = TT_INT if type(value.value) is int else TT_FLOAT
+    return NumberNode(Token(tok_type, value.value, pos_start, pos_end))
+
+
+def respan(node, pos_start, pos_end):
+    """Return a node equivalent to ``node`` that spans the given positions.
+
+    Used when an identity operation is removed: the value of the kept
+    operand must carry the span of the whole removed operation, exactly as
+    the operation's result would have.
+
+    Args:
+        node: A literal, BinOpNode or UnaryOpNode.
+        pos_start: Start position of the replaced expression.
+        pos_end: End position of the replaced expression.
+
+    Returns:
+        A copy of ``node`` with the new span.
+    """
+    if isinstance(node, (NumberNode, StringNode)):
+        return type(node)(Token(node.tok.type, node.tok.value, pos_start, pos_end))
+    node = copy.copy(node)
+    node.pos_start = pos_start
+    node.pos_end = pos_end
+    return node
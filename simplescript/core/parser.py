@@ -6,6 +6,7 @@ into an Abstract Syntax Tree (AST) following the SimpleScript grammar.
 
 from typing import List, Callable, Optional
 from simplescript.utils.parse_result import ParseResult
+from simplescript.core.resolver import Resolver
 from simplescript.core.constants import (
     TT_INT,
     TT_FLOAT,
@@ -34,6 +35,7 @@ from simplescript.core.constants import (
     TT_KEYWORD,
     TT_COMMA,
     TT_ARROW,
+    TT_NEWLINE,
 )
 from simplescript.errors.errors import InvalidSyntaxError
 from simplescript.ast.nodes import (
@@ -50,6 +52,7 @@ from simplescript.ast.nodes import (
     WhileNode,
     FuncDefNode,
     CallNode,
+    ProgramNode,
 )
 from simplescript.tokens.token import Token
 
@@ -61,7 +64,8 @@ class Parser:
     with operator precedence handled through the grammar structure.
 
     Grammar (ordered by precedence, lowest to highest):
-        - expr: VAR assignment | SHOW access | logical (AND/OR)
+        - program: statements separated by NEWLINE tokens (newline or ';')
+        - expr: VAR assignment | SHOW expression | logical (AND/OR)
         - comp_expr: NOT | comparison operators
         - arith_expr: addition / subtraction
         - term: multiplication / division
@@ -70,13 +74,27 @@ class Parser:
         - call: function call
         - atom: literals, identifiers, parenthesized expressions, keywords
 
+    Chains of left-associative operators (``a + b + c ...``) are parsed
+    in a loop, however long. Everything else that nests is parsed by
+    recursion: each bracket, argument list, IF, FOR, WHILE or FUNC part,
+    VAR or SHOW value, unary operator and right operand of ``^`` is one
+    level of nesting. Input nested deeper than the Python stack allows,
+    or deeper than ``max_nesting`` levels if given, is reported as the
+    syntax error ``Expression nested too deeply`` instead of raising a
+    ``RecursionError``.
+
     Args:
         tokens: List of tokens produced by the Lexer.
+        max_nesting: Deepest nesting of sub-expressions accepted, or None
+            to accept any nesting the Python stack has room for.
 
     Attributes:
         tokens (list[Token]): The token sequence to parse.
         token_index (int): Current position in the token sequence.
         current_token (Token): The token at the current position.
+        max_nesting (Optional[int]): Deepest nesting of sub-expressions
+            accepted, or None for no limit but the Python stack.
+        nesting (int): Nesting level of the sub-expression being parsed.
 
     Example:
         >>> parser = Parser(tokens)
@@ -87,10 +105,12 @@ class Parser:
         ...     print(result.node)
     """
 
-    def __init__(self, tokens: List[Token]) -> None:
+    def __init__(self, tokens: List[Token], max_nesting: Optional[int] = None) -> None:
         self.current_token: Optional[Token] = None
         self.tokens = tokens
         self.token_index: int = -1
+        self.max_nesting = max_nesting
+        self.nesting = 0
         self.advance()
 
     def advance(self) -> Optional[Token]:
@@ -104,30 +124,141 @@ class Parser:
             self.current_token = self.tokens[self.token_index]
         return self.current_token
 
+    def too_deep(self) -> InvalidSyntaxError:
+        """Build the error reported for input nested too deeply.
+
+        Returns:
+            The InvalidSyntaxError, at the current token.
+        """
+        return InvalidSyntaxError(
+            self.current_token.pos_start,
+            self.current_token.pos_end,
+            "Expression nested too deeply",
+        )
+
+    def enter_nesting(self) -> Optional[InvalidSyntaxError]:
+        """Enter one level of nesting, unless that exceeds ``max_nesting``.
+
+        A caller that enters a level must leave it, by decrementing
+        ``nesting``, once the nested sub-expression is parsed. The check
+        is inlined at each level rather than made by a wrapper, which
+        would add Python frames to every level of recursion.
+
+        Returns:
+            None once the level is entered, or the error to report.
+        """
+        if self.max_nesting is not None and self.nesting >= self.max_nesting:
+            return self.too_deep()
+        self.nesting += 1
+        return None
+
     def parse(self) -> ParseResult:
         """Parse the token sequence into an AST.
 
-        Entry point for parsing. Parses a single expression and verifies
-        that all tokens have been consumed.
+        Entry point for parsing. Parses a whole program and verifies that
+        all tokens have been consumed.
 
         Returns:
-            A ParseResult containing the root AST node on success,
-            or an error if parsing fails.
+            A ParseResult containing a ProgramNode on success, or an error
+            if parsing fails.
         """
-        res = self.expr()
-        if not res.error and (
-            self.current_token.type != TT_EOF
-            and self.current_token.type != TT_IDENTIFIER
-        ):
+        try:
+            res = self.program()
+        except RecursionError:
+            return ParseResult().failure(self.too_deep())
+        if not res.error and self.current_token.type != TT_EOF:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
                     self.current_token.pos_end,
-                    "Expected '+', '-', '*', '/', '^', '==', '!=', '<', '>', <=', '>=', 'AND' or 'OR'",
+                    "Expected '+', '-', '*', '/', '^', '==', '!=', '<', '>', <=', '>=', 'AND', 'OR' or newline",
                 )
             )
         return res
 
+    def program(self) -> ParseResult:
+        """Parse a sequence of statements.
+
+        Syntax: ``NEWLINE* (expr (NEWLINE+ expr)*)? NEWLINE*``
+
+        Every variable in the program is resolved to its scope (see
+        ``Resolver``) before the ProgramNode is returned.
+
+        Returns:
+            A ParseResult containing a ProgramNode.
+        """
+        res = ParseResult()
+        statements = []
+        pos_start = self.current_token.pos_start.copy()
+
+        self.skip_newlines(res)
+        while self.current_token.type != TT_EOF:
+            statement = res.register(self.expr())
+            if res.error:
+                return res
+            statements.append(statement)
+
+            if self.current_token.type != TT_NEWLINE:
+                break
+            self.skip_newlines(res)
+
+        # Only the last statement's value is the program's result.
+        for statement in statements[:-1]:
+            self.mark_value_unused(statement)
+
+        program = ProgramNode(statements, pos_start, self.current_token.pos_end.copy())
+        Resolver().resolve(program)
+        return res.success(program)
+
+    def mark_value_unused(self, node) -> None:
+        """Mark the loops whose value is discarded when ``node``'s is.
+
+        A loop's value is the list of its body's results; when the loop's
+        own value is discarded, the engines run it without building that
+        list. The mark carries into loop bodies and IF branches, whose
+        values only ever become the value of the enclosing node.
+
+        Args:
+            node: An AST node whose value is not used.
+        """
+        if isinstance(node, (ForNode, WhileNode)):
+            node.value_unused = True
+            self.mark_value_unused(node.body_node)
+        elif isinstance(node, IfNode):
+            for _, expr in node.cases:
+                self.mark_value_unused(expr)
+            if node.else_case:
+                self.mark_value_unused(node.else_case)
+
+    def mark_tail_calls(self, node) -> None:
+        """Mark the calls in tail position in a function body.
+
+        A call is in tail position when its result becomes the function's
+        result: the body itself, or a branch of an IF in tail position.
+        The engines run such calls in place of the calling function's
+        frame, so tail recursion takes constant stack space.
+
+        Args:
+            node: A function body, or a node in tail position in one.
+        """
+        if isinstance(node, CallNode):
+            node.tail = True
+        elif isinstance(node, IfNode):
+            for _, expr in node.cases:
+                self.mark_tail_calls(expr)
+            if node.else_case:
+                self.mark_tail_calls(node.else_case)
+
+    def skip_newlines(self, res: ParseResult) -> None:
+        """Consume any NEWLINE tokens at the current position.
+
+        Args:
+            res: The ParseResult that records the consumed tokens.
+        """
+        while self.current_token.type == TT_NEWLINE:
+            res.register_advancement()
+            self.advance()
+
     def atom(self) -> ParseResult:
         """Parse an atomic expression.
 
@@ -207,7 +338,11 @@ class Parser:
                 return res
             return res.success(while_expr)
 
-        elif token.matches(TT_KEYWORD, "FUNC"):
+        elif (
+            token.matches(TT_KEYWORD, "FUNC")
+            or token.matches(TT_KEYWORD, "MEMO")
+            or token.matches(TT_KEYWORD, "NOMEMO")
+        ):
             func_def = res.register(self.func_def())
             if res.error:
                 return res
@@ -282,7 +417,7 @@ class Parser:
         Returns:
             A ParseResult containing the parsed AST node.
         """
-        return self.bin_op(self.call, (TT_POW,), self.factor)
+        return self.bin_op(self.call, (TT_POW,), self.factor, nest_right=True)
 
     def factor(self) -> ParseResult:
         """Parse a factor expression (handles unary +/-).
@@ -296,7 +431,13 @@ class Parser:
         if token.type in (TT_PLUS, TT_MINUS):
             res.register_advancement()
             self.advance()
-            factor = res.register(self.factor())
+            error = self.enter_nesting()
+            if error:
+                return res.failure(error)
+            try:
+                factor = res.register(self.factor())
+            finally:
+                self.nesting -= 1
             if res.error:
                 return res
             return res.success(UnaryOpNode(token, factor))
@@ -527,13 +668,25 @@ class Parser:
     def func_def(self) -> ParseResult:
         """Parse a function definition expression.
 
-        Syntax: ``FUNC name?(param1, param2, ...) -> expr``
+        Syntax: ``(MEMO|NOMEMO)? FUNC name?(param1, param2, ...) -> expr``
+
+        ``MEMO`` memoizes the function even if it is not pure, ``NOMEMO``
+        never memoizes it; by default only pure functions are memoized.
 
         Returns:
             A ParseResult containing a FuncDefNode.
         """
         res = ParseResult()
 
+        memoize = None
+        if self.current_token.matches(TT_KEYWORD, "MEMO"):
+            memoize = True
+        elif self.current_token.matches(TT_KEYWORD, "NOMEMO"):
+            memoize = False
+        if memoize is not None:
+            res.register_advancement()
+            self.advance()
+
         if not self.current_token.matches(TT_KEYWORD, "FUNC"):
             return res.failure(
                 InvalidSyntaxError(
@@ -631,7 +784,8 @@ class Parser:
         if res.error:
             return res
 
-        return res.success(FuncDefNode(var_name_tok, arg_name_toks, node_to_return))
+        self.mark_tail_calls(node_to_return)
+        return res.success(FuncDefNode(var_name_tok, arg_name_toks, node_to_return, memoize))
 
     def list_expr(self) -> ParseResult:
         """Parse a list expression.
@@ -808,7 +962,13 @@ class Parser:
             operator_token = self.current_token
             res.register_advancement()
             self.advance()
-            node = res.register(self.comp_expr())
+            error = self.enter_nesting()
+            if error:
+                return res.failure(error)
+            try:
+                node = res.register(self.comp_expr())
+            finally:
+                self.nesting -= 1
             if res.error:
                 return res
             return res.success(UnaryOpNode(operator_token, node))
@@ -830,84 +990,89 @@ class Parser:
     def expr(self) -> ParseResult:
         """Parse a full expression.
 
-        This is the top-level parsing method that handles variable
-        assignment (VAR), variable access (SHOW), and logical
+        This is the statement-level parsing method that handles variable
+        assignment (VAR), showing a value (SHOW), and logical
         operations (AND/OR).
 
         Returns:
             A ParseResult containing the parsed AST node.
         """
-        res = ParseResult()
-
-        # Variable assignment
-        if self.current_token.matches(TT_KEYWORD, "VAR"):
-            res.register_advancement()
-            self.advance()
+        error = self.enter_nesting()
+        if error:
+            return ParseResult().failure(error)
+        try:
+            res = ParseResult()
+
+            # Variable assignment
+            if self.current_token.matches(TT_KEYWORD, "VAR"):
+                res.register_advancement()
+                self.advance()
 
-            if self.current_token.type != TT_IDENTIFIER:
-                return res.failure(
-                    InvalidSyntaxError(
-                        self.current_token.pos_start,
-                        self.current_token.pos_end,
-                        "Expected identifier",
+                if self.current_token.type != TT_IDENTIFIER:
+                    return res.failure(
+                        InvalidSyntaxError(
+                            self.current_token.pos_start,
+                            self.current_token.pos_end,
+                            "Expected identifier",
+                        )
                     )
-                )
 
-            var_name = self.current_token
-            res.register_advancement()
-            self.advance()
+                var_name = self.current_token
+                res.register_advancement()
+                self.advance()
 
-            if self.current_token.type != TT_EQ:
-                return res.failure(
-                    InvalidSyntaxError(
-                        self.current_token.pos_start,
-                        self.current_token.pos_end,
-                        "Expected '='",
+                if self.current_token.type != TT_EQ:
+                    return res.failure(
+                        InvalidSyntaxError(
+                            self.current_token.pos_start,
+                            self.current_token.pos_end,
+                            "Expected '='",
+                        )
                     )
-                )
 
-            res.register_advancement()
-            self.advance()
+                res.register_advancement()
+                self.advance()
 
-            expr = res.register(self.expr())
-            if res.error:
-                return res
+                expr = res.register(self.expr())
+                if res.error:
+                    return res
 
-            return res.success(VarAssignNode(var_name, expr))
+                return res.success(VarAssignNode(var_name, expr))
 
-        # Variable access
-        elif self.current_token.matches(TT_KEYWORD, "SHOW"):
-            res.register_advancement()
-            self.advance()
+            # Show the value of an expression
+            elif self.current_token.matches(TT_KEYWORD, "SHOW"):
+                res.register_advancement()
+                self.advance()
+
+                expr = res.register(self.expr())
+                if res.error:
+                    return res
+
+                return res.success(expr)
 
-            if self.current_token.type != TT_IDENTIFIER:
+            node = res.register(
+                self.bin_op(self.comp_expr, ((TT_KEYWORD, "AND"), (TT_KEYWORD, "OR")))
+            )
+
+            if res.error:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
                         self.current_token.pos_end,
-                        "Expected identifier",
+                        "Expected Keyword, '+', '-', '(', '[', identifier, 'IF', 'FOR', 'WHILE', 'FUNC', or 'NOT'",
                     )
                 )
 
-            return res.success(VarAccessNode(self.current_token))
-
-        node = res.register(
-            self.bin_op(self.comp_expr, ((TT_KEYWORD, "AND"), (TT_KEYWORD, "OR")))
-        )
-
-        if res.error:
-            return res.failure(
-                InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    self.current_token.pos_end,
-                    "Expected Keyword, '+', '-', '(', '[', identifier, 'IF', 'FOR', 'WHILE', 'FUNC', or 'NOT'",
-                )
-            )
-
-        return res.success(node)
+            return res.success(node)
+        finally:
+            self.nesting -= 1
 
     def bin_op(
-        self, func_a: Callable, ops: tuple, func_b: Optional[Callable] = None
+        self,
+        func_a: Callable,
+        ops: tuple,
+        func_b: Optional[Callable] = None,
+        nest_right: bool = False,
     ) -> ParseResult:
         """Parse a binary operation with given operator tokens.
 
@@ -918,6 +1083,8 @@ class Parser:
             func_a: Parser method for the left operand (and right if func_b is None).
             ops: Tuple of operator token types (or (type, value) tuples for keywords).
             func_b: Parser method for the right operand (defaults to func_a).
+            nest_right: Whether each right operand is a level of nesting,
+                as for ``^``, whose right operand holds the rest of the chain.
 
         Returns:
             A ParseResult containing the parsed BinOpNode chain.
@@ -936,7 +1103,16 @@ class Parser:
             op_tok = self.current_token
             res.register_advancement()
             self.advance()
-            right = res.register(func_b())
+            if nest_right:
+                error = self.enter_nesting()
+                if error:
+                    return res.failure(error)
+                try:
+                    right = res.register(func_b())
+                finally:
+                    self.nesting -= 1
+            else:
+                right = res.register(func_b())
             if res.error:
                 return res
             left = BinOpNode(left, op_tok, right)
@@ -0,0 +1,132 @@
+"""Type-feedback quickening of binary operations in the Interpreter.
+
+Every BinOpNode records the types of the operands it is evaluated with.
+Once it has seen the same pair of types ``QUICKEN_THRESHOLD`` times in a
+row, the Interpreter quickens it: the node keeps an evaluator specialized
+for those types, guarded by a check of the operand types, and skips the
+operator dispatch. Two Numbers are combined with the raw Python operator;
+other types call their operation method directly. If the guard fails, the
+node is deoptimized back to the general path and starts recording again;
+after ``MAX_DEOPTIMIZATIONS`` of those, it stays general for good.
+
+The VM and the closure engine need no feedback to get there: their
+binary operations are compiled with the operator already looked up, and
+apply the raw Python operator whenever both operands are ``NUMBER_TYPES``,
+the same guard as a node quickened for Numbers.
+"""
+
+from typing import Callable, FrozenSet, Optional, Tuple
+from simplescript.core.compiler import BINARY_OPS
+from simplescript.types.number import Constant, Number
+
+QUICKEN_THRESHOLD: int = 8
+"""Evaluations with the same operand types before a node is quickened."""
+
+MAX_DEOPTIMIZATIONS: int = 4
+"""Deoptimizations after which a node is no longer quickened."""
+
+NUMBER_TYPES: FrozenSet[type] = frozenset((Number, Constant))
+"""Operand types accepted by the evaluators specialized for Numbers."""
+
+Evaluator = Callable[..., Tuple[Optional[Number], Optional[object]]]
+"""``evaluator(left, right) -> (result, error)``, like a Value operation."""
+
+
+class QuickeningStats:
+    """Counts of the BinOpNodes quickened and deoptimized.
+
+    Attributes:
+        quickened (int): Number of times a node was quickened.
+        deoptimized (int): Number of times a quickened node saw operand
+            types its evaluator does not handle and was deoptimized.
+    """
+
+    __slots__ = ("quickened", "deoptimized")
+
+    def __init__(self) -> None:
+        self.quickened = 0
+        self.deoptimized = 0
+
+    def reset(self) -> None:
+        """Set both counts back to zero."""
+        self.quickened = 0
+        self.deoptimized = 0
+
+    def __repr__(self) -> str:
+        return f"<QuickeningStats quickened={self.quickened} deoptimized={self.deoptimized}>"
+
+
+stats = QuickeningStats()
+"""The counts for every BinOpNode the Interpreter evaluates."""
+
+
+def _number_evaluator(op_key: str) -> Evaluator:
+    """Return an evaluator of an operator on two Numbers.
+
+    It gives the same result as the operator's Number method, computed
+    with the raw Python operator. A division by zero is left to the method,
+    which reports it.
+
+    Args:
+        op_key: The operator's key in ``BINARY_OPS``.
+
+    Returns:
+        The evaluator.
+    """
+    method_name, raw_op = BINARY_OPS[op_key]
+    new = object.__new__
+    true, false = Number.TRUE, Number.FALSE
+
+    if method_name.startswith("get_comparison_"):
+
+        def compare(left, right):
+            return (true if raw_op(left.value, right.value) else false), None
+
+        return compare
+
+    if method_name in ("anded_by", "ored_by"):
+
+        def logical(left, right):
+            return Number.of(raw_op(left.value, right.value)), None
+
+        return logical
+
+    if method_name == "dived_by":
+        dived_by = Number.dived_by
+
+        def divide(left, right):
+            if right.value == 0:
+                return dived_by(left, right)
+            result = new(Number)
+            result.value = left.value / right.value
+            result.context = left.context
+            return result, None
+
+        return divide
+
+    def arithmetic(left, right):
+        result = new(Number)
+        result.value = raw_op(left.value, right.value)
+        result.context = left.context
+        return result, None
+
+    return arithmetic
+
+
+def specialize(op_key: str, left_type: type, right_type: type) -> tuple:
+    """Build the quickened state of a node for a pair of operand types.
+
+    Args:
+        op_key: The operator's key in ``BINARY_OPS``.
+        left_type: The type of the left operands seen.
+        right_type: The type of the right operands seen.
+
+    Returns:
+        A ``(left_types, right_types, evaluator)`` tuple: the evaluator
+        may be called when the left operand's type is in ``left_types``
+        and the right one's in ``right_types``.
+    """
+    if left_type in NUMBER_TYPES and right_type in NUMBER_TYPES:
+        return NUMBER_TYPES, NUMBER_TYPES, _number_evaluator(op_key)
+    method = getattr(left_type, BINARY_OPS[op_key][0])
+    return frozenset((left_type,)), frozenset((right_type,)), method
@@ -0,0 +1,241 @@
+"""Variable resolution pass for SimpleScript.
+
+This module provides the Resolver class, which runs over the AST once
+after parsing and gives every variable a fixed address. Variables local to
+a function get a slot in that function's call frame, addressed by
+``(depth, slot)``, where ``depth`` counts the function scopes between the
+use and the definition; every other variable is global, and is looked up
+by name in the global symbol table.
+
+Scoping is lexical: a function's locals are its parameters and every name
+its body assigns with ``VAR``, binds with ``FOR`` or defines with a named
+``FUNC``, wherever in the body that happens. Any other name the body uses
+belongs to the nearest enclosing function that defines it, or is global.
+
+The resolver also finds the pure functions, whose result depends only on
+their arguments, and which can therefore be memoized.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from simplescript.ast.nodes import (
+    BinOpNode,
+    UnaryOpNode,
+    VarAssignNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    VarAccessNode,
+    FuncDefNode,
+    CallNode,
+    ListNode,
+    MapNode,
+    ProgramNode,
+)
+
+_END_OF_SCOPE = object()
+"""Marks where the resolver leaves a function's scope."""
+
+_CHILDREN: Dict[type, Callable] = {
+    BinOpNode: lambda node: (node.left_node, node.right_node),
+    UnaryOpNode: lambda node: (node.node,),
+    VarAssignNode: lambda node: (node.value_node,),
+    IfNode: lambda node: [
+        child for case in node.cases for child in case
+    ] + [node.else_case],
+    ForNode: lambda node: (
+        node.start_value_node,
+        node.end_value_node,
+        node.step_value_node,
+        node.body_node,
+    ),
+    WhileNode: lambda node: (node.condition_node, node.body_node),
+    FuncDefNode: lambda node: (node.body_node,),
+    CallNode: lambda node: [node.node_to_call] + node.arg_nodes,
+    ListNode: lambda node: node.element_nodes,
+    MapNode: lambda node: [child for pair in node.key_value_pairs for child in pair],
+    ProgramNode: lambda node: node.statement_nodes,
+}
+
+
+def child_nodes(node) -> Iterable:
+    """Return the direct children of an AST node (leaves have none).
+
+    Args:
+        node: The AST node.
+
+    Returns:
+        The child nodes, without the None placeholders of optional parts.
+    """
+    children = _CHILDREN.get(type(node))
+    if children is None:
+        return ()
+    return [child for child in children(node) if child is not None]
+
+
+class Resolver:
+    """Gives every function-local variable a slot in its function's frame.
+
+    Uses the visitor pattern: for each AST node type ``XxxNode`` that
+    names a variable, a method ``resolve_XxxNode`` records the variable's
+    address on the node. Nodes are updated in place.
+
+    The tree is walked with an explicit stack of pending nodes rather than
+    by recursion, so arbitrarily long chains such as ``1 + 1 + ... + 1``
+    do not hit the Python recursion limit.
+
+    Attributes:
+        scopes (list[dict]): The enclosing function scopes, innermost last,
+            each mapping a local name to its slot.
+
+    Example:
+        >>> ast = Parser(tokens).parse()
+        >>> Resolver().resolve(ast.node)
+    """
+
+    def __init__(self) -> None:
+        self.scopes: List[Dict[str, int]] = []
+
+    def resolve(self, node) -> None:
+        """Resolve the variables of an AST node and its children.
+
+        Args:
+            node: The AST node to resolve.
+        """
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            if node is _END_OF_SCOPE:
+                self.scopes.pop()
+                continue
+            method = getattr(self, f"resolve_{type(node).__name__}", None)
+            if method is not None:
+                method(node)
+            if type(node) is FuncDefNode:
+                # Leave the function's scope once its body is resolved.
+                pending.append(_END_OF_SCOPE)
+            pending.extend(child_nodes(node))
+
+    def lookup(self, name: str) -> Tuple[int, Optional[int]]:
+        """Find the address of a variable used in the current scope.
+
+        Args:
+            name: The variable name.
+
+        Returns:
+            ``(depth, slot)`` for a local of an enclosing function, or
+            ``(0, None)`` for a global variable.
+        """
+        for depth, scope in enumerate(reversed(self.scopes)):
+            slot = scope.get(name)
+            if slot is not None:
+                return depth, slot
+        return 0, None
+
+    def local_slot(self, name: str) -> Optional[int]:
+        """Return the slot a name bound in the current scope is stored in.
+
+        Args:
+            name: A name bound in the current scope.
+
+        Returns:
+            Its slot in the current function's frame, or None at top level.
+        """
+        return self.scopes[-1][name] if self.scopes else None
+
+    def collect_locals(self, node, names: List[str]) -> None:
+        """Append the names that ``node`` binds in its function to ``names``.
+
+        Args:
+            node: An AST node in a function body.
+            names: Receives each bound name, in source order.
+        """
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, (VarAssignNode, ForNode)):
+                names.append(node.var_name_tok.value)
+            elif isinstance(node, FuncDefNode):
+                if node.var_name_tok:
+                    names.append(node.var_name_tok.value)
+                # The body is a scope of its own.
+                continue
+            # Push the children last-first, so they are visited in order.
+            pending.extend(reversed(child_nodes(node)))
+
+    def resolve_VarAccessNode(self, node) -> None:
+        """Record where the accessed variable lives."""
+        node.depth, node.slot = self.lookup(node.var_name_tok.value)
+
+    def resolve_VarAssignNode(self, node) -> None:
+        """Record the assigned variable's slot."""
+        node.slot = self.local_slot(node.var_name_tok.value)
+
+    def resolve_ForNode(self, node) -> None:
+        """Record the loop variable's slot."""
+        node.slot = self.local_slot(node.var_name_tok.value)
+
+    def resolve_FuncDefNode(self, node) -> None:
+        """Record the function's slot, number its locals and enter its scope.
+
+        Parameters take the first slots, in order, so that a call's
+        arguments fill them directly; a repeated parameter name refers to
+        the last one, as it would if the arguments were bound one by one.
+        """
+        if node.var_name_tok:
+            node.slot = self.local_slot(node.var_name_tok.value)
+
+        scope = {arg_tok.value: index for index, arg_tok in enumerate(node.arg_name_toks)}
+        size = len(node.arg_name_toks)
+        names: List[str] = []
+        self.collect_locals(node.body_node, names)
+        for name in names:
+            if name not in scope:
+                scope[name] = size
+                size += 1
+        node.frame_size = size
+        node.callees = self.pure_callees(node.body_node, scope)
+
+        self.scopes.append(scope)
+
+    def pure_callees(self, body_node, scope: Dict[str, int]) -> Optional[Tuple[str, ...]]:
+        """Check whether a function body is pure.
+
+        SimpleScript values are immutable and a body's ``VAR`` can only
+        assign the function's own locals, so a body is pure unless its
+        result can depend on something other than the arguments: reading
+        a variable of an enclosing scope (which may be reassigned), calling
+        a function held in a variable of any scope but the global one, or
+        defining a nested function. Calls to global functions are allowed;
+        whether those are pure too is checked when the function is called,
+        since a global name can be rebound.
+
+        Args:
+            body_node: The function body.
+            scope: The function's locals, mapping each name to its slot.
+
+        Returns:
+            The names of the global functions the body calls, in order of
+            first use, or None if the body is not pure.
+        """
+        callees: Dict[str, None] = {}
+        pending = [body_node]
+        while pending:
+            node = pending.pop()
+            node_type = type(node)
+            if node_type is FuncDefNode:
+                return None
+            if node_type is VarAccessNode:
+                if node.var_name_tok.value not in scope:
+                    return None
+            elif node_type is CallNode:
+                callee = node.node_to_call
+                if type(callee) is not VarAccessNode:
+                    return None
+                name = callee.var_name_tok.value
+                if name in scope or self.lookup(name)[1] is not None:
+                    return None
+                callees[name] = None
+                pending.extend(reversed(node.arg_nodes))
+                continue
+            pending.extend(reversed(child_nodes(node)))
+        return tuple(callees)
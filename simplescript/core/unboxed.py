@@ -0,0 +1,191 @@
+"""Unboxed evaluation of numeric expressions.
+
+An expression such as ``a * a + b * b - 2 * a * b`` builds a Number (and
+sets its position and context) for every intermediate result. When a
+BinOpNode's whole subtree is arithmetic and comparison operators applied
+to numeric literals and variables, ``numeric_tree`` compiles it once into
+a NumericTree: a closure over raw Python ints and floats. The Interpreter
+reads each variable once, runs the closure, and boxes only the final
+result. Anything the closure cannot handle (a variable that is not a
+Number, a division by zero, an overflow) makes the Interpreter evaluate
+the subtree the normal way instead, which reports the exact error it
+always has; the subtree has no side effects, so evaluating it twice is
+safe.
+
+The VM and the closure engine evaluate NumericTrees the same way: the
+compiler emits an EVAL_UNBOXED instruction ahead of the subtree's normal
+code, and the closure compiler wraps the subtree's normal closure.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+from simplescript.ast.nodes import BinOpNode, NumberNode, VarAccessNode
+from simplescript.core.compiler import BINARY_OPS
+from simplescript.core.constants import TT_KEYWORD
+
+MIN_OPERATIONS: int = 2
+"""Fewest operators a subtree needs to be evaluated unboxed."""
+
+MAX_DEPTH: int = 32
+"""Deepest subtree evaluated unboxed; deeper ones (such as long chains of
+``+``) are left to the Interpreter's loop over the chain."""
+
+Raw = Callable[[list], object]
+"""A compiled subexpression: ``raw(values)`` computes its raw value from the
+raw values of the tree's variables."""
+
+
+class NumericTree:
+    """A numeric subtree compiled to run over raw numbers.
+
+    Args:
+        variables: One VarAccessNode per distinct variable the subtree
+            reads, in the order ``evaluate`` expects their values.
+        evaluate: Computes the subtree's raw value from the variables'
+            raw values.
+        comparison: Whether the root operator is a comparison, whose
+            result is ``Number.TRUE`` or ``Number.FALSE``.
+        context_index: Index in ``variables`` of the variable whose context
+            the result takes, or None if it takes the current context.
+
+    Attributes:
+        variables (tuple): The VarAccessNodes to read.
+        evaluate (Callable): The compiled subtree.
+        comparison (bool): Whether the root is a comparison.
+        context_index (Optional[int]): Index of that variable.
+    """
+
+    __slots__ = ("variables", "evaluate", "comparison", "context_index")
+
+    def __init__(
+        self,
+        variables: tuple,
+        evaluate: Raw,
+        comparison: bool,
+        context_index: Optional[int],
+    ) -> None:
+        self.variables = variables
+        self.evaluate = evaluate
+        self.comparison = comparison
+        self.context_index = context_index
+
+
+class _NotNumeric(Exception):
+    """Raised while compiling a subtree that cannot be evaluated unboxed."""
+
+
+def _op_key(node: BinOpNode) -> str:
+    """Return a BinOpNode's key in ``BINARY_OPS``."""
+    op_tok = node.op_tok
+    return op_tok.value if op_tok.type == TT_KEYWORD else op_tok.type
+
+
+class _Builder:
+    """Compiles a subtree into nested closures over the variables' values."""
+
+    def __init__(self) -> None:
+        self.variables: List[VarAccessNode] = []
+        self.indexes: Dict[Tuple, int] = {}
+        self.operations = 0
+
+    def variable(self, node: VarAccessNode) -> int:
+        """Return the index of a variable's value, adding it if new."""
+        key = (node.var_name_tok.value, node.depth, node.slot)
+        index = self.indexes.get(key)
+        if index is None:
+            index = self.indexes[key] = len(self.variables)
+            self.variables.append(node)
+        return index
+
+    def build(self, node, depth: int) -> Raw:
+        """Compile ``node`` into a closure computing its raw value.
+
+        Raises:
+            _NotNumeric: If the subtree holds anything but numeric literals,
+                variables and arithmetic or comparison operators, or is
+                deeper than ``MAX_DEPTH``.
+        """
+        node_type = type(node)
+        if node_type is NumberNode:
+            value = node.tok.value
+            return lambda values: value
+        if node_type is VarAccessNode:
+            index = self.variable(node)
+            return lambda values: values[index]
+        if node_type is not BinOpNode or depth >= MAX_DEPTH:
+            raise _NotNumeric
+        key = _op_key(node)
+        if key in ("AND", "OR"):
+            raise _NotNumeric
+        self.operations += 1
+        op = BINARY_OPS[key][1]
+        left = self.build(node.left_node, depth + 1)
+        right = self.build(node.right_node, depth + 1)
+        return lambda values: op(left(values), right(values))
+
+
+_CONSTANT = object()
+"""The context source of a subtree whose value is a Constant."""
+
+
+def _is_comparison(node: BinOpNode) -> bool:
+    """Return whether a BinOpNode is a comparison."""
+    return BINARY_OPS[_op_key(node)][0].startswith("get_comparison_")
+
+
+def _context_source(node, builder: _Builder):
+    """Find where the normal evaluation of a numeric subtree gets its context.
+
+    A literal or a comparison evaluates to a Constant, with no context, and
+    so does an operation on two Constants; any other operation takes the
+    context of its left operand, or the current context if that is a
+    Constant.
+
+    Args:
+        node: The subtree, already compiled by ``builder``.
+        builder: The builder holding the subtree's variables.
+
+    Returns:
+        ``_CONSTANT`` if the subtree's value is a Constant, the index in
+        ``builder.variables`` of the variable whose context it takes, or
+        None for the current context.
+    """
+    if type(node) is NumberNode:
+        return _CONSTANT
+    if type(node) is VarAccessNode:
+        return builder.variable(node)
+    if _is_comparison(node):
+        return _CONSTANT
+    left = _context_source(node.left_node, builder)
+    if left is not _CONSTANT:
+        return left
+    if _context_source(node.right_node, builder) is _CONSTANT:
+        return _CONSTANT
+    return None
+
+
+def numeric_tree(node: BinOpNode) -> Optional[NumericTree]:
+    """Compile a BinOpNode's subtree for unboxed evaluation, if possible.
+
+    Args:
+        node: The root of the subtree.
+
+    Returns:
+        The NumericTree, or None if the subtree is not purely numeric,
+        has fewer than ``MIN_OPERATIONS`` operators, is too deep, or is an
+        arithmetic operation on two Constants.
+    """
+    builder = _Builder()
+    try:
+        evaluate = builder.build(node, 0)
+    except _NotNumeric:
+        return None
+    if builder.operations < MIN_OPERATIONS:
+        return None
+
+    comparison = _is_comparison(node)
+    context_index = None if comparison else _context_source(node, builder)
+    if context_index is _CONSTANT:
+        # The normal evaluation gives a new Constant (see
+        # ``operands.binary_result``).
+        return None
+    return NumericTree(tuple(builder.variables), evaluate, comparison, context_index)
@@ -0,0 +1,618 @@
+"""Stack-based virtual machine for SimpleScript bytecode.
+
+This module provides the VM class that executes CodeObjects produced by
+the Compiler. It is an alternative to the tree-walking Interpreter that
+produces the same values and errors, but avoids per-node dispatch and
+per-node RTResult allocation, and runs SimpleScript function calls on an
+explicit frame stack instead of Python recursion.
+"""
+
+from typing import Callable
+from simplescript.core.bytecode import (
+    CodeObject,
+    LOAD_NUMBER,
+    LOAD_STRING,
+    LOAD_VAR,
+    STORE_VAR,
+    BINARY_OP,
+    UNARY_OP,
+    JUMP,
+    POP_JUMP_IF_FALSE,
+    LOAD_NONE,
+    FOR_PREP,
+    FOR_ITER,
+    WHILE_PREP,
+    LOOP_APPEND,
+    LOOP_END,
+    MAKE_FUNCTION,
+    CALL,
+    BUILD_LIST,
+    BUILD_MAP,
+    RETURN,
+    LOAD_CALLEE,
+    TAIL_CALL,
+    POP_TOP,
+    LOAD_LOCAL,
+    LOAD_OUTER,
+    STORE_LOCAL,
+    EVAL_UNBOXED,
+)
+from simplescript.core.compiler import compile_function_body
+from simplescript.core.constants import TT_MINUS
+from simplescript.core.context import Context
+from simplescript.core.operands import (
+    binary_result,
+    called_copy,
+    located,
+    operation_error,
+    unary_result,
+)
+from simplescript.core.loops import STALLED_LOOP_DETAILS, loop_values, stalled
+from simplescript.errors.errors import RTError
+from simplescript.types.function import Function
+from simplescript.types.builtin_function import BuiltInFunction, Caller
+from simplescript.types.list import List
+from simplescript.types.map import Map
+from simplescript.types.number import Constant, Number
+from simplescript.types.string import String
+from simplescript.utils.memo_cache import MISSING
+from simplescript.utils.rt_result import RTResult
+
+DEFAULT_MAX_DEPTH: int = 1000
+"""Default maximum number of nested SimpleScript function calls."""
+
+
+class VM(Caller):
+    """Executes SimpleScript bytecode on a value stack.
+
+    Function calls push a frame onto an explicit frame stack, so deep
+    SimpleScript recursion is bounded by ``max_depth`` rather than by the
+    Python recursion limit. Tail calls replace the calling frame instead,
+    so tail recursion is not bounded at all. As a Caller, the VM runs the
+    functions that built-ins call in a nested ``run``.
+
+    Args:
+        max_depth: Maximum number of nested function calls before a
+            runtime error is reported.
+
+    Attributes:
+        max_depth (int): Maximum number of nested function calls.
+
+    Example:
+        >>> code = Compiler().compile(ast_root)
+        >>> result = VM().run(code, Context('<program>'))
+    """
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH) -> None:
+        self.max_depth = max_depth
+
+    def run_body(self, func: Function, context: Context) -> RTResult:
+        """Run a function's body in a context prepared for the call.
+
+        Args:
+            func: The function whose body to run.
+            context: The call's context, whose frame holds the arguments.
+
+        Returns:
+            An RTResult containing the body's value or an error.
+        """
+        return self.run(compile_function_body(func.name, func.body_node), context)
+
+    def body_runner(self, func: Function) -> Callable[[Context], RTResult]:
+        """Return a callable running a function's body, compiled once.
+
+        A body that is one purely numeric subtree, such as ``x * x + 1``,
+        is evaluated unboxed by the callable itself, as its EVAL_UNBOXED
+        instruction would be, without a run of the VM loop; the VM runs it
+        only when unboxed evaluation fails.
+        """
+        code = compile_function_body(func.name, func.body_node)
+        run = self.run
+        instructions = code.instructions
+        op, arg = instructions[0]
+        if op != EVAL_UNBOXED or arg[6] != len(instructions) - 1:
+            return lambda context: run(code, context)
+
+        unboxed_value = self.unboxed_value
+
+        def run_body(context: Context) -> RTResult:
+            value = unboxed_value(arg, context)
+            if value is None:
+                return run(code, context)
+            return RTResult().success(value)
+
+        return run_body
+
+    def run(self, code: CodeObject, context: Context) -> RTResult:
+        """Execute a CodeObject in the given context.
+
+        Args:
+            code: The compiled program.
+            context: The execution context (provides the symbol table).
+
+        Returns:
+            An RTResult containing the computed value or an error.
+        """
+        # Numbers are built with object.__new__ and direct attribute stores
+        # on the hot paths below: it produces exactly what
+        # ``Number(value).set_context(...).set_pos(...)`` would, without the
+        # three method calls of the constructor chain.
+        new = object.__new__
+        resolve = self.resolve
+        unboxed_value = self.unboxed_value
+        res = RTResult()
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        frames = []
+        # The traceback parent and entry position of the contexts of tail
+        # calls made from the current frame (see TailCall), once one is made.
+        tail_parent = None
+        codes = {}
+        instructions = code.instructions
+        pc = 0
+
+        while True:
+            op, arg = instructions[pc]
+            pc += 1
+
+            if op == LOAD_LOCAL:
+                name, slot, pos_start, pos_end = arg
+                value = context.frame[slot]
+                if value is None:
+                    return res.failure(
+                        RTError(pos_start, pos_end, f"'{name}' is not defined", context)
+                    )
+                if type(value) is Number:
+                    copy = new(Number)
+                    copy.value = value.value
+                    copy.context = value.context
+                    copy.pos_start = pos_start
+                    copy.pos_end = pos_end
+                    push(copy)
+                else:
+                    push(value.copy().set_pos(pos_start, pos_end))
+
+            elif op == LOAD_VAR or op == LOAD_OUTER:
+                if op == LOAD_VAR:
+                    name, pos_start, pos_end = arg
+                    value = context.symbol_table.symbols.get(name)
+                    if value is None:
+                        value = context.symbol_table.get(name)
+                else:
+                    name, depth, slot, pos_start, pos_end = arg
+                    value = resolve(name, depth, slot, context)
+                if value is None:
+                    return res.failure(
+                        RTError(pos_start, pos_end, f"'{name}' is not defined", context)
+                    )
+                if type(value) is Number:
+                    copy = new(Number)
+                    copy.value = value.value
+                    copy.context = value.context
+                    copy.pos_start = pos_start
+                    copy.pos_end = pos_end
+                    push(copy)
+                else:
+                    push(value.copy().set_pos(pos_start, pos_end))
+
+            elif op == LOAD_NUMBER:
+                push(arg)
+
+            elif op == BINARY_OP:
+                right = pop()
+                left = pop()
+                method_name, fast_op, shared, pos_start, pos_end, node = arg
+                # Follows ``binary_result``, on the raw operator's result.
+                if (type(left) is Number or type(left) is Constant) and (
+                    type(right) is Number or type(right) is Constant
+                ):
+                    try:
+                        raw = fast_op(left.value, right.value)
+                    except ZeroDivisionError:
+                        pass
+                    else:
+                        if shared:
+                            result = Number.of(raw)
+                            if type(result) is Constant:
+                                push(result)
+                                continue
+                        else:
+                            result = new(Number)
+                            result.value = raw
+                            result.context = left.context
+                        if result.context is None:
+                            if type(left) is Constant and type(right) is Constant:
+                                push(Constant(raw))
+                                continue
+                            result.context = context
+                        result.pos_start = pos_start
+                        result.pos_end = pos_end
+                        push(result)
+                        continue
+                result, error = getattr(left, method_name)(right)
+                if error:
+                    return res.failure(
+                        operation_error(node, left, right, error, context)
+                    )
+                push(binary_result(result, node, left, right, context))
+
+            elif op == EVAL_UNBOXED:
+                # Anything but Numbers, or a failed computation, falls
+                # through to the subtree's normal code.
+                value = unboxed_value(arg, context)
+                if value is not None:
+                    push(value)
+                    pc = arg[6]
+
+            elif op == POP_JUMP_IF_FALSE:
+                if not pop().is_true():
+                    pc = arg
+
+            elif op == JUMP:
+                pc = arg
+
+            elif op == CALL or op == TAIL_CALL:
+                argc, pos_start, pos_end = arg
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                callee = pop()
+
+                if type(callee) is not Function:
+                    value = res.register(
+                        self.call_value(callee, args, pos_start, pos_end, context)
+                    )
+                    if res.error:
+                        return res
+                    push(value)
+                    continue
+
+                if argc != callee.arity:
+                    return res.failure(
+                        callee.arity_error(argc, pos_start, pos_end, context)
+                    )
+
+                if op == CALL:
+                    # A memoized function's result is cached when the frame
+                    # of the call returns; a tail call inherits its caller's
+                    # frame instead of pushing one.
+                    pending = None
+                    if callee.memo is not None:
+                        key, value = callee.memo_lookup(args)
+                        if value is not MISSING:
+                            push(callee.memo_result(value, pos_start, pos_end, context))
+                            continue
+                        if key is not None:
+                            pending = callee, key
+                    if len(frames) >= self.max_depth:
+                        return res.failure(
+                            RTError(
+                                pos_start,
+                                pos_end,
+                                "Maximum recursion depth exceeded",
+                                context,
+                            )
+                        )
+                    frames.append((instructions, pc, context, tail_parent, pending))
+                    parent, entry_pos = context, pos_start
+                    tail_parent = None
+                else:
+                    if tail_parent is None:
+                        tail_parent = (context, pos_start)
+                    parent, entry_pos = tail_parent
+
+                context = callee.call_context(args, entry_pos, parent)
+                instructions = self.function_code(callee, codes)
+                pc = 0
+
+            elif op == LOAD_CALLEE:
+                name, depth, slot, pos_start, pos_end = arg
+                value = resolve(name, depth, slot, context)
+                if value is None:
+                    return res.failure(
+                        RTError(pos_start, pos_end, f"'{name}' is not defined", context)
+                    )
+                push(value)
+
+            elif op == RETURN:
+                if not frames:
+                    return res.success(pop())
+                instructions, pc, context, tail_parent, pending = frames.pop()
+                if pending is not None:
+                    pending[0].memo_store(pending[1], stack[-1])
+
+            elif op == STORE_LOCAL:
+                value = stack[-1]
+                if type(value) is Constant:
+                    value = stack[-1] = located(value, arg[1], context)
+                context.frame[arg[0]] = value
+
+            elif op == STORE_VAR:
+                value = stack[-1]
+                if type(value) is Constant:
+                    value = stack[-1] = located(value, arg[1], context)
+                context.symbol_table.symbols[arg[0]] = value
+
+            elif op == FOR_ITER:
+                state = stack[-1]
+                i = next(state[1], None)
+                if i is not None:
+                    value = new(Number)
+                    value.value = i
+                    value.pos_start = value.pos_end = value.context = None
+                    if arg[1] is None:
+                        context.symbol_table.symbols[arg[0]] = value
+                    else:
+                        context.frame[arg[1]] = value
+                elif stalled(state[2]):
+                    return res.failure(
+                        RTError(arg[3], arg[4], STALLED_LOOP_DETAILS, context)
+                    )
+                else:
+                    pc = arg[2]
+
+            elif op == LOOP_APPEND:
+                value = pop()
+                stack[-1][0].append(value)
+
+            elif op == LOAD_STRING:
+                value = new(String)
+                value.value, value.pos_start, value.pos_end = arg
+                value.context = context
+                push(value)
+
+            elif op == UNARY_OP:
+                value, error = self.unary_op(pop(), arg, context)
+                if error:
+                    return res.failure(error)
+                push(value)
+
+            elif op == LOAD_NONE:
+                push(None)
+
+            elif op == POP_TOP:
+                pop()
+
+            elif op == FOR_PREP:
+                step_value = pop()
+                end_value = pop()
+                start_value = pop()
+                values = loop_values(start_value.value, end_value.value, step_value.value)
+                push([[], iter(values), values])
+
+            elif op == WHILE_PREP:
+                push([[]])
+
+            elif op == LOOP_END:
+                state = pop()
+                push(List(state[0]).set_context(context).set_pos(arg[0], arg[1]))
+
+            elif op == MAKE_FUNCTION:
+                push(self.make_function(arg, context))
+
+            elif op == BUILD_LIST:
+                push(self.build_list(stack, arg))
+
+            elif op == BUILD_MAP:
+                push(self.build_map(stack, arg))
+
+            else:
+                raise Exception(f"Unknown opcode {op}")
+
+    @staticmethod
+    def resolve(name: str, depth: int, slot, context: Context):
+        """Return the value of a variable, or None if it is not defined.
+
+        Args:
+            name: The variable's name, looked up if it is global.
+            depth: Number of enclosing functions up to the variable's frame.
+            slot: The variable's frame slot, or None for a global.
+            context: The current execution context.
+
+        Returns:
+            The variable's value, or None.
+        """
+        if slot is None:
+            value = context.symbol_table.symbols.get(name)
+            if value is None:
+                value = context.symbol_table.get(name)
+            return value
+        frame = context.frame
+        while depth:
+            frame = frame.parent
+            depth -= 1
+        return frame[slot]
+
+    @classmethod
+    def unboxed_value(cls, arg: tuple, context: Context):
+        """Execute EVAL_UNBOXED: evaluate a numeric subtree over raw numbers.
+
+        Args:
+            arg: The instruction's argument.
+            context: The current execution context.
+
+        Returns:
+            The subtree's value, or None if a variable is not a Number or
+            the computation fails.
+        """
+        (
+            variables,
+            evaluate,
+            comparison,
+            context_index,
+            pos_start,
+            pos_end,
+            _,
+        ) = arg
+        values = []
+        for name, depth, slot in variables:
+            value = cls.resolve(name, depth, slot, context)
+            if type(value) is not Number and type(value) is not Constant:
+                return None
+            values.append(value)
+        try:
+            raw = evaluate([value.value for value in values])
+        except ArithmeticError:
+            return None
+        if comparison:
+            return Number.TRUE if raw else Number.FALSE
+        result = object.__new__(Number)
+        result.value = raw
+        if context_index is None:
+            result.context = context
+        else:
+            result.context = values[context_index].context
+        result.pos_start = pos_start
+        result.pos_end = pos_end
+        return result
+
+    @staticmethod
+    def unary_op(operand, arg: tuple, context: Context) -> tuple:
+        """Execute UNARY_OP: negate an operand or apply NOT to it.
+
+        Args:
+            operand: The operand.
+            arg: The instruction's argument.
+            context: The current execution context.
+
+        Returns:
+            A tuple of (the result, placed by ``unary_result``, None) or
+            (None, error).
+        """
+        unary, node = arg
+        value, error = operand, None
+        if unary == TT_MINUS:
+            value, error = operand.multed_by(Number.of(-1))
+        elif unary == "NOT":
+            value, error = operand.notted()
+        if error:
+            return None, error
+        return unary_result(value, node, operand, context), None
+
+    def call_value(
+        self, callee, args: list, pos_start, pos_end, context: Context
+    ) -> RTResult:
+        """Call a value that is not a user-defined function.
+
+        Built-ins are called with the VM as their Caller; any other value
+        is called through ``execute``, which reports that it cannot be.
+
+        Args:
+            callee: The value called.
+            args: The argument values.
+            pos_start: Start position of the call expression.
+            pos_end: End position of the call expression.
+            context: The context the call is made in.
+
+        Returns:
+            An RTResult containing the return value or an error.
+        """
+        if type(callee) is BuiltInFunction:
+            return callee.call(args, pos_start, pos_end, context, self)
+        return called_copy(callee, pos_start, pos_end, context).execute(args)
+
+    @staticmethod
+    def function_code(callee: Function, codes: dict) -> list:
+        """Return the instructions of a function's body.
+
+        Args:
+            callee: The function called.
+            codes: The instructions already looked up in this run, by body
+                node.
+
+        Returns:
+            The body's instructions.
+        """
+        body_node = callee.body_node
+        instructions = codes.get(body_node)
+        if instructions is None:
+            instructions = compile_function_body(callee.name, body_node).instructions
+            codes[body_node] = instructions
+        return instructions
+
+    @staticmethod
+    def make_function(arg: tuple, context: Context) -> Function:
+        """Execute MAKE_FUNCTION: create a function, binding it if named.
+
+        Args:
+            arg: The instruction's argument.
+            context: The current execution context.
+
+        Returns:
+            The new Function.
+        """
+        (
+            func_name,
+            body_node,
+            arg_names,
+            frame_size,
+            pos_start,
+            pos_end,
+            bind,
+            slot,
+            callees,
+            memoize,
+        ) = arg
+        func_value = (
+            Function(
+                func_name,
+                body_node,
+                arg_names,
+                frame_size,
+                context.frame,
+                callees,
+                memoize,
+            )
+            .set_context(context)
+            .set_pos(pos_start, pos_end)
+        )
+        if bind:
+            if slot is None:
+                context.symbol_table.set(func_name, func_value)
+            else:
+                context.frame[slot] = func_value
+        return func_value
+
+    @staticmethod
+    def build_list(stack: list, arg: tuple) -> List:
+        """Execute BUILD_LIST: pop the elements off the stack into a List.
+
+        Args:
+            stack: The value stack.
+            arg: The instruction's argument.
+
+        Returns:
+            The new List.
+        """
+        count, pos_start, pos_end = arg
+        if count:
+            elements = stack[-count:]
+            del stack[-count:]
+        else:
+            elements = []
+        return List(elements).set_pos(pos_start, pos_end)
+
+    @staticmethod
+    def build_map(stack: list, arg: tuple) -> Map:
+        """Execute BUILD_MAP: pop the keys and values off the stack into a Map.
+
+        Args:
+            stack: The value stack.
+            arg: The instruction's argument.
+
+        Returns:
+            The new Map.
+        """
+        count, pos_start, pos_end = arg
+        elements = {}
+        if count:
+            items = stack[-2 * count:]
+            del stack[-2 * count:]
+            for index in range(0, len(items), 2):
+                key = items[index]
+                key_str = key.value if isinstance(key, String) else str(key)
+                elements[key_str] = items[index + 1]
+        return Map(elements).set_pos(pos_start, pos_end)
@@ -44,10 +44,12 @@ class Error:
             A formatted error message including the error name, details,
             file location, and a visual pointer to the error.
         """
+        source = self.pos_start.source
+        line, _ = source.line_col(self.pos_start.index)
         result = f"{self.error_name}: {self.details}\n"
-        result += f"File {self.pos_start.fName}, line {self.pos_start.lnNumber + 1}"
+        result += f"File {source.name}, line {line + 1}"
         result += "\n\n" + string_with_arrows(
-            self.pos_start.fText, self.pos_start, self.pos_end
+            source.text, self.pos_start, self.pos_end
         )
         return result
 
@@ -125,7 +127,7 @@ class RTError(Error):
         result = self.generate_traceback()
         result += f"{self.error_name}: {self.details}"
         result += "\n\n" + string_with_arrows(
-            self.pos_start.fText, self.pos_start, self.pos_end
+            self.pos_start.source.text, self.pos_start, self.pos_end
         )
         return result
 
@@ -143,8 +145,10 @@ class RTError(Error):
         ctx = self.context
 
         while ctx:
+            source = pos.source
+            line, _ = source.line_col(pos.index)
             result = (
-                f"  File {pos.fName}, line {str(pos.lnNumber + 1)}, "
+                f"  File {source.name}, line {str(line + 1)}, "
                 f"in {ctx.display_name}\n"
             ) + result
             pos = ctx.parent_entry_pos
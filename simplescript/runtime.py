@@ -1,42 +1,113 @@
 """Main runtime entry point for the SimpleScript interpreter.
 
 This module provides the ``run`` function that ties together the lexer,
-parser, and interpreter to execute SimpleScript source code.
+parser, and an execution engine to execute SimpleScript source code.
 """
 
-from typing import Tuple, Optional, Any
+from typing import Callable, Dict, Iterator, Tuple, Optional, Any
 from simplescript.core.lexer import Lexer
 from simplescript.core.parser import Parser
 from simplescript.core.interpreter import Interpreter
+from simplescript.core.evaluator import Evaluator
+from simplescript.core.compiler import Compiler
+from simplescript.core.closure_compiler import run_closure
+from simplescript.core.optimizer import Optimizer
+from simplescript.core.builtins import builtin_symbol_table
+from simplescript.core.vm import VM, DEFAULT_MAX_DEPTH
 from simplescript.core.context import Context
+from simplescript.utils.rt_result import RTResult
 from simplescript.utils.symbol_table import SymbolTable
-from simplescript.errors.errors import Error
+from simplescript.errors.errors import Error, RTError
 
-# Global symbol table persists across multiple run() calls (REPL sessions)
-global_symbol_table = SymbolTable()
+# Global symbol table persists across multiple run() calls (REPL sessions);
+# its parent holds the built-in functions
+global_symbol_table = SymbolTable(builtin_symbol_table())
 
 
-def run(file_name: str, text: str) -> Tuple[Optional[Any], Optional[Error]]:
-    """Execute SimpleScript source code and return the result.
+Engine = Callable[[Any, Context, int], RTResult]
+"""``engine(node, context, max_depth) -> RTResult``; see ``run``."""
+
+
+def _run_interpreter(node, context: Context, max_depth: int) -> RTResult:
+    """Evaluate an AST with the tree-walking Interpreter.
+
+    Its recursion is bounded by the Python stack, not by ``max_depth``.
+    """
+    return Interpreter().visit(node, context)
+
+
+def _run_evaluator(node, context: Context, max_depth: int) -> RTResult:
+    """Evaluate an AST with the Evaluator, which raises runtime errors.
+
+    Its recursion is bounded by the Python stack, not by ``max_depth``.
+    """
+    return Evaluator().visit(node, context)
+
+
+def _run_vm(node, context: Context, max_depth: int) -> RTResult:
+    """Compile an AST to bytecode and execute it on the VM."""
+    return VM(max_depth).run(Compiler().compile(node), context)
+
+
+def _run_closure(node, context: Context, max_depth: int) -> RTResult:
+    """Compile an AST to closures and execute them.
+
+    Their recursion is bounded by the Python stack, not by ``max_depth``.
+    """
+    return run_closure(node, context)
+
+
+ENGINES: Dict[str, Engine] = {
+    "interpreter": _run_interpreter,
+    "evaluator": _run_evaluator,
+    "vm": _run_vm,
+    "closure": _run_closure,
+}
+"""Available execution engines, keyed by the name accepted by ``run``."""
+
+
+def _get_engine(engine: str) -> Engine:
+    """Look up an execution engine by name.
+
+    Raises:
+        ValueError: If ``engine`` is not a known execution engine.
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown engine '{engine}', expected one of: {', '.join(ENGINES)}"
+        )
+    return ENGINES[engine]
+
+
+def _evaluate(evaluate: Engine, node, context: Context, max_depth: int) -> RTResult:
+    """Run an engine on a node, reporting a too deep tree as a runtime error.
 
-    Performs the full interpretation pipeline: lexing, parsing, and
-    interpreting. The global symbol table is shared across calls,
-    allowing variables defined in one call to be accessed in subsequent
-    calls (useful for REPL sessions).
+    The parser accepts any nesting the Python stack has room for, and the
+    engines may need more of it to walk the tree than the parser did.
+    """
+    try:
+        return evaluate(node, context, max_depth)
+    except RecursionError:
+        return RTResult().failure(
+            RTError(node.pos_start, node.pos_end, "Expression nested too deeply", context)
+        )
+
+
+def parse(
+    file_name: str, text: str, optimize: bool = True
+) -> Tuple[Optional[Any], Optional[Error]]:
+    """Lex, parse and optionally optimize SimpleScript source code.
 
     Args:
         file_name: The name of the source file (used for error reporting).
-        text: The SimpleScript source code to execute.
+        text: The SimpleScript source code to parse.
+        optimize: Whether to run the AST optimizer (constant folding and
+            arithmetic simplification) on the parsed tree.
 
     Returns:
-        A tuple of (result, error):
-            - On success: (value, None) where value is the computed result.
-            - On failure: (None, error) where error describes what went wrong.
-
-    Example:
-        >>> result, error = run('<stdin>', 'VAR x = 10 + 5')
-        >>> print(result)
-        15
+        A tuple of (node, error):
+            - On success: (node, None) where node is the ProgramNode.
+            - On failure: (None, error) with the lexing or parsing error.
     """
     # Tokenize
     lexer = Lexer(file_name, text)
@@ -50,10 +121,166 @@ def run(file_name: str, text: str) -> Tuple[Optional[Any], Optional[Error]]:
     if ast.error:
         return None, ast.error
 
-    # Interpret
-    interpreter = Interpreter()
+    # Optimize
+    node = ast.node
+    if optimize:
+        try:
+            node = Optimizer().optimize(node)
+        except RecursionError:
+            # Too deep to optimize in full. The optimizer rewrites the tree
+            # in place, one equivalent subtree at a time, so run what it left.
+            pass
+    return node, None
+
+
+def execute(
+    node, engine: str = "interpreter", max_depth: int = DEFAULT_MAX_DEPTH
+) -> Tuple[Optional[Any], Optional[Error]]:
+    """Execute a parsed AST in the global scope.
+
+    Args:
+        node: The root AST node, as returned by ``parse``.
+        engine: The execution engine to use (see ``run``).
+        max_depth: Maximum number of nested function calls on the VM
+            (see ``run``).
+
+    Returns:
+        A tuple of (result, error), as returned by ``run``.
+
+    Raises:
+        ValueError: If ``engine`` is not a known execution engine.
+    """
     context = Context("<simplescript>")
     context.symbol_table = global_symbol_table
-    result = interpreter.visit(ast.node, context)
+    result = _evaluate(_get_engine(engine), node, context, max_depth)
 
     return result.value, result.error
+
+
+def execute_iter(
+    node, engine: str = "interpreter", max_depth: int = DEFAULT_MAX_DEPTH
+) -> Iterator[Tuple[Optional[Any], Optional[Error]]]:
+    """Execute a parsed program one top-level statement at a time.
+
+    Args:
+        node: The ProgramNode to execute, as returned by ``parse``.
+        engine: The execution engine to use (see ``run``).
+        max_depth: Maximum number of nested function calls on the VM
+            (see ``run``).
+
+    Yields:
+        A (result, error) tuple for each statement, in order; a loop before
+        the last statement evaluates to None, as its value is unused.
+        Execution stops after the first error.
+
+    Raises:
+        ValueError: If ``engine`` is not a known execution engine.
+    """
+    evaluate = _get_engine(engine)
+    context = Context("<simplescript>")
+    context.symbol_table = global_symbol_table
+
+    for statement_node in node.statement_nodes:
+        result = _evaluate(evaluate, statement_node, context, max_depth)
+        yield result.value, result.error
+        if result.error:
+            return
+
+
+def run_iter(
+    file_name: str,
+    text: str,
+    engine: str = "interpreter",
+    optimize: bool = True,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> Iterator[Tuple[Optional[Any], Optional[Error]]]:
+    """Execute SimpleScript source code, yielding each statement's result.
+
+    The source is lexed and parsed in one pass, then its top-level
+    statements are executed in order, so the results of a long program
+    are available as soon as each statement finishes.
+
+    Args:
+        file_name: The name of the source file (used for error reporting).
+        text: The SimpleScript source code to execute.
+        engine: The execution engine to use (see ``run``).
+        optimize: Whether to run the AST optimizer before executing.
+        max_depth: Maximum number of nested function calls on the VM
+            (see ``run``).
+
+    Yields:
+        A (result, error) tuple for each top-level statement. A syntax
+        error is yielded alone, before anything runs; execution stops
+        after the first runtime error.
+
+    Example:
+        >>> for result, error in run_iter('<stdin>', 'VAR x = 1; x + 1'):
+        ...     print(result)
+        1
+        2
+
+    Raises:
+        ValueError: If ``engine`` is not a known execution engine.
+    """
+    _get_engine(engine)
+
+    node, error = parse(file_name, text, optimize)
+    if error:
+        yield None, error
+        return
+
+    yield from execute_iter(node, engine, max_depth)
+
+
+def run(
+    file_name: str,
+    text: str,
+    engine: str = "interpreter",
+    optimize: bool = True,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> Tuple[Optional[Any], Optional[Error]]:
+    """Execute SimpleScript source code and return the result.
+
+    Performs the full interpretation pipeline: lexing, parsing,
+    optimizing, and executing. The source may hold several statements
+    separated by newlines or ``;``; the result is the last one's value.
+    The global symbol table is shared across calls, allowing variables
+    defined in one call to be accessed in subsequent calls (useful for
+    REPL sessions).
+
+    Args:
+        file_name: The name of the source file (used for error reporting).
+        text: The SimpleScript source code to execute.
+        engine: The execution engine to use: ``"interpreter"`` (the
+            tree-walker), ``"evaluator"`` (the tree-walker propagating
+            runtime errors as exceptions), ``"vm"`` (bytecode compiler and
+            stack VM) or ``"closure"`` (AST compiled into pre-bound Python
+            closures).
+        optimize: Whether to run the AST optimizer (constant folding and
+            arithmetic simplification) before executing.
+        max_depth: Maximum number of nested function calls on the VM,
+            beyond which a call is the runtime error ``Maximum recursion
+            depth exceeded``. The VM keeps its frames on the heap, so this
+            may be raised far past the Python recursion limit; the other
+            engines recurse in Python and are bounded by its stack instead.
+
+    Returns:
+        A tuple of (result, error):
+            - On success: (value, None) where value is the computed result.
+            - On failure: (None, error) where error describes what went wrong.
+
+    Example:
+        >>> result, error = run('<stdin>', 'VAR x = 10 + 5')
+        >>> print(result)
+        15
+
+    Raises:
+        ValueError: If ``engine`` is not a known execution engine.
+    """
+    _get_engine(engine)
+
+    node, error = parse(file_name, text, optimize)
+    if error:
+        return None, error
+
+    return execute(node, engine, max_depth)
@@ -1,6 +1,7 @@
-"""Token and position classes for the SimpleScript lexer."""
+"""Token, position and source classes for the SimpleScript lexer."""
 
+from simplescript.tokens.source import Source
 from simplescript.tokens.position import Position
 from simplescript.tokens.token import Token
 
-__all__ = ["Position", "Token"]
+__all__ = ["Source", "Position", "Token"]
@@ -1,49 +1,67 @@
 """Position tracking for the SimpleScript lexer.
 
-This module provides the Position class used to track the current location
-within source code during lexical analysis and error reporting.
+This module provides the Position class used to point at a location within
+source code for the parser, the interpreters and error reporting.
 """
 
-from typing import Optional
+from typing import Optional, Tuple
+from simplescript.tokens.source import Source
 
 
 class Position:
-    """Tracks a position within source code text.
+    """A location within source code text.
 
-    Maintains the current index, line number, and column number within
-    the source text. Used throughout the lexer, parser, and error reporting
-    to pinpoint exact locations in the source code.
+    A position is only an offset into a shared Source. The line number,
+    column number, file name and text are read from that source on demand,
+    so creating a position is cheap and line/column numbers are only
+    computed for positions that are actually reported.
 
     Args:
+        source: The source the offset points into.
         index: Character index in the source text.
-        ln_number: Current line number (0-based).
-        col_number: Current column number (0-based).
-        f_name: Name of the source file.
-        f_text: Full source text content.
 
     Attributes:
+        source (Source): The source the offset points into.
         index (int): Character index in the source text.
-        lnNumber (int): Current line number (0-based).
-        colNumber (int): Current column number (0-based).
-        fName (str): Name of the source file.
-        fText (str): Full source text content.
     """
 
-    def __init__(
-        self, index: int, ln_number: int, col_number: int, f_name: str, f_text: str
-    ) -> None:
+    __slots__ = ("source", "index")
+
+    def __init__(self, source: Source, index: int) -> None:
+        self.source = source
         self.index = index
-        self.lnNumber = ln_number
-        self.colNumber = col_number
-        self.fName = f_name
-        self.fText = f_text
+
+    @property
+    def line_col(self) -> Tuple[int, int]:
+        """The (line number, column number) of this position, both 0-based."""
+        return self.source.line_col(self.index)
+
+    @property
+    def lnNumber(self) -> int:
+        """Line number (0-based)."""
+        return self.source.line_col(self.index)[0]
+
+    @property
+    def colNumber(self) -> int:
+        """Column number (0-based)."""
+        return self.source.line_col(self.index)[1]
+
+    @property
+    def fName(self) -> str:
+        """Name of the source file."""
+        return self.source.name
+
+    @property
+    def fText(self) -> str:
+        """Full source text content."""
+        return self.source.text
 
     def advance(self, current_char: Optional[str] = None) -> "Position":
         """Advance the position by one character.
 
-        Increments the index and column number. If the current character
-        is a newline, the line number is incremented and the column number
-        is reset to zero.
+        Line and column numbers follow from the index, so the character
+        being stepped over is not needed; the argument is accepted for
+        compatibility.
 
         Args:
             current_char: The character at the current position before advancing.
@@ -52,11 +70,6 @@ class Position:
             This Position instance for method chaining.
         """
         self.index += 1
-        self.colNumber += 1
-
-        if current_char == "\n":
-            self.lnNumber += 1
-            self.colNumber = 0
         return self
 
     def copy(self) -> "Position":
@@ -65,6 +78,4 @@ class Position:
         Returns:
             A new Position instance with the same values.
         """
-        return Position(
-            self.index, self.lnNumber, self.colNumber, self.fName, self.fText
-        )
+        return Position(self.source, self.index)
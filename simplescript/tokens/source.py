@@ -0,0 +1,92 @@
+"""Shared source text for the SimpleScript lexer.
+
+This module provides the Source class, which holds the name and text of
+a piece of SimpleScript source once, so that tokens and positions only
+need to store integer offsets into it.
+"""
+
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+
+class Source:
+    """The name and text of a piece of source code.
+
+    Every token and position lexed from the same text shares one Source.
+    Line and column numbers are not tracked while lexing; they are computed
+    from an offset only when needed (for example, to report an error), by
+    bisecting a table of line-start offsets that is built on first use.
+
+    Args:
+        name: Name of the source file (used for error reporting).
+        text: Full source text content.
+
+    Attributes:
+        name (str): Name of the source file.
+        text (str): Full source text content.
+
+    Example:
+        >>> source = Source("<stdin>", "VAR a = 1\\nVAR b = a")
+        >>> source.line_col(14)
+        (1, 4)
+    """
+
+    def __init__(self, name: str, text: str) -> None:
+        self.name = name
+        self.text = text
+        self._line_starts: Optional[List[int]] = None
+
+    @property
+    def line_starts(self) -> List[int]:
+        """Offsets of the first character of each line, built on first use."""
+        if self._line_starts is None:
+            text = self.text
+            starts = [0]
+            index = text.find("\n")
+            while index >= 0:
+                starts.append(index + 1)
+                index = text.find("\n", index + 1)
+            self._line_starts = starts
+        return self._line_starts
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """Compute the line and column of an offset.
+
+        Args:
+            offset: Character offset into the text. Offsets past the end of
+                the text count as part of the last line.
+
+        Returns:
+            A tuple of (line number, column number), both 0-based.
+        """
+        line_starts = self.line_starts
+        line = bisect_right(line_starts, offset) - 1
+        return line, offset - line_starts[line]
+
+    def line_text(self, line: int) -> str:
+        """Return the text of a line, without its trailing newline.
+
+        Args:
+            line: The 0-based line number.
+
+        Returns:
+            The line's text, or an empty string past the last line.
+        """
+        line_starts = self.line_starts
+        if line >= len(line_starts):
+            return ""
+        start = line_starts[line]
+        end = self.text.find("\n", start)
+        return self.text[start:] if end < 0 else self.text[start:end]
+
+    def __getstate__(self) -> dict:
+        # The line table is cheap to rebuild; keep it out of cached programs.
+        return {"name": self.name, "text": self.text}
+
+    def __setstate__(self, state: dict) -> None:
+        self.name = state["name"]
+        self.text = state["text"]
+        self._line_starts = None
+
+    def __repr__(self) -> str:
+        return f"Source({self.name!r})"
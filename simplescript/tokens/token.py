@@ -6,6 +6,7 @@ token produced by the lexer during tokenization.
 
 from typing import Any, Optional
 from simplescript.tokens.position import Position
+from simplescript.tokens.source import Source
 
 
 class Token:
@@ -13,21 +14,26 @@ class Token:
 
     A token holds the type of the lexical element (e.g., INT, PLUS, KEYWORD)
     along with an optional value (e.g., the actual number or identifier string),
-    and its position within the source text.
+    and its location as integer offsets into a shared Source. Position
+    objects for the start and end are only created when asked for.
 
     Args:
         type_: The token type identifier (from constants).
         value: The actual value of the token, if applicable.
         pos_start: Starting position of the token in source text.
-        pos_end: Ending position of the token in source text.
+        pos_end: Ending position of the token in source text. Defaults to
+            one character after ``pos_start``.
 
     Attributes:
         type (str): The token type identifier.
         value: The actual value of the token.
-        pos_start (Position): Starting position in source text.
-        pos_end (Position): Ending position in source text.
+        source (Source): The source the token was lexed from, or None.
+        start (int): Offset of the first character of the token.
+        end (int): Offset just past the last character of the token.
     """
 
+    __slots__ = ("type", "value", "source", "start", "end")
+
     def __init__(
         self,
         type_: str,
@@ -37,12 +43,54 @@ class Token:
     ) -> None:
         self.type = type_
         self.value = value
+        self.source: Optional[Source] = None
+        self.start = 0
+        self.end = 0
         if pos_start:
-            self.pos_start = pos_start.copy()
-            self.pos_end = pos_start.copy()
-            self.pos_end.advance()
-        if pos_end:
-            self.pos_end = pos_end
+            self.source = pos_start.source
+            self.start = pos_start.index
+            self.end = pos_end.index if pos_end else pos_start.index + 1
+        elif pos_end:
+            self.source = pos_end.source
+            self.start = self.end = pos_end.index
+
+    @classmethod
+    def from_offsets(
+        cls, type_: str, value: Any, source: Source, start: int, end: int
+    ) -> "Token":
+        """Create a token directly from offsets, without building positions.
+
+        Args:
+            type_: The token type identifier (from constants).
+            value: The actual value of the token, if applicable.
+            source: The source the token was lexed from.
+            start: Offset of the first character of the token.
+            end: Offset just past the last character of the token.
+
+        Returns:
+            The new Token.
+        """
+        token = cls.__new__(cls)
+        token.type = type_
+        token.value = value
+        token.source = source
+        token.start = start
+        token.end = end
+        return token
+
+    @property
+    def pos_start(self) -> Optional[Position]:
+        """Starting position of the token in source text."""
+        if self.source is None:
+            return None
+        return Position(self.source, self.start)
+
+    @property
+    def pos_end(self) -> Optional[Position]:
+        """Ending position of the token in source text."""
+        if self.source is None:
+            return None
+        return Position(self.source, self.end)
 
     def matches(self, type_: str, value: Any) -> bool:
         """Check if this token matches a given type and value.
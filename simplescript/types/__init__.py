@@ -4,5 +4,7 @@ from simplescript.types.base import Value
 from simplescript.types.number import Number
 from simplescript.types.string import String
 from simplescript.types.function import Function
+from simplescript.types.builtin_function import BuiltInFunction
+from simplescript.types.number_array import NumberArray
 
-__all__ = ["Value", "Number", "String", "Function"]
+__all__ = ["Value", "Number", "String", "Function", "BuiltInFunction", "NumberArray"]
@@ -23,6 +23,8 @@ class Value:
         context (Optional[Context]): The execution context.
     """
 
+    __slots__ = ("pos_start", "pos_end", "context")
+
     def __init__(self) -> None:
         self.set_pos()
         self.set_context()
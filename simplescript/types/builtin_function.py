@@ -0,0 +1,282 @@
+"""Built-in function type for the SimpleScript runtime.
+
+This module defines the BuiltInFunction class, which represents functions
+implemented in Python, such as ``ARRAY``, that SimpleScript code calls
+like user-defined functions, and the Caller interface through which they
+call functions back on the engine running them.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Tuple
+from simplescript.types.base import Value
+from simplescript.types.function import BaseFunction, Function, TailCall
+from simplescript.types.number import Constant
+from simplescript.core.context import Context
+from simplescript.utils.frame import Frame
+from simplescript.utils.memo_cache import MISSING
+from simplescript.utils.rt_result import RTResult
+from simplescript.errors.errors import RTError
+
+Implementation = Callable[..., Tuple[Optional[Value], Optional[RTError]]]
+"""``implementation(args, pos_start, pos_end, context, caller) -> (value, error)``."""
+
+
+class Caller(ABC):
+    """The interface an execution engine gives built-ins to call functions.
+
+    Higher-order built-ins such as ``MAP`` call a function once per list
+    element. ``calls`` returns a Python callable for those calls, which
+    runs user-defined functions on the engine that called the built-in.
+
+    Engines implement ``run_body``, through which ``call`` runs function
+    bodies, and may override ``body_runner`` to prepare a function's body
+    once for many calls.
+    """
+
+    def call(
+        self, func: Function, args: list, pos_start, pos_end, context: Context
+    ) -> RTResult:
+        """Call a user-defined function, as a call expression would.
+
+        When the body ends in a tail call, the body's result is a TailCall,
+        which is made here in a loop instead of recursively. A memoized
+        function's cache is consulted before the call, and stores the
+        result of the whole loop; the tail calls themselves are not cached.
+        Calls that are not tail calls nest Python calls, so deep recursion
+        exhausts the Python stack; that is reported as a runtime error at
+        the call that overflowed, as the VM reports exceeding its
+        ``max_depth``.
+
+        Args:
+            func: The function to call.
+            args: The argument values.
+            pos_start: Start position of the call expression.
+            pos_end: End position of the call expression.
+            context: The context the call is made in.
+
+        Returns:
+            An RTResult containing the return value, or an error if the
+            wrong number of arguments was passed, the recursion is too deep
+            or the body failed.
+        """
+        memoized = func
+        key = None
+        if func.memo is not None and len(args) == func.arity:
+            key, value = func.memo_lookup(args)
+            if value is not MISSING:
+                return RTResult().success(
+                    func.memo_result(value, pos_start, pos_end, context)
+                )
+
+        caller = parent = context
+        entry_pos = pos_start
+        while True:
+            if len(args) != func.arity:
+                return RTResult().failure(
+                    func.arity_error(len(args), pos_start, pos_end, context)
+                )
+            new_context = func.call_context(args, entry_pos, parent)
+            try:
+                res = self.run_body(func, new_context)
+            except RecursionError:
+                return RTResult().failure(
+                    RTError(pos_start, pos_end, "Maximum recursion depth exceeded", context)
+                )
+            tail_call = res.value
+            if type(tail_call) is not TailCall or res.error:
+                if key is not None and not res.error:
+                    memoized.memo_store(key, tail_call)
+                return res
+            if parent is caller:
+                # See TailCall: only the first tail call keeps its caller.
+                parent, entry_pos = new_context, tail_call.pos_start
+            func, args = tail_call.func, tail_call.args
+            pos_start, pos_end = tail_call.pos_start, tail_call.pos_end
+            context = new_context
+
+    @abstractmethod
+    def run_body(self, func: Function, context: Context) -> RTResult:
+        """Evaluate a function's body in a context prepared for the call.
+
+        Args:
+            func: The function whose body to evaluate.
+            context: The call's context, whose frame holds the arguments.
+
+        Returns:
+            An RTResult containing the body's value, which may be a
+            TailCall, or an error.
+        """
+
+    def body_runner(self, func: Function) -> Callable[[Context], RTResult]:
+        """Return a callable running a function's body, like ``run_body``.
+
+        Args:
+            func: The function whose body to run.
+
+        Returns:
+            A callable taking the call's context and returning the RTResult
+            of the body.
+        """
+        return lambda context: self.run_body(func, context)
+
+    def calls(
+        self, callee: BaseFunction, pos_start, pos_end, context: Context
+    ) -> Callable[[list], RTResult]:
+        """Return a callable making repeated calls to one function.
+
+        A user-defined function runs every call in the same Context,
+        replacing only its frame, and its arity and frame layout are read
+        once. Anything else is called normally, as is a memoized function
+        while its memo is caching, which it may stop doing mid-loop.
+
+        Args:
+            callee: The function to call.
+            pos_start: Start position of the calling expression.
+            pos_end: End position of the calling expression.
+            context: The context the calls are made in.
+
+        Returns:
+            A callable taking a list of argument values, which it takes
+            over, and returning the call's RTResult.
+        """
+        if type(callee) is BuiltInFunction:
+            return lambda args: callee.call(args, pos_start, pos_end, context, self)
+        call_context = Context(callee.name, context, pos_start)
+        call_context.symbol_table = callee.context.symbol_table
+        arity, parent = callee.arity, callee.frame
+        padding = callee.frame_size - arity
+        run_body = self.body_runner(callee)
+
+        def call(args: list) -> RTResult:
+            if len(args) != arity:
+                return RTResult().failure(
+                    callee.arity_error(len(args), pos_start, pos_end, context)
+                )
+            for i, arg_value in enumerate(args):
+                if type(arg_value) is Constant:
+                    args[i] = arg_value.set_context(call_context)
+                else:
+                    arg_value.context = call_context
+            frame = call_context.frame = Frame(args)
+            frame.parent = parent
+            if padding > 0:
+                frame.extend([None] * padding)
+            try:
+                res = run_body(call_context)
+            except RecursionError:
+                return RTResult().failure(
+                    RTError(pos_start, pos_end, "Maximum recursion depth exceeded", context)
+                )
+            tail_call = res.value
+            if type(tail_call) is TailCall and not res.error:
+                return self.call(
+                    tail_call.func,
+                    tail_call.args,
+                    tail_call.pos_start,
+                    tail_call.pos_end,
+                    call_context,
+                )
+            return res
+
+        memo = callee.memo
+        if memo is None:
+            return call
+
+        def call_memoized(args: list) -> RTResult:
+            if memo.active:
+                return self.call(callee, args, pos_start, pos_end, context)
+            return call(args)
+
+        return call_memoized
+
+
+class BuiltInFunction(BaseFunction):
+    """Represents a function implemented in Python.
+
+    The implementation receives the argument values, the position of the
+    call, the context it is made in and the engine's Caller, and returns a
+    ``(value, error)`` tuple like the operations of Value. Errors are
+    reported in the caller's context, since a built-in has no context of
+    its own.
+
+    Args:
+        name: The function name, as SimpleScript code calls it.
+        arity: Number of parameters, which every call must pass.
+        implementation: The Python function computing the result.
+        pure: Whether the result depends only on the arguments, so pure
+            user functions calling it can be memoized.
+
+    Attributes:
+        implementation (Callable): The Python function.
+        pure (bool): Whether the function is pure.
+
+    Example:
+        >>> BuiltInFunction("ARRAY", 1, builtin_array)
+        <built-in function ARRAY>
+    """
+
+    __slots__ = ("implementation", "pure")
+
+    def __init__(
+        self, name: str, arity: int, implementation: Implementation, pure: bool = True
+    ) -> None:
+        super().__init__(name, arity)
+        self.implementation = implementation
+        self.pure = pure
+
+    def call(
+        self, args: list, pos_start, pos_end, context, caller: Optional[Caller] = None
+    ) -> RTResult:
+        """Call the function with already-evaluated arguments.
+
+        Args:
+            args: The argument values.
+            pos_start: Start position of the call expression.
+            pos_end: End position of the call expression.
+            context: The context the call is made in.
+            caller: The engine making the call, for built-ins that call
+                functions; the Interpreter if None.
+
+        Returns:
+            An RTResult containing the return value, or an error if the
+            wrong number of arguments was passed or the call failed.
+        """
+        res = RTResult()
+        if len(args) != self.arity:
+            return res.failure(self.arity_error(len(args), pos_start, pos_end, context))
+        if caller is None:
+            # Import here to avoid circular import
+            from simplescript.core.interpreter import Interpreter
+
+            caller = Interpreter()
+        value, error = self.implementation(args, pos_start, pos_end, context, caller)
+        if error:
+            return res.failure(error)
+        return res.success(value.set_pos(pos_start, pos_end).set_context(context))
+
+    def execute(self, args: list) -> RTResult:
+        """Call the function at its own position and context.
+
+        Args:
+            args: List of argument values to pass to the function.
+
+        Returns:
+            An RTResult containing the return value or an error.
+        """
+        return self.call(args, self.pos_start, self.pos_end, self.context)
+
+    def copy(self) -> "BuiltInFunction":
+        """Create a copy of this BuiltInFunction.
+
+        Returns:
+            A new BuiltInFunction with the same implementation, position
+            and context.
+        """
+        copy = BuiltInFunction(self.name, self.arity, self.implementation, self.pure)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def __repr__(self) -> str:
+        """Return a string representation of this function."""
+        return f"<built-in function {self.name}>"
@@ -1,47 +1,304 @@
 """Function type for the SimpleScript runtime.
 
 This module defines the Function class, which represents user-defined
-functions that can be called with arguments during execution.
+functions that can be called with arguments during execution, and the
+BaseFunction class it shares with built-in functions.
 """
 
-from typing import List, Optional
+import math
+from typing import Dict, List, Optional, Tuple
 from simplescript.types.base import Value
+from simplescript.types.number import Number
+from simplescript.types.string import String
 from simplescript.utils.rt_result import RTResult
 from simplescript.core.context import Context
+from simplescript.utils.frame import Frame
+from simplescript.utils.memo_cache import MISSING, MemoCache, configured_memo_size
 from simplescript.utils.symbol_table import SymbolTable
 from simplescript.errors.errors import RTError
 
+_interpreter = None
+"""Interpreter shared by every ``execute`` call, created on first use."""
 
-class Function(Value):
+
+class BaseFunction(Value):
+    """A value that can be called: a user-defined or built-in function.
+
+    Args:
+        name: The function name.
+        arity: Number of parameters, which every call must pass.
+
+    Attributes:
+        name (str): The function name.
+        arity (int): Number of parameters.
+    """
+
+    __slots__ = ("name", "arity")
+
+    def __init__(self, name: str, arity: int) -> None:
+        super().__init__()
+        self.name = name
+        self.arity = arity
+
+    def arity_error(self, argc: int, pos_start, pos_end, context) -> RTError:
+        """Build the error reported when a call passes the wrong arg count.
+
+        Args:
+            argc: The number of arguments passed.
+            pos_start: Start position of the call expression.
+            pos_end: End position of the call expression.
+            context: The context the call is made in.
+
+        Returns:
+            The RTError, in the calling context.
+        """
+        if argc > self.arity:
+            details = f"{argc - self.arity} too many args passed into '{self.name}'"
+        else:
+            details = f"{self.arity - argc} too few args passed into '{self.name}'"
+        return RTError(pos_start, pos_end, details, context)
+
+
+class Function(BaseFunction):
     """Represents a user-defined function in SimpleScript.
 
     Functions have a name (or are anonymous), a body expression, and a
-    list of parameter names. When executed, they create a new scope and
+    list of parameter names. When executed, they create a new frame of
+    local variables, holding the arguments in its first slots, and
     evaluate their body expression.
 
+    A memoized function caches its results by argument values, in an LRU
+    cache of its own. Functions are memoized when they are pure (see
+    ``Resolver.pure_callees``) unless defined with ``NOMEMO FUNC``, and
+    always when defined with ``MEMO FUNC``; a pure function's cache is
+    adaptive, and stops caching calls that rarely repeat (see
+    ``MemoCache``). No function is memoized when the configured memo size
+    is 0 (see ``configured_memo_size``). Only calls whose arguments are
+    all numbers or strings are cached. The result of a pure function can
+    also depend on the global functions it calls: before using its cache,
+    a pure function checks that those names (and the names those functions
+    call in turn) still hold the same pure functions, and empties the
+    cache when they do not.
+
     Args:
         name: The function name, or None for anonymous functions.
         body_node: The AST node for the function body expression.
         arg_names: List of parameter name strings.
+        frame_size: Number of local variable slots (see
+            ``FuncDefNode.frame_size``); defaults to one per parameter.
+        frame: Frame of the function call the function was defined in,
+            whose variables the body can read, or None at top level.
+        callees: The global functions the body calls, if it is pure (see
+            ``FuncDefNode.callees``), or None.
+        memoize: Whether to memoize the function; defaults to whether it
+            is pure, with an adaptive cache.
+        memo_size: Most results the memo keeps; defaults to
+            ``configured_memo_size()``.
 
     Attributes:
         name (str): The function name (defaults to '<anonymous>').
         body_node: The body expression AST node.
         arg_names (list[str]): Parameter name strings.
+        arity (int): Number of parameters, which every call must pass.
+        frame_size (int): Number of local variable slots.
+        frame (Optional[Frame]): The defining call's frame.
+        callees (Optional[tuple[str, ...]]): The global functions a pure
+            body calls, or None if the function is not pure.
+        memo (Optional[MemoCache]): The cached results, or None if the
+            function is not memoized. Copies of the function share it.
     """
 
-    def __init__(self, name: Optional[str], body_node, arg_names: List[str]) -> None:
-        super().__init__()
-        self.name = name or "<anonymous>"
+    __slots__ = (
+        "body_node",
+        "arg_names",
+        "frame_size",
+        "frame",
+        "callees",
+        "memo",
+    )
+
+    def __init__(
+        self,
+        name: Optional[str],
+        body_node,
+        arg_names: List[str],
+        frame_size: Optional[int] = None,
+        frame: Optional[Frame] = None,
+        callees: Optional[Tuple[str, ...]] = None,
+        memoize: Optional[bool] = None,
+        memo_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(name or "<anonymous>", len(arg_names))
         self.body_node = body_node
         self.arg_names = arg_names
+        self.frame_size = self.arity if frame_size is None else frame_size
+        self.frame = frame
+        self.callees = callees
+        self.memo = None
+        if memoize is False or (memoize is None and callees is None):
+            return
+        if memo_size is None:
+            memo_size = configured_memo_size()
+        if memo_size > 0:
+            self.memo = MemoCache(memo_size, adaptive=memoize is None)
+
+    def memo_key(self, args: list) -> Optional[tuple]:
+        """Build the key this function's memo caches a call's result under.
+
+        Args:
+            args: The argument values, as many as the function's arity.
+
+        Returns:
+            The key, or None if the call's result must not be cached: the
+            function is not memoized (or its memo has stopped caching), an
+            argument is not a number or a string, or a global function it
+            calls is not pure (or not defined).
+        """
+        memo = self.memo
+        if memo is None or not memo.active:
+            return None
+        if self.callees is not None:
+            symbols = self.context.symbol_table
+            dependencies = memo.dependencies
+            if dependencies is not None:
+                for name, function in dependencies:
+                    if symbols.get(name) is not function:
+                        dependencies = None
+                        break
+            if dependencies is None:
+                dependencies = self.dependencies(symbols)
+                if dependencies is None:
+                    return None
+                if memo.dependencies is not None:
+                    # A global function was rebound since the results
+                    # were cached.
+                    memo.clear()
+                memo.dependencies = dependencies
+
+        key = []
+        for arg in args:
+            if not isinstance(arg, (Number, String)):
+                return None
+            value = arg.value
+            # Keep 1 and 1.0 apart, and 0.0 and -0.0: they are equal, but
+            # print differently.
+            if type(value) is float:
+                key.append((float, value, math.copysign(1.0, value)))
+            else:
+                key.append((type(value), value))
+        return tuple(key)
+
+    def memo_lookup(self, args: list) -> tuple:
+        """Look a call's result up in this function's memo.
+
+        Args:
+            args: The argument values, as many as the function's arity.
+
+        Returns:
+            A tuple of (the key to cache the call's result under, or None
+            if it must not be cached (see ``memo_key``); the cached result,
+            or ``MISSING``).
+        """
+        key = self.memo_key(args)
+        if key is None:
+            return None, MISSING
+        return key, self.memo.lookup(key)
+
+    def memo_store(self, key: tuple, value) -> None:
+        """Cache a call's result in this function's memo.
+
+        The memo keeps a copy of its own, so that the value returned by
+        the call (which may become another call's argument, taking that
+        call's context) does not change the cached result.
+
+        Args:
+            key: The key built by ``memo_key``.
+            value: The call's result.
+        """
+        self.memo.store(key, None if value is None else value.copy())
+
+    def memo_result(self, value, pos_start, pos_end, context: Context):
+        """Return a cached result as the call it stands for would.
+
+        Every call gets its own copy, located at the call and in a context
+        of this function entered from the call, as a computed result is.
+
+        Args:
+            value: The result found by ``memo_lookup``.
+            pos_start: Start position of the call expression.
+            pos_end: End position of the call expression.
+            context: The context the call is made in.
+
+        Returns:
+            The copy, or None if the function returned no value.
+        """
+        if value is None:
+            return None
+        call_context = Context(self.name, context, pos_start)
+        call_context.symbol_table = self.context.symbol_table
+        return value.copy().set_pos(pos_start, pos_end).set_context(call_context)
+
+    def dependencies(self, symbols: SymbolTable) -> Optional[tuple]:
+        """Find the global functions a pure function's result depends on.
+
+        Args:
+            symbols: The global symbol table (whose parent holds the
+                built-in functions).
+
+        Returns:
+            ``(name, function)`` pairs for every global function the body
+            calls, directly or through other functions, or None if one of
+            them is not a pure function (or a pure built-in).
+        """
+        found: Dict[str, Value] = {}
+        pending = list(self.callees)
+        while pending:
+            name = pending.pop()
+            if name in found:
+                continue
+            function = symbols.get(name)
+            if type(function) is Function:
+                if function.callees is None:
+                    return None
+                pending.extend(function.callees)
+            elif not getattr(function, "pure", False):
+                return None
+            found[name] = function
+        return tuple(found.items())
+
+    def call_context(self, args: list, pos_start, context: Context) -> Context:
+        """Create the context a call of this function runs its body in.
+
+        The new context's parent is the calling context, for tracebacks;
+        its frame's parent is the defining call's frame, for variables.
+        The context's frame holds the arguments in its first slots, and
+        the arguments are moved into the new context; a Constant, which
+        other expressions share, is replaced by a copy instead. The caller
+        must already have checked that ``len(args) == self.arity``.
+
+        Args:
+            args: The argument values.
+            pos_start: Start position of the call expression.
+            context: The context the call is made in.
+
+        Returns:
+            The new context.
+        """
+        new_context = Context(self.name, context, pos_start)
+        new_context.symbol_table = self.context.symbol_table
+        for i, arg_value in enumerate(args):
+            args[i] = arg_value.set_context(new_context)
+        frame = new_context.frame = Frame(args)
+        frame.parent = self.frame
+        if self.frame_size > len(args):
+            frame.extend([None] * (self.frame_size - len(args)))
+        return new_context
 
     def execute(self, args: list) -> RTResult:
         """Execute this function with the given arguments.
 
-        Creates a new execution context with its own symbol table,
-        binds the arguments to parameter names, and evaluates the
-        function body.
+        Evaluates the function body with the shared Interpreter, in a new
+        context whose frame holds the arguments.
 
         Args:
             args: List of argument values to pass to the function.
@@ -51,53 +308,31 @@ class Function(Value):
             the wrong number of arguments was provided or if the
             body evaluation fails.
         """
-        # Import here to avoid circular import
-        from simplescript.core.interpreter import Interpreter
-
-        res = RTResult()
-        interpreter = Interpreter()
-        new_context = Context(self.name, self.context, self.pos_start)
-        new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
-
-        if len(args) > len(self.arg_names):
-            return res.failure(
-                RTError(
-                    self.pos_start,
-                    self.pos_end,
-                    f"{len(args) - len(self.arg_names)} too many args passed into '{self.name}'",
-                    self.context,
-                )
-            )
-
-        if len(args) < len(self.arg_names):
-            return res.failure(
-                RTError(
-                    self.pos_start,
-                    self.pos_end,
-                    f"{len(self.arg_names) - len(args)} too few args passed into '{self.name}'",
-                    self.context,
-                )
-            )
-
-        for i in range(len(args)):
-            arg_name = self.arg_names[i]
-            arg_value = args[i]
-            arg_value.set_context(new_context)
-            new_context.symbol_table.set(arg_name, arg_value)
-
-        value = res.register(interpreter.visit(self.body_node, new_context))
-        if res.error:
-            return res
-        return res.success(value)
+        global _interpreter
+        if _interpreter is None:
+            # Import here to avoid circular import
+            from simplescript.core.interpreter import Interpreter
+
+            _interpreter = Interpreter()
+        return _interpreter.call(self, args, self.pos_start, self.pos_end, self.context)
 
     def copy(self) -> "Function":
         """Create a copy of this Function.
 
         Returns:
             A new Function instance with the same name, body, arguments,
-            position, and context.
+            frame, memo, position, and context.
         """
-        copy = Function(self.name, self.body_node, self.arg_names)
+        copy = Function(
+            self.name,
+            self.body_node,
+            self.arg_names,
+            self.frame_size,
+            self.frame,
+            self.callees,
+            memoize=False,
+        )
+        copy.memo = self.memo
         copy.set_context(self.context)
         copy.set_pos(self.pos_start, self.pos_end)
         return copy
@@ -105,3 +340,32 @@ class Function(Value):
     def __repr__(self) -> str:
         """Return a string representation of this function."""
         return f"<function {self.name}>"
+
+
+class TailCall:
+    """A call in tail position, to be made once its caller has returned.
+
+    A function body returns a TailCall instead of making a call marked
+    ``CallNode.tail``; the engine that called the function then calls
+    ``func`` in its place, in a loop, so tail recursion does not grow the
+    Python stack.
+
+    The context of the first tail call in such a loop has the function
+    that made it as its traceback parent, like any call; each later tail
+    call replaces the function that made it instead, so that a chain of
+    tail calls keeps two contexts alive rather than one per call.
+
+    Args:
+        func: The function to call.
+        args: The argument values.
+        pos_start: Start position of the call expression.
+        pos_end: End position of the call expression.
+    """
+
+    __slots__ = ("func", "args", "pos_start", "pos_end")
+
+    def __init__(self, func: Function, args: list, pos_start, pos_end) -> None:
+        self.func = func
+        self.args = args
+        self.pos_start = pos_start
+        self.pos_end = pos_end
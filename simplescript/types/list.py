@@ -1,7 +1,8 @@
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 from simplescript.errors.errors import RTError
 from simplescript.types.base import Value
 from simplescript.types.number import Number
+from simplescript.utils.persistent_vector import PersistentVector
 
 
 class List(Value):
@@ -10,15 +11,25 @@ class List(Value):
     Supports appending elements, removing elements by index, extending lists,
     and retrieving elements by index.
 
+    The elements are held in a PersistentVector, which is never modified:
+    every operation builds a new vector sharing most of its structure with
+    the old one. Appending and indexing are (amortized) O(1) and
+    O(log32 n), and copies share the vector, so ``copy`` (and so reading a
+    variable) is O(1).
+
     Args:
-        elements: List of values to initialize the list with.
+        elements: The values to initialize the list with.
 
     Attributes:
-        elements: List of values.
+        elements (PersistentVector): The values.
     """
 
-    def __init__(self, elements: list) -> None:
+    __slots__ = ("elements",)
+
+    def __init__(self, elements: Iterable[Value]) -> None:
         super().__init__()
+        if not isinstance(elements, PersistentVector):
+            elements = PersistentVector(elements)
         self.elements = elements
 
     def added_to(self, other: Value) -> Tuple[Optional["List"], Optional[RTError]]:
@@ -31,12 +42,15 @@ class List(Value):
             A tuple of (result List, None) on success, or (None, error).
         """
         new_list = self.copy()
-        new_list.elements.append(other)
+        new_list.elements = self.elements.append(other)
         return new_list, None
 
     def subbed_by(self, other: Value) -> Tuple[Optional["List"], Optional[RTError]]:
         """Remove an element from this list by index.
 
+        Removing the last element is O(log32 n); removing any other element
+        rebuilds the list.
+
         Args:
             other: The index of the element to remove.
 
@@ -46,7 +60,7 @@ class List(Value):
         if isinstance(other, Number):
             new_list = self.copy()
             try:
-                new_list.elements.pop(other.value)
+                new_list.elements = self.elements.remove(other.value)
                 return new_list, None
             except:
                 return None, RTError(
@@ -61,6 +75,8 @@ class List(Value):
     def multed_by(self, other: Value) -> Tuple[Optional["List"], Optional[RTError]]:
         """Extend this list with another list.
 
+        Costs one amortized O(1) append per element of ``other``.
+
         Args:
             other: The list to extend this list with.
 
@@ -69,7 +85,7 @@ class List(Value):
         """
         if isinstance(other, List):
             new_list = self.copy()
-            new_list.elements.extend(other.elements)
+            new_list.elements = self.elements.extend(other.elements)
             return new_list, None
         else:
             return None, Value.illegal_operation(self, other)
@@ -99,10 +115,12 @@ class List(Value):
     def copy(self):
         """Create a copy of this list.
 
+        The copy shares this list's elements, which are never modified.
+
         Returns:
             A new List instance with the same elements, position, and context.
         """
-        copy = List(self.elements[:])
+        copy = List(self.elements)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         return copy
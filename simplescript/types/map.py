@@ -1,7 +1,8 @@
-from typing import Optional, Tuple
+from typing import Mapping, Optional, Tuple
 from simplescript.errors.errors import RTError
 from simplescript.types.base import Value
 from simplescript.types.string import String
+from simplescript.utils.persistent_map import PersistentMap
 
 
 class Map(Value):
@@ -10,20 +11,33 @@ class Map(Value):
     Supports getting values by key, adding/updating key-value pairs,
     removing keys, and merging with other maps.
 
+    The elements are held in a PersistentMap (a hash array mapped trie),
+    which is never modified: adding or removing a key builds a new map
+    sharing most of its structure with the old one, in O(log32 n), and
+    copies share the map, so ``copy`` (and so reading a variable) is O(1).
+    Keys keep their insertion order.
+
     Args:
-        elements: Dictionary of key-value pairs.
+        elements: The key-value pairs to initialize the map with.
 
     Attributes:
-        elements: Dictionary mapping keys to values.
+        elements (PersistentMap): Mapping of keys to values.
     """
 
-    def __init__(self, elements: dict) -> None:
+    __slots__ = ("elements",)
+
+    def __init__(self, elements: Mapping[str, Value]) -> None:
         super().__init__()
+        if not isinstance(elements, PersistentMap):
+            elements = PersistentMap(elements)
         self.elements = elements
 
     def added_to(self, other: Value) -> Tuple[Optional["Map"], Optional[RTError]]:
         """Add or update a key-value pair in this map.
 
+        A map much smaller than this one is added key by key, in O(log32 n)
+        per key, sharing the rest of this map.
+
         Args:
             other: A Map containing the key-value pair(s) to add/update.
 
@@ -32,7 +46,7 @@ class Map(Value):
         """
         if isinstance(other, Map):
             new_map = self.copy()
-            new_map.elements.update(other.elements)
+            new_map.elements = self.elements.update(other.elements)
             return new_map, None
         else:
             return None, Value.illegal_operation(self, other)
@@ -49,7 +63,7 @@ class Map(Value):
         if isinstance(other, String):
             new_map = self.copy()
             try:
-                del new_map.elements[other.value]
+                new_map.elements = self.elements.remove(other.value)
                 return new_map, None
             except KeyError:
                 return None, RTError(
@@ -72,7 +86,7 @@ class Map(Value):
         """
         if isinstance(other, Map):
             new_map = self.copy()
-            new_map.elements.update(other.elements)
+            new_map.elements = self.elements.update(other.elements)
             return new_map, None
         else:
             return None, Value.illegal_operation(self, other)
@@ -102,10 +116,12 @@ class Map(Value):
     def copy(self):
         """Create a copy of this map.
 
+        The copy shares this map's elements, which are never modified.
+
         Returns:
             A new Map instance with the same elements, position, and context.
         """
-        copy = Map(self.elements.copy())
+        copy = Map(self.elements)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         return copy
@@ -5,10 +5,16 @@ floating-point values and supports arithmetic, comparison, and logical
 operations.
 """
 
-from typing import Tuple, Optional, Union
+from typing import List, Tuple, Optional, Union
 from simplescript.types.base import Value
 from simplescript.errors.errors import RTError
 
+SMALL_INT_MIN: int = -5
+"""Smallest integer with a shared Number (see ``Number.of``)."""
+
+SMALL_INT_MAX: int = 256
+"""Largest integer with a shared Number (see ``Number.of``)."""
+
 
 class Number(Value):
     """Represents a numeric value (integer or float) in SimpleScript.
@@ -21,12 +27,58 @@ class Number(Value):
 
     Attributes:
         value (Union[int, float]): The numeric value.
+        TRUE (Constant): Shared result of comparisons that hold.
+        FALSE (Constant): Shared result of comparisons that do not hold.
     """
 
+    __slots__ = ("value",)
+
+    TRUE: "Constant"
+    FALSE: "Constant"
+
     def __init__(self, value: Union[int, float]) -> None:
         super().__init__()
         self.value = value
 
+    @staticmethod
+    def of(value: Union[int, float]) -> "Number":
+        """Return a Number for a value, shared if it is a small integer.
+
+        Integers from ``SMALL_INT_MIN`` to ``SMALL_INT_MAX`` come from a
+        cache of Constants with no position or context; any other value
+        gets a new Number.
+
+        Args:
+            value: The numeric value.
+
+        Returns:
+            A shared Constant or a new Number.
+        """
+        if type(value) is int and SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+            return _small_ints[value - SMALL_INT_MIN]
+        return Number(value)
+
+    def operate_on_array(
+        self, method_name: str, other: Value
+    ) -> Tuple[Optional[Value], Optional[RTError]]:
+        """Apply an operation whose right operand is not a Number.
+
+        Broadcasts this number over a NumberArray on the right; any other
+        operand is an illegal operation.
+
+        Args:
+            method_name: The operation, e.g. ``"added_to"``.
+            other: The right-hand operand.
+
+        Returns:
+            A tuple of (result NumberArray, None) on success, or (None, error).
+        """
+        from simplescript.types.number_array import NumberArray
+
+        if isinstance(other, NumberArray):
+            return other.elementwise(method_name, self, reflected=True)
+        return None, self.illegal_operation(other)
+
     def added_to(self, other: Value) -> Tuple[Optional["Number"], Optional[RTError]]:
         """Add another number to this one.
 
@@ -38,7 +90,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return Number(self.value + other.value).set_context(self.context), None
-        return None, self.illegal_operation(other)
+        return self.operate_on_array("added_to", other)
 
     def subbed_by(self, other: Value) -> Tuple[Optional["Number"], Optional[RTError]]:
         """Subtract another number from this one.
@@ -51,7 +103,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return Number(self.value - other.value).set_context(self.context), None
-        return None, self.illegal_operation(other)
+        return self.operate_on_array("subbed_by", other)
 
     def multed_by(self, other: Value) -> Tuple[Optional["Number"], Optional[RTError]]:
         """Multiply this number by another.
@@ -64,7 +116,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return Number(self.value * other.value).set_context(self.context), None
-        return None, self.illegal_operation(other)
+        return self.operate_on_array("multed_by", other)
 
     def dived_by(self, other: Value) -> Tuple[Optional["Number"], Optional[RTError]]:
         """Divide this number by another.
@@ -82,7 +134,7 @@ class Number(Value):
                     other.pos_start, other.pos_end, "Division by zero", self.context
                 )
             return Number(self.value / other.value).set_context(self.context), None
-        return None, self.illegal_operation(other)
+        return self.operate_on_array("dived_by", other)
 
     def powed_by(self, other: Value) -> Tuple[Optional["Number"], Optional[RTError]]:
         """Raise this number to the power of another.
@@ -95,7 +147,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return Number(self.value**other.value).set_context(self.context), None
-        return None, self.illegal_operation(other)
+        return self.operate_on_array("powed_by", other)
 
     def get_comparison_eq(
         self, other: Value
@@ -106,14 +158,11 @@ class Number(Value):
             other: The value to compare against.
 
         Returns:
-            Number(1) if equal, Number(0) otherwise.
+            Number.TRUE if equal, Number.FALSE otherwise.
         """
         if isinstance(other, Number):
-            return (
-                Number(int(self.value == other.value)).set_context(self.context),
-                None,
-            )
-        return None, self.illegal_operation(other)
+            return Number.TRUE if self.value == other.value else Number.FALSE, None
+        return self.operate_on_array("get_comparison_eq", other)
 
     def get_comparison_ne(
         self, other: Value
@@ -124,14 +173,11 @@ class Number(Value):
             other: The value to compare against.
 
         Returns:
-            Number(1) if not equal, Number(0) otherwise.
+            Number.TRUE if not equal, Number.FALSE otherwise.
         """
         if isinstance(other, Number):
-            return (
-                Number(int(self.value != other.value)).set_context(self.context),
-                None,
-            )
-        return None, self.illegal_operation(other)
+            return Number.TRUE if self.value != other.value else Number.FALSE, None
+        return self.operate_on_array("get_comparison_ne", other)
 
     def get_comparison_lt(
         self, other: Value
@@ -142,11 +188,11 @@ class Number(Value):
             other: The value to compare against.
 
         Returns:
-            Number(1) if less than, Number(0) otherwise.
+            Number.TRUE if less than, Number.FALSE otherwise.
         """
         if isinstance(other, Number):
-            return Number(int(self.value < other.value)).set_context(self.context), None
-        return None, self.illegal_operation(other)
+            return Number.TRUE if self.value < other.value else Number.FALSE, None
+        return self.operate_on_array("get_comparison_lt", other)
 
     def get_comparison_gt(
         self, other: Value
@@ -157,11 +203,11 @@ class Number(Value):
             other: The value to compare against.
 
         Returns:
-            Number(1) if greater than, Number(0) otherwise.
+            Number.TRUE if greater than, Number.FALSE otherwise.
         """
         if isinstance(other, Number):
-            return Number(int(self.value > other.value)).set_context(self.context), None
-        return None, self.illegal_operation(other)
+            return Number.TRUE if self.value > other.value else Number.FALSE, None
+        return self.operate_on_array("get_comparison_gt", other)
 
     def get_comparison_lte(
         self, other: Value
@@ -172,14 +218,11 @@ class Number(Value):
             other: The value to compare against.
 
         Returns:
-            Number(1) if less than or equal, Number(0) otherwise.
+            Number.TRUE if less than or equal, Number.FALSE otherwise.
         """
         if isinstance(other, Number):
-            return (
-                Number(int(self.value <= other.value)).set_context(self.context),
-                None,
-            )
-        return None, self.illegal_operation(other)
+            return Number.TRUE if self.value <= other.value else Number.FALSE, None
+        return self.operate_on_array("get_comparison_lte", other)
 
     def get_comparison_gte(
         self, other: Value
@@ -190,14 +233,11 @@ class Number(Value):
             other: The value to compare against.
 
         Returns:
-            Number(1) if greater than or equal, Number(0) otherwise.
+            Number.TRUE if greater than or equal, Number.FALSE otherwise.
         """
         if isinstance(other, Number):
-            return (
-                Number(int(self.value >= other.value)).set_context(self.context),
-                None,
-            )
-        return None, self.illegal_operation(other)
+            return Number.TRUE if self.value >= other.value else Number.FALSE, None
+        return self.operate_on_array("get_comparison_gte", other)
 
     def anded_by(self, other: Value) -> Tuple[Optional["Number"], Optional[RTError]]:
         """Perform logical AND with another number.
@@ -206,13 +246,11 @@ class Number(Value):
             other: The right-hand operand.
 
         Returns:
-            Number(1) if both are truthy, Number(0) otherwise.
+            0 if this number is zero, otherwise the right operand's value
+            truncated to an integer.
         """
         if isinstance(other, Number):
-            return (
-                Number(int(self.value and other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value and other.value)), None
         return None, self.illegal_operation(other)
 
     def ored_by(self, other: Value) -> Tuple[Optional["Number"], Optional[RTError]]:
@@ -222,22 +260,20 @@ class Number(Value):
             other: The right-hand operand.
 
         Returns:
-            Number(1) if either is truthy, Number(0) otherwise.
+            This number's value truncated to an integer if it is non-zero,
+            otherwise the right operand's.
         """
         if isinstance(other, Number):
-            return (
-                Number(int(self.value or other.value)).set_context(self.context),
-                None,
-            )
+            return Number.of(int(self.value or other.value)), None
         return None, self.illegal_operation(other)
 
     def notted(self) -> Tuple["Number", None]:
         """Perform logical NOT on this number.
 
         Returns:
-            Number(1) if this value is 0, Number(0) otherwise.
+            Number.TRUE if this value is 0, Number.FALSE otherwise.
         """
-        return Number(1 if self.value == 0 else 0).set_context(self.context), None
+        return Number.TRUE if self.value == 0 else Number.FALSE, None
 
     def is_true(self) -> bool:
         """Check if this number is truthy (non-zero).
@@ -260,3 +296,78 @@ class Number(Value):
 
     def __repr__(self) -> str:
         return str(self.value)
+
+
+class Constant(Number):
+    """A Number shared between evaluations, which is never modified in place.
+
+    Constants are used for the small-integer cache, ``Number.TRUE`` /
+    ``Number.FALSE`` and the literals that the engines build once per
+    NumberNode, none of which have a position or context. Because several
+    expressions can hold the same Constant, ``set_pos`` and ``set_context``
+    return a modified copy instead of changing it; callers must use the
+    returned value.
+
+    Args:
+        value: The numeric value.
+        pos_start: Start position in source text, if any.
+        pos_end: End position in source text, if any.
+        context: The execution context, if any.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, value: Union[int, float], pos_start=None, pos_end=None, context=None
+    ) -> None:
+        self.value = value
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+        self.context = context
+
+    def set_pos(self, pos_start=None, pos_end=None) -> Number:
+        """Return a copy of this constant at the given position.
+
+        Args:
+            pos_start: Starting position in source text.
+            pos_end: Ending position in source text.
+
+        Returns:
+            A new Number with this value, the given position and this context.
+        """
+        return self.copy().set_pos(pos_start, pos_end)
+
+    def set_context(self, context=None) -> Number:
+        """Return a copy of this constant in the given context.
+
+        Args:
+            context: The execution context.
+
+        Returns:
+            A new Number with this value and position, in the given context.
+        """
+        return self.copy().set_context(context)
+
+    def located(self, pos_start, pos_end, context) -> Number:
+        """Return a copy of this constant at a position, in a context.
+
+        Args:
+            pos_start: Starting position in source text.
+            pos_end: Ending position in source text.
+            context: The execution context.
+
+        Returns:
+            A new, unshared Number with this value.
+        """
+        copy = Number(self.value)
+        copy.pos_start = pos_start
+        copy.pos_end = pos_end
+        copy.context = context
+        return copy
+
+
+_small_ints: List[Constant] = [
+    Constant(value) for value in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)
+]
+Number.TRUE = _small_ints[1 - SMALL_INT_MIN]
+Number.FALSE = _small_ints[0 - SMALL_INT_MIN]
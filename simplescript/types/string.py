@@ -4,7 +4,7 @@ This module defines the String class (internally String), which represents
 string values and supports concatenation and repetition operations.
 """
 
-from typing import Tuple, Optional
+from typing import List, Optional, Tuple
 from simplescript.types.base import Value
 
 
@@ -14,6 +14,14 @@ class String(Value):
     Supports concatenation with other strings (using +) and repetition
     with numbers (using ``*``).
 
+    Concatenation is deferred: the result keeps a list of the pieces to
+    join, and the text is only built (once) when ``value`` is read, e.g.
+    to print or compare the string. The pieces list is append-only and
+    shared: appending to a String whose pieces end the list adds one piece
+    in place, so ``VAR s = s + "..."`` in a loop costs amortized O(1) per
+    iteration instead of copying the text built so far. Appending to an
+    older String copies its pieces into a new list first.
+
     Args:
         value: The string content.
 
@@ -21,13 +29,41 @@ class String(Value):
         value (str): The string content.
     """
 
+    __slots__ = ("_text", "_pieces", "_count")
+
     def __init__(self, value: str) -> None:
         super().__init__()
         self.value = value
 
+    @classmethod
+    def _joined(cls, pieces: List[str], count: int) -> "String":
+        """Create a String for the first ``count`` entries of ``pieces``."""
+        string = cls.__new__(cls)
+        string.pos_start = string.pos_end = string.context = None
+        string._text = None
+        string._pieces = pieces
+        string._count = count
+        return string
+
+    @property
+    def value(self) -> str:
+        """The string content, joined from its pieces on first access."""
+        if self._text is None:
+            self._text = "".join(self._pieces[: self._count])
+            self._pieces = None
+        return self._text
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self._text = value
+        self._pieces = None
+
     def added_to(self, other: Value) -> Tuple[Optional["String"], Optional[Exception]]:
         """Concatenate another string to this one.
 
+        Costs amortized O(1), unless a longer string was already built on
+        top of this one, in which case this string's pieces are copied.
+
         Args:
             other: The string value to concatenate.
 
@@ -36,7 +72,15 @@ class String(Value):
             if the other value is not a string.
         """
         if isinstance(other, String):
-            return String(self.value + other.value).set_context(self.context), None
+            pieces = self._pieces
+            if pieces is None:
+                pieces, count = [self._text], 1
+            else:
+                count = self._count
+                if len(pieces) != count:
+                    pieces = pieces[:count]
+            pieces.append(other.value)
+            return String._joined(pieces, count + 1).set_context(self.context), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -68,10 +112,15 @@ class String(Value):
     def copy(self) -> "String":
         """Create a copy of this String.
 
+        The copy shares this string's pieces without joining them.
+
         Returns:
             A new String instance with the same value, position, and context.
         """
-        copy = String(self.value)
+        if self._text is None:
+            copy = String._joined(self._pieces, self._count)
+        else:
+            copy = String(self._text)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         return copy
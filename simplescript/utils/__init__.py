@@ -1,8 +1,10 @@
 """Utility classes for the SimpleScript interpreter."""
 
 from simplescript.utils.symbol_table import SymbolTable
+from simplescript.utils.frame import Frame
+from simplescript.utils.memo_cache import MemoCache
 from simplescript.utils.parse_result import ParseResult
 from simplescript.utils.rt_result import RTResult
 from simplescript.utils.string_with_arrows import string_with_arrows
 
-__all__ = ["SymbolTable", "ParseResult", "RTResult", "string_with_arrows"]
+__all__ = ["SymbolTable", "Frame", "MemoCache", "ParseResult", "RTResult", "string_with_arrows"]
@@ -0,0 +1,53 @@
+"""Call frames holding the local variables of a function call.
+
+This module provides the Frame class, the array-backed storage for the
+locals of one SimpleScript function call, whose variables the resolver
+has already given fixed slot numbers.
+"""
+
+from typing import Any, List, Optional
+
+
+class Frame(list):
+    """The local variables of one function call, indexed by slot.
+
+    The resolver numbers every local of a function (its parameters first,
+    then the names it assigns) and records a (depth, slot) address on each
+    variable node, so reading a local is a list index instead of a
+    dictionary lookup by name. Slots of locals not yet assigned hold None.
+
+    Frames are created on every call, so Frame keeps list's constructor:
+    use ``new_frame``, or build one from the arguments and then set
+    ``parent`` and pad it to the function's frame size.
+
+    Attributes:
+        parent (Optional[Frame]): Frame of the call the function was
+            defined in, holding the variables at depth 1; its own
+            ``parent`` holds those at depth 2, and so on. None for a
+            function defined at the top level.
+
+    Example:
+        >>> frame = new_frame([Number(1)], 2, None)
+        >>> frame[1] is None
+        True
+    """
+
+    __slots__ = ("parent",)
+
+
+def new_frame(args: List[Any], size: int, parent: Optional[Frame]) -> Frame:
+    """Create the frame for a function call.
+
+    Args:
+        args: The argument values, which fill the first slots.
+        size: Total number of slots; the rest start as None.
+        parent: Frame of the call the function was defined in, or None.
+
+    Returns:
+        The new frame.
+    """
+    frame = Frame(args)
+    frame.parent = parent
+    if size > len(args):
+        frame.extend([None] * (size - len(args)))
+    return frame
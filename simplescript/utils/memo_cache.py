@@ -0,0 +1,143 @@
+"""Bounded cache of the results of a memoized function.
+
+This module provides the MemoCache class, a least-recently-used cache
+mapping the argument values of calls to a SimpleScript function to the
+values those calls returned.
+
+The number of results a memoized function keeps is set through the
+``SIMPLESCRIPT_MEMO_SIZE`` environment variable; ``0`` turns memoization
+off.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+DEFAULT_MEMO_SIZE: int = 1024
+"""Number of results a memoized function keeps when no size is configured."""
+
+MEMO_SIZE_ENV_VAR: str = "SIMPLESCRIPT_MEMO_SIZE"
+"""Environment variable setting the number of results a memoized function keeps."""
+
+MIN_HIT_RATE: float = 0.25
+"""Hits per miss below which a full adaptive cache stops caching."""
+
+MISSING = object()
+"""Returned by ``MemoCache.lookup`` for arguments with no cached result."""
+
+
+class MemoCache:
+    """The cached results of one memoized function, least recently used first.
+
+    Looking up a key moves it to the end; storing a key when the cache is
+    full evicts the entry at the front, which is the one least recently
+    looked up or stored.
+
+    An adaptive cache stops caching when it is full but has had fewer than
+    ``MIN_HIT_RATE`` hits per miss: the calls it is seeing rarely repeat,
+    so caching them costs more than it saves.
+
+    Args:
+        maxsize: Most results kept; defaults to ``configured_memo_size()``.
+        adaptive: Whether the cache may stop caching.
+
+    Attributes:
+        maxsize (int): Most results kept.
+        adaptive (bool): Whether the cache may stop caching.
+        active (bool): False once an adaptive cache has stopped caching;
+            it is then empty, and Function no longer looks results up.
+        hits (int): Number of lookups that found a result.
+        misses (int): Number of lookups that did not.
+        dependencies (Optional[tuple]): ``(name, function)`` pairs of the
+            global functions the cached results were computed with, or None
+            before the first call (kept up to date by Function).
+
+    Example:
+        >>> memo = MemoCache(1)
+        >>> memo.store((1,), "one")
+        >>> memo.lookup((1,)), memo.hits
+        ('one', 1)
+    """
+
+    __slots__ = (
+        "maxsize",
+        "adaptive",
+        "active",
+        "hits",
+        "misses",
+        "dependencies",
+        "_results",
+    )
+
+    def __init__(self, maxsize: Optional[int] = None, adaptive: bool = False) -> None:
+        self.maxsize = configured_memo_size() if maxsize is None else maxsize
+        self.adaptive = adaptive
+        self.active = True
+        self.hits = 0
+        self.misses = 0
+        self.dependencies: Optional[Tuple[Tuple[str, Any], ...]] = None
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def lookup(self, key: Hashable) -> Any:
+        """Return the result cached for a key, or ``MISSING``.
+
+        Args:
+            key: The key built from the call's arguments.
+
+        Returns:
+            The cached result, or ``MISSING`` if there is none.
+        """
+        results = self._results
+        value = results.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            results.move_to_end(key)
+        return value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Cache the result for a key, evicting the least recently used one.
+
+        An adaptive cache with too few hits stops caching instead of
+        evicting (see the class docstring).
+
+        Args:
+            key: The key built from the call's arguments.
+            value: The call's result.
+        """
+        results = self._results
+        results[key] = value
+        if len(results) > self.maxsize:
+            if self.adaptive and self.hits < self.misses * MIN_HIT_RATE:
+                self.active = False
+                results.clear()
+            else:
+                results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result; the hit and miss counts are kept."""
+        self._results.clear()
+
+    def __repr__(self) -> str:
+        return (
+            f"MemoCache(size={len(self._results)}, maxsize={self.maxsize}, "
+            f"hits={self.hits}, misses={self.misses}, active={self.active})"
+        )
+
+
+def configured_memo_size() -> int:
+    """Return the memo size set through ``MEMO_SIZE_ENV_VAR``.
+
+    Returns:
+        The variable's value, or ``DEFAULT_MEMO_SIZE`` if it is unset or
+        not a non-negative integer.
+    """
+    try:
+        size = int(os.environ.get(MEMO_SIZE_ENV_VAR, ""))
+    except ValueError:
+        return DEFAULT_MEMO_SIZE
+    return size if size >= 0 else DEFAULT_MEMO_SIZE
@@ -18,6 +18,8 @@ class ParseResult:
         advance_count (int): Number of tokens consumed during parsing.
     """
 
+    __slots__ = ("error", "node", "advance_count")
+
     def __init__(self) -> None:
         self.error = None
         self.node = None
@@ -0,0 +1,355 @@
+"""Persistent map used to store the elements of a SimpleScript Map.
+
+This module provides the PersistentMap class, an immutable mapping backed
+by a hash array mapped trie (HAMT), so that adding, replacing and removing
+a key share structure with the original map instead of copying it.
+"""
+
+from typing import Any, Iterable, Iterator, Mapping, Optional, Tuple, Union
+from simplescript.utils.persistent_vector import PersistentVector
+
+BITS: int = 5
+"""Number of hash bits consumed by each level of the trie."""
+
+MASK: int = (1 << BITS) - 1
+"""Mask selecting the child index at one level of the trie."""
+
+HASH_BITS: int = 64
+"""Number of hash bits used; keys whose hashes agree on all of them collide."""
+
+HASH_MASK: int = (1 << HASH_BITS) - 1
+"""Mask turning ``hash(key)`` into a non-negative ``HASH_BITS``-bit value."""
+
+MERGE_REBUILD_RATIO: int = 8
+"""Right-hand maps at least 1/8 the size of the left are merged by rebuilding."""
+
+_MISSING = object()
+_DELETED = object()
+
+
+def _count_bits(bits: int) -> int:
+    """Return the number of set bits in a non-negative integer."""
+    return bin(bits).count("1")
+
+
+_popcount = getattr(int, "bit_count", _count_bits)
+"""Count set bits, with ``int.bit_count`` where it exists (Python 3.10+)."""
+
+
+def _lookup(root: "_BitmapNode", key_hash: int, key: Any) -> Any:
+    """Return the entry stored for ``key`` in a trie, or ``_MISSING``.
+
+    Walks down from ``root`` in a loop rather than through each node's
+    ``get``, since lookups are the most frequent operation.
+    """
+    node = root
+    shift = 0
+    while True:
+        if type(node) is _CollisionNode:
+            return node.get(shift, key_hash, key, _MISSING)
+        bitmap = node.bitmap
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not bitmap & bit:
+            return _MISSING
+        node = node.items[_popcount(bitmap & (bit - 1))]
+        if type(node) is tuple:
+            return node[1] if node[0] == key else _MISSING
+        shift += BITS
+
+
+def _merge(shift: int, item1: Any, hash1: int, item2: Any, hash2: int) -> Any:
+    """Build the smallest subtree at ``shift`` holding two items.
+
+    Args:
+        shift: Hash bits already consumed above the subtree.
+        item1: A leaf (key, value) tuple or a collision node.
+        hash1: The hash of ``item1``'s key(s).
+        item2: A leaf tuple for a key not in ``item1``.
+        hash2: The hash of ``item2``'s key.
+
+    Returns:
+        A bitmap node or, when the hashes are equal, a collision node.
+    """
+    if hash1 == hash2:
+        if type(item1) is _CollisionNode:
+            return _CollisionNode(hash1, item1.pairs + (item2,))
+        return _CollisionNode(hash1, (item1, item2))
+    index1 = (hash1 >> shift) & MASK
+    index2 = (hash2 >> shift) & MASK
+    if index1 == index2:
+        return _BitmapNode(1 << index1, (_merge(shift + BITS, item1, hash1, item2, hash2),))
+    items = (item1, item2) if index1 < index2 else (item2, item1)
+    return _BitmapNode((1 << index1) | (1 << index2), items)
+
+
+class _BitmapNode:
+    """A trie node with up to 32 children, present ones listed in ``items``.
+
+    Bit ``i`` of ``bitmap`` is set when the node has a child for the hash
+    chunk ``i``; ``items`` holds those children in chunk order. A child is
+    either a (key, value) leaf tuple or another node.
+    """
+
+    __slots__ = ("bitmap", "items")
+
+    def __init__(self, bitmap: int, items: tuple) -> None:
+        self.bitmap = bitmap
+        self.items = items
+
+    def set(self, shift: int, key_hash: int, key: Any, value: Any) -> "_BitmapNode":
+        bit = 1 << ((key_hash >> shift) & MASK)
+        index = _popcount(self.bitmap & (bit - 1))
+        items = self.items
+        if not self.bitmap & bit:
+            return _BitmapNode(
+                self.bitmap | bit, items[:index] + ((key, value),) + items[index:]
+            )
+
+        item = items[index]
+        if type(item) is not tuple:
+            child = item.set(shift + BITS, key_hash, key, value)
+        elif item[0] == key:
+            child = (key, value)
+        else:
+            child = _merge(
+                shift + BITS, item, hash(item[0]) & HASH_MASK, (key, value), key_hash
+            )
+        return _BitmapNode(self.bitmap, items[:index] + (child,) + items[index + 1:])
+
+    def remove(self, shift: int, key_hash: int, key: Any) -> Any:
+        """Return this node without ``key``.
+
+        Returns:
+            The new node; None if it is empty; or, below the root, the only
+            remaining leaf tuple, so the parent can hold it directly.
+
+        Raises:
+            KeyError: If ``key`` is not in the node.
+        """
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            raise KeyError(key)
+        index = _popcount(self.bitmap & (bit - 1))
+        items = self.items
+        item = items[index]
+        if type(item) is tuple:
+            if item[0] != key:
+                raise KeyError(key)
+            child = None
+        else:
+            child = item.remove(shift + BITS, key_hash, key)
+
+        if child is None:
+            if self.bitmap == bit:
+                return None
+            items = items[:index] + items[index + 1:]
+            if shift and len(items) == 1 and type(items[0]) is tuple:
+                return items[0]
+            return _BitmapNode(self.bitmap ^ bit, items)
+        if shift and len(items) == 1 and type(child) is tuple:
+            return child
+        return _BitmapNode(self.bitmap, items[:index] + (child,) + items[index + 1:])
+
+
+class _CollisionNode:
+    """A trie node holding leaves for keys whose hashes are equal."""
+
+    __slots__ = ("key_hash", "pairs")
+
+    def __init__(self, key_hash: int, pairs: tuple) -> None:
+        self.key_hash = key_hash
+        self.pairs = pairs
+
+    def get(self, shift: int, key_hash: int, key: Any, default: Any) -> Any:
+        if key_hash == self.key_hash:
+            for pair in self.pairs:
+                if pair[0] == key:
+                    return pair[1]
+        return default
+
+    def set(self, shift: int, key_hash: int, key: Any, value: Any) -> Any:
+        if key_hash != self.key_hash:
+            return _merge(shift, self, self.key_hash, (key, value), key_hash)
+        pairs = tuple(pair for pair in self.pairs if pair[0] != key)
+        return _CollisionNode(key_hash, pairs + ((key, value),))
+
+    def remove(self, shift: int, key_hash: int, key: Any) -> Any:
+        pairs = tuple(pair for pair in self.pairs if pair[0] != key)
+        if key_hash != self.key_hash or len(pairs) == len(self.pairs):
+            raise KeyError(key)
+        return pairs[0] if len(pairs) == 1 else _CollisionNode(key_hash, pairs)
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+class PersistentMap:
+    """An immutable mapping with cheap non-destructive updates.
+
+    Keys are stored in a hash array mapped trie: each level consumes five
+    bits of the key's hash to pick one of up to 32 children, so lookups,
+    insertions and removals touch O(log32 n) nodes, and every update
+    returns a new map sharing all unchanged nodes with the old one.
+
+    Iteration follows insertion order, like a dict: replacing a key's value
+    keeps its position, and a removed key that is added again goes last.
+    The order is kept in a PersistentVector of keys; removed keys leave a
+    placeholder there until more than half the entries are placeholders,
+    when the map is rebuilt.
+
+    Args:
+        items: A mapping, or an iterable of (key, value) pairs.
+
+    Attributes:
+        count (int): Number of keys.
+        root: Root node of the trie. Each leaf maps a key to a tuple of
+            (position in ``order``, value).
+        order (PersistentVector): Keys in insertion order, with placeholders
+            for removed keys.
+
+    Example:
+        >>> first = PersistentMap({"a": 1})
+        >>> second = first.set("b", 2)
+        >>> dict(first.items()), dict(second.items())
+        ({'a': 1}, {'a': 1, 'b': 2})
+    """
+
+    __slots__ = ("count", "root", "order")
+
+    def __init__(
+        self, items: Union[Mapping[Any, Any], Iterable[Tuple[Any, Any]]] = ()
+    ) -> None:
+        if isinstance(items, Mapping):
+            items = items.items()
+        root = _EMPTY_NODE
+        keys = []
+        for key, value in items:
+            key_hash = hash(key) & HASH_MASK
+            entry = _lookup(root, key_hash, key)
+            if entry is _MISSING:
+                entry = (len(keys), value)
+                keys.append(key)
+            else:
+                entry = (entry[0], value)
+            root = root.set(0, key_hash, key, entry)
+
+        self.count = len(keys)
+        self.root = root
+        self.order = PersistentVector(keys)
+
+    @classmethod
+    def _make(cls, count: int, root: _BitmapNode, order: PersistentVector) -> "PersistentMap":
+        """Create a map from its parts, without copying them."""
+        result = cls.__new__(cls)
+        result.count = count
+        result.root = root
+        result.order = order
+        return result
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get(self, key: Any, default: Optional[Any] = None) -> Any:
+        """Return the value for ``key``, or ``default`` if it is missing."""
+        entry = _lookup(self.root, hash(key) & HASH_MASK, key)
+        return default if entry is _MISSING else entry[1]
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return the value for ``key``.
+
+        Raises:
+            KeyError: If ``key`` is not in the map.
+        """
+        entry = _lookup(self.root, hash(key) & HASH_MASK, key)
+        if entry is _MISSING:
+            raise KeyError(key)
+        return entry[1]
+
+    def __contains__(self, key: Any) -> bool:
+        return _lookup(self.root, hash(key) & HASH_MASK, key) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        for key in self.order:
+            if key is not _DELETED:
+                yield key
+
+    def keys(self) -> Iterator[Any]:
+        """Iterate over the keys in insertion order."""
+        return iter(self)
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over (key, value) pairs in insertion order."""
+        root = self.root
+        for key in self.order:
+            if key is not _DELETED:
+                yield key, _lookup(root, hash(key) & HASH_MASK, key)[1]
+
+    def set(self, key: Any, value: Any) -> "PersistentMap":
+        """Return a new map with ``key`` set to ``value``.
+
+        Args:
+            key: The key to add or replace.
+            value: The value for ``key``.
+
+        Returns:
+            The new map.
+        """
+        key_hash = hash(key) & HASH_MASK
+        entry = _lookup(self.root, key_hash, key)
+        if entry is _MISSING:
+            order = self.order
+            root = self.root.set(0, key_hash, key, (len(order), value))
+            return self._make(self.count + 1, root, order.append(key))
+        root = self.root.set(0, key_hash, key, (entry[0], value))
+        return self._make(self.count, root, self.order)
+
+    def remove(self, key: Any) -> "PersistentMap":
+        """Return a new map without ``key``.
+
+        Raises:
+            KeyError: If ``key`` is not in the map.
+        """
+        key_hash = hash(key) & HASH_MASK
+        entry = _lookup(self.root, key_hash, key)
+        if entry is _MISSING:
+            raise KeyError(key)
+        root = self.root.remove(0, key_hash, key) or _EMPTY_NODE
+        result = self._make(self.count - 1, root, self.order.set(entry[0], _DELETED))
+        if len(result.order) > 2 * result.count + 1:
+            return PersistentMap(result.items())
+        return result
+
+    def update(
+        self, other: Union["PersistentMap", Mapping[Any, Any]]
+    ) -> "PersistentMap":
+        """Return a new map with the keys and values of ``other`` added.
+
+        Keys of ``other`` replace those of this map, as ``dict.update``
+        does. A right-hand map much smaller than this one is merged key by
+        key, sharing this map's structure; a larger one is merged by
+        rebuilding, which is cheaper than that many separate updates.
+
+        Args:
+            other: The map whose entries to add.
+
+        Returns:
+            The new map (``other`` itself, if this map is empty and ``other``
+            is a PersistentMap).
+        """
+        if not self.count:
+            return other if isinstance(other, PersistentMap) else PersistentMap(other)
+        if len(other) * MERGE_REBUILD_RATIO < self.count:
+            result = self
+            for key, value in other.items():
+                result = result.set(key, value)
+            return result
+        merged = dict(self.items())
+        merged.update(other.items())
+        return PersistentMap(merged)
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self.items())!r})"
+
+
+EMPTY: PersistentMap = PersistentMap()
+"""The empty map."""
@@ -0,0 +1,298 @@
+"""Persistent vector used to store the elements of a SimpleScript List.
+
+This module provides the PersistentVector class, an immutable sequence
+that shares structure between versions, so that appending to, indexing
+into and removing the last element of a vector do not copy it.
+"""
+
+import operator
+from typing import Any, Iterable, Iterator, List, Optional
+
+BITS: int = 5
+"""Number of index bits consumed by each level of the trie."""
+
+WIDTH: int = 1 << BITS
+"""Number of children of a full trie node (and elements of a full leaf)."""
+
+MASK: int = WIDTH - 1
+"""Mask selecting the child index at one level of the trie."""
+
+
+class PersistentVector:
+    """An immutable sequence with cheap non-destructive updates.
+
+    Elements are stored in a 32-way trie of leaves holding 32 elements
+    each, plus a tail buffer holding the last 1-32 elements. Appending only
+    copies the tail (or, once it is full, the path to the new leaf), so it
+    is amortized O(1); indexing and removing the last element walk one path
+    of the trie and are O(log32 n). Every update returns a new vector that
+    shares all unchanged nodes with the old one, which is never modified.
+
+    Nodes are Python lists that are never modified once they are part of
+    a vector; internal nodes hold only as many children as are in use.
+
+    Args:
+        items: The initial elements.
+
+    Attributes:
+        count (int): Number of elements.
+        shift (int): Index bits below the root (``BITS`` times its height).
+        root (list): Root node of the trie.
+        tail (list): The last 1-32 elements (empty for an empty vector).
+
+    Example:
+        >>> vector = PersistentVector([1, 2]).append(3)
+        >>> list(vector), vector[-1]
+        ([1, 2, 3], 3)
+    """
+
+    __slots__ = ("count", "shift", "root", "tail")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        items = list(items)
+        count = len(items)
+        tail_offset = ((count - 1) >> BITS) << BITS if count else 0
+
+        # Build the trie bottom-up from full leaves: nodes are left-packed,
+        # exactly as repeated appends would have left them.
+        nodes: List[list] = [
+            items[start:start + WIDTH] for start in range(0, tail_offset, WIDTH)
+        ]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [nodes[start:start + WIDTH] for start in range(0, len(nodes), WIDTH)]
+            shift += BITS
+
+        self.count = count
+        self.shift = shift
+        self.root = nodes
+        self.tail = items[tail_offset:]
+
+    @classmethod
+    def _make(cls, count: int, shift: int, root: list, tail: list) -> "PersistentVector":
+        """Create a vector from its parts, without copying them."""
+        vector = cls.__new__(cls)
+        vector.count = count
+        vector.shift = shift
+        vector.root = root
+        vector.tail = tail
+        return vector
+
+    def _tail_offset(self) -> int:
+        """Return the index of the first element held in the tail."""
+        return ((self.count - 1) >> BITS) << BITS if self.count else 0
+
+    def _leaf_for(self, index: int) -> list:
+        """Return the leaf (or tail) that holds a non-negative index."""
+        if index >= self._tail_offset():
+            return self.tail
+        node = self.root
+        level = self.shift
+        while level > 0:
+            node = node[(index >> level) & MASK]
+            level -= BITS
+        return node
+
+    def _normalize(self, index: Any) -> int:
+        """Turn a (possibly negative) index into an offset, as lists do.
+
+        Raises:
+            TypeError: If ``index`` is not an integer.
+            IndexError: If ``index`` is out of range.
+        """
+        index = operator.index(index)
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("vector index out of range")
+        return index
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return the element at an index; negative indices count from the end.
+
+        Raises:
+            TypeError: If ``index`` is not an integer.
+            IndexError: If ``index`` is out of range.
+        """
+        index = self._normalize(index)
+        return self._leaf_for(index)[index & MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        for start in range(0, self._tail_offset(), WIDTH):
+            yield from self._leaf_for(start)
+        yield from self.tail
+
+    def append(self, value: Any) -> "PersistentVector":
+        """Return a new vector with ``value`` added at the end.
+
+        Args:
+            value: The element to append.
+
+        Returns:
+            The new vector.
+        """
+        count = self.count
+        if count - self._tail_offset() < WIDTH:
+            return self._make(count + 1, self.shift, self.root, self.tail + [value])
+
+        # The tail is full: move it into the trie and start a new one.
+        shift = self.shift
+        if (count >> BITS) > (1 << shift):
+            root = [self.root, self._new_path(shift, self.tail)]
+            shift += BITS
+        else:
+            root = self._push_tail(shift, self.root, self.tail)
+        return self._make(count + 1, shift, root, [value])
+
+    def _push_tail(self, level: int, parent: list, tail: list) -> list:
+        """Return a copy of ``parent`` with a full tail added as its last leaf."""
+        index = ((self.count - 1) >> level) & MASK
+        node = list(parent)
+        if level == BITS:
+            child = tail
+        elif index < len(parent):
+            child = self._push_tail(level - BITS, parent[index], tail)
+        else:
+            child = self._new_path(level - BITS, tail)
+        if index < len(node):
+            node[index] = child
+        else:
+            node.append(child)
+        return node
+
+    @staticmethod
+    def _new_path(level: int, leaf: list) -> list:
+        """Return a chain of single-child nodes ``level`` bits deep above a leaf."""
+        node = leaf
+        while level > 0:
+            node = [node]
+            level -= BITS
+        return node
+
+    def set(self, index: Any, value: Any) -> "PersistentVector":
+        """Return a new vector with the element at an index replaced.
+
+        Args:
+            index: The index to replace; negative indices count from the end.
+            value: The new element.
+
+        Raises:
+            TypeError: If ``index`` is not an integer.
+            IndexError: If ``index`` is out of range.
+        """
+        index = self._normalize(index)
+        if index >= self._tail_offset():
+            tail = list(self.tail)
+            tail[index & MASK] = value
+            return self._make(self.count, self.shift, self.root, tail)
+        root = self._set_in(self.shift, self.root, index, value)
+        return self._make(self.count, self.shift, root, self.tail)
+
+    def _set_in(self, level: int, node: list, index: int, value: Any) -> list:
+        """Return a copy of ``node`` with the element at ``index`` replaced."""
+        node = list(node)
+        if level == 0:
+            node[index & MASK] = value
+        else:
+            child = (index >> level) & MASK
+            node[child] = self._set_in(level - BITS, node[child], index, value)
+        return node
+
+    def extend(self, items: Iterable[Any]) -> "PersistentVector":
+        """Return a new vector with ``items`` added at the end.
+
+        Args:
+            items: The elements to append, in order.
+
+        Returns:
+            The new vector (``items`` itself, when this vector is empty and
+            ``items`` is a PersistentVector).
+        """
+        if not self.count and isinstance(items, PersistentVector):
+            return items
+        items = list(items)
+        vector = self
+        start = 0
+        while start < len(items):
+            room = WIDTH - (vector.count - vector._tail_offset())
+            if room == 0:
+                vector = vector.append(items[start])
+                start += 1
+                continue
+            # Fill the tail with as many items as fit in one step.
+            chunk = items[start:start + room]
+            vector = self._make(
+                vector.count + len(chunk), vector.shift, vector.root, vector.tail + chunk
+            )
+            start += len(chunk)
+        return vector
+
+    def pop(self) -> "PersistentVector":
+        """Return a new vector without the last element.
+
+        Raises:
+            IndexError: If the vector is empty.
+        """
+        count = self.count
+        if count == 0:
+            raise IndexError("pop from empty vector")
+        if count == 1:
+            return EMPTY
+        if count - self._tail_offset() > 1:
+            return self._make(count - 1, self.shift, self.root, self.tail[:-1])
+
+        # The tail becomes empty: the last leaf of the trie replaces it.
+        tail = self._leaf_for(count - 2)
+        shift = self.shift
+        root = self._pop_tail(shift, self.root)
+        if root is None:
+            root = []
+        if shift > BITS and len(root) == 1:
+            root = root[0]
+            shift -= BITS
+        return self._make(count - 1, shift, root, tail)
+
+    def _pop_tail(self, level: int, node: list) -> Optional[list]:
+        """Return a copy of ``node`` without its last leaf, or None if empty."""
+        index = ((self.count - 2) >> level) & MASK
+        if level > BITS:
+            child = self._pop_tail(level - BITS, node[index])
+            if child is None and index == 0:
+                return None
+            new_node = node[:index]
+            if child is not None:
+                new_node.append(child)
+            return new_node
+        if index == 0:
+            return None
+        return node[:index]
+
+    def remove(self, index: Any) -> "PersistentVector":
+        """Return a new vector without the element at an index.
+
+        Removing the last element is O(log32 n); removing any other element
+        rebuilds the vector.
+
+        Args:
+            index: The index to remove; negative indices count from the end.
+
+        Raises:
+            TypeError: If ``index`` is not an integer.
+            IndexError: If ``index`` is out of range.
+        """
+        index = self._normalize(index)
+        if index == self.count - 1:
+            return self.pop()
+        items = list(self)
+        del items[index]
+        return PersistentVector(items)
+
+    def __repr__(self) -> str:
+        return f"PersistentVector({list(self)!r})"
+
+
+EMPTY: PersistentVector = PersistentVector()
+"""The empty vector."""
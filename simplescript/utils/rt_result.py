@@ -18,6 +18,8 @@ class RTResult:
         error (Optional[Error]): The error encountered, if any.
     """
 
+    __slots__ = ("value", "error")
+
     def __init__(self) -> None:
         self.value: Any = None
         self.error = None
@@ -14,6 +14,9 @@ def string_with_arrows(text: str, pos_start: Position, pos_end: Position) -> str
     underneath the region between pos_start and pos_end, making it easy
     to identify where an error occurred.
 
+    Line numbers, columns and line text are looked up in the line-start
+    table of the positions' shared Source, which holds ``text``.
+
     Args:
         text: The full source text.
         pos_start: Starting position of the error region.
@@ -28,30 +31,19 @@ def string_with_arrows(text: str, pos_start: Position, pos_end: Position) -> str
         VAR A =
               ^
     """
-    result = ""
-
-    # Calculate indices
-    idx_start = max(text.rfind("\n", 0, pos_start.index), 0)
-    idx_end = text.find("\n", idx_start + 1)
-    if idx_end < 0:
-        idx_end = len(text)
-
-    # Generate each line
-    line_count = pos_end.lnNumber - pos_start.lnNumber + 1
-    for i in range(line_count):
-        # Calculate line columns
-        line = text[idx_start:idx_end]
-        col_start = pos_start.colNumber if i == 0 else 0
-        col_end = pos_end.colNumber if i == line_count - 1 else len(line) - 1
-
-        # Append to result
-        result += line + "\n"
-        result += " " * col_start + "^" * (col_end - col_start)
-
-        # Re-calculate indices
-        idx_start = idx_end
-        idx_end = text.find("\n", idx_start + 1)
-        if idx_end < 0:
-            idx_end = len(text)
-
-    return result.replace("\t", "")
+    source = pos_start.source
+    line_start, col_start = source.line_col(pos_start.index)
+    line_end, col_end = source.line_col(pos_end.index)
+    if line_end > line_start and col_end == 0:
+        # A region ending just past a newline ends with that newline.
+        line_end -= 1
+        col_end = len(source.line_text(line_end)) + 1
+
+    lines = []
+    for line_number in range(line_start, line_end + 1):
+        line = source.line_text(line_number)
+        first = col_start if line_number == line_start else 0
+        last = col_end if line_number == line_end else len(line)
+        lines.append(line + "\n" + " " * first + "^" * (last - first))
+
+    return "\n".join(lines).replace("\t", "")
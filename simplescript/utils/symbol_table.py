@@ -21,21 +21,29 @@ class SymbolTable:
         symbols (dict): Dictionary mapping names to their values.
     """
 
+    __slots__ = ("parent", "symbols")
+
     def __init__(self, parent: Optional["SymbolTable"] = None) -> None:
         self.parent = parent
         self.symbols: dict[str, Any] = {}
 
     def get(self, name: str) -> Optional[Any]:
-        """Retrieve a value by name from this scope.
+        """Retrieve a value by name from this scope or an enclosing one.
 
         Args:
             name: The variable or function name to look up.
 
         Returns:
-            The value associated with the name, or None if not found.
+            The value associated with the name in the nearest scope that
+            defines it, or None if not found.
         """
-        value = self.symbols.get(name, None)
-        return value
+        table = self
+        while table is not None:
+            value = table.symbols.get(name)
+            if value is not None:
+                return value
+            table = table.parent
+        return None
 
     def set(self, name: str, value: Any) -> None:
         """Set a variable or function binding in this scope.
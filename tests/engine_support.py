@@ -0,0 +1,110 @@
+"""Helpers for re-running the integration suite on other execution engines."""
+
+from unittest import mock
+from simplescript.runtime import run, global_symbol_table
+from tests import test_integration
+
+
+class EngineMixin:
+    """Runs the wrapped integration test case with the engine in ``ENGINE``."""
+
+    ENGINE = "interpreter"
+
+    def setUp(self):
+        # Run in an empty global scope, as the test case would when run on
+        # its own, and leave one behind for the test modules that follow.
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+        engine = self.ENGINE
+
+        def run_with_engine(file_name, text):
+            return run(file_name, text, engine=engine)
+
+        patcher = mock.patch.object(test_integration, "run", run_with_engine)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+def assert_same_outcome(test_case, text, engine):
+    """Assert that ``engine`` and the interpreter agree on a program.
+
+    Args:
+        test_case: The running TestCase.
+        text: The SimpleScript source to run on both engines.
+        engine: The engine compared against the tree-walking interpreter.
+    """
+    tree_val, tree_err = run("<parity>", text)
+    other_val, other_err = run("<parity>", text, engine=engine)
+    test_case.assertEqual(str(tree_val), str(other_val), text)
+    test_case.assertEqual(type(tree_err), type(other_err), text)
+    if tree_err:
+        test_case.assertEqual(tree_err.as_string(), other_err.as_string(), text)
+
+
+PARITY_PROGRAMS = [
+    "1 + 2 * 3 - 4 / 2",
+    "2 ^ 10",
+    "NOT 0",
+    "(NOT 0) * 3 + (NOT 1) - (NOT 0) / 4",
+    "(NOT 1) / (NOT 1)",
+    "-(3 + 4)",
+    "5 > 3 AND 2 < 1 OR 1 == 1",
+    '"ab" * 3 + "c"',
+    "IF 0 THEN 1 ELIF 0 THEN 2",
+    "FOR i = 0 TO 5 THEN i * 2",
+    "FOR i = 10 TO 0 STEP -3 THEN i",
+    "FOR i = 0 TO 1 STEP 0.25 THEN i",
+    "FOR i = 0 TO 1 STEP 0 THEN i",
+    "VAR a = ARRAY([1, 2, 3]); 10 - a * 2 + a / 2",
+    "ARRAY([1, 2]) + ARRAY([1, 2, 3])",
+    "ARRAY([1, 2]) / ARRAY([1, 0])",
+    'ARRAY([1, "a"])',
+    "VAR a = 3; VAR b = 4\na * a + b * b - 2 * a * b",
+    "VAR a = 3; VAR z = 0\n1 + a * 2 / (z * a) - 4",
+    'VAR s = "ab"; VAR n = 2\ns * n + s',
+    "FUNC f(a, b) -> (a + b) * (a - b) < a * b / 2\nf(5, 2)",
+    "FUNC f(a) -> a * a - 1\nf(3) / (f(1) * 2)",
+    "MAP(FUNC(x) -> x * x, [1, 2, 3])",
+    "FILTER(FUNC(x) -> x > 1, [1, 2, 3])",
+    "REDUCE(FUNC(a, x) -> a + x, [1, 2, 3], 0)",
+    "MAP(FUNC(x) -> 1 / x, [1, 0])",
+    "MAP(FUNC(x) -> x * x + 1, [1, 2.5])",
+    'MAP(FUNC(x) -> x * x + 1, [2, "a"])',
+    "MAP(FUNC(x) -> 1 / (x * x - 4), [1, 2])",
+    "VAR k = 3\nMAP(FUNC(x) -> x * k + k, [1, 2])",
+    '[1, "a", [2]] * [3]',
+    '{"a": 1, 2: "b"} + {"c": 3}',
+    "10 / 0",
+    "10 / (5 - 5)",
+    '1 + "a"',
+    '"a" - 1',
+    "[1, 2] / 7",
+    '(1 < 2) + "a"',
+    "5 / (1 > 2)",
+    '[1, 2] / (1 < 2 AND 5)',
+    "(FUNC(a) -> a / (a < 0))(3)",
+    '{"a": 1} - "z"',
+    "FUNC(a) -> a + undefined_name",
+    "(FUNC(a) -> a / 0)(1)",
+    "(FUNC(a, b) -> a)(1)",
+    "(FUNC(a) -> a)(1, 2)",
+    "5(1)",
+    "VAR a = 1; VAR b = a + 1\nb * 10",
+    "1\n\n2 / 0\n3",
+    "[1,\n 2] + (3\n)",
+    "",
+    "FUNC fib(n) -> IF n <= 1 THEN n ELSE fib(n - 1) + fib(n - 2)\nfib(10)",
+    "FUNC adder(a) -> FUNC(b) -> a + b\nVAR add1 = adder(1)\nadd1(2)",
+    "FUNC f(a, a) -> a\nf(1, 2)",
+    "FUNC f(n) -> FOR i = 0 TO n THEN VAR acc = acc + i\nf(3)",
+    "FUNC g(x) -> x / 0\nFUNC f(x) -> IF x THEN g(x) ELSE 0\nf(1)",
+    "FUNC f(x) -> x(1)\nf(5)",
+    'FUNC f() -> 5\nf() + "x"',
+    'FUNC f() -> 5\n"x" - f()',
+    'FUNC f(x) -> IF x THEN -5 ELSE NOT x\nf(1) - "x"',
+    'FUNC f(x) -> x < 2\nVAR a = f(1)\na - "x"',
+    'FUNC f(x) -> [x, 5]\nf(1) / 1 - "x"',
+    'MAP(FUNC(x) -> 5, [1]) / 0 - "x"',
+    "FUNC f() -> 5\nf()(1)",
+]
+"""Programs whose values and errors every engine must reproduce exactly."""
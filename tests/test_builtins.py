@@ -0,0 +1,124 @@
+"""Tests for the MAP, FILTER and REDUCE built-in functions."""
+
+import unittest
+from unittest import mock
+from simplescript.runtime import ENGINES, run, global_symbol_table
+from simplescript.types.builtin_function import Caller
+from simplescript.types.function import Function
+
+
+class TestHigherOrderBuiltins(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def check(self, text, expected):
+        for engine in ENGINES:
+            with self.subTest(text=text, engine=engine):
+                global_symbol_table.symbols.clear()
+                value, error = run("<builtins>", text, engine=engine)
+                self.assertIsNone(error, error and error.as_string())
+                self.assertEqual(expected, str(value))
+
+    def check_error(self, text, details):
+        for engine in ENGINES:
+            with self.subTest(text=text, engine=engine):
+                global_symbol_table.symbols.clear()
+                value, error = run("<builtins>", text, engine=engine)
+                self.assertIsNone(value)
+                self.assertEqual(details, error.details)
+                self.assertIn(f"Runtime Error: {details}\n", error.as_string())
+
+    def test_map(self):
+        self.check("MAP(FUNC(x) -> x * 2, [1, 2, 3])", "[2, 4, 6]")
+        self.check("MAP(FUNC(x) -> x, [])", "[]")
+        self.check('NOMEMO FUNC greet(s) -> "hi " + s\nMAP(greet, ["a", "b"])', '["hi a", "hi b"]')
+        self.check("MAP(ARRAY, [[1], [2, 3]])", "[array[1], array[2, 3]]")
+
+    def test_filter(self):
+        self.check("FILTER(FUNC(x) -> x > 1, [1, 2, 3])", "[2, 3]")
+        self.check("FILTER(FUNC(x) -> 0, [1, 2, 3])", "[]")
+        self.check("FILTER(FUNC(x) -> IF x > 1 THEN 1, [1, 2, 3])", "[2, 3]")
+
+    def test_reduce(self):
+        self.check("REDUCE(FUNC(a, x) -> a + x, [1, 2, 3], 10)", "16")
+        self.check("REDUCE(FUNC(a, x) -> a + x, [], 10)", "10")
+        self.check("REDUCE(FUNC(a, x) -> a * [x], [1, 2], [])", "[1, 2]")
+
+    def test_functions_see_their_scope(self):
+        self.check(
+            "FUNC scale(k, xs) -> MAP(FUNC(x) -> x * k, xs)\nscale(3, [1, 2])",
+            "[3, 6]",
+        )
+        self.check(
+            "FUNC adders(xs) -> MAP(FUNC(x) -> FUNC(y) -> x + y, xs)\n"
+            "VAR fs = adders([1, 2])\n(fs / 0)(10) + (fs / 1)(10)",
+            "23",
+        )
+
+    def test_recursive_and_tail_recursive_functions(self):
+        self.check(
+            "FUNC fact(n) -> IF n <= 1 THEN 1 ELSE n * fact(n - 1)\nMAP(fact, [1, 5])",
+            "[1, 120]",
+        )
+        self.check(
+            "NOMEMO FUNC count(n, acc) -> IF n == 0 THEN acc ELSE count(n - 1, acc + 1)\n"
+            "MAP(FUNC(n) -> count(n, 0), [3, 5000])",
+            "[3, 5000]",
+        )
+
+    def test_nested_calls(self):
+        self.check("MAP(FUNC(xs) -> MAP(FUNC(x) -> x + 1, xs), [[1], [2, 3]])", "[[2], [3, 4]]")
+
+    def test_errors(self):
+        self.check_error("MAP(1, [1])", "MAP expects a function as its first argument")
+        self.check_error("FILTER(FUNC(x) -> x, 1)", "FILTER expects a list as its second argument")
+        self.check_error("MAP(5, [1])", "MAP expects a function as its first argument")
+        self.check_error("FILTER(FUNC (a) -> a, 7)", "FILTER expects a list as its second argument")
+        self.check_error("REDUCE([1], [1], 0)", "REDUCE expects a function as its first argument")
+        self.check_error("REDUCE(FUNC(x) -> x, [1])", "1 too few args passed into 'REDUCE'")
+        self.check_error("MAP(FUNC(a, b) -> a, [1])", "1 too few args passed into '<anonymous>'")
+        self.check_error("MAP(FUNC(x) -> 1 / x, [1, 0])", "Division by zero")
+        self.check_error(
+            "REDUCE(FUNC(a, x) -> IF x > 1 THEN a + x, [1, 2], 0)",
+            "REDUCE expects its function to return a value",
+        )
+
+    def test_error_traceback_goes_through_the_function(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                _, error = run(
+                    "<builtins>", "FUNC inv(x) -> 1 / x\nMAP(inv, [0])", engine=engine
+                )
+                self.assertIn("in INV", error.as_string())
+
+    def test_callback_skips_its_memo_once_it_stops_caching(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                global_symbol_table.symbols.clear()
+                with mock.patch.object(
+                    Function, "memo_key", autospec=True, side_effect=Function.memo_key
+                ) as memo_key:
+                    value, error = run(
+                        "<builtins>",
+                        "FUNC sq(x) -> x * x\n"
+                        "VAR ys = MAP(sq, FOR i = 0 TO 1100 THEN i)\n"
+                        "ys / 1099",
+                        engine=engine,
+                    )
+                self.assertIsNone(error)
+                self.assertEqual("1207801", str(value))
+                self.assertFalse(global_symbol_table.get("SQ").memo.active)
+                self.assertEqual(1025, memo_key.call_count)
+
+    def test_caller_requires_call_and_run_body(self):
+        class Incomplete(Caller):
+            def call(self, func, args, pos_start, pos_end, context):
+                return None
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""Tests for the on-disk cache of parsed programs."""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from simplescript import cache as cache_module
+from simplescript.cache import ProgramCache, CACHE_DIR_NAME, cache_disabled_by_env
+from simplescript.cli import run_file
+from simplescript.runtime import global_symbol_table
+
+
+class CacheTestCase(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = temp_dir.name
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def write_source(self, text, name="script.simc"):
+        path = os.path.join(self.dir, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def run_file(self, path, cache):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            run_file(path, cache)
+        return output.getvalue()
+
+
+class TestProgramCache(CacheTestCase):
+    """Tests for ProgramCache loading, storing and invalidation."""
+
+    def test_round_trip(self):
+        path = self.write_source("1 + 2")
+        cache = ProgramCache()
+        self.assertIsNone(cache.load(path, "1 + 2"))
+        self.assertTrue(cache.store(path, "1 + 2", ["program"]))
+        self.assertEqual(["program"], cache.load(path, "1 + 2"))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.assertTrue(os.path.isdir(os.path.join(self.dir, CACHE_DIR_NAME)))
+
+    def test_changed_source_is_miss(self):
+        path = self.write_source("1 + 2")
+        cache = ProgramCache()
+        cache.store(path, "1 + 2", ["old"])
+        self.assertIsNone(cache.load(path, "1 + 3"))
+
+    def test_changed_version_is_miss(self):
+        path = self.write_source("1")
+        ProgramCache().store(path, "1", ["old"])
+        with mock.patch.object(cache_module, "CACHE_FORMAT", cache_module.CACHE_FORMAT + 1):
+            self.assertIsNone(ProgramCache().load(path, "1"))
+
+    def test_optimize_setting_is_part_of_key(self):
+        path = self.write_source("1")
+        ProgramCache(optimize=True).store(path, "1", ["optimized"])
+        self.assertIsNone(ProgramCache(optimize=False).load(path, "1"))
+
+    def test_corrupt_entry_is_miss(self):
+        path = self.write_source("1")
+        cache = ProgramCache()
+        os.makedirs(os.path.dirname(cache.cache_path(path)))
+        with open(cache.cache_path(path), "wb") as f:
+            f.write(b"not a pickle")
+        self.assertIsNone(cache.load(path, "1"))
+        self.assertEqual(1, cache.misses)
+
+    def test_disabled(self):
+        path = self.write_source("1")
+        cache = ProgramCache(enabled=False)
+        self.assertFalse(cache.store(path, "1", ["program"]))
+        self.assertIsNone(cache.load(path, "1"))
+        self.assertEqual((0, 0), (cache.hits, cache.misses))
+        self.assertFalse(os.path.exists(os.path.join(self.dir, CACHE_DIR_NAME)))
+        self.assertEqual("cache: disabled", cache.stats_line())
+
+    def test_unwritable_directory(self):
+        path = self.write_source("1")
+        with open(os.path.join(self.dir, CACHE_DIR_NAME), "w"):
+            pass
+        self.assertFalse(ProgramCache().store(path, "1", ["program"]))
+
+    def test_disabled_by_env(self):
+        with mock.patch.dict(os.environ, {cache_module.DISABLE_ENV_VAR: "1"}):
+            self.assertTrue(cache_disabled_by_env())
+        with mock.patch.dict(os.environ, {cache_module.DISABLE_ENV_VAR: ""}):
+            self.assertFalse(cache_disabled_by_env())
+
+
+class TestRunFileCache(CacheTestCase):
+    """Tests for running files through the cache."""
+
+    def test_second_run_hits(self):
+        path = self.write_source("VAR a = 2 + 3\n\nSHOW a\n(FUNC(x) -> x * 2)(4)\n")
+        cache = ProgramCache()
+        first = self.run_file(path, cache)
+        second = self.run_file(path, cache)
+        self.assertEqual("5\n5\n8\n", first)
+        self.assertEqual(first, second)
+        self.assertEqual("cache: 1 hit(s), 1 miss(es)", cache.stats_line())
+
+    def test_syntax_error_not_cached(self):
+        path = self.write_source("VAR a = 1\nVAR = 2\n")
+        cache = ProgramCache()
+        for _ in range(2):
+            output = io.StringIO()
+            with redirect_stdout(output), self.assertRaises(SystemExit):
+                run_file(path, cache)
+            self.assertTrue(output.getvalue().startswith("Invalid Syntax"))
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_edited_file_is_reparsed(self):
+        path = self.write_source("1 + 1\n")
+        cache = ProgramCache()
+        self.assertEqual("2\n", self.run_file(path, cache))
+        self.write_source("1 + 2\n")
+        self.assertEqual("3\n", self.run_file(path, cache))
+        self.assertEqual(2, cache.misses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for the closure-compilation execution engine.
+
+The full integration suite is re-run with ``engine="closure"``, and a set
+of programs is checked to produce identical values and errors on both the
+tree-walking interpreter and the closure engine.
+"""
+
+import unittest
+from simplescript.runtime import run
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.core.closure_compiler import compile_function_body
+from tests import test_integration
+from tests.engine_support import EngineMixin, PARITY_PROGRAMS, assert_same_outcome
+
+
+class ClosureEngineMixin(EngineMixin):
+    ENGINE = "closure"
+
+
+class TestVariablesClosure(ClosureEngineMixin, test_integration.TestVariables):
+    pass
+
+
+class TestLoopsClosure(ClosureEngineMixin, test_integration.TestLoops):
+    pass
+
+
+class TestFunctionsAnonymousClosure(
+    ClosureEngineMixin, test_integration.TestFunctionsAnonymous
+):
+    pass
+
+
+class TestFunctionsNamedClosure(ClosureEngineMixin, test_integration.TestFunctionsNamed):
+    pass
+
+
+class TestStringsClosure(ClosureEngineMixin, test_integration.TestStrings):
+    pass
+
+
+class TestListsClosure(ClosureEngineMixin, test_integration.TestLists):
+    pass
+
+
+class TestListErrorsClosure(ClosureEngineMixin, test_integration.TestListErrors):
+    pass
+
+
+class TestMapsClosure(ClosureEngineMixin, test_integration.TestMaps):
+    pass
+
+
+class TestMapErrorsClosure(ClosureEngineMixin, test_integration.TestMapErrors):
+    pass
+
+
+class TestErrorsClosure(ClosureEngineMixin, test_integration.TestErrors):
+    pass
+
+
+class TestClosureParity(unittest.TestCase):
+    """Tests that the closure engine and the interpreter agree."""
+
+    def test_programs(self):
+        for text in PARITY_PROGRAMS:
+            with self.subTest(text=text):
+                assert_same_outcome(self, text, "closure")
+
+    def test_recursion(self):
+        run(
+            "<closure>",
+            "FUNC fib(f, n) -> IF n <= 1 THEN n ELSE f(f, n - 1) + f(f, n - 2)",
+            engine="closure",
+        )
+        self.assertEqual("55", str(run("<closure>", "fib(fib, 10)", engine="closure")[0]))
+
+
+class TestFunctionBodyCache(unittest.TestCase):
+    """Tests for the per-definition cache of compiled function bodies."""
+
+    def test_body_compiled_once(self):
+        tokens, _ = Lexer("<closure>", "FUNC(x) -> x + 1").make_tokens()
+        body_node = Parser(tokens).parse().node.statement_nodes[0].body_node
+        self.assertIs(compile_function_body(body_node), compile_function_body(body_node))
+
+
+if __name__ == "__main__":
+    unittest.main()
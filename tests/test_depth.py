@@ -0,0 +1,161 @@
+"""Tests for long and deeply nested programs and deep recursion."""
+
+import inspect
+import sys
+import unittest
+from simplescript.runtime import ENGINES, run, global_symbol_table
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.errors.errors import InvalidSyntaxError, RTError
+
+CHAIN_LENGTH = 3000
+
+
+class DepthTestCase(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def run_all(self, text, optimize=True):
+        for engine in ENGINES:
+            global_symbol_table.symbols.clear()
+            yield engine, run("<depth>", text, engine=engine, optimize=optimize)
+
+
+class TestLongChains(DepthTestCase):
+    """Long chains of left-associative operators never recurse per operand."""
+
+    def test_literal_chain(self):
+        text = " + ".join(["1"] * CHAIN_LENGTH)
+        for optimize in (True, False):
+            for engine, (value, error) in self.run_all(text, optimize):
+                self.assertIsNone(error, engine)
+                self.assertEqual(str(CHAIN_LENGTH), str(value), engine)
+
+    def test_variable_chain(self):
+        text = "VAR x = 2\nx" + " * x / x - x + x" * CHAIN_LENGTH
+        for engine, (value, error) in self.run_all(text):
+            self.assertIsNone(error, engine)
+            self.assertEqual("2.0", str(value), engine)
+
+    def test_logical_chain(self):
+        text = " AND ".join(["1 < 2"] * CHAIN_LENGTH)
+        for engine, (value, error) in self.run_all(text):
+            self.assertIsNone(error, engine)
+            self.assertEqual("1", str(value), engine)
+
+    def test_chain_error_position(self):
+        text = " + ".join(["1"] * 100) + ' + "a"'
+        results = {engine: error.as_string() for engine, (_, error) in self.run_all(text)}
+        self.assertEqual(1, len(set(results.values())), results)
+        self.assertIn("Illegal operation", results["interpreter"])
+
+    def test_chain_in_function(self):
+        text = "FUNC f(x) -> " + " + ".join(["x"] * CHAIN_LENGTH) + "\nf(1)"
+        for engine, (value, error) in self.run_all(text):
+            self.assertIsNone(error, engine)
+            self.assertEqual(str(CHAIN_LENGTH), str(value), engine)
+
+
+class TestNesting(DepthTestCase):
+    """Nesting is limited by the Python stack, with a syntax error past it."""
+
+    def parse(self, text, **kwargs):
+        tokens, error = Lexer("<depth>", text).make_tokens()
+        self.assertIsNone(error)
+        return Parser(tokens, **kwargs).parse()
+
+    def assertTooDeep(self, text, **kwargs):
+        ast = self.parse(text, **kwargs)
+        self.assertIsInstance(ast.error, InvalidSyntaxError)
+        self.assertIn("nested too deeply", ast.error.details)
+
+    def with_stack(self, frames):
+        """Leave ``frames`` Python frames of headroom for the rest of a test."""
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + frames)
+        self.addCleanup(sys.setrecursionlimit, limit)
+
+    def test_nesting_within_limit(self):
+        self.with_stack(1000)
+        programs = [
+            "(" * 70 + "1" + ")" * 70,
+            "[" * 60 + "1" + "]" * 60,
+            "IF 1 THEN " * 60 + "1",
+            "-" * 400 + "1",
+            "NOT " * 400 + "1",
+            " ^ ".join(["1"] * 300),
+            "FUNC id(x) -> x\n" + "id([(" * 20 + "1" + ")])" * 20,
+        ]
+        for text in programs:
+            for engine, (value, error) in self.run_all(text):
+                self.assertIsNone(error, (engine, text[:20]))
+
+    def test_parses_what_the_stack_allows(self):
+        self.with_stack(1000)
+        for text in ("-" * 900 + "1", "id(" * 75 + "1" + ")" * 75):
+            self.assertIsNone(self.parse(text).error, text[:20])
+
+    def test_nesting_past_limit(self):
+        self.with_stack(1000)
+        depth = 1000
+        self.assertTooDeep("(" * depth + "1" + ")" * depth)
+        self.assertTooDeep("[" * depth + "]" * depth)
+        self.assertTooDeep("IF 1 THEN " * depth + "1")
+        self.assertTooDeep("VAR a = " * depth + "1")
+
+    def test_long_prefix_and_power_chains(self):
+        for text in ("-" * 5000 + "1", "NOT " * 5000 + "1", " ^ ".join(["1"] * 5000)):
+            self.assertTooDeep(text)
+
+    def test_too_deep_to_run(self):
+        self.with_stack(1000)
+        for engine, (value, error) in self.run_all("-" * 800 + "1"):
+            self.assertIsInstance(error, RTError, engine)
+            self.assertEqual("Expression nested too deeply", error.details, engine)
+
+    def test_configurable_limit(self):
+        self.assertIsNone(self.parse("((1))", max_nesting=3).error)
+        self.assertTooDeep("((1))", max_nesting=2)
+        self.assertIsNone(self.parse("-(-1) ^ 2", max_nesting=4).error)
+        self.assertTooDeep("-(-1) ^ 2", max_nesting=3)
+        self.assertTooDeep("NOT NOT 1", max_nesting=2)
+
+
+class TestDeepRecursion(DepthTestCase):
+    """Recursion too deep to finish is a runtime error on every engine."""
+
+    def test_deep_recursion_error(self):
+        text = "FUNC d(n) -> IF n == 0 THEN 0 ELSE 1 + d(n - 1)\nd(100000)"
+        messages = set()
+        for engine, (value, error) in self.run_all(text):
+            self.assertIsInstance(error, RTError, engine)
+            self.assertEqual("Maximum recursion depth exceeded", error.details, engine)
+            # The traceback has a frame per call, as many as the engine made.
+            traceback = error.generate_traceback()
+            self.assertIn(
+                "line 2, in <simplescript>\n  File <depth>, line 1, in D", traceback
+            )
+            self.assertGreater(traceback.count(" in D\n"), 100, engine)
+            messages.add(error.as_string()[len(traceback):])
+        self.assertEqual(1, len(messages), messages)
+
+    def test_vm_max_depth(self):
+        text = "FUNC d(n) -> IF n == 0 THEN 0 ELSE 1 + d(n - 1)\nd(5000)"
+        _, error = run("<depth>", text, engine="vm")
+        self.assertEqual("Maximum recursion depth exceeded", error.details)
+        value, error = run("<depth>", text, engine="vm", max_depth=10000)
+        self.assertIsNone(error)
+        self.assertEqual("5000", str(value))
+        _, error = run("<depth>", "d(100)", engine="vm", max_depth=50)
+        self.assertEqual("Maximum recursion depth exceeded", error.details)
+
+    def test_recursion_within_limit(self):
+        text = "FUNC d(n) -> IF n == 0 THEN 0 ELSE 1 + d(n - 1)\nd(50)"
+        for engine, (value, error) in self.run_all(text):
+            self.assertIsNone(error, engine)
+            self.assertEqual("50", str(value), engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
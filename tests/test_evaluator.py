@@ -0,0 +1,109 @@
+"""Tests for the exception-based Evaluator.
+
+The full integration suite is re-run with ``engine="evaluator"``, and a
+set of programs is checked to produce identical values and errors on both
+the tree-walking interpreter and the Evaluator.
+"""
+
+import unittest
+from simplescript.runtime import parse
+from simplescript.core.context import Context
+from simplescript.core.evaluator import EvaluationError, Evaluator
+from simplescript.utils.symbol_table import SymbolTable
+from tests import test_integration
+from tests.engine_support import EngineMixin, PARITY_PROGRAMS, assert_same_outcome
+
+
+class EvaluatorEngineMixin(EngineMixin):
+    ENGINE = "evaluator"
+
+
+class TestVariablesEvaluator(EvaluatorEngineMixin, test_integration.TestVariables):
+    pass
+
+
+class TestLoopsEvaluator(EvaluatorEngineMixin, test_integration.TestLoops):
+    pass
+
+
+class TestFunctionsAnonymousEvaluator(
+    EvaluatorEngineMixin, test_integration.TestFunctionsAnonymous
+):
+    pass
+
+
+class TestFunctionsNamedEvaluator(
+    EvaluatorEngineMixin, test_integration.TestFunctionsNamed
+):
+    pass
+
+
+class TestStringsEvaluator(EvaluatorEngineMixin, test_integration.TestStrings):
+    pass
+
+
+class TestListsEvaluator(EvaluatorEngineMixin, test_integration.TestLists):
+    pass
+
+
+class TestListErrorsEvaluator(
+    EvaluatorEngineMixin, test_integration.TestListErrors
+):
+    pass
+
+
+class TestMapsEvaluator(EvaluatorEngineMixin, test_integration.TestMaps):
+    pass
+
+
+class TestMapErrorsEvaluator(EvaluatorEngineMixin, test_integration.TestMapErrors):
+    pass
+
+
+class TestErrorsEvaluator(EvaluatorEngineMixin, test_integration.TestErrors):
+    pass
+
+
+class TestEvaluatorParity(unittest.TestCase):
+    """Tests that the Evaluator and the interpreter agree."""
+
+    def test_programs(self):
+        for text in PARITY_PROGRAMS:
+            with self.subTest(text=text):
+                assert_same_outcome(self, text, "evaluator")
+
+
+class TestEvaluationErrors(unittest.TestCase):
+    def setUp(self):
+        self.context = Context("<evaluator>")
+        self.context.symbol_table = SymbolTable()
+
+    def parse(self, text):
+        node, error = parse("<evaluator>", text)
+        self.assertIsNone(error)
+        return node
+
+    def test_evaluate_returns_plain_values(self):
+        value = Evaluator().evaluate(self.parse("VAR x = 2; x * 3 + 1"), self.context)
+        self.assertEqual(7, value.value)
+
+    def test_evaluate_raises_errors(self):
+        node = self.parse("VAR x = 1\n[x] + y")
+        with self.assertRaises(EvaluationError) as caught:
+            Evaluator().evaluate(node, self.context)
+        self.assertEqual("'Y' is not defined", caught.exception.error.details)
+
+    def test_visit_returns_errors(self):
+        res = Evaluator().visit(self.parse("1 / (2 - 2)"), self.context)
+        self.assertIsNone(res.value)
+        self.assertEqual("Division by zero", res.error.details)
+
+    def test_deep_recursion(self):
+        res = Evaluator().visit(
+            self.parse("NOMEMO FUNC f(n) -> 1 + f(n + 1)\nf(0)"), self.context
+        )
+        self.assertEqual("Maximum recursion depth exceeded", res.error.details)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Tests for calling user-defined functions."""
+
+import inspect
+import sys
+import unittest
+from simplescript.runtime import ENGINES, run, global_symbol_table
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.types.number import Number
+
+
+class TestFunctionCalls(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def define(self, text):
+        func, error = run("<function>", text)
+        self.assertIsNone(error)
+        return func
+
+    def test_arity_is_computed_at_definition(self):
+        self.assertEqual(2, self.define("FUNC add(a, b) -> a + b").arity)
+        self.assertEqual(0, self.define("FUNC() -> 1").arity)
+
+    def test_execute(self):
+        func = self.define("FUNC add(a, b) -> a + b")
+        result = func.execute([Number(2), Number(3)])
+        self.assertIsNone(result.error)
+        self.assertEqual(5, result.value.value)
+
+    def test_execute_checks_arity(self):
+        func = self.define("FUNC add(a, b) -> a + b")
+        result = func.execute([Number(2)])
+        self.assertIn("1 too few args passed into 'ADD'", result.error.as_string())
+
+
+class TestCallTracebacks(unittest.TestCase):
+    """Tests that calls leave no trace in the tracebacks of later errors."""
+
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def test_shared_constant_arguments(self):
+        text = (
+            "NOMEMO FUNC f(x) -> x\n"
+            "VAR a = 1\n"
+            "f(a < 2)\n"
+            "f(1)\n"
+            "VAR t = a < 2\n"
+            "VAR r = t + t\n"
+            'r + "s"'
+        )
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                _, error = run("<calls>", text, engine=engine)
+                self.assertEqual(
+                    "Traceback (most recent call last):\n"
+                    "  File <calls>, line 7, in <simplescript>\n",
+                    error.generate_traceback(),
+                )
+                self.assertIsNone(Number.TRUE.context)
+                self.assertIsNone(Number.of(1).context)
+
+    def assert_frames(self, text, *frames):
+        """Assert the traceback of a program's error on every engine."""
+        expected = "Traceback (most recent call last):\n" + "".join(
+            f"  File <calls>, line {line}, in {name}\n" for line, name in frames
+        )
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                global_symbol_table.symbols.clear()
+                _, error = run("<calls>", text, engine=engine)
+                self.assertEqual(expected, error.generate_traceback())
+
+    def test_nested_call_by_name(self):
+        self.assert_frames(
+            "FUNC a(x) -> x / 0\nFUNC b(x) -> 1 + a(x)\nb(1)",
+            (3, "<simplescript>"),
+            (2, "B"),
+            (1, "A"),
+        )
+
+    def test_nested_tail_call(self):
+        self.assert_frames(
+            "FUNC a(x) -> x / 0\nFUNC b(x) -> a(x)\nb(1)",
+            (3, "<simplescript>"),
+            (2, "B"),
+            (1, "A"),
+        )
+
+    def test_call_from_callback(self):
+        self.assert_frames(
+            "FUNC a(x) -> x / 0\nMAP(FUNC(x) -> 1 + a(x), [1])",
+            (2, "<simplescript>"),
+            (2, "<anonymous>"),
+            (1, "A"),
+        )
+
+    def test_arity_error_in_function(self):
+        self.assert_frames(
+            "FUNC a(x) -> x\nFUNC b() -> 1 + a()\nb()",
+            (3, "<simplescript>"),
+            (2, "B"),
+        )
+
+    def test_tail_call_chain_keeps_first_caller(self):
+        self.assert_frames(
+            "FUNC f(n) -> IF n == 0 THEN 1 / 0 ELSE f(n - 1)\nFUNC g() -> 1 + f(3)\ng()",
+            (3, "<simplescript>"),
+            (2, "G"),
+            (1, "F"),
+            (1, "F"),
+        )
+
+
+class TestTailCalls(unittest.TestCase):
+    """Tests that calls in tail position run in constant stack space."""
+
+    COUNTDOWN = "FUNC loop(n) -> IF n == 0 THEN 0 ELSE loop(n - 1)"
+    EVEN_ODD = (
+        "FUNC even(n) -> IF n == 0 THEN 1 ELSE odd(n - 1)\n"
+        "FUNC odd(n) -> IF n == 0 THEN 0 ELSE even(n - 1)"
+    )
+
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def run_shallow(self, text, engine):
+        """Run a program with little Python stack to spare."""
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 200)
+        try:
+            return run("<tail>", text, engine=engine)
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def test_tail_positions_are_marked(self):
+        tokens, _ = Lexer("<tail>", "FUNC f(n) -> IF n THEN f(n - 1) ELSE 1 + f(n)").make_tokens()
+        func = Parser(tokens).parse().node.statement_nodes[0]
+        (_, then_call), = func.body_node.cases
+        self.assertTrue(then_call.tail)
+        self.assertFalse(func.body_node.else_case.right_node.tail)
+
+    def test_self_recursion(self):
+        for engine in ENGINES:
+            value, error = self.run_shallow(f"{self.COUNTDOWN}\nloop(10000)", engine)
+            self.assertIsNone(error, engine)
+            self.assertEqual("0", str(value), engine)
+
+    def test_mutual_recursion(self):
+        for engine in ENGINES:
+            value, error = self.run_shallow(f"{self.EVEN_ODD}\neven(10001)", engine)
+            self.assertIsNone(error, engine)
+            self.assertEqual("0", str(value), engine)
+
+    def test_million_levels(self):
+        value, error = run("<tail>", f"{self.COUNTDOWN}\nloop(1000000)", engine="vm")
+        self.assertIsNone(error)
+        self.assertEqual("0", str(value))
+
+    def test_tail_call_arity_error(self):
+        for engine in ENGINES:
+            _, error = run("<tail>", "FUNC f(n) -> IF n THEN f() ELSE 0\nf(1)", engine=engine)
+            self.assertIn("1 too few args passed into 'F'", error.as_string(), engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
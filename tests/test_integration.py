@@ -351,6 +351,17 @@ class TestLists(unittest.TestCase):
         self.assertEqual("[1, 5, 20]", str(returned_val))
         self.assertIsNone(returned_err)
 
+    def test_list_operations_leave_variable_unchanged(self):
+        run("<stdin>", "VAR list1 = [1, 2, 3]")
+        run("<stdin>", "VAR list2 = list1 + 4")
+        run("<stdin>", "VAR list3 = list1 - 0")
+        run("<stdin>", "VAR list4 = list1 * [5]")
+        returned_val, returned_err = run("<stdin>", "[list1, list2, list3, list4]")
+        self.assertEqual(
+            "[[1, 2, 3], [1, 2, 3, 4], [2, 3], [1, 2, 3, 5]]", str(returned_val)
+        )
+        self.assertIsNone(returned_err)
+
 
 class TestListErrors(unittest.TestCase):
     """Tests for list error handling."""
@@ -486,6 +497,16 @@ class TestMaps(unittest.TestCase):
         self.assertIsNotNone(returned_val)
         self.assertIsNone(returned_err)
 
+    def test_map_operations_leave_variable_unchanged(self):
+        run("<stdin>", 'VAR map1 = {"a": 1, "b": 2}')
+        run("<stdin>", 'VAR map2 = map1 + {"c": 3}')
+        run("<stdin>", 'VAR map3 = map1 - "a"')
+        returned_val, returned_err = run("<stdin>", "[map1, map2, map3]")
+        self.assertEqual(
+            '[{"a": 1, "b": 2}, {"a": 1, "b": 2, "c": 3}, {"b": 2}]', str(returned_val)
+        )
+        self.assertIsNone(returned_err)
+
 
 class TestMapErrors(unittest.TestCase):
     """Tests for map error handling."""
@@ -0,0 +1,123 @@
+"""Tests for the regex-based lexer."""
+
+import pickle
+import unittest
+from simplescript.core.lexer import Lexer
+from simplescript.errors.errors import IllegalCharError, ExpectedCharError
+from simplescript.tokens.source import Source
+
+
+def tokenize(text):
+    return Lexer("<lexer>", text).make_tokens()
+
+
+def span(token_or_error):
+    start, end = token_or_error.pos_start, token_or_error.pos_end
+    return (start.index, start.lnNumber, start.colNumber), (
+        end.index,
+        end.lnNumber,
+        end.colNumber,
+    )
+
+
+class TestLexer(unittest.TestCase):
+    """Tests for tokens, positions and lexing errors."""
+
+    def test_token_types(self):
+        tokens, error = tokenize("VAR x_1 = 2.5 -> == != <= >= ; foo")
+        self.assertIsNone(error)
+        self.assertEqual(
+            [
+                "KEYWORD", "IDENTIFIER", "EQ", "FLOAT", "ARROW", "EE", "NE",
+                "LTE", "GTE", "NEWLINE", "IDENTIFIER", "EOF",
+            ],
+            [token.type for token in tokens],
+        )
+        self.assertEqual("X_1", tokens[1].value)
+
+    def test_numbers(self):
+        tokens, _ = tokenize("12 3. 4.50")
+        self.assertEqual([12, 3.0, 4.5], [token.value for token in tokens[:3]])
+        self.assertEqual(["INT", "FLOAT", "FLOAT"], [t.type for t in tokens[:3]])
+
+    def test_second_decimal_point_is_illegal(self):
+        _, error = tokenize("1.2.3")
+        self.assertIsInstance(error, IllegalCharError)
+        self.assertEqual(((3, 0, 3), (4, 0, 4)), span(error))
+
+    def test_string_escapes(self):
+        tokens, _ = tokenize(r'"a\nb\t\"q\" \\ \z" ' + r"'it\'s'")
+        self.assertEqual('a\nb\t"q" \\ z', tokens[0].value)
+        self.assertEqual("it's", tokens[1].value)
+
+    def test_unterminated_string(self):
+        tokens, error = tokenize('"abc')
+        self.assertIsNone(error)
+        self.assertEqual("abc", tokens[0].value)
+        self.assertEqual(((0, 0, 0), (5, 0, 5)), span(tokens[0]))
+        self.assertEqual(5, tokens[1].pos_start.index)
+
+    def test_positions_across_lines(self):
+        tokens, _ = tokenize('a\n  "x\ny" b\n(1\n)')
+        b = tokens[3]
+        self.assertEqual("B", b.value)
+        self.assertEqual(((10, 2, 3), (11, 2, 4)), span(b))
+        self.assertEqual(["NEWLINE", "LPAREN", "INT", "RPAREN", "EOF"], [t.type for t in tokens[4:]])
+        self.assertEqual(4, tokens[7].pos_start.lnNumber)
+
+    def test_illegal_character(self):
+        _, error = tokenize("1 + \n #")
+        self.assertIsInstance(error, IllegalCharError)
+        self.assertEqual("'#'", error.details)
+        self.assertEqual(((6, 1, 1), (7, 1, 2)), span(error))
+
+    def test_bang_without_equals(self):
+        _, error = tokenize("a !b")
+        self.assertIsInstance(error, ExpectedCharError)
+        self.assertEqual(((2, 0, 2), (4, 0, 4)), span(error))
+        _, error = tokenize("a !")
+        self.assertEqual(((2, 0, 2), (4, 0, 4)), span(error))
+
+    def test_tokens_share_source(self):
+        tokens, _ = tokenize("a + 12")
+        self.assertTrue(all(t.source is tokens[0].source for t in tokens))
+        self.assertEqual([(0, 1), (2, 3), (4, 6), (6, 7)], [(t.start, t.end) for t in tokens])
+
+    def test_tokens_and_positions_are_slotted(self):
+        tokens, _ = tokenize("a")
+        self.assertFalse(hasattr(tokens[0], "__dict__"))
+        self.assertFalse(hasattr(tokens[0].pos_start, "__dict__"))
+
+    def test_bang_before_newline_arrows(self):
+        _, error = tokenize("a !\nb")
+        self.assertEqual(
+            "Expected Character: '=' (after '!')\nFile <lexer>, line 1\n\na !\n  ^^",
+            error.as_string(),
+        )
+
+
+class TestSource(unittest.TestCase):
+    """Tests for line and column lookup in a Source."""
+
+    def test_line_col(self):
+        source = Source("<source>", "ab\n\ncd\n")
+        self.assertEqual(
+            [(0, 0), (0, 2), (1, 0), (2, 0), (2, 2), (3, 0), (3, 1)],
+            [source.line_col(offset) for offset in (0, 2, 3, 4, 6, 7, 8)],
+        )
+
+    def test_line_text(self):
+        source = Source("<source>", "ab\n\ncd")
+        self.assertEqual(["ab", "", "cd", ""], [source.line_text(n) for n in range(4)])
+
+    def test_line_table_is_lazy_and_not_pickled(self):
+        source = Source("<source>", "a\nb")
+        self.assertIsNone(source._line_starts)
+        self.assertEqual((1, 0), source.line_col(2))
+        copy = pickle.loads(pickle.dumps(source))
+        self.assertIsNone(copy._line_starts)
+        self.assertEqual(("<source>", "a\nb"), (copy.name, copy.text))
+
+
+if __name__ == "__main__":
+    unittest.main()
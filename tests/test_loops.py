@@ -0,0 +1,76 @@
+"""Tests for FOR loop iteration on every engine."""
+
+import unittest
+from simplescript.runtime import ENGINES, run, global_symbol_table
+from simplescript.core.loops import FloatSteps, loop_values, stalled
+
+
+class TestLoopValues(unittest.TestCase):
+    def test_integer_loops_use_range(self):
+        self.assertEqual(range(0, 5, 2), loop_values(0, 5, 2))
+        self.assertEqual([10, 7, 4, 1], list(loop_values(10, 0, -3)))
+
+    def test_float_loops_add_the_step(self):
+        values = loop_values(0, 0.5, 0.1)
+        self.assertIsInstance(values, FloatSteps)
+        self.assertEqual([0, 0.1, 0.2, 0.30000000000000004, 0.4], list(values))
+        self.assertFalse(stalled(values))
+        self.assertEqual([1.5, 0.5], list(loop_values(1.5, 0, -1)))
+
+    def test_step_that_stops_changing_the_value_stalls(self):
+        values = loop_values(2.0 ** 53 - 2, 2.0 ** 54, 1)
+        self.assertEqual([2.0 ** 53 - 2, 2.0 ** 53 - 1], list(values))
+        self.assertTrue(stalled(values))
+
+    def test_zero_step(self):
+        values = loop_values(0, 1, 0)
+        self.assertEqual([], list(values))
+        self.assertTrue(stalled(values))
+        self.assertFalse(stalled(loop_values(1, 0, 0)))
+
+
+class TestForLoops(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def test_values(self):
+        for text, expected in [
+            ("FOR i = 0 TO 5 THEN i", "[0, 1, 2, 3, 4]"),
+            ("FOR i = 5 TO 0 STEP -2 THEN i", "[5, 3, 1]"),
+            ("FOR i = 0 TO 1 STEP 0.25 THEN i", "[0, 0.25, 0.5, 0.75]"),
+            ("FOR i = 0.5 TO 3 THEN i", "[0.5, 1.5, 2.5]"),
+            ("FOR i = 0 TO 3 THEN VAR i = 10", "[10, 10, 10]"),
+            ("FUNC f(n) -> FOR i = 0 TO n THEN i * i\nf(4)", "[0, 1, 4, 9]"),
+        ]:
+            for engine in ENGINES:
+                with self.subTest(text=text, engine=engine):
+                    value, error = run("<loops>", text, engine=engine)
+                    self.assertIsNone(error)
+                    self.assertEqual(expected, str(value))
+
+    def test_stalled_step_is_an_error(self):
+        for text in [
+            "FOR i = 0 TO 1 STEP 0 THEN i",
+            "VAR big = 9007199254740992.0\nFOR i = big - 2 TO big * 2 THEN i",
+            "FUNC f() -> FOR i = 0 TO 1 STEP 0 THEN 1\nf()",
+        ]:
+            for engine in ENGINES:
+                with self.subTest(text=text, engine=engine):
+                    value, error = run("<loops>", text, engine=engine)
+                    self.assertIsNone(value)
+                    self.assertIn(
+                        "Loop STEP is too small to change the loop variable",
+                        error.as_string(),
+                    )
+
+    def test_zero_step_without_iterations(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                value, error = run("<loops>", "FOR i = 1 TO 0 STEP 0 THEN i", engine=engine)
+                self.assertIsNone(error)
+                self.assertEqual("[]", str(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+"""Tests for purity analysis and the memoization of pure functions."""
+
+import os
+import unittest
+from unittest import mock
+from simplescript.runtime import ENGINES, run, global_symbol_table
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.utils.memo_cache import (
+    DEFAULT_MEMO_SIZE,
+    MEMO_SIZE_ENV_VAR,
+    MISSING,
+    MemoCache,
+    configured_memo_size,
+)
+
+
+class TestMemoCache(unittest.TestCase):
+    def test_lookup_counts_hits_and_misses(self):
+        memo = MemoCache(4)
+        self.assertIs(MISSING, memo.lookup((1,)))
+        memo.store((1,), "one")
+        self.assertEqual("one", memo.lookup((1,)))
+        self.assertEqual((1, 1), (memo.hits, memo.misses))
+
+    def test_evicts_least_recently_used(self):
+        memo = MemoCache(2)
+        memo.store((1,), "one")
+        memo.store((2,), "two")
+        memo.lookup((1,))
+        memo.store((3,), "three")
+        self.assertEqual(2, len(memo))
+        self.assertIs(MISSING, memo.lookup((2,)))
+        self.assertEqual("one", memo.lookup((1,)))
+
+    def test_none_is_a_result(self):
+        memo = MemoCache()
+        memo.store((), None)
+        self.assertIsNone(memo.lookup(()))
+
+    def test_adaptive_cache_stops_when_full_of_misses(self):
+        for adaptive in (False, True):
+            memo = MemoCache(2, adaptive)
+            for i in range(3):
+                memo.lookup((i,))
+                memo.store((i,), i)
+            self.assertEqual(not adaptive, memo.active)
+            self.assertEqual(0 if adaptive else 2, len(memo))
+
+    def test_adaptive_cache_with_hits_evicts(self):
+        memo = MemoCache(2, adaptive=True)
+        for i in range(3):
+            memo.store((i,), i)
+            memo.lookup((i,))
+        self.assertTrue(memo.active)
+        self.assertEqual(2, len(memo))
+
+    def test_size_is_configured_by_environment(self):
+        cases = [("8", 8), ("0", 0), ("", DEFAULT_MEMO_SIZE), ("-1", DEFAULT_MEMO_SIZE)]
+        for value, size in cases:
+            with self.subTest(value=value):
+                with mock.patch.dict(os.environ, {MEMO_SIZE_ENV_VAR: value}):
+                    self.assertEqual(size, configured_memo_size())
+                    if size:
+                        self.assertEqual(size, MemoCache().maxsize)
+
+
+class TestPurity(unittest.TestCase):
+    def parse(self, text):
+        tokens, error = Lexer("<memo>", text).make_tokens()
+        self.assertIsNone(error)
+        ast = Parser(tokens).parse()
+        self.assertIsNone(ast.error)
+        return ast.node.statement_nodes[0]
+
+    def test_pure_bodies(self):
+        for text, callees in [
+            ("FUNC f(a, b) -> a + b * 2", ()),
+            ("FUNC f(n) -> FOR i = 0 TO n THEN VAR n = n + i", ()),
+            ("FUNC fib(n) -> IF n <= 1 THEN n ELSE fib(n - 1) + fib(n - 2)", ("FIB",)),
+            ("FUNC f(x) -> g(h(x)) + g(x)", ("G", "H")),
+        ]:
+            with self.subTest(text=text):
+                self.assertEqual(callees, self.parse(text).callees)
+
+    def test_impure_bodies(self):
+        for text in [
+            "FUNC f(x) -> x + y",
+            "FUNC f(g) -> g(1)",
+            "FUNC f(x) -> FUNC() -> x",
+            "FUNC f(a) -> FUNC g(b) -> a + b",
+            "FUNC f() -> (FUNC() -> 1)()",
+        ]:
+            with self.subTest(text=text):
+                self.assertIsNone(self.parse(text).callees)
+
+    def test_explicit_choice(self):
+        self.assertIs(True, self.parse("MEMO FUNC f(x) -> x + y").memoize)
+        self.assertIs(False, self.parse("NOMEMO FUNC f(x) -> x").memoize)
+        self.assertIsNone(self.parse("FUNC f(x) -> x").memoize)
+
+
+class TestMemoization(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def run_on(self, engine, text):
+        value, error = run("<memo>", text, engine=engine)
+        self.assertIsNone(error, text)
+        return value
+
+    def memo(self, name):
+        return global_symbol_table.get(name).memo
+
+    def test_recursive_pure_function_is_memoized(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                global_symbol_table.symbols.clear()
+                value = self.run_on(
+                    engine,
+                    "FUNC fib(n) -> IF n <= 1 THEN n ELSE fib(n - 1) + fib(n - 2)\n"
+                    "fib(90)",
+                )
+                self.assertEqual("2880067194370816120", str(value))
+                memo = self.memo("FIB")
+                self.assertEqual((91, 88), (memo.misses, memo.hits))
+
+    def test_arguments_are_keyed_by_type(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                value = self.run_on(engine, 'FUNC f(x) -> x\n[f(1), f(1.0), f("1"), f(1)]')
+                self.assertEqual('[1, 1.0, "1", 1]', str(value))
+                self.assertEqual((3, 1), (self.memo("F").misses, self.memo("F").hits))
+
+    def test_signed_zeros_are_keyed_apart(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                value = self.run_on(engine, "FUNC f(x) -> x\n[f(0.0), f(-0.0), f(0.0)]")
+                self.assertEqual("[0.0, -0.0, 0.0]", str(value))
+                self.assertEqual((2, 1), (self.memo("F").misses, self.memo("F").hits))
+
+    def test_calls_with_other_arguments_are_not_cached(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.run_on(engine, "FUNC first(l) -> l / 0\nfirst([1])\nfirst([1])")
+                memo = self.memo("FIRST")
+                self.assertEqual((0, 0, 0), (len(memo), memo.misses, memo.hits))
+
+    def test_rebinding_a_callee_empties_the_cache(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                value = self.run_on(
+                    engine,
+                    "FUNC h(x) -> sq(x) + 1\n"
+                    "FUNC sq(x) -> x * x\n"
+                    "VAR a = h(3)\n"
+                    "FUNC sq(x) -> x * 10\n"
+                    "[a, h(3)]",
+                )
+                self.assertEqual("[10, 31]", str(value))
+
+    def test_impure_callee_disables_caching(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                value = self.run_on(
+                    engine,
+                    "VAR k = 2\n"
+                    "FUNC scale(x) -> x * k\n"
+                    "FUNC h(x) -> scale(x)\n"
+                    "VAR a = h(3)\n"
+                    "VAR k = 5\n"
+                    "[a, h(3)]",
+                )
+                self.assertEqual("[6, 15]", str(value))
+                self.assertIsNone(self.memo("SCALE"))
+                self.assertEqual(0, len(self.memo("H")))
+
+    def test_opt_in_and_out(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                value = self.run_on(
+                    engine,
+                    "VAR k = 2\n"
+                    "MEMO FUNC scale(x) -> x * k\n"
+                    "VAR a = scale(3)\n"
+                    "VAR k = 5\n"
+                    "NOMEMO FUNC double(x) -> x * 2\n"
+                    "[a, scale(3), double(1)]",
+                )
+                self.assertEqual("[6, 6, 2]", str(value))
+                self.assertEqual(1, self.memo("SCALE").hits)
+                self.assertIsNone(self.memo("DOUBLE"))
+
+    def test_tail_calls_cache_only_the_outer_call(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.run_on(
+                    engine,
+                    "FUNC count(n, acc) -> IF n == 0 THEN acc ELSE count(n - 1, acc + 1)\n"
+                    "count(100, 0)\n"
+                    "count(100, 0)",
+                )
+                memo = self.memo("COUNT")
+                self.assertEqual((1, 1, 1), (len(memo), memo.misses, memo.hits))
+
+    def test_tail_call_to_another_function_caches_the_caller(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.run_on(
+                    engine,
+                    "FUNC g(n) -> n + 1\nFUNC f(n) -> g(n)\nf(1)\nf(1)",
+                )
+                self.assertEqual((1, 1), (len(self.memo("F")), self.memo("F").hits))
+                self.assertEqual(0, len(self.memo("G")))
+
+    def test_cached_results_are_not_shared_with_callers(self):
+        for engine in ENGINES:
+            tracebacks = []
+            for keyword in ("MEMO", "NOMEMO"):
+                global_symbol_table.symbols.clear()
+                _, error = run(
+                    "<memo>",
+                    f"{keyword} FUNC z(n) -> n * 0\n"
+                    "FUNC h(a) -> a\n"
+                    "h(z(1))\n"
+                    "z(1) / 0",
+                    engine=engine,
+                )
+                tracebacks.append(error.as_string())
+            with self.subTest(engine=engine):
+                self.assertEqual(tracebacks[1], tracebacks[0])
+                self.assertNotIn("in H", tracebacks[0])
+
+    def test_pure_function_with_distinct_calls_stops_memoizing(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                global_symbol_table.symbols.clear()
+                value = self.run_on(
+                    engine,
+                    "FUNC sq(x) -> x * x\n"
+                    "MEMO FUNC cube(x) -> x * x * x\n"
+                    "VAR xs = FOR i = 0 TO 1100 THEN [sq(i), cube(i)]\n"
+                    "xs / 1099",
+                )
+                self.assertEqual("[1207801, 1327373299]", str(value))
+                self.assertFalse(self.memo("SQ").active)
+                self.assertEqual(1025, self.memo("SQ").misses)
+                self.assertTrue(self.memo("CUBE").active)
+                self.assertEqual(1024, len(self.memo("CUBE")))
+
+    def test_memo_size_zero_disables_memoization(self):
+        with mock.patch.dict(os.environ, {MEMO_SIZE_ENV_VAR: "0"}):
+            for engine in ENGINES:
+                with self.subTest(engine=engine):
+                    value = self.run_on(engine, "MEMO FUNC f(x) -> x + 1\nf(1) + f(1)")
+                    self.assertEqual("4", str(value))
+                    self.assertIsNone(self.memo("F"))
+
+    def test_copies_share_the_cache(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.run_on(engine, "FUNC f(x) -> x\nVAR g = f\ng(1)\nf(1)")
+                self.assertEqual(1, self.memo("F").hits)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Tests for shared Number constants."""
+
+import pickle
+import unittest
+from simplescript.core.interpreter import Interpreter
+from simplescript.core.context import Context
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.runtime import ENGINES, run, global_symbol_table
+from simplescript.types.number import Constant, Number
+from simplescript.utils.symbol_table import SymbolTable
+
+
+class TestConstants(unittest.TestCase):
+    """Tests for the small-integer cache and boolean singletons."""
+
+    def test_comparisons_return_singletons(self):
+        one, two = Number(1), Number(2)
+        self.assertIs(Number.TRUE, one.get_comparison_lt(two)[0])
+        self.assertIs(Number.FALSE, one.get_comparison_eq(two)[0])
+        self.assertIs(Number.TRUE, Number(0).notted()[0])
+        self.assertIs(Number.of(2), one.anded_by(two)[0])
+
+    def test_small_int_cache(self):
+        self.assertIs(Number.of(100), Number.of(100))
+        self.assertIsNot(Number.of(1000), Number.of(1000))
+        self.assertEqual(1.0, Number.of(1.0).value)
+        self.assertIsNot(Number.of(1.0), Number.TRUE)
+
+    def test_constants_are_not_modified(self):
+        context = Context("<test>")
+        moved = Number.TRUE.set_pos("start", "end").set_context(context)
+        self.assertIsNot(Number.TRUE, moved)
+        self.assertIs(type(moved), Number)
+        self.assertEqual(("start", "end", context), (moved.pos_start, moved.pos_end, moved.context))
+        self.assertIsNone(Number.TRUE.pos_start)
+        self.assertIsNone(Number.TRUE.context)
+
+
+class TestLiteralReuse(unittest.TestCase):
+    """Tests for literals built once per NumberNode."""
+
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def evaluate(self, node, context):
+        return Interpreter().visit(node, context).value
+
+    def test_literal_reused_across_contexts(self):
+        tokens, _ = Lexer("<test>", "7").make_tokens()
+        node = Parser(tokens).parse().node.statement_nodes[0]
+        context = Context("<test>")
+        context.symbol_table = SymbolTable()
+        first = self.evaluate(node, context)
+        self.assertIsInstance(first, Constant)
+        self.assertIsNone(first.context)
+        self.assertIs(first, self.evaluate(node, context))
+        self.assertIs(first, self.evaluate(node, Context("<other>")))
+
+    def test_literal_not_pickled(self):
+        tokens, _ = Lexer("<test>", "7").make_tokens()
+        node = Parser(tokens).parse().node.statement_nodes[0]
+        self.evaluate(node, Context("<test>"))
+        copy = pickle.loads(pickle.dumps(node))
+        self.assertIsNone(copy.constant)
+        self.assertEqual(7, copy.tok.value)
+
+    def test_returned_literal_reports_errors_at_the_call(self):
+        # Every engine returns the literal itself, which the caller locates.
+        for text in ['FUNC f() -> 5\nf() + "x"', 'FUNC f() -> 5\n"x" - f()']:
+            for engine in ENGINES:
+                with self.subTest(text=text, engine=engine):
+                    global_symbol_table.symbols.clear()
+                    value, error = run("<test>", text, engine=engine)
+                    self.assertIsNone(value)
+                    message = error.as_string()
+                    self.assertIn("File <test>, line 2, in <simplescript>\nRuntime", message)
+                    self.assertNotIn("in F", message)
+                    self.assertIn(f"\n\n{text.splitlines()[1]}\n^^^", message)
+
+    def test_argument_gets_own_context(self):
+        value, error = run("<test>", "FUNC f(a) -> a / 0\nf(1)\nf(2)")
+        self.assertIsNone(value)
+        self.assertIn("in F", error.as_string())
+
+
+if __name__ == "__main__":
+    unittest.main()
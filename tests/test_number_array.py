@@ -0,0 +1,106 @@
+"""Tests for NumberArray and the ARRAY and LIST built-in functions."""
+
+import unittest
+from array import array
+from simplescript.runtime import ENGINES, run, global_symbol_table
+from simplescript.types.number import Number
+from simplescript.types.number_array import NumberArray, pack
+
+
+class TestPack(unittest.TestCase):
+    def test_integers_pack_as_int64(self):
+        self.assertEqual(array("q", [1, 2, 3]), pack([1, 2, 3]))
+        self.assertEqual(array("q", [1, 0]), pack([True, False]))
+
+    def test_any_float_packs_as_double(self):
+        self.assertEqual(array("d", [1.0, 2.5]), pack([1, 2.5]))
+        self.assertEqual("d", pack([2 ** 70, 0.5]).typecode)
+
+    def test_integer_overflow_raises(self):
+        with self.assertRaises(OverflowError):
+            pack([1, 2 ** 63])
+
+
+class TestNumberArray(unittest.TestCase):
+    def test_elementwise_arithmetic(self):
+        a = NumberArray(pack([1, 2, 3]))
+        b = NumberArray(pack([4, 5, 6]))
+        self.assertEqual("array[5, 7, 9]", str(a.added_to(b)[0]))
+        self.assertEqual("array[-3, -3, -3]", str(a.subbed_by(b)[0]))
+        self.assertEqual("array[4, 10, 18]", str(a.multed_by(b)[0]))
+        self.assertEqual("array[0.25, 0.4, 0.5]", str(a.dived_by(b)[0]))
+        self.assertEqual("array[1, 32, 729]", str(a.powed_by(b)[0]))
+
+    def test_number_broadcasts_on_either_side(self):
+        a = NumberArray(pack([1, 2, 4]))
+        self.assertEqual("array[2, 4, 8]", str(a.multed_by(Number(2))[0]))
+        self.assertEqual("array[9, 8, 6]", str(Number(10).subbed_by(a)[0]))
+        self.assertEqual("array[4.0, 2.0, 1.0]", str(Number(4).dived_by(a)[0]))
+        self.assertEqual("array[2, 4, 16]", str(Number(2).powed_by(a)[0]))
+
+    def test_comparisons_give_ones_and_zeros(self):
+        a = NumberArray(pack([1, 2, 3]))
+        self.assertEqual("array[0, 1, 0]", str(a.get_comparison_eq(Number(2))[0]))
+        self.assertEqual("array[1, 0, 0]", str(a.get_comparison_lt(Number(2))[0]))
+        self.assertEqual("array[0, 1, 1]", str(Number(2).get_comparison_lte(a)[0]))
+
+    def test_errors(self):
+        a = NumberArray(pack([1, 2]))
+        for result, details in [
+            (a.added_to(NumberArray(pack([1]))), "Array lengths differ (2 and 1)"),
+            (a.dived_by(NumberArray(pack([1, 0]))), "Division by zero"),
+            (a.dived_by(Number(0)), "Division by zero"),
+            (Number(1).dived_by(NumberArray(pack([0.0]))), "Division by zero"),
+            (a.powed_by(Number(64)), "Array element out of range"),
+            (NumberArray(pack([-8])).powed_by(Number(0.5)), "Array element is not a real number"),
+            (a.anded_by(Number(1)), "Illegal operation"),
+        ]:
+            with self.subTest(details=details):
+                value, error = result
+                self.assertIsNone(value)
+                self.assertEqual(details, error.details)
+
+
+class TestArrayBuiltins(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def test_values(self):
+        for text, expected in [
+            ("ARRAY([1, 2, 3]) * 2 + 1", "array[3, 5, 7]"),
+            ("VAR xs = ARRAY([1, 2.5])\nxs - xs", "array[0.0, 0.0]"),
+            ("ARRAY([])", "array[]"),
+            ("LIST(ARRAY([1, 2, 3]) >= 2)", "[0, 1, 1]"),
+            ("FUNC scale(xs, k) -> ARRAY(xs) * k\nscale([1, 2], 3)", "array[3, 6]"),
+            ("VAR ARRAY = 5\nARRAY + 1", "6"),
+        ]:
+            for engine in ENGINES:
+                with self.subTest(text=text, engine=engine):
+                    global_symbol_table.symbols.clear()
+                    value, error = run("<array>", text, engine=engine)
+                    self.assertIsNone(error)
+                    self.assertEqual(expected, str(value))
+
+    def test_errors(self):
+        for text, details in [
+            ('ARRAY([1, "a"])', "ARRAY expects a list of numbers"),
+            ("ARRAY(1)", "ARRAY expects a list of numbers"),
+            ("ARRAY([9223372036854775808])", "Array element out of range"),
+            ("ARRAY([1], [2])", "1 too many args passed into 'ARRAY'"),
+            ("LIST([1])", "LIST expects an array"),
+            ("LIST(5)", "LIST expects an array"),
+        ]:
+            for engine in ENGINES:
+                with self.subTest(text=text, engine=engine):
+                    value, error = run("<array>", text, engine=engine)
+                    self.assertIsNone(value)
+                    self.assertEqual(details, error.details)
+                    # Reported at the call, even for a literal argument.
+                    message = error.as_string()
+                    self.assertIn("in <simplescript>", message)
+                    self.assertIn(f"Runtime Error: {details}\n\n{text}\n^", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Tests for the AST optimizer (constant folding and simplification)."""
+
+import unittest
+from simplescript.runtime import run
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.core.optimizer import Optimizer
+from simplescript.ast.nodes import NumberNode, StringNode, BinOpNode, VarAccessNode
+from tests.engine_support import PARITY_PROGRAMS
+
+OPTIMIZER_PROGRAMS = [
+    "10 * (5 + 2) - 3",
+    '"hello" + " " + "world"',
+    '"-" * (2 + 3)',
+    "-(2 ^ 3) + NOT (1 == 2)",
+    "(2 + 3) * 1 / 0",
+    "1 / (2 - 2)",
+    '(1 + 2) + "a"',
+    '"a" * (1 + 1) - 1',
+    "(1 < 2) * 1 + 0",
+    "(4 / 2) ^ 1 - 0",
+    "(2 - 4) + 0 / (3 - 3)",
+    "(-0.0 + 0) / 1",
+    "-0.0 * 1",
+    "(-8) ^ 0.5",
+    "VAR l = [1] + 0",
+    "VAR s = \"ab\" * 1",
+    "IF 1 + 1 == 2 THEN \"yes\" ELSE \"no\"",
+    "FOR i = 0 TO 2 + 1 THEN i * 1 + 0",
+    "FUNC(x) -> x + 2 * 3",
+    "(FUNC(x) -> x * (1 + 0))(7)",
+    "(FUNC(x) -> x * (1 + 0))([1])",
+    "[1 + 1, {\"k\" + \"ey\": 2 * 2}]",
+    "IF 0 THEN \"a\" * 100000000 ELSE 2 ^ 100000 > 1",
+]
+"""Programs mixing foldable expressions with runtime errors."""
+
+
+class TestOptimizerOutcome(unittest.TestCase):
+    """Tests that optimizing never changes a program's value or error."""
+
+    def assert_unchanged(self, text):
+        plain_val, plain_err = run("<opt>", text, optimize=False)
+        opt_val, opt_err = run("<opt>", text)
+        self.assertEqual(str(plain_val), str(opt_val), text)
+        self.assertEqual(type(plain_err), type(opt_err), text)
+        if plain_err:
+            self.assertEqual(plain_err.as_string(), opt_err.as_string(), text)
+
+    def test_programs(self):
+        for text in PARITY_PROGRAMS + OPTIMIZER_PROGRAMS:
+            with self.subTest(text=text):
+                self.assert_unchanged(text)
+
+    def test_folded_values(self):
+        self.assertEqual("67", str(run("<opt>", "10 * (5 + 2) - 3")[0]))
+        self.assertEqual('"hello world"', str(run("<opt>", '"hello" + " " + "world"')[0]))
+
+
+class TestOptimizer(unittest.TestCase):
+    """Tests for the rewrites performed by the Optimizer."""
+
+    def optimize(self, text):
+        tokens, error = Lexer("<opt>", text).make_tokens()
+        self.assertIsNone(error)
+        ast = Parser(tokens).parse()
+        self.assertIsNone(ast.error)
+        optimizer = Optimizer()
+        program = optimizer.optimize(ast.node)
+        return program.statement_nodes[0], optimizer
+
+    def test_fold_numbers(self):
+        node, optimizer = self.optimize("10 * (5 + 2) - 3")
+        self.assertIsInstance(node, NumberNode)
+        self.assertEqual(67, node.tok.value)
+        self.assertEqual(3, optimizer.folded)
+
+    def test_fold_keeps_span(self):
+        node, _ = self.optimize("1 + 2 * 3")
+        self.assertEqual(0, node.pos_start.index)
+        self.assertEqual(9, node.pos_end.index)
+
+    def test_fold_strings(self):
+        node, _ = self.optimize('"ab" * 2 + "c"')
+        self.assertIsInstance(node, StringNode)
+        self.assertEqual("ababc", node.tok.value)
+
+    def test_division_by_zero_not_folded(self):
+        node, optimizer = self.optimize("1 / (2 - 2)")
+        self.assertIsInstance(node, BinOpNode)
+        self.assertIsInstance(node.right_node, NumberNode)
+        self.assertEqual(1, optimizer.folded)
+
+    def test_illegal_operation_not_folded(self):
+        node, _ = self.optimize('1 + "a"')
+        self.assertIsInstance(node, BinOpNode)
+
+    def test_large_results_not_folded(self):
+        node, _ = self.optimize('"a" * 100000')
+        self.assertIsInstance(node, BinOpNode)
+        node, _ = self.optimize("2 ^ 100000")
+        self.assertIsInstance(node, BinOpNode)
+
+    def test_identity_on_numeric_operand(self):
+        node, optimizer = self.optimize("(x < 2) * 1")
+        self.assertIsInstance(node, BinOpNode)
+        self.assertEqual(node.op_tok.type, "LT")
+        self.assertEqual(11, node.pos_end.index)
+        self.assertEqual(1, optimizer.simplified)
+
+    def test_identity_on_unknown_operand_kept(self):
+        for text in ("x * 1", "x + 0", "x ^ 1", "(x / 2) + 0"):
+            with self.subTest(text=text):
+                node, optimizer = self.optimize(text)
+                self.assertIsInstance(node, BinOpNode)
+                self.assertEqual(0, optimizer.simplified)
+
+    def test_function_body_optimized(self):
+        node, _ = self.optimize("FUNC f(x) -> x + 2 * 3")
+        self.assertIsInstance(node.body_node.left_node, VarAccessNode)
+        self.assertIsInstance(node.body_node.right_node, NumberNode)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for the persistent map behind SimpleScript maps."""
+
+import unittest
+from simplescript.utils.persistent_map import EMPTY, PersistentMap
+
+
+class CollidingKey:
+    """A key whose hash is chosen by the test, to force hash collisions."""
+
+    def __init__(self, name, key_hash):
+        self.name = name
+        self.key_hash = key_hash
+
+    def __hash__(self):
+        return self.key_hash
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.name == self.name
+
+
+class TestPersistentMap(unittest.TestCase):
+    """Tests for PersistentMap."""
+
+    def test_set_and_get(self):
+        result = EMPTY
+        for i in range(2000):
+            result = result.set(f"k{i}", i)
+        self.assertEqual(2000, len(result))
+        self.assertEqual(1234, result["k1234"])
+        self.assertIn("k0", result)
+        self.assertNotIn("k2000", result)
+        self.assertIsNone(result.get("missing"))
+        with self.assertRaises(KeyError):
+            result["missing"]
+
+    def test_insertion_order(self):
+        result = PersistentMap({"b": 1, "a": 2}).set("c", 3).set("b", 4)
+        self.assertEqual([("b", 4), ("a", 2), ("c", 3)], list(result.items()))
+        result = result.remove("b").set("b", 5)
+        self.assertEqual(["a", "c", "b"], list(result))
+
+    def test_remove(self):
+        result = PersistentMap((f"k{i}", i) for i in range(500))
+        expected = {f"k{i}": i for i in range(500)}
+        for i in range(0, 500, 3):
+            result = result.remove(f"k{i}")
+            del expected[f"k{i}"]
+        self.assertEqual(list(expected.items()), list(result.items()))
+        with self.assertRaises(KeyError):
+            result.remove("k0")
+
+    def test_remove_compacts_order(self):
+        result = PersistentMap((i, i) for i in range(100))
+        for i in range(90):
+            result = result.remove(i)
+        self.assertLessEqual(len(result.order), 2 * len(result) + 1)
+        self.assertEqual(list(range(90, 100)), list(result))
+
+    def test_hash_collisions(self):
+        keys = [CollidingKey(i, i % 3) for i in range(30)]
+        result = PersistentMap((key, key.name) for key in keys)
+        self.assertEqual(list(range(30)), [result[key] for key in keys])
+        for key in keys[::2]:
+            result = result.remove(key)
+        self.assertEqual(list(range(1, 30, 2)), [value for _, value in result.items()])
+        with self.assertRaises(KeyError):
+            result.remove(keys[0])
+
+    def test_update(self):
+        big = PersistentMap((i, i) for i in range(100))
+        for other in ({100: "x", 5: "y"}, {i: -i for i in range(50, 150)}):
+            expected = dict(big.items())
+            expected.update(other)
+            self.assertEqual(list(expected.items()), list(big.update(other).items()))
+            self.assertEqual(
+                list(expected.items()), list(big.update(PersistentMap(other)).items())
+            )
+        self.assertIs(big, EMPTY.update(big))
+
+    def test_old_versions_unchanged(self):
+        versions = [EMPTY]
+        for i in range(300):
+            versions.append(versions[-1].set(i, i))
+        versions[-1].remove(0).update({1: "x"})
+        for size, version in enumerate(versions):
+            self.assertEqual([(i, i) for i in range(size)], list(version.items()))
+
+
+if __name__ == "__main__":
+    unittest.main()
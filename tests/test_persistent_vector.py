@@ -0,0 +1,81 @@
+"""Tests for the persistent vector behind SimpleScript lists."""
+
+import unittest
+from simplescript.utils.persistent_vector import EMPTY, PersistentVector
+
+# Sizes around the tail, leaf and trie-level boundaries (32, 32 * 32 + 32).
+SIZES = [0, 1, 31, 32, 33, 64, 65, 1055, 1056, 1057, 2000]
+
+
+class TestPersistentVector(unittest.TestCase):
+    """Tests for PersistentVector."""
+
+    def test_append_and_index(self):
+        for size in SIZES:
+            vector = EMPTY
+            for i in range(size):
+                vector = vector.append(i)
+            self.assertEqual(list(range(size)), list(vector), size)
+            self.assertEqual(size, len(vector))
+            self.assertEqual(list(range(size)), [vector[i] for i in range(size)])
+            self.assertEqual(list(vector), list(PersistentVector(range(size))))
+
+    def test_negative_and_invalid_indices(self):
+        vector = PersistentVector(range(40))
+        self.assertEqual(39, vector[-1])
+        self.assertEqual(0, vector[-40])
+        for index in (40, -41):
+            with self.assertRaises(IndexError):
+                vector[index]
+        with self.assertRaises(TypeError):
+            vector[1.0]
+
+    def test_pop_to_empty(self):
+        for size in SIZES:
+            vector = PersistentVector(range(size))
+            expected = list(range(size))
+            while expected:
+                vector = vector.pop()
+                expected.pop()
+                self.assertEqual(len(expected), len(vector))
+            self.assertEqual([], list(vector))
+        with self.assertRaises(IndexError):
+            EMPTY.pop()
+
+    def test_remove(self):
+        vector = PersistentVector(range(100))
+        self.assertEqual([0, 2], list(PersistentVector(range(3)).remove(1)))
+        self.assertEqual(list(range(99)), list(vector.remove(-1)))
+        self.assertEqual([i for i in range(100) if i != 50], list(vector.remove(50)))
+        with self.assertRaises(IndexError):
+            vector.remove(100)
+
+    def test_extend(self):
+        for size in SIZES:
+            for extra in (0, 1, 33, 1100):
+                vector = PersistentVector(range(size)).extend(range(size, size + extra))
+                self.assertEqual(list(range(size + extra)), list(vector), (size, extra))
+
+    def test_set(self):
+        for size in SIZES[1:]:
+            vector = PersistentVector(range(size))
+            for index in {0, size // 2, size - 1, -1}:
+                expected = list(range(size))
+                expected[index] = "x"
+                self.assertEqual(expected, list(vector.set(index, "x")), (size, index))
+            self.assertEqual(list(range(size)), list(vector))
+        with self.assertRaises(IndexError):
+            PersistentVector(range(3)).set(3, "x")
+
+    def test_old_versions_unchanged(self):
+        versions = [EMPTY]
+        for i in range(1100):
+            versions.append(versions[-1].append(i))
+        popped = versions[-1].pop().pop()
+        self.assertEqual(list(range(1098)), list(popped))
+        for size, vector in enumerate(versions):
+            self.assertEqual(list(range(size)), list(vector))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Tests for whole-program parsing and statement-by-statement execution."""
+
+import unittest
+from simplescript.runtime import run, run_iter, global_symbol_table
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.ast.nodes import ProgramNode
+from simplescript.errors.errors import InvalidSyntaxError, RTError
+
+
+class ProgramTestCase(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def results(self, text, engine="interpreter"):
+        return [
+            (str(value), error)
+            for value, error in run_iter("<program>", text, engine=engine)
+        ]
+
+
+class TestProgramParsing(ProgramTestCase):
+    """Tests for the program-level grammar."""
+
+    def parse(self, text):
+        tokens, error = Lexer("<program>", text).make_tokens()
+        self.assertIsNone(error)
+        return Parser(tokens).parse()
+
+    def test_statements(self):
+        ast = self.parse("\n\nVAR a = 1\n\nVAR b = 2; a + b\n")
+        self.assertIsNone(ast.error)
+        self.assertIsInstance(ast.node, ProgramNode)
+        self.assertEqual(3, len(ast.node.statement_nodes))
+
+    def test_empty_program(self):
+        ast = self.parse("\n;\n")
+        self.assertIsNone(ast.error)
+        self.assertEqual([], ast.node.statement_nodes)
+
+    def test_newlines_inside_brackets(self):
+        ast = self.parse("VAR m = {\n  \"a\": [1,\n 2],\n  \"b\": (3\n + 4)\n}\nm")
+        self.assertIsNone(ast.error)
+        self.assertEqual(2, len(ast.node.statement_nodes))
+
+    def test_missing_separator(self):
+        ast = self.parse("1 2")
+        self.assertIsInstance(ast.error, InvalidSyntaxError)
+
+    def test_trailing_identifier_rejected(self):
+        ast = self.parse("1 a")
+        self.assertIsInstance(ast.error, InvalidSyntaxError)
+
+    def test_unused_loop_values_marked(self):
+        ast = self.parse(
+            "FOR i = 0 TO 2 THEN WHILE 0 THEN 1\n"
+            "IF 1 THEN FOR j = 0 TO 2 THEN j\n"
+            "VAR r = FOR k = 0 TO 2 THEN k\n"
+            "FOR m = 0 TO 2 THEN m"
+        )
+        outer, branch, assigned, last = ast.node.statement_nodes
+        self.assertTrue(outer.value_unused)
+        self.assertTrue(outer.body_node.value_unused)
+        self.assertTrue(branch.cases[0][1].value_unused)
+        self.assertFalse(assigned.value_node.value_unused)
+        self.assertFalse(last.value_unused)
+
+
+class TestProgramExecution(ProgramTestCase):
+    """Tests for running multi-statement programs."""
+
+    def test_run_returns_last_value(self):
+        value, error = run("<program>", "VAR a = 2\nVAR b = a * 3\nb + 1")
+        self.assertIsNone(error)
+        self.assertEqual("7", str(value))
+
+    def test_show_expression(self):
+        run("<program>", "FUNC square(x) -> x * x")
+        self.assertEqual("49", str(run("<program>", "SHOW square(7)")[0]))
+
+    def test_run_iter_yields_each_statement(self):
+        self.assertEqual(
+            [("1", None), ("2", None), ("3", None)],
+            self.results("VAR a = 1\nVAR a = a + 1; a + 1"),
+        )
+
+    def test_run_iter_stops_at_runtime_error(self):
+        results = self.results("1\n2 / 0\n3")
+        self.assertEqual(2, len(results))
+        self.assertIsInstance(results[1][1], RTError)
+
+    def test_syntax_error_before_execution(self):
+        results = self.results("VAR a = 1\nVAR = 2")
+        self.assertEqual(1, len(results))
+        self.assertIsInstance(results[0][1], InvalidSyntaxError)
+        self.assertIsNone(global_symbol_table.get("A"))
+
+    def test_error_reports_source_line(self):
+        _, error = run("<program>", "VAR a = 1\n\nVAR b = a / 0\nb")
+        message = error.as_string()
+        self.assertIn("line 3", message)
+        self.assertTrue(message.endswith("VAR b = a / 0\n            ^"))
+
+    def test_unused_loop_values(self):
+        text = (
+            "VAR n = 0\n"
+            "FOR i = 0 TO 3 THEN FOR j = 0 TO 2 THEN VAR n = n + 1\n"
+            "WHILE n < 10 THEN VAR n = n + 1\n"
+            "VAR r = FOR i = 0 TO 3 THEN i\n"
+            "[n, r]"
+        )
+        for engine in ("interpreter", "evaluator", "vm", "closure"):
+            with self.subTest(engine=engine):
+                value, error = run("<program>", text, engine=engine)
+                self.assertIsNone(error)
+                self.assertEqual("[10, [0, 1, 2]]", str(value))
+        self.assertEqual("[0, 1, 2]", str(run("<program>", "FOR i = 0 TO 3 THEN i")[0]))
+
+    def test_engines(self):
+        text = "FUNC add(a, b) -> a + b\nVAR x = add(1, 2)\n[x,\n add(x, x)]"
+        expected = self.results(text)
+        for engine in ("vm", "closure"):
+            with self.subTest(engine=engine):
+                global_symbol_table.symbols.clear()
+                self.assertEqual(expected, self.results(text, engine))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for the type-feedback quickening of BinOpNodes in the Interpreter."""
+
+import pickle
+import unittest
+from simplescript.runtime import run, global_symbol_table
+from simplescript.core import quickening
+from simplescript.core.quickening import MAX_DEOPTIMIZATIONS, QUICKEN_THRESHOLD
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.types.number import Number
+
+
+class TestQuickening(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+        quickening.stats.reset()
+
+    def define(self, text):
+        _, error = run("<quickening>", text)
+        self.assertIsNone(error)
+        return global_symbol_table.symbols["F"].body_node
+
+    def call(self, text):
+        value, error = run("<quickening>", text)
+        self.assertIsNone(error, error and error.as_string())
+        return str(value)
+
+    def test_node_is_quickened_after_warm_up(self):
+        body = self.define("NOMEMO FUNC f(a, b) -> a + b")
+        for _ in range(QUICKEN_THRESHOLD - 1):
+            self.assertEqual("3", self.call("f(1, 2)"))
+        self.assertIsNone(body.quickened)
+        self.assertEqual("3", self.call("f(1, 2)"))
+        self.assertIsNotNone(body.quickened)
+        self.assertEqual(1, quickening.stats.quickened)
+        self.assertEqual("7.5", self.call("f(5, 2.5)"))
+        self.assertEqual(0, quickening.stats.deoptimized)
+
+    def test_literal_operands_share_the_number_evaluator(self):
+        self.assertEqual(
+            str([int(i / 2 == 2 or i == 11) for i in range(12)]),
+            self.call("FOR i = 0 TO 12 THEN i / 2 == 2 OR i == 11"),
+        )
+        self.assertEqual(4, quickening.stats.quickened)
+        self.assertEqual(0, quickening.stats.deoptimized)
+
+    def test_other_types_are_quickened_to_their_method(self):
+        body = self.define('NOMEMO FUNC f(a, b) -> a + b')
+        for _ in range(QUICKEN_THRESHOLD):
+            self.call('f("a", "b")')
+        self.assertIsNotNone(body.quickened)
+        self.assertEqual('"xy"', self.call('f("x", "y")'))
+
+    def test_new_types_deoptimize(self):
+        body = self.define("NOMEMO FUNC f(a, b) -> a + b")
+        for _ in range(QUICKEN_THRESHOLD):
+            self.call("f(1, 2)")
+        self.assertEqual('"ab"', self.call('f("a", "b")'))
+        self.assertIsNone(body.quickened)
+        self.assertEqual(1, quickening.stats.deoptimized)
+        self.assertEqual("[1, 2]", self.call("f([1], 2)"))
+
+    def test_node_stays_general_after_repeated_deoptimization(self):
+        body = self.define("NOMEMO FUNC f(a, b) -> a + b")
+        for _ in range(MAX_DEOPTIMIZATIONS):
+            for _ in range(QUICKEN_THRESHOLD):
+                self.call("f(1, 2)")
+            self.call('f("a", "b")')
+        for _ in range(QUICKEN_THRESHOLD):
+            self.call("f(1, 2)")
+        self.assertIsNone(body.quickened)
+        self.assertEqual(MAX_DEOPTIMIZATIONS, quickening.stats.quickened)
+        self.assertEqual(MAX_DEOPTIMIZATIONS, quickening.stats.deoptimized)
+
+    def test_errors_of_quickened_nodes(self):
+        self.define("NOMEMO FUNC f(a, b) -> a / b")
+        for _ in range(QUICKEN_THRESHOLD):
+            self.call("f(1, 2)")
+        value, error = run("<quickening>", "f(1, 0)")
+        self.assertIsNone(value)
+        self.assertEqual("Division by zero", error.details)
+        self.assertIn("in F", error.as_string())
+        self.assertTrue(error.as_string().endswith("NOMEMO FUNC f(a, b) -> a / b\n" + " " * 27 + "^"))
+
+    def test_feedback_is_not_pickled(self):
+        tokens, _ = Lexer("<quickening>", "1 + 2").make_tokens()
+        node = Parser(tokens).parse().node.statement_nodes[0]
+        node.feedback = [Number, Number, QUICKEN_THRESHOLD, 0]
+        node.quickened = quickening.specialize("PLUS", Number, Number)
+        copy = pickle.loads(pickle.dumps(node))
+        self.assertIsNone(copy.feedback)
+        self.assertIsNone(copy.quickened)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests for the variable resolution pass and lexical scoping."""
+
+import unittest
+from simplescript.runtime import ENGINES, run, global_symbol_table
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.errors.errors import RTError
+from simplescript.utils.symbol_table import SymbolTable
+
+
+class TestResolver(unittest.TestCase):
+    """Tests for the addresses the resolver records on the AST."""
+
+    def parse(self, text):
+        tokens, error = Lexer("<resolver>", text).make_tokens()
+        self.assertIsNone(error)
+        ast = Parser(tokens).parse()
+        self.assertIsNone(ast.error)
+        return ast.node.statement_nodes[0]
+
+    def test_params_take_first_slots(self):
+        func = self.parse("FUNC f(a, b) -> VAR c = a + b")
+        self.assertEqual(3, func.frame_size)
+        self.assertEqual(2, func.body_node.slot)
+        left = func.body_node.value_node.left_node
+        self.assertEqual((0, 0), (left.depth, left.slot))
+
+    def test_repeated_assignment_shares_slot(self):
+        func = self.parse("FUNC f(n) -> FOR i = 0 TO n THEN VAR n = n + i")
+        self.assertEqual(2, func.frame_size)
+        self.assertEqual(1, func.body_node.slot)
+        self.assertEqual(0, func.body_node.body_node.slot)
+
+    def test_outer_variable_depth(self):
+        func = self.parse("FUNC f(a) -> FUNC(b) -> a + b")
+        binop = func.body_node.body_node
+        self.assertEqual((1, 0), (binop.left_node.depth, binop.left_node.slot))
+        self.assertEqual((0, 0), (binop.right_node.depth, binop.right_node.slot))
+
+    def test_globals_have_no_slot(self):
+        func = self.parse("FUNC f() -> g")
+        self.assertIsNone(func.body_node.slot)
+        self.assertIsNone(func.slot)
+
+
+class TestLexicalScoping(unittest.TestCase):
+    """Tests that every engine scopes function variables the same way."""
+
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def run_all(self, text):
+        results = []
+        for engine in ENGINES:
+            global_symbol_table.symbols.clear()
+            value, error = run("<scope>", text, engine=engine)
+            results.append((engine, value, error))
+        return results
+
+    def assertValue(self, expected, text):
+        for engine, value, error in self.run_all(text):
+            self.assertIsNone(error, engine)
+            self.assertEqual(expected, str(value), engine)
+
+    def test_closure_reads_enclosing_parameter(self):
+        self.assertValue("3", "FUNC adder(a) -> FUNC(b) -> a + b\nVAR add1 = adder(1)\nadd1(2)")
+
+    def test_nested_closures(self):
+        self.assertValue("6", "FUNC f(x) -> FUNC(y) -> FUNC(z) -> x + y + z\nVAR g = f(1)\nVAR h = g(2)\nh(3)")
+
+    def test_function_reads_globals(self):
+        self.assertValue("11", "VAR g = 10\nFUNC h(x) -> x + g\nh(1)")
+        self.assertValue("5", "FUNC f() -> y\nVAR y = 5\nf()")
+
+    def test_recursion(self):
+        self.assertValue("610", "FUNC fib(n) -> IF n <= 1 THEN n ELSE fib(n - 1) + fib(n - 2)\nfib(15)")
+
+    def test_named_inner_function_recursion(self):
+        self.assertValue(
+            "7",
+            "FUNC outer(a) -> (FUNC inner(b) -> IF b == 0 THEN a ELSE inner(b - 1))(3)\nouter(7)",
+        )
+
+    def test_locals_do_not_leak(self):
+        for engine, value, error in self.run_all("FUNC f(x) -> VAR y = x * 2\nf(4)\ny"):
+            self.assertIsInstance(error, RTError, engine)
+            self.assertIn("'Y' is not defined", error.as_string(), engine)
+
+    def test_local_read_before_assignment(self):
+        for engine, value, error in self.run_all(
+            "FUNC f(n) -> FOR i = 0 TO n THEN VAR acc = acc + i\nf(3)"
+        ):
+            self.assertIsInstance(error, RTError, engine)
+            self.assertIn("'ACC' is not defined", error.as_string(), engine)
+
+
+class TestSymbolTable(unittest.TestCase):
+    def test_get_falls_back_to_parent(self):
+        parent = SymbolTable()
+        parent.set("A", 1)
+        child = SymbolTable(parent)
+        self.assertEqual(1, child.get("A"))
+        self.assertIsNone(child.get("B"))
+
+
+if __name__ == "__main__":
+    unittest.main()
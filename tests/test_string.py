@@ -0,0 +1,43 @@
+"""Tests for deferred String concatenation."""
+
+import unittest
+from simplescript.runtime import run, global_symbol_table
+from simplescript.types.number import Number
+from simplescript.types.string import String
+
+
+class TestStringConcatenation(unittest.TestCase):
+    """Tests for String values built by concatenation."""
+
+    def test_branches_do_not_affect_each_other(self):
+        base, _ = String("a").added_to(String("b"))
+        left, _ = base.added_to(String("c"))
+        right, _ = base.added_to(String("d"))
+        longer, _ = left.added_to(String("e"))
+        self.assertEqual(
+            ["ab", "abc", "abd", "abce"],
+            [base.value, left.value, right.value, longer.value],
+        )
+
+    def test_copy_and_repeat_of_unjoined_string(self):
+        joined, _ = String("ab").added_to(String("c"))
+        copy = joined.copy()
+        extended, _ = copy.added_to(String("!"))
+        self.assertEqual("abc!", extended.value)
+        self.assertEqual("abcabc", joined.multed_by(Number(2))[0].value)
+        self.assertTrue(String("").added_to(String("x"))[0].is_true())
+        self.assertFalse(String("").added_to(String(""))[0].is_true())
+
+    def test_accumulate_in_loop(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+        for engine in ("interpreter", "evaluator", "vm", "closure"):
+            run("<test>", 'VAR s = ""', engine=engine)
+            run("<test>", 'FOR i = 0 TO 1000 THEN VAR s = s + "ab"', engine=engine)
+            value, error = run("<test>", "s", engine=engine)
+            self.assertIsNone(error)
+            self.assertEqual("ab" * 1000, value.value, engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for the unboxed evaluation of numeric subtrees on every engine."""
+
+import contextlib
+import unittest
+from unittest import mock
+from simplescript.runtime import ENGINES, parse, run, global_symbol_table
+from simplescript.core import closure_compiler, interpreter, unboxed
+from simplescript.core.bytecode import EVAL_UNBOXED
+from simplescript.core.compiler import Compiler
+from simplescript.core.context import Context
+from simplescript.core.unboxed import MAX_DEPTH, numeric_tree
+from simplescript.types.number import Number
+
+
+def expression(text):
+    node, error = parse("<unboxed>", text, optimize=False)
+    assert error is None
+    return node.statement_nodes[-1]
+
+
+class TestNumericTree(unittest.TestCase):
+    def test_numeric_subtrees(self):
+        tree = numeric_tree(expression("a * a + b * b - 2 * a * b"))
+        self.assertEqual(["A", "B"], [node.var_name_tok.value for node in tree.variables])
+        self.assertEqual(9, tree.evaluate([5, 2]))
+        self.assertFalse(tree.comparison)
+        self.assertEqual(0, tree.context_index)
+
+        tree = numeric_tree(expression("2 * x < x ^ 2"))
+        self.assertTrue(tree.comparison)
+        self.assertIsNone(tree.context_index)
+        self.assertEqual(1, tree.evaluate([3]))
+
+    def test_other_subtrees(self):
+        for text in [
+            "a + 1",
+            "a + f(1) * 2",
+            "a + -b * 2",
+            'a + "s" * 2',
+            "a * 2 AND b",
+            "a + [1] * 2",
+            " + ".join(["a"] * (MAX_DEPTH + 2)),
+        ]:
+            with self.subTest(text=text):
+                self.assertIsNone(numeric_tree(expression(text)))
+
+
+class TestUnboxedEvaluation(unittest.TestCase):
+    def setUp(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+
+    def outcome(self, text, engine):
+        global_symbol_table.symbols.clear()
+        value, error = run("<unboxed>", text, engine=engine, optimize=False)
+        return str(value), error and error.as_string()
+
+    def boxed_outcome(self, text, engine):
+        with contextlib.ExitStack() as stack:
+            for module in (interpreter, closure_compiler, unboxed):
+                stack.enter_context(
+                    mock.patch.object(module, "numeric_tree", return_value=None)
+                )
+            return self.outcome(text, engine)
+
+    def test_same_outcome_as_boxed_evaluation(self):
+        for text in [
+            "VAR a = 5; VAR b = 2\na * a + b * b - 2 * a * b",
+            "VAR a = 5\na / 2 + a * 0.5",
+            "VAR a = 2\na ^ 64 * a - 1",
+            "VAR a = 5; VAR b = 2\n(a < b) + (a >= b) * 10",
+            "FUNC f(a, b) -> a * a + b * b - 2 * a * b\nf(7, 3)",
+            "FUNC f(a) -> a * 2 + 1\nf(1.5)",
+            "VAR a = 1; VAR z = 0\n1 + a * 2 / (z * a) - 4",
+            "VAR z = 0\nFUNC f(a) -> a * 2 / z + 1\nf(3)",
+            "FUNC f(a) -> a * 2 + 1\nVAR r = f(3)\nr / 0",
+            'VAR a = "ab"\na * 2 + a',
+            "VAR a = [1]\na * [2] + 3",
+            "VAR a = 1\na * b + 1",
+        ]:
+            for engine in ENGINES:
+                with self.subTest(text=text, engine=engine):
+                    self.assertEqual(
+                        self.boxed_outcome(text, engine), self.outcome(text, engine)
+                    )
+
+    def test_variables_are_read_once_per_evaluation(self):
+        node = expression("a * a + a * 2")
+        with mock.patch.object(
+            interpreter.Interpreter, "lookup", autospec=True, return_value=Number(3)
+        ) as lookup:
+            result = interpreter.Interpreter().visit(node, Context("<unboxed>"))
+        self.assertEqual(15, result.value.value)
+        self.assertEqual(1, lookup.call_count)
+
+    def test_vm_skips_the_boxed_code(self):
+        code = Compiler().compile(expression("a * a + 1"))
+        op, arg = code.instructions[0]
+        self.assertEqual(EVAL_UNBOXED, op)
+        self.assertEqual(len(code.instructions) - 1, arg[-1])
+        self.assertEqual((("A", 0, None),), arg[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
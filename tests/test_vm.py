@@ -0,0 +1,136 @@
+"""Tests for the bytecode compiler and stack VM execution engine.
+
+The full integration suite is re-run with ``engine="vm"``, and a set of
+programs is checked to produce identical values and errors on both the
+tree-walking interpreter and the VM.
+"""
+
+import unittest
+from unittest import mock
+from simplescript.runtime import run, global_symbol_table
+from simplescript.core.lexer import Lexer
+from simplescript.core.parser import Parser
+from simplescript.core.compiler import Compiler
+from simplescript.core.context import Context
+from simplescript.core.vm import VM
+from simplescript.utils.frame import Frame
+from simplescript.utils.symbol_table import SymbolTable
+from simplescript.types.number import Number
+from simplescript.errors.errors import RTError
+from tests import test_integration
+from tests.engine_support import EngineMixin, PARITY_PROGRAMS, assert_same_outcome
+
+
+class VMEngineMixin(EngineMixin):
+    ENGINE = "vm"
+
+
+class TestVariablesVM(VMEngineMixin, test_integration.TestVariables):
+    pass
+
+
+class TestLoopsVM(VMEngineMixin, test_integration.TestLoops):
+    pass
+
+
+class TestFunctionsAnonymousVM(VMEngineMixin, test_integration.TestFunctionsAnonymous):
+    pass
+
+
+class TestFunctionsNamedVM(VMEngineMixin, test_integration.TestFunctionsNamed):
+    pass
+
+
+class TestStringsVM(VMEngineMixin, test_integration.TestStrings):
+    pass
+
+
+class TestListsVM(VMEngineMixin, test_integration.TestLists):
+    pass
+
+
+class TestListErrorsVM(VMEngineMixin, test_integration.TestListErrors):
+    pass
+
+
+class TestMapsVM(VMEngineMixin, test_integration.TestMaps):
+    pass
+
+
+class TestMapErrorsVM(VMEngineMixin, test_integration.TestMapErrors):
+    pass
+
+
+class TestErrorsVM(VMEngineMixin, test_integration.TestErrors):
+    pass
+
+
+class TestEngineParity(unittest.TestCase):
+    """Tests that the VM and the interpreter agree on values and errors."""
+
+    def test_programs(self):
+        for text in PARITY_PROGRAMS:
+            with self.subTest(text=text):
+                assert_same_outcome(self, text, "vm")
+
+    def test_function_defined_by_other_engine(self):
+        run("<parity>", "FUNC cube(x) -> x * x * x")
+        self.assertEqual("27", str(run("<parity>", "cube(3)", engine="vm")[0]))
+        run("<parity>", "FUNC halve(x) -> x / 2", engine="vm")
+        self.assertEqual("4.0", str(run("<parity>", "halve(8)")[0]))
+
+    def test_recursion(self):
+        run("<parity>", "FUNC fib(f, n) -> IF n <= 1 THEN n ELSE f(f, n - 1) + f(f, n - 2)")
+        self.assertEqual("55", str(run("<parity>", "fib(fib, 10)", engine="vm")[0]))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            run("<parity>", "1", engine="nope")
+
+
+class TestVM(unittest.TestCase):
+    """Tests for the VM itself."""
+
+    def compile(self, text):
+        tokens, error = Lexer("<vm>", text).make_tokens()
+        self.assertIsNone(error)
+        ast = Parser(tokens).parse()
+        self.assertIsNone(ast.error)
+        return Compiler().compile(ast.node)
+
+    def context(self):
+        context = Context("<vm>")
+        context.symbol_table = SymbolTable()
+        return context
+
+    def test_max_depth(self):
+        context = self.context()
+        VM().run(self.compile("FUNC forever(f) -> 1 + f(f)"), context)
+        result = VM(max_depth=50).run(self.compile("forever(forever)"), context)
+        self.assertIsInstance(result.error, RTError)
+        self.assertIn("recursion depth", result.error.details)
+
+    def test_numeric_body_runs_without_the_vm_loop(self):
+        global_symbol_table.symbols.clear()
+        self.addCleanup(global_symbol_table.symbols.clear)
+        run("<vm>", "NOMEMO FUNC sq(x) -> x * x + 1")
+        vm = VM()
+        context = self.context()
+        with mock.patch.object(vm, "run", wraps=vm.run) as vm_run:
+            run_body = vm.body_runner(global_symbol_table.get("SQ"))
+            context.frame = Frame([Number(3)])
+            self.assertEqual("10", str(run_body(context).value))
+            self.assertEqual(0, vm_run.call_count)
+            context.frame = Frame([run("<vm>", '"a"')[0]])
+            self.assertIsInstance(run_body(context).error, RTError)
+            self.assertEqual(1, vm_run.call_count)
+
+    def test_disassemble(self):
+        listing = self.compile("VAR a = 1 + 2").disassemble()
+        self.assertIn("BINARY_OP", listing)
+        self.assertIn("STORE_VAR", listing)
+        self.assertIn("RETURN", listing)
+
+
+if __name__ == "__main__":
+    unittest.main()